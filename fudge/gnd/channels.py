@@ -257,32 +257,39 @@ class channel( ancestryModule.ancestry ) :
 
         return( not( self.fissionGenre is None ) )
 
-    def calculateAverageProductData( self, style, indent = '', **kwargs ) :
+    def calculateAverageProductData( self, style, indent = '', productIndices = None, **kwargs ) :
         """
         Calculate average product data.
 
         :param style: The style to use.
         :param indent: string; The amount to indent and verbose output.
+        :param productIndices: list of the indices of the products to do (all products if None).
         :param kwargs: string; All other parameters.
         :return:
         """
 
         kwargs['outputChannel'] = self
         for productIndex, product in enumerate( self ) :
+            if( ( productIndices is not None ) and ( productIndex not in productIndices ) ) : continue
             kwargs['product'] = product
             kwargs['productIndex'] = str( productIndex )
             product.calculateAverageProductData( style, indent = indent, **kwargs )
 
-    def processSnMultiGroup( self, style, tempInfo, indent ) :
+    def processSnMultiGroup( self, style, tempInfo, indent, Q = True, productIndices = None ) :
+        """
+        Adds the Sn multi-group data for style to Q (only if Q is True) and to each product whose index is in
+        productIndices (all products if productIndices is None).
+        """
 
         indent2 = indent + tempInfo['incrementalIndent']
         status = 0
 
-        self.Q.processSnMultiGroup( style, tempInfo, indent )
+        if( Q ) : self.Q.processSnMultiGroup( style, tempInfo, indent )
 
         tempInfo['transferMatrixComment'] = tempInfo['reactionSuite'].inputParticlesToReactionString( suffix = " --> " ) +  \
                 self.toString( simpleString = True )
         for productIndex, product in enumerate( self ) :
+            if( ( productIndices is not None ) and ( productIndex not in productIndices ) ) : continue
             tempInfo['productIndex'] = str( productIndex )
             tempInfo['productName'] = product.name
             if( isinstance( product.particle, xParticleModule.nuclearLevel ) ) :
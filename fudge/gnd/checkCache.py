@@ -0,0 +1,199 @@
+# <<BEGIN-copyright>>
+# Copyright (c) 2016, Lawrence Livermore National Security, LLC.
+# Produced at the Lawrence Livermore National Laboratory.
+# Written by the LLNL Nuclear Data and Theory group
+#         (email: mattoon1@llnl.gov)
+# LLNL-CODE-683960.
+# All rights reserved.
+# 
+# This file is part of the FUDGE package (For Updating Data and 
+#         Generating Evaluations)
+# 
+# When citing FUDGE, please use the following reference:
+#   C.M. Mattoon, B.R. Beck, N.R. Patel, N.C. Summers, G.W. Hedstrom, D.A. Brown, "Generalized Nuclear Data: A New Structure (with Supporting Infrastructure) for Handling Nuclear Data", Nuclear Data Sheets, Volume 113, Issue 12, December 2012, Pages 3145-3171, ISSN 0090-3752, http://dx.doi.org/10. 1016/j.nds.2012.11.008
+# 
+# 
+#     Please also read this link - Our Notice and Modified BSD License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the disclaimer below.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the disclaimer (as noted below) in the
+#       documentation and/or other materials provided with the distribution.
+#     * Neither the name of LLNS/LLNL nor the names of its contributors may be used
+#       to endorse or promote products derived from this software without specific
+#       prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL LAWRENCE LIVERMORE NATIONAL SECURITY, LLC,
+# THE U.S. DEPARTMENT OF ENERGY OR CONTRIBUTORS BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# 
+# 
+# Additional BSD Notice
+# 
+# 1. This notice is required to be provided under our contract with the U.S.
+# Department of Energy (DOE). This work was produced at Lawrence Livermore
+# National Laboratory under Contract No. DE-AC52-07NA27344 with the DOE.
+# 
+# 2. Neither the United States Government nor Lawrence Livermore National Security,
+# LLC nor any of their employees, makes any warranty, express or implied, or assumes
+# any liability or responsibility for the accuracy, completeness, or usefulness of any
+# information, apparatus, product, or process disclosed, or represents that its use
+# would not infringe privately-owned rights.
+# 
+# 3. Also, reference herein to any specific commercial products, process, or services
+# by trade name, trademark, manufacturer or otherwise does not necessarily constitute
+# or imply its endorsement, recommendation, or favoring by the United States Government
+# or Lawrence Livermore National Security, LLC. The views and opinions of authors expressed
+# herein do not necessarily state or reflect those of the United States Government or
+# Lawrence Livermore National Security, LLC, and shall not be used for advertising or
+# product endorsement purposes.
+# 
+# <<END-copyright>>
+
+"""
+checkCache.py contains the 'checkCache' class used by reactionSuite.check to store the derived data (reconstructed
+cross sections and average product energies and momenta) that it calculates. Each entry is keyed by a hash of the
+data it was derived from, so that checking a reactionSuite again only recalculates the data for the parts that changed.
+"""
+
+import os
+import hashlib
+import cPickle
+import datetime
+
+__metaclass__ = type
+
+class checkCache( dict ) :
+    """
+    A dictionary of derived data, keyed by a sha1 hash of the inputs used to calculate the data. The cache can be
+    saved to, and read from, a file so that it can be reused between sessions. For example:
+
+        >>> cache = checkCache( 'n-Fe056.checkCache' )
+        >>> warnings = reactionSuite.check( cache = cache )
+        >>> cache.save( )
+
+    The forms in the cache are copies not attached to any reactionSuite. They are copied again when added to one.
+    """
+
+    def __init__( self, fileName = None ) :
+
+        dict.__init__( self )
+        self.fileName = fileName
+        self.added = []             # keys added since self was created, in order.
+        if( ( fileName is not None ) and os.path.exists( fileName ) ) :
+            with open( fileName, 'rb' ) as fIn : dict.update( self, cPickle.load( fIn ) )
+
+    def add( self, key, value ) :
+
+        self[key] = value
+        self.added.append( key )
+
+    def save( self, fileName = None ) :
+
+        if( fileName is None ) : fileName = self.fileName
+        if( fileName is None ) : raise ValueError( 'no file name given for saving checkCache' )
+        with open( fileName, 'wb' ) as fOut : cPickle.dump( dict( self ), fOut, cPickle.HIGHEST_PROTOCOL )
+
+    def reconstructResonances( self, reactionSuite, styleName, **kwargs ) :
+        """
+        Calls reactionSuite.reconstructResonances( styleName, **kwargs ) unless the reconstructed cross sections for the
+        same resonances, background cross sections and kwargs are in self, in which case they are added to reactionSuite.
+        """
+
+        from . import styles as stylesModule
+
+        evaluatedLabel = reactionSuite.styles.getEvaluatedStyle( ).label
+        keyItems = [ 'reconstructResonances', reactionSuite.resonances.toXMLList( ), sorted( kwargs.items( ) ) ]
+        for reaction in reactionSuite :
+            if( hasattr( reaction, 'crossSection' ) and ( evaluatedLabel in reaction.crossSection ) ) :
+                keyItems += [ str( reaction ), reaction.crossSection[evaluatedLabel].toXMLList( ) ]
+        key = hashKey( keyItems )
+
+        if( key in self ) :
+            for index, reaction in enumerate( reactionSuite ) :
+                if( index in self[key] ) : reaction.crossSection.add( copyForm( self[key][index], styleName ) )
+            reactionSuite.styles.add( stylesModule.crossSectionReconstructed( label = styleName, date = str( datetime.date.today( ) ) ) )
+        else :
+            reactionSuite.reconstructResonances( styleName, **kwargs )
+            forms = {}
+            for index, reaction in enumerate( reactionSuite ) :
+                if( hasattr( reaction, 'crossSection' ) and ( styleName in reaction.crossSection ) ) :
+                    forms[index] = copyForm( reaction.crossSection[styleName] )
+            self.add( key, forms )
+
+    def averageProductDataKey( self, reaction, info ) :
+        """Returns the key for the average product data of reaction calculated by reactionSuite.check."""
+
+        reactionSuite = info['reactionSuite']
+        arguments = info['averageProductDataArgs']
+        return( hashKey( [ 'averageProductData', str( reactionSuite.projectile ), str( reactionSuite.target ),
+                reactionSuite.particles.toXMLList( ), info['style'].label, reaction.toXMLList( ),
+                arguments['energyAccuracy'], arguments['momentumAccuracy'] ] ) )
+
+    def calculateAverageProductData( self, reaction, info ) :
+        """
+        Calls reaction.calculateAverageProductData with the style and arguments of reactionSuite.check (from info) unless
+        the average product data for the same reaction are in self, in which case they are added to reaction.
+        """
+
+        style = info['averageProductDataStyle']
+        key = self.averageProductDataKey( reaction, info )
+        if( key in self ) :
+            addAverageProductDataForms( reaction, self[key], style.label )
+        else :
+            reaction.calculateAverageProductData( style = style, **info['averageProductDataArgs'] )
+            self.add( key, averageProductDataForms( reaction, style.label ) )
+
+def hashKey( items ) :
+    """Returns the sha1 hex digest of the string representation of the list items."""
+
+    return( hashlib.sha1( repr( items ) ).hexdigest( ) )
+
+def copyForm( form, label = None ) :
+    """Returns a copy of form that is not attached to any ancestor. If label is not None, the copy's label is set to it."""
+
+    form = form.copy( )
+    form.setAncestor( None )
+    if( label is not None ) : form.label = label
+    return( form )
+
+def averageProductDataComponents( reaction ) :
+    """
+    Yields ( path, component ) for the energyDeposition and momentumDeposition components of each product and decay
+    product of reaction, where path is the tuple of product indices followed by the component's moniker.
+    """
+
+    def productComponents( outputChannel, path ) :
+
+        for index, product in enumerate( outputChannel ) :
+            productPath = path + ( index, )
+            yield( productPath + ( 'energyDeposition', ), product.energyDeposition )
+            yield( productPath + ( 'momentumDeposition', ), product.momentumDeposition )
+            if( product.outputChannel is not None ) :
+                for item in productComponents( product.outputChannel, productPath ) : yield( item )
+
+    if( hasattr( reaction, 'outputChannel' ) ) :
+        for item in productComponents( reaction.outputChannel, ( ) ) : yield( item )
+
+def averageProductDataForms( reaction, styleLabel ) :
+    """Returns the list of ( path, copy of form ) for the average product data forms of reaction with label styleLabel."""
+
+    return( [ ( path, copyForm( component[styleLabel] ) ) for path, component in averageProductDataComponents( reaction )
+            if( styleLabel in component ) ] )
+
+def addAverageProductDataForms( reaction, forms, styleLabel ) :
+    """Adds a copy of each form in forms, as returned by averageProductDataForms, to reaction with label styleLabel."""
+
+    components = dict( averageProductDataComponents( reaction ) )
+    for path, form in forms : components[path].add( copyForm( form, styleLabel ) )
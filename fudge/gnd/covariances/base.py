@@ -72,6 +72,7 @@ from xData import array as arrayModule
 from xData import XYs as XYsModule
 from xData import link as linkModule
 from xData import values as valuesModule
+from xData import standards as standardsModule
 
 from pqu import PQU
 
@@ -155,8 +156,7 @@ class covarianceMatrix( ancestryModule.ancestry ):
                 self.matrix.array.symmetry in (arrayModule.symmetryUpperToken,arrayModule.symmetryLowerToken) ):
             return True
         # could still be symmetric even if it doesn't use compression
-        arr = self.matrix.array.constructArray()
-        return numpy.all( arr==arr.T )
+        return self.matrix.array.isSymmetric()
 
     def convertAxesToUnits( self, units ):
         '''
@@ -192,20 +192,16 @@ class covarianceMatrix( ancestryModule.ancestry ):
         if not self.isSymmetric():
             raise TypeError( "Can only extract correlation matrices from symmetric covariance matrices" )
                 
-        # Rescale result matrix
-        theCorrelationMatrix = self.matrix.array.constructArray()
-        theUncertainty = copy.copy( numpy.diag( theCorrelationMatrix ) )
+        # Rescale result matrix, keeping the storage of self
+        theUncertainty = self.matrix.array.diagonalValues()
         theUncertainty[ theUncertainty < 0.0 ] = 0.0
-        theUncertainty = numpy.sqrt( theUncertainty )
-        for i1 in range( theCorrelationMatrix.shape[0] ):
-            for i2 in range( theCorrelationMatrix.shape[1] ):
-                theCorrelationMatrix[i1,i2] /= ( theUncertainty[i1] * theUncertainty[i2] )
+        with numpy.errstate( divide='ignore' ):
+            inverseUncertainty = 1.0 / numpy.sqrt( theUncertainty )
 
         # Return the result
-        tridata = theCorrelationMatrix[numpy.tri(theCorrelationMatrix.shape[0])==1.0].tolist()
         correlation = griddedModule.gridded(
                 axes=self.matrix.axes.copy(),
-                array=arrayModule.full(shape=theCorrelationMatrix.shape, data=tridata, symmetry=arrayModule.symmetryLowerToken) )
+                array=self.matrix.array.scaled( inverseUncertainty ) )
         correlation.axes[0].unit = ''
         return correlation
         
@@ -230,28 +226,23 @@ class covarianceMatrix( ancestryModule.ancestry ):
 
         # Make sure we have usable row data to rescale with
         if rowData is None: 
-            rowData = self.ancestor.rowData.link.toPointwise_withLinearXYs()
+            rowData = self.ancestor.findAttributeInAncestry( 'rowData' ).link.toPointwise_withLinearXYs(1e-8,1e-8)
         if not isinstance( rowData, XYsModule.XYs1d ):
             raise TypeError( 'rowData must be of type XYs1d, found %s' % type(rowData) )
-        gRowData = rowData.group( self.matrix.axes[2].values )
+        gRowData = self.__groupedData( rowData, 2 )
 
         # Only generate the column rescaling if we need to
         if not self.matrix.axes[1].style=='link':
             if colData is None: 
-                colData = self.ancestor.columnData.link.toPointwise_withLinearXYs()
+                colData = self.ancestor.findAttributeInAncestry( 'columnData' ).link.toPointwise_withLinearXYs(1e-8,1e-8)
             if not isinstance( colData, XYsModule.XYs1d ):
                 raise TypeError( 'colData must be of type XYs1d, found %s' % type(colData) )
-            gColData = colData.group( self.matrix.axes[1].values )
-        else: gColData = gRowData
+            gColData = self.__groupedData( colData, 1 )
+            colUnit = colData.axes[0].unit
+        else: gColData, colUnit = None, rowData.axes[0].unit
         
         # Rescale!
-        newData = []
-        for i,row in enumerate(self.matrix.array.constructArray()):
-            newRow = []
-            for j, cell in enumerate(row):
-                newRow.append( gRowData[i][1]*gColData[j][1]*cell )
-            newData.append( newRow )
-        result.matrix.data = newData
+        result.matrix = self.__scaledMatrix( gRowData, gColData, PQU.unitOperationSymbol( rowData.axes[0].unit, colUnit, '*' ) )
         result.type=tokens.absoluteToken
         return result
         
@@ -276,31 +267,49 @@ class covarianceMatrix( ancestryModule.ancestry ):
 
         # Make sure we have usable row data to rescale with
         if rowData is None: 
-            rowData = self.ancestor.rowData.link.toPointwise_withLinearXYs(1e-8,1e-8)
+            rowData = self.ancestor.findAttributeInAncestry( 'rowData' ).link.toPointwise_withLinearXYs(1e-8,1e-8)
         if not isinstance( rowData, XYsModule.XYs1d ):
             raise TypeError( 'rowData must be of type XYs1d, found %s' % type(rowData) )
-        gRowData = rowData.group( self.matrix.axes[2].values )
+        gRowData = self.__groupedData( rowData, 2 )
 
         # Only generate the column rescaling if we need to
         if not self.matrix.axes[1].style=='link':
             if colData is None: 
-                colData = self.ancestor.columnData.link.toPointwise_withLinearXYs(1e-8,1e-8)
+                colData = self.ancestor.findAttributeInAncestry( 'columnData' ).link.toPointwise_withLinearXYs(1e-8,1e-8)
             if not isinstance( colData, XYsModule.XYs1d ):
                 raise TypeError( 'colData must be of type XYs1d, found %s' % type(colData) )
-            gColData = colData.group( self.matrix.axes[1].values )
-        else: gColData = gRowData
+            gColData = reciprocal( self.__groupedData( colData, 1 ) )
+        else: gColData = None
 
         # Rescale!
-        newData = []
-        for i,row in enumerate(self.matrix.array.constructArray()):
-            newRow = []
-            for j, cell in enumerate(row):
-                newRow.append( cell/gRowData[i][1]/gColData[j][1] )
-            newData.append( newRow )
-        result.matrix.data = newData
+        result.matrix = self.__scaledMatrix( reciprocal( gRowData ), gColData, '' )
         result.type=tokens.relativeToken
         return result
         
+    def __groupedData( self, data, axisIndex ):
+        """
+        Returns the averages of the XYs1d data over the groups of axis axisIndex of self.matrix, as a numpy array
+        with one value per row (axisIndex = 2) or column (axisIndex = 1) of the matrix.
+        """
+
+        boundaries = list( self.matrix.axes[axisIndex].values )
+        length = self.matrix.array.shape[2 - axisIndex]
+        grouped = numpy.zeros( length )
+        averages = data.group( boundaries, norm = 'dx' )
+        grouped[:min( length, len( averages ) )] = averages[:length]
+        return grouped
+
+    def __scaledMatrix( self, rowScale, columnScale, unit ):
+        """
+        Returns a copy of self.matrix with element [i,j] multiplied by rowScale[i] * columnScale[j] and with the unit
+        of its matrix elements set to unit.
+        """
+
+        axes = self.matrix.axes.copy()
+        axes[0].unit = unit
+        return griddedModule.gridded( axes, self.matrix.array.scaled( rowScale, columnScale ),
+                index = self.matrix.index, valueType = self.matrix.valueType, label = self.matrix.label )
+
     def check( self, info ): 
         """Check if uncertainty in the bounds passed into the checker.  
         Requires specification of the data ("theData") if the covariance is not relative.
@@ -395,9 +404,9 @@ class covarianceMatrix( ancestryModule.ancestry ):
             self.data = A.tolist()
         return warnings + self.matrix.fix( **kw )
         
-    def group( self, groupBoundaries = ( None, None ), groupUnit = ( None, None ) ):
+    def group( self, groupBoundaries = ( None, None ), groupUnit = ( None, None ), flux = None ):
         '''
-        Group the matrix in self
+        Returns a copy of self regrouped onto new group boundaries. Self is not modified.
 
         :param groupBoundaries: a 2 element list containing the group boundaries for the rows 
                                 and columns (respectively) of the covariance to be regrouped
@@ -405,8 +414,7 @@ class covarianceMatrix( ancestryModule.ancestry ):
         :param groupUnit: a 2 element list containing the units in which group boundaries are 
                           specified for the rows and columns (respectively) of the covariance 
                           to be regrouped
-            
-        .. note::  We still need to do flux weighting
+        :param flux: an optional XYs1d instance, in groupUnit, used to weight the regrouping
             
             
         .. rubric:: Regrouping Theory
@@ -459,13 +467,14 @@ class covarianceMatrix( ancestryModule.ancestry ):
         It is straightforward to generalize to the case where the row and column bases are 
         different.
         
-        In the routine below, we abuse :py:class:`xData.XYs1d` to specify the functions 
-        :math:`w_i(E)` and use the :py:func:`XYs1d.groupOneFunction()` method to perform the integrals to get
-        the regrouping matrix.  We do this separately for the rows and the columns.
-        The matrix multiplication that converts a covariance from one pair of bases (group 
-        structures) to another is accomplished using numpy.
+        In the routine below, the matrices :math:`m_{ij}` for the rows and the columns are calculated directly from
+        the group boundaries by :py:func:`overlapMatrix` (the integral of :math:`v_i(E) w_j(E)` is just the length of
+        the intersection of the two groups) and the covariance is regrouped with two numpy matrix products.
+        If flux is given, the integrals are weighted by the flux :math:`\phi(E)`, i.e.,
+
+        .. math::
+            m_{ij} = \left( \int dE v_i(E) \phi(E) \right)^{-1} \int dE v_i(E) w_j(E) \phi(E)
 
-        
         .. rubric:: An explanation of fudge's 'flat' interpolation
         
         Suppose we have a function :math:`f(E)` specified using fudge's `'flat'` interpolation.  
@@ -481,46 +490,47 @@ class covarianceMatrix( ancestryModule.ancestry ):
             * From :math:`E_{N-1} \\rightarrow E_N`, :math:`f(E)` evaluates to :math:`f_{N-1}`
             * Above :math:`E_N`, :math:`f(E)` evaluates to :math:`0.0`
         '''
-        # determine where to get the settings for the potentially mirrored second axis
-        if self.matrix.axes[1].style == 'link': axis1index = 2
-        else:                                   axis1index = 1
-        
-        # setup the old axes in a form we can (ab)use in the XYs1d class
-        axes2_ = axesModule.axes( labelsUnits={1:( self.matrix.axes[2].label, self.matrix.axes[2].unit ),0:( 'dummy', '' )} )
-        axes1_ = axesModule.axes( labelsUnits={1:( self.matrix.axes[axis1index].label, self.matrix.axes[axis1index].unit ),0:( 'dummy', '' )} )
-        
-        # define basis functions for the rows and columns
-        basis2 = XYsModule.XYs1d( axes=axes2_, data=[ ( x, 0.0 ) for x in self.matrix.axes[2].values ], interpolation='flat' )
-        basis1 = XYsModule.XYs1d( axes=axes1_, data=[ ( x, 0.0 ) for x in self.matrix.axes[axis1index].values ], interpolation='flat' )
-        basis2 = basis2.convertAxisToUnit( 1, groupUnit[0] )
-        basis1 = basis1.convertAxisToUnit( 1, groupUnit[1] )
-    
-        # build the regrouping matrices for the two bases
-        w0 = []
-        for idx in range( self.matrix.array.shape[0] ):
-            basis2[idx] = ( basis2[idx][0], 1.0 )
-            w0.append( basis2.groupOneFunction( groupBoundaries[0], norm = 'dx' ) )
-            basis2[idx] = ( basis2[idx][0], 0.0 )
-        w0 = numpy.mat( w0 )
-        w1 = []
-        for j in range( self.matrix.array.shape[1] ):
-            basis1[j] = ( basis1[j][0], 1.0 )
-            w1.append( basis1.groupOneFunction( groupBoundaries[1], norm = 'dx' ) )
-            basis1[j] = ( basis1[j][0], 0.0 )
-        w1 = numpy.mat( w1 )
-                
-        # set up the regrouped covariance matrix
+
+        groupedArray, rowGroupBoundaries, rowUnit, columnGroupBoundaries, columnUnit, symmetric = \
+                self._groupArray( groupBoundaries, groupUnit, flux )
         grouped = copy.copy( self )
-        grouped.matrix.axes[2].data = groupBoundaries[0]
-        grouped.matrix.axes[1].data = groupBoundaries[1]
-        grouped.matrix.axes[2].unit = groupUnit[0]
-        grouped.matrix.axes[1].unit = groupUnit[1]
-        odata = numpy.mat( self.matrix.array.constructArray() )
-        gdata = w0.T * odata * w1
-        trigdata = gdata[numpy.tri(gdata.shape[0])==1.0].tolist()[0]
-        grouped.matrix.array = arrayModule.full(shape=gdata.shape,data=trigdata,symmetry=arrayModule.symmetryLowerToken)
+        grouped.matrix = groupedGridded( self.matrix.axes, groupedArray, rowGroupBoundaries, rowUnit,
+                columnGroupBoundaries, columnUnit, symmetric )
+        grouped.matrix.ancestor = grouped
         return grouped
 
+    def _groupArray( self, groupBoundaries, groupUnit, flux ) :
+        '''
+        For internal use only. Returns the tuple ( groupedArray, rowGroupBoundaries, rowUnit, columnGroupBoundaries,
+        columnUnit, symmetric ) where groupedArray is the numpy array of self regrouped as described in group and
+        symmetric is True if the regrouped matrix is symmetric with the same row and column group boundaries.
+        '''
+
+        rowAxis = self.matrix.axes[2]
+        if self.matrix.axes[1].style == 'link': columnAxis = rowAxis
+        else:                                   columnAxis = self.matrix.axes[1]
+        rowUnit, columnUnit = groupUnit
+        if( rowUnit is None ) : rowUnit = rowAxis.unit
+        if( columnUnit is None ) : columnUnit = columnAxis.unit
+
+        rowGroupBoundaries = boundariesAsArray( groupBoundaries[0] )
+        columnGroupBoundaries = boundariesAsArray( groupBoundaries[1] )
+        rowBoundaries = boundariesAsArray( rowAxis.values, rowAxis.unit, rowUnit )
+        columnBoundaries = boundariesAsArray( columnAxis.values, columnAxis.unit, columnUnit )
+
+        rowOverlap = overlapMatrix( rowBoundaries, rowGroupBoundaries, flux )
+        sameBases = ( ( columnAxis is rowAxis ) and ( columnUnit == rowUnit ) and
+                numpy.array_equal( columnGroupBoundaries, rowGroupBoundaries ) )
+        if( sameBases ) :
+            columnOverlap = rowOverlap
+        else :
+            columnOverlap = overlapMatrix( columnBoundaries, columnGroupBoundaries, flux )
+        # Some ENDF matrices have one value too many or too few, so fit the overlap matrices to the shape of the array.
+        rowOverlap = fitOverlapMatrix( rowOverlap, self.matrix.array.shape[0] )
+        columnOverlap = fitOverlapMatrix( columnOverlap, self.matrix.array.shape[1] )
+        groupedArray = numpy.dot( rowOverlap, self.matrix.array.dot( columnOverlap.T ) )
+        return( groupedArray, rowGroupBoundaries, rowUnit, columnGroupBoundaries, columnUnit, sameBases and self.isSymmetric( ) )
+
     def removeExtraZeros(self):
         """
         Remove all extra zeros from the underlying matrix
@@ -566,7 +576,7 @@ class covarianceMatrix( ancestryModule.ancestry ):
         if not self.isSymmetric():
             raise ValueError("getUncertaintyVector only applies to symmetric matrices!")
         energies = list( self.matrix.axes[-1].values )
-        diag = numpy.diagonal( self.matrix.array.constructArray() ).copy()
+        diag = self.matrix.array.diagonalValues()
         diag[ diag < 0.0 ] = 0.0
         diag = list( numpy.sqrt( diag ) )
         diag.append( diag[-1] )                             # point corresponding to final energy bin
@@ -583,7 +593,7 @@ class covarianceMatrix( ancestryModule.ancestry ):
         # do we need to convert absolute->relative or vice versa?
         if (relative and self.type==tokens.absoluteToken) or (not relative and self.type==tokens.relativeToken):
             if theData is None:
-                theData = self.ancestor.rowData.link.toPointwise_withLinearXYs(1e-8,1e-8)
+                theData = self.ancestor.findAttributeInAncestry( 'rowData' ).link.toPointwise_withLinearXYs(1e-8,1e-8)
             try:
                 theData = theData.toPointwise_withLinearXYs(1e-8,1e-8)
                 uncert, theData = uncert.mutualify(1e-8, 1e-8, False, theData, 1e-8, 1e-8, False)
@@ -691,3 +701,97 @@ class covarianceMatrix( ancestryModule.ancestry ):
                 energyBounds=energyBounds, ENDFconversionFlag=element.get("ENDFconversionFlag") )
         xPath.pop()
         return CM
+
+def groupedGridded( axes, groupedArray, rowGroupBoundaries, rowUnit, columnGroupBoundaries, columnUnit, symmetric ) :
+    """
+    Returns a gridded instance for the regrouped covariance groupedArray. The labels of the returned axes are taken
+    from axes. If symmetric is True, the column axis is a link to the row axis and only the lower triangle is stored.
+    """
+
+    axes = axes.copy( )
+    axes[2] = axesModule.grid( axes[2].label, 2, rowUnit, style = axesModule.boundariesGridToken,
+            values = valuesModule.values( list( rowGroupBoundaries ) ) )
+    if( symmetric ) :
+        axes[1] = axesModule.grid( axes[1].label, 1, rowUnit, style = axesModule.linkGridToken,
+                values = linkModule.link( link = axes[2].values, relative = True ) )
+        data = groupedArray[numpy.tri( groupedArray.shape[0] ) == 1.0].tolist( )
+        array = arrayModule.full( shape = groupedArray.shape, data = data, symmetry = arrayModule.symmetryLowerToken )
+    else :
+        axes[1] = axesModule.grid( axes[1].label, 1, columnUnit, style = axesModule.boundariesGridToken,
+                values = valuesModule.values( list( columnGroupBoundaries ) ) )
+        array = arrayModule.full( shape = groupedArray.shape, data = groupedArray.flatten( ).tolist( ) )
+    return( griddedModule.gridded( axes = axes, array = array ) )
+
+def boundariesAsArray( boundaries, unitFrom = None, unitTo = None ) :
+    """
+    Returns group boundaries as a numpy array of floats, converted from unitFrom to unitTo if both are given.
+
+    :param boundaries: a list of floats, a numpy array or a :py:class:`xData.values.values` instance
+    """
+
+    if( isinstance( boundaries, valuesModule.values ) ) : boundaries = boundaries.values
+    boundaries = numpy.array( boundaries, dtype = float )
+    if( ( unitFrom is not None ) and ( unitTo is not None ) and ( unitFrom != unitTo ) ) :
+        boundaries *= PQU.convertUnits( 1., unitFrom, unitTo )
+    return( boundaries )
+
+def reciprocal( values ) :
+    """Returns the reciprocal of the numpy array values, with 0 where values is 0."""
+
+    inverse = numpy.zeros( len( values ) )
+    nonZero = values != 0
+    inverse[nonZero] = 1.0 / values[nonZero]
+    return( inverse )
+
+def fitOverlapMatrix( overlap, length ) :
+    """
+    Returns overlap with its number of columns changed to length, by removing columns or appending columns of zeros.
+    """
+
+    if( overlap.shape[1] >= length ) : return( overlap[:,:length] )
+    return( numpy.concatenate( ( overlap, numpy.zeros( ( overlap.shape[0], length - overlap.shape[1] ) ) ), axis = 1 ) )
+
+def overlapMatrix( boundaries, groupBoundaries, flux = None ) :
+    """
+    Returns the matrix m that regroups flat interpolated data f on boundaries onto groupBoundaries as f' = m f. The
+    matrix has shape ( len( groupBoundaries ) - 1, len( boundaries ) - 1 ) and m[i,j] is the length of the overlap
+    of group i of groupBoundaries with group j of boundaries divided by the width of group i. If flux (an XYs1d
+    instance with the same unit as the boundaries) is given, the lengths are replaced by the integrals of flux
+    over them. Only the overlapping pairs of groups, at most len( boundaries ) + len( groupBoundaries ) of them,
+    are calculated.
+
+    :param boundaries: the boundaries of the data's groups, as accepted by boundariesAsArray
+    :param groupBoundaries: the new group boundaries, as accepted by boundariesAsArray
+    :param flux: an optional XYs1d instance
+    """
+
+    boundaries = boundariesAsArray( boundaries )
+    groupBoundaries = boundariesAsArray( groupBoundaries )
+    overlap = numpy.zeros( ( len( groupBoundaries ) - 1, len( boundaries ) - 1 ) )
+    if( 0 in overlap.shape ) : return( overlap )
+
+    points = numpy.union1d( boundaries, groupBoundaries )
+    lows = points[:-1]
+    groupIndices = numpy.searchsorted( groupBoundaries, lows, side = 'right' ) - 1
+    indices = numpy.searchsorted( boundaries, lows, side = 'right' ) - 1
+    inside = ( groupIndices >= 0 ) & ( groupIndices < overlap.shape[0] ) & ( indices >= 0 ) & ( indices < overlap.shape[1] )
+
+    if( flux is None ) :
+        cumulative = points
+        groupCumulative = groupBoundaries
+    else :
+        if( flux.interpolation != standardsModule.interpolation.linlinToken ) :
+            flux = flux.toPointwise_withLinearXYs( accuracy = 1e-4, lowerEps = 1e-8, upperEps = 1e-8 )
+        fluxXs, fluxYs = map( numpy.array, flux.copyDataToXsAndYs( ) )
+        xs = numpy.union1d( points, fluxXs )
+        ys = numpy.interp( xs, fluxXs, fluxYs, left = 0., right = 0. )
+        integrals = numpy.zeros( len( xs ) )
+        integrals[1:] = numpy.cumsum( 0.5 * ( ys[1:] + ys[:-1] ) * numpy.diff( xs ) )
+        cumulative = integrals[numpy.searchsorted( xs, points )]
+        groupCumulative = integrals[numpy.searchsorted( xs, groupBoundaries )]
+
+    numpy.add.at( overlap, ( groupIndices[inside], indices[inside] ), numpy.diff( cumulative )[inside] )
+    widths = numpy.diff( groupCumulative )
+    nonZero = widths != 0
+    overlap[nonZero] /= widths[nonZero][:,numpy.newaxis]
+    return( overlap )
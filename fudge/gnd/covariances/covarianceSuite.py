@@ -67,8 +67,9 @@ Module with containers for covariances in several different forms
 
 import sys
 from xData.ancestry import ancestry
+from xData import XMLWriter as XMLWriterModule
 from fudge.gnd import styles as stylesModule
-from . import section, summed, mixed, modelParameters
+from . import section, base, summed, mixed, modelParameters
 from ..version import GND_VERSION
 
 __metaclass__ = type
@@ -130,9 +131,9 @@ class covarianceSuite( ancestry ):
 
     def saveToOpenedFile( self, fOut, **kwargs ) :
 
-        xmlString = self.toXMLList( **kwargs )
-        fOut.write( '\n'.join( xmlString ) )
-        fOut.write( '\n' )
+        writer = XMLWriterModule.XMLWriter( fOut )
+        self.toXMLStream( writer, **kwargs )
+        writer.close( )
 
     def saveToFile( self, fileName, **kwargs ):
 
@@ -281,33 +282,74 @@ class covarianceSuite( ancestry ):
                         if hasattr(covar, "removeExtraZeros"):
                             covar.removeExtraZeros()
     
+    def group( self, groupBoundaries, groupUnit, flux = None, skipIncompatible = False ):
+        """
+        Regroups the covariance of each section onto new group boundaries and returns an OrderedDict of
+        :py:class:`base.covarianceMatrix` instances keyed by section label. Self is not modified.
+
+        :param groupBoundaries: the new group boundaries. Either a list of boundaries used for both rows and
+            columns, or a tuple of ( rowBoundaries, columnBoundaries ).
+        :param groupUnit: the unit of groupBoundaries. Either a unit used for both rows and columns, or a tuple
+            of ( rowUnit, columnUnit ).
+        :param flux: optional XYs1d flux used to weight the regrouping (see base.covarianceMatrix.group).
+        :param skipIncompatible: if True, sections whose components cannot be summed (e.g. a mixture of absolute
+            and relative matrices) are left out of the result instead of raising a ValueError.
+        """
+
+        import collections
+
+        if( isinstance( groupBoundaries, tuple ) ) :
+            if( len( groupBoundaries ) != 2 ) : raise ValueError( 'groupBoundaries tuple must have length 2' )
+        else :
+            groupBoundaries = ( groupBoundaries, groupBoundaries )
+        if( not( isinstance( groupUnit, tuple ) ) ) : groupUnit = ( groupUnit, groupUnit )
+
+        groupedSections = collections.OrderedDict( )
+        for section_ in self.sections :
+            form = section_[0]
+            if( isinstance( form, mixed.mixedForm ) ) :
+                grouper = form.group
+            elif( isinstance( form, ( base.covarianceMatrix, summed.summedCovariance ) ) ) :
+                grouper = form.toCovarianceMatrix( ).group
+            else :      # e.g. LegendreOrderCovarianceForm, which is not a function of incident energy groups only.
+                continue
+            try :
+                groupedSections[section_.label] = grouper( groupBoundaries, groupUnit, flux = flux )
+            except ValueError :
+                if( not( skipIncompatible ) ) : raise
+        return( groupedSections )
+
     def toXMLList( self, indent = '', **kwargs ) :
         """Write self out to GND-XML"""
 
+        return XMLWriterModule.toXMLList( self, indent, **kwargs )
+
+    def toXMLStream( self, writer, indent = '', **kwargs ) :
+        """Write self out to GND-XML, one section at a time (see xData.XMLWriter)"""
+
         incrementalIndent = kwargs.get( 'incrementalIndent', '  ' )
         indent2 = indent + incrementalIndent
         indent3 = indent2 + incrementalIndent
 
-        xmlString = [ '%s<%s projectile="%s" target="%s" version="%s"'
-                % ( indent, self.moniker, self.projectile, self.target, self.version ) ]
-        xmlString[-1] += ' xmlns:xlink="http://www.w3.org/1999/xlink">'
-        xmlString += self.styles.toXMLList( indent2, **kwargs )
+        writer.writeLine( '%s<%s projectile="%s" target="%s" version="%s"'
+                % ( indent, self.moniker, self.projectile, self.target, self.version ) )
+        writer.appendToLastLine( ' xmlns:xlink="http://www.w3.org/1999/xlink">' )
+        writer.write( self.styles, indent2, **kwargs )
         if self.reactionSums:
-            xmlString += [ indent2 + '<reactionSums>',
-                indent3 + '<!-- Covariances may be given for a sum of several reactions. Define these "summed reactions" here: -->' ]
+            writer.writeLines( [ indent2 + '<reactionSums>',
+                indent3 + '<!-- Covariances may be given for a sum of several reactions. Define these "summed reactions" here: -->' ] )
             for reactionSum in self.reactionSums:
-                xmlString += reactionSum.toXMLList( indent3, **kwargs )
-            xmlString[-1] += '</reactionSums>'
+                writer.write( reactionSum, indent3, **kwargs )
+            writer.appendToLastLine( '</reactionSums>' )
         if self.externalReactions:
-            xmlString += [ indent2 + '<externalReactions>',
-                indent3 + "<!-- This target has covariances with reactions on different target(s). List other target/reactions: -->" ]
+            writer.writeLines( [ indent2 + '<externalReactions>',
+                indent3 + "<!-- This target has covariances with reactions on different target(s). List other target/reactions: -->" ] )
             for externalReaction_ in self.externalReactions:
-                xmlString += externalReaction_.toXMLList( indent3, **kwargs )
-            xmlString[-1] += '</externalReactions>'
+                writer.write( externalReaction_, indent3, **kwargs )
+            writer.appendToLastLine( '</externalReactions>' )
         for section_ in self.sections + self.modelParameterCovariances:
-            xmlString += section_.toXMLList( indent2, **kwargs )
-        xmlString.append( indent + '</%s>' % self.moniker )
-        return xmlString
+            writer.write( section_, indent2, **kwargs )
+        writer.writeLine( indent + '</%s>' % self.moniker )
 
     @staticmethod
     def parseXMLNode( CSelement, xPath, linkData ):
@@ -64,6 +64,7 @@
 from xData.ancestry import ancestry
 from xData import gridded as griddedModule
 from xData import axes as axesModule
+from . import tokens
 import copy
 
 __metaclass__ = type
@@ -205,63 +206,42 @@ class mixedForm( ancestry ):
 
     def toCovarianceMatrix( self ):
         """
-        Sum all parts together to build a single matrix.
-        FIXME: currently breaks if the 'mixed' section contains a mixture of absolute/relative/correlation matrices.
+        Sum all parts together to build a single matrix on the union of the components' group boundaries.
+        If the parts are a mixture of absolute and relative matrices, the result is absolute.
+        FIXME: currently breaks if the 'mixed' section contains correlation matrices.
         """
         if len( self.components ) == 1: return self.components[0].toCovarianceMatrix()
-        import fudge.gnd.covariances.base as base
         import numpy
-        import xData.values as valuesModule
-        import xData.array as arrayModule
-
-        # set up common data using first component
-        firstCovMtx = self.components[0].toCovarianceMatrix()
-        commonRowAxis = copy.copy( firstCovMtx.matrix.axes[2] )
-        if firstCovMtx.matrix.axes[1].style=='link':
-            commonColAxis = copy.copy( firstCovMtx.matrix.axes[2] )
-        else:
-            commonColAxis = copy.copy( firstCovMtx.matrix.axes[1] )
-        commonMatrixAxis = copy.copy( firstCovMtx.matrix.axes[0] )
-        commonType = firstCovMtx.type
-
-        # We're going to have to merge grids, so we'll need this function to do the dirty work
-        def add_values(v1,v2):
-            v=set()
-            v.update(v1.values)
-            v.update(v2.values)
-            return valuesModule.values(sorted(v))
-
-        # first pass through components is to collect bins to set up the common grid + do assorted checking
-        for c in self.components[1:]:
-            cc = c.toCovarianceMatrix() # a little recursion to take care of nested covariances
-            if cc.type != commonType:
-                raise ValueError( "Incompatible types in %s: %s vs. %s" % (self.__class__, commonType, cc.type) )
-            if cc.matrix.axes[0].unit !=  commonMatrixAxis.unit: raise ValueError("covariance matrix components with different units?!? %s vs. %s"%(cc.matrix.axes[0].unit, commonMatrixAxis.unit))
-            if cc.matrix.axes[1].style != 'link': cc.matrix.axes[1].convertToUnit(commonColAxis.unit)
-            cc.matrix.axes[2].convertToUnit(commonRowAxis.unit)
-            commonRowAxis.__values = add_values(commonRowAxis.values, cc.matrix.axes[2].values)
-            if cc.matrix.axes[1].style == 'link': commonColAxis.__values = add_values(commonColAxis.values, cc.matrix.axes[2].values)
-            else:                                 commonColAxis.__values = add_values(commonColAxis.values, cc.matrix.axes[1].values)
-
-        # now sum up the components
-        commonMatrix = numpy.mat( firstCovMtx.group( ( commonRowAxis.values, commonColAxis.values ), ( commonRowAxis.unit, commonColAxis.unit ) ).matrix.array.constructArray() )
-        for c in self.components[1:]:
-            cc = c.toCovarianceMatrix() # a little recursion to take care of nested covariances
-            commonMatrix += numpy.mat( cc.group( ( commonRowAxis.values, commonColAxis.values ), ( commonRowAxis.unit, commonColAxis.unit ) ).matrix.array.constructArray() )
-        
-        # now create the instance of the resulting covarianceMatrix
-        if all( [component.matrix.axes[1].style == 'link' for component in self.components] ):  commonColAxis = self.components[0].matrix.axes[1].copy()
-        newAxes=axesModule.axes(
-                labelsUnits={0 : (commonMatrixAxis.label, commonMatrixAxis.unit),
-                             1 : (commonColAxis.label, commonColAxis.unit),
-                             2 : (commonRowAxis.label, commonRowAxis.unit)} )
-        newAxes[0]=commonMatrixAxis
-        newAxes[1]=commonColAxis
-        newAxes[2]=commonRowAxis
-        trigdata = commonMatrix[numpy.tri(commonMatrix.shape[0])==1.0].tolist()[0]
-        gridded = griddedModule.gridded( axes=newAxes, array=arrayModule.full(shape=commonMatrix.shape,data=trigdata,symmetry=arrayModule.symmetryLowerToken) )
-
-        return base.covarianceMatrix( type=commonType, matrix=gridded )
+        import fudge.gnd.covariances.base as base
+
+        covarianceMatrices = [ c.toCovarianceMatrix() for c in self.components ] # a little recursion to take care of nested covariances
+        firstCovMtx = covarianceMatrices[0]
+        rowUnit = firstCovMtx.matrix.axes[2].unit
+        if firstCovMtx.matrix.axes[1].style=='link': colUnit = rowUnit
+        else:                                        colUnit = firstCovMtx.matrix.axes[1].unit
+
+        # collect the bins of all components to set up the common grid
+        rowBoundaries, colBoundaries = [], []
+        for cc in covarianceMatrices:
+            rowBoundaries.append( base.boundariesAsArray( cc.matrix.axes[2].values, cc.matrix.axes[2].unit, rowUnit ) )
+            if cc.matrix.axes[1].style=='link': colBoundaries.append( base.boundariesAsArray( cc.matrix.axes[2].values, cc.matrix.axes[2].unit, colUnit ) )
+            else:                               colBoundaries.append( base.boundariesAsArray( cc.matrix.axes[1].values, cc.matrix.axes[1].unit, colUnit ) )
+        groupBoundaries = ( numpy.unique( numpy.concatenate( rowBoundaries ) ), numpy.unique( numpy.concatenate( colBoundaries ) ) )
+
+        result = sumGroupedCovariances( covarianceMatrices, groupBoundaries, ( rowUnit, colUnit ), self.label )
+        result.setAncestor( self )      # so that the result can still find the section's rowData and columnData
+        return result
+
+    def group( self, groupBoundaries = ( None, None ), groupUnit = ( None, None ), flux = None ):
+        """
+        Regroups each component onto groupBoundaries and returns their sum as a covarianceMatrix.
+        See :py:meth:`fudge.gnd.covariances.base.covarianceMatrix.group` for the arguments.
+        """
+
+        covarianceMatrices = [ c.toCovarianceMatrix() for c in self.components ]
+        result = sumGroupedCovariances( covarianceMatrices, groupBoundaries, groupUnit, self.label, flux = flux )
+        result.setAncestor( self )
+        return result
 
     def toAbsolute( self, rowData=None, colData=None ): 
         '''
@@ -342,3 +322,41 @@ class mixedForm( ancestry ):
         for i,form in enumerate( mixed_.components ): form.index = i
         xPath.pop()
         return mixed_
+
+def sumGroupedCovariances( covarianceMatrices, groupBoundaries, groupUnit, label, flux = None, coefficients = None ):
+    """
+    Regroups each covarianceMatrix in covarianceMatrices onto groupBoundaries and returns their sum as a covarianceMatrix.
+    If covarianceMatrices contains both absolute and relative matrices, each is converted to absolute (using the data
+    its section points to) before summing. All covarianceMatrices must then have the same type and matrix unit. If
+    coefficients is not None, each regrouped matrix is scaled by its coefficient before summing. The returned
+    covarianceMatrix is labeled label.
+    """
+
+    types = set( [ cc.type for cc in covarianceMatrices ] )
+    if len( types ) > 1 and types <= set( [ tokens.absoluteToken, tokens.relativeToken ] ):
+        covarianceMatrices = [ cc.toAbsolute() for cc in covarianceMatrices ]
+
+    firstCovMtx = covarianceMatrices[0]
+    commonType = firstCovMtx.type
+    for cc in covarianceMatrices[1:]:
+        if cc.type != commonType:
+            raise ValueError( "Incompatible types in %s: %s vs. %s" % (label, commonType, cc.type) )
+        if cc.matrix.axes[0].unit != firstCovMtx.matrix.axes[0].unit:
+            raise ValueError("covariance matrix components with different units?!? %s vs. %s"%(cc.matrix.axes[0].unit, firstCovMtx.matrix.axes[0].unit))
+
+    import fudge.gnd.covariances.base as base
+
+    if coefficients is None: coefficients = len( covarianceMatrices ) * [ 1 ]
+
+    commonMatrix, rowGroupBoundaries, rowUnit, colGroupBoundaries, colUnit, symmetric = \
+            firstCovMtx._groupArray( groupBoundaries, groupUnit, flux )
+    commonMatrix *= coefficients[0]
+    for coefficient, cc in zip( coefficients[1:], covarianceMatrices[1:] ):
+        ccMatrix, ccRowGroupBoundaries, ccRowUnit, ccColGroupBoundaries, ccColUnit, ccSymmetric = \
+                cc._groupArray( ( rowGroupBoundaries, colGroupBoundaries ), ( rowUnit, colUnit ), flux )
+        commonMatrix += coefficient * ccMatrix
+        symmetric = symmetric and ccSymmetric
+
+    gridded = base.groupedGridded( firstCovMtx.matrix.axes, commonMatrix, rowGroupBoundaries, rowUnit, colGroupBoundaries,
+            colUnit, symmetric )
+    return base.covarianceMatrix( label, type=commonType, matrix=gridded )
@@ -121,64 +121,39 @@ class summedCovariance( ancestry ):
         Note, each part must be converted to an absolute covariance before summing.
         '''
         if len( self.pointerList ) == 1: return self.pointerList[0].link['eval'].toCovarianceMatrix()
-        import numpy, copy
-        from .mixed import mixedForm
-        from xData import values as valuesModule
-        from xData import axes as axesModule
-        from xData import array as arrayModule
-        from xData import gridded as griddedModule
+        import numpy
+        from .mixed import mixedForm, sumGroupedCovariances
+        from .base import boundariesAsArray
 
         # utility function to get a component as an absolute matrix over the correct row/column bounds
         # need special coding if mixed since only need the part of a mixedForm that overlaps with the current 
         # covariance
         def __get_abs_cov_mtx( ptr ):
             c = ptr.link['eval']
-            if isinstance( c, mixedForm ): c=c.shrinkToBounds(self.getRowBounds())
+            if isinstance( c, mixedForm ):
+                shrunk = c.shrinkToBounds(self.getRowBounds())
+                if len( shrunk ) > 0: c = shrunk      # otherwise no component fits inside the bounds, so use all of them
             return c.toCovarianceMatrix()
-        
-        # set up common data using first element in pointerList
-        firstCovMtx = __get_abs_cov_mtx(self.pointerList[0]) #.link['eval'].toCovarianceMatrix().toAbsolute()
-        commonRowAxis = copy.copy( firstCovMtx.matrix.axes[2] )
-        if firstCovMtx.matrix.axes[1].style=='link': commonColAxis = copy.copy( firstCovMtx.matrix.axes[2] )
-        else:                                        commonColAxis = copy.copy( firstCovMtx.matrix.axes[1] )
-        commonMatrixAxis = copy.copy( firstCovMtx.matrix.axes[0] )
-        commonType = firstCovMtx.type
+
+        covarianceMatrices = [ __get_abs_cov_mtx( p ) for p in self.pointerList ]
+        firstCovMtx = covarianceMatrices[0]
+        rowUnit = firstCovMtx.matrix.axes[2].unit
+        if firstCovMtx.matrix.axes[1].style=='link': colUnit = rowUnit
+        else:                                        colUnit = firstCovMtx.matrix.axes[1].unit
+
+        # collect the bins of all components to set up the common grid
+        rowBoundaries, colBoundaries = [], []
+        for cc in covarianceMatrices:
+            rowBoundaries.append( boundariesAsArray( cc.matrix.axes[2].values, cc.matrix.axes[2].unit, rowUnit ) )
+            if cc.matrix.axes[1].style=='link': colBoundaries.append( boundariesAsArray( cc.matrix.axes[2].values, cc.matrix.axes[2].unit, colUnit ) )
+            else:                               colBoundaries.append( boundariesAsArray( cc.matrix.axes[1].values, cc.matrix.axes[1].unit, colUnit ) )
+        groupBoundaries = ( numpy.unique( numpy.concatenate( rowBoundaries ) ), numpy.unique( numpy.concatenate( colBoundaries ) ) )
+
         coefficients = [ p['coefficient'] for p in self.pointerList ]
-        
-        # We're going to have to merge grids, so we'll need this function to do the dirty work
-        def add_values(v1,v2):
-            v=set()
-            v.update(v1.values)
-            v.update(v2.values)
-            return valuesModule.values(sorted(v))
-
-        # first pass through components is to collect bins to set up the common grid + do assorted checking
-        for p in self.pointerList[1:]:
-            cc = __get_abs_cov_mtx(p) #.link['eval'].toCovarianceMatrix().toAbsolute() # a little recursion to take care of nested covariances
-            if cc.type != commonType: raise ValueError( "Incompatable types in "+str(self.__class__)+": "+str(commonType)+' vs. '+str(cc.type) )
-            cc.matrix.axes[0].unit = commonMatrixAxis.unit
-            cc.matrix.axes[1].convertToUnit(commonColAxis.unit)
-            cc.matrix.axes[2].convertToUnit(commonRowAxis.unit)
-            commonRowAxis._values = add_values(commonRowAxis.values, cc.matrix.axes[2].values)
-            if cc.matrix.axes[1].style=='link': commonColAxis.__values = add_values(commonColAxis.values, cc.matrix.axes[2].values)
-            else:                               commonColAxis.__values = add_values(commonColAxis.values, cc.matrix.axes[1].values)
-
-        # now sum up the components
-        commonMatrix = self.pointerList[0]['coefficient'] * firstCovMtx.group( ( commonRowAxis.values, commonColAxis.values ), ( commonRowAxis.unit, commonColAxis.unit ) ).matrix.array.constructArray()
-        for p in self.pointerList[1:]:
-            cc = p.link['eval'].toCovarianceMatrix() # a little recursion to take care of nested covariances
-            commonMatrix += p['coefficient'] * cc.group( ( commonRowAxis.data, commonColAxis.data ), ( commonRowAxis.unit, commonColAxis.unit ) ).matrix.array.constructArray()
-        
-        # now create the instance of the resulting covarianceMatrix
-        newAxes=axesModule.axes(
-                labelsUnits={0 : (commonMatrixAxis.label, commonMatrixAxis.unit),
-                             1 : (commonColAxis.label, commonColAxis.unit),
-                             2 : (commonRowAxis.label, commonRowAxis.unit)} )
-        newAxes[0]=commonMatrixAxis
-        newAxes[1]=commonColAxis
-        newAxes[2]=commonRowAxis
-        trigdata = commonMatrix[numpy.tri(commonMatrix.shape[0])==1.0].tolist()[0]
-        return griddedModule.gridded( axes=newAxes, array=arrayModule.full(shape=commonMatrix.shape,data=trigdata,symmetry=arrayModule.symmetryLowerToken) )
+        result = sumGroupedCovariances( covarianceMatrices, groupBoundaries, ( rowUnit, colUnit ), self.label,
+                coefficients = coefficients )
+        result.setAncestor( self )      # so that the result can still find the section's rowData and columnData
+        return result
 
     def toXMLList( self, indent = '', **kwargs ) :
         """
@@ -102,14 +102,14 @@ class Test_covariance_baseClass( TestCaseBase ):
 
     def test_toXMLList(self):
         self.assertXMLListsEqual( HCovariance[1].toXMLList(), '''<section label="1" id="n + H1">
-    <rowData ENDF_MFMT="33,2" xlink:href="/reactionSuite/reactions/reaction[@label='0']/crossSection/XYs[@label='eval']"/>
+    <rowData ENDF_MFMT="33,2" xlink:href="/reactionSuite/reactions/reaction[@label='0']/crossSection/XYs1d[@label='eval']"/>
     <covarianceMatrix label="eval" type="relative">
       <gridded dimension="2">
         <axes>
           <grid index="2" label="row_energy_bounds" unit="eV" style="boundaries">
             <values length="96">1e-5 2e-5 5e-5 1e-4 2e-4 5e-4 1e-3 2e-3 5e-3 1e-2 0.0253 5e-2 0.1 0.2 0.5 1 2 5 10 20 50 1e2 2e2 5e2 1e3 2e3 4e3 6e3 8e3 1e4 1.5e4 2e4 4e4 6e4 8e4 1e5 1.5e5 2e5 3e5 4e5 5e5 6e5 7e5 8e5 9e5 1e6 1.2e6 1.4e6 1.6e6 1.8e6 2e6 2.2e6 2.4e6 2.6e6 2.8e6 3e6 3.2e6 3.4e6 3.6e6 3.8e6 4e6 4.2e6 4.4e6 4.6e6 4.8e6 5e6 5.5e6 6e6 6.5e6 7e6 7.5e6 8e6 8.5e6 9e6 9.5e6 1e7 1.05e7 1.1e7 1.15e7 1.2e7 1.25e7 1.3e7 1.35e7 1.4e7 1.45e7 1.5e7 1.55e7 1.6e7 1.65e7 1.7e7 1.75e7 1.8e7 1.85e7 1.9e7 1.95e7 2e7</values></grid>
           <grid index="1" label="column_energy_bounds" unit="eV" style="link">
-            <link xlink:href="../grid[@index='2']/values"/></grid>
+            <link xlink:href="../../grid[@index='2']/values"/></grid>
           <axis index="0" label="matrix_elements" unit=""/></axes>
         <array shape="95,95" symmetry="lower">
           <values length="4560">1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.715461e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.71546e-6 1.715461e-6 1.715465e-6 1.71546e-6 1.71546e-6 1.715462e-6 1.715462e-6 1.715462e-6 1.715462e-6 1.715462e-6 1.715462e-6 1.715462e-6 1.715462e-6 1.715462e-6 1.715458e-6 1.715462e-6 1.715462e-6 1.715464e-6 1.715462e-6 1.715462e-6 1.715462e-6 1.715462e-6 1.715462e-6 1.715462e-6 1.715462e-6 1.715462e-6 1.715463e-6
@@ -163,7 +163,15 @@ class Test_covariance_baseClass( TestCaseBase ):
     
     def test_toCovarianceMatrix(self): pass
     
-    def test_toCorrelationMatrix(self): pass
+    def test_toCorrelationMatrix(self):
+        import numpy
+        covariance = HCovariance[1]['eval']
+        correlation = covariance.getCorrelationMatrix()
+        self.assertEqual( correlation.array.compression, covariance.matrix.array.compression )
+        variances = covariance.matrix.array.diagonalValues()
+        dense = covariance.matrix.array.constructArray()
+        self.assertTrue( numpy.allclose( correlation.array.constructArray(),
+                dense / numpy.sqrt( numpy.outer( variances, variances ) ), rtol = 1e-12 ) )
     
     def test_getRowBounds(self):
         self.assertEquals( HCovariance[1]['eval'].getRowBounds(), (PQU.PQU( "1.e-5 eV" ), PQU.PQU( "2.e7 eV" )))
@@ -173,29 +181,62 @@ class Test_covariance_baseClass( TestCaseBase ):
     
     def test_toAbsolute_and_toRelative(self): 
         '''
-        The constant covariance in  is 0.01 everywhere and relative.  So, in absolute covariance
-        it is :: 
-        
-            cov(E,E') = sigma(E)*0.0144*sigma(E')
-        
-        With a constant cross section of 1.5 b, the covariance should be (1.5 b)^2*0.0144 = 3.24e-2 b^2
+        Section 1 is a relative covariance. With a constant cross section of 1.5 b, the absolute covariance is
+
+            cov(E,E') = 1.5 b * rel_cov(E,E') * 1.5 b
+
+        and converting it back to relative should give the original matrix.
         '''
-        import fudge.gnd.reactionData.crossSection 
-        XYs1d = fudge.gnd.reactionData.crossSectionXYs1d.
-        ptwise = XYs1d( axes=XYs1d.defaultAxes(), data=[ [1e-5,1.5], [20.0e6,1.5] ] )
-        original = copy.copy(HCovariance[1]['eval'])
+        import numpy
+        import fudge.gnd.reactionData.crossSection as crossSectionModule
+        ptwise = crossSectionModule.XYs1d( axes=crossSectionModule.defaultAxes(), data=[ [1e-5,1.5], [20.0e6,1.5] ] )
+        original = HCovariance[1]['eval']
+        self.assertEqual( original.type, 'relative' )
 
         # start as relative, so first call should do nothing
-        self.assertEqual( HCovariance[1]['eval'].toRelative().toXMLList(), original.toXMLList() )
+        self.assertEqual( original.toRelative().toXMLList(), original.toXMLList() )
 
         # call to absolute better change things
-        self.assertEqual(
-            HCovariance[1]['eval'].toAbsolute(ptwise).toXMLList(),
-            [ x.replace('relative','absolute').replace('1.44','3.24') for x in original.toXMLList() ] )
+        absolute = original.toAbsolute(ptwise)
+        self.assertEqual( absolute.type, 'absolute' )
+        self.assertEqual( absolute.matrix.axes[0].unit, 'b**2' )
+        self.assertEqual( list( absolute.matrix.axes[2].values ), list( original.matrix.axes[2].values ) )
+        self.assertTrue( numpy.allclose( absolute.matrix.array.constructArray(),
+                1.5**2 * original.matrix.array.constructArray(), rtol = 1e-12, atol = 0 ) )
     
         # call to relative better bring us back
-        self.assertEqual( HCovariance[1].toRelative(ptwise).toXMLList(), original.toXMLList() )
+        relative = absolute.toRelative(ptwise)
+        self.assertEqual( relative.type, 'relative' )
+        self.assertEqual( relative.matrix.axes[0].unit, '' )
+        self.assertTrue( numpy.allclose( relative.matrix.array.constructArray(),
+                original.matrix.array.constructArray(), rtol = 1e-12, atol = 0 ) )
     
+    def test_toAbsolute_explicitColumnAxis(self):
+        '''
+        A symmetric matrix with its own (not linked) column axis that is scaled by different row and column data is
+        no longer symmetric, so the absolute matrix is stored in full.
+        '''
+        import numpy
+        import fudge.gnd.reactionData.crossSection as crossSectionModule
+        from xData import axes as axesModule, gridded as griddedModule
+        original = HCovariance[1]['eval']
+        self.assertNotEqual( original.matrix.array.symmetry, 'none' )
+        axes = original.matrix.axes.copy()
+        rowAxis = axes[2]
+        axes[1] = axesModule.grid( 'column_energy_bounds', 1, rowAxis.unit, rowAxis.style, rowAxis.values.copy(),
+                interpolation = rowAxis.interpolation )
+        covariance = copy.copy( original )
+        covariance.matrix = griddedModule.gridded( axes, original.matrix.array.copy() )
+
+        rowData = crossSectionModule.XYs1d( axes=crossSectionModule.defaultAxes(), data=[ [1e-5,1.5], [20.0e6,1.5] ] )
+        colData = crossSectionModule.XYs1d( axes=crossSectionModule.defaultAxes(), data=[ [1e-5,1.0], [20.0e6,3.0] ] )
+        absolute = covariance.toAbsolute( rowData, colData )
+        self.assertEqual( absolute.matrix.array.symmetry, 'none' )
+        columnScale = numpy.array( colData.group( list( rowAxis.values ), norm = 'dx' ) )
+        self.assertTrue( numpy.allclose( absolute.matrix.array.constructArray(),
+                original.matrix.array.constructArray() * numpy.outer( 1.5 * numpy.ones( len( columnScale ) ), columnScale ),
+                rtol = 1e-12, atol = 0 ) )
+
     def test_check(self): 
         self.assertItemsEqual( HCovariance[1].check({
             'checkUncLimits':False,
@@ -204,7 +245,29 @@ class Test_covariance_baseClass( TestCaseBase ):
     
     def test_fix(self): pass
     
-    def test_group(self): pass
+    def test_group(self):
+        import numpy
+        original = HCovariance[1]['eval']
+        boundaries = list( original.matrix.axes[2].values )
+        originalArray = original.matrix.array.constructArray()
+        nGroups = len( boundaries ) - 1
+
+        # regrouping onto the original boundaries changes nothing
+        same = original.group( ( boundaries, boundaries ), ( 'eV', 'eV' ) )
+        self.assertEqual( list( same.matrix.axes[2].values ), boundaries )
+        self.assertTrue( numpy.allclose( same.matrix.array.constructArray(), originalArray[:nGroups,:nGroups], rtol = 1e-12 ) )
+
+        # merging pairs of groups gives the width weighted average of each 2x2 block
+        coarse = boundaries[::2]
+        if( coarse[-1] != boundaries[-1] ) : coarse.append( boundaries[-1] )
+        grouped = original.group( ( coarse, coarse ), ( 'eV', 'eV' ) ).matrix.array.constructArray()
+        widths = numpy.diff( boundaries )
+        block = originalArray[:2,:2]
+        expected = numpy.dot( numpy.dot( widths[:2], block ), widths[:2] ) / widths[:2].sum()**2
+        self.assertAlmostEqual( grouped[0,0], expected, delta = 1e-12 * abs( expected ) )
+
+        # the boundaries of self are untouched
+        self.assertEqual( list( original.matrix.axes[2].values ), boundaries )
     
     def test_removeExtraZeros(self): pass
     
@@ -68,6 +68,7 @@ import base, miscellaneous
 import fudge
 from fudge.core.utilities import brb
 from fudge.core.math import fudgemath as fudgemathModule
+from numericalFunctions import integration as integrationModule
 
 from pqu import PQU
 
@@ -202,32 +203,19 @@ class form( baseModule.form ) :
 
     def calculateAverageProductData( self, style, indent = '', **kwargs ) :
 
-        def sqrtE_MuComAverage( f, r, a, tolerance ) :          # This still needs to be tested.?????????
+        def calculateAverageProductDataAtEnergies( self, Eins ) :
 
-            def u_mu_func( energy_out, parameters ) :
-
-                a = parameters[2].evaluate( energy_out )
-                if( abs( a ) < 1e-2 ) :
-                    a2 = a * a
-                    csa = a * ( 315. + a2 * ( -21. + 2. * a2 ) ) / 945.
-                else :
-                    csa = math.cosh( a ) / math.sinh( a ) - 1. / a
-                return( math.sqrt( energy_out ) * parameters[0].evaluate( energy_out ) * parameters[1].evaluate( energy_out ) * csa )
-
-            epMin = max( f.domainMin( ), r.domainMin( ), a.domainMin( ) )
-            epMax = min( f.domainMax( ), r.domainMax( ), a.domainMax( ) )
-            _sqrtE_mu_com, quadInfo = miscellaneous.GnG_adaptiveQuadrature( u_mu_func, epMin, epMax, [ f, r, a ], miscellaneous.GaussQuadrature2, tolerance )
-            return( _sqrtE_mu_com )
-
-        def calculateAverageProductDataAtEnergy( self, Ein ) :
-
-            f, r, a = self.KalbackMannSelf.getFRAatEnergy_asLinearPointwise( Ein )
-            E_com = self.m1x * Ein
-            Ex_com = f.integrateWithWeight_x( )
-            _sqrtE_mu_com = sqrtE_MuComAverage( f, r, a, energyAccuracy )
-            E_mu = 2. * math.sqrt( self.m1x * Ein ) * _sqrtE_mu_com
-            multi = self.multiplicity.getValue( Ein )
-            return( multi * ( E_com + Ex_com + E_mu ), multi * math.sqrt( 2. * massx ) * ( math.sqrt( m1x * Ein ) + _sqrtE_mu_com ) )
+            FRAs = [ self.KalbackMannSelf.getFRAatEnergy_asLinearPointwise( Ein ) for Ein in Eins ]
+            _sqrtE_mu_coms = integrationModule.KalbachMann_sqrtEp_MuAverages( 2,
+                    [ [ function.copyDataToXYs( ) for function in FRA ] for FRA in FRAs ], energyAccuracy )
+            averages = []
+            for Ein, ( f, r, a ), _sqrtE_mu_com in zip( Eins, FRAs, _sqrtE_mu_coms ) :
+                E_com = self.m1x * Ein
+                Ex_com = f.integrateWithWeight_x( )
+                E_mu = 2. * math.sqrt( self.m1x * Ein ) * _sqrtE_mu_com
+                multi = self.multiplicity.getValue( Ein )
+                averages.append( ( multi * ( E_com + Ex_com + E_mu ), multi * math.sqrt( 2. * massx ) * ( math.sqrt( m1x * Ein ) + _sqrtE_mu_com ) ) )
+            return( averages )
 
         class calculateDepositionInfo :
 
@@ -241,7 +229,7 @@ class form( baseModule.form ) :
 
             def evaluateAtX( self, E ) :
 
-                Eout, pout = calculateAverageProductDataAtEnergy( self, E )
+                Eout, pout = calculateAverageProductDataAtEnergies( self, [ E ] )[0]
                 if( self.mode == 0 ) : return( Eout, pout )
                 if( self.mode == 1 ) : return( Eout )
                 return( pout )
@@ -278,8 +266,7 @@ class form( baseModule.form ) :
         while( Es[0] < EMin ) : del Es[0]
         aveEnergy = []
         aveMomentum = []
-        for E in Es : 
-            Eout, pout = calculateAverageProductDataAtEnergy( calculationData, E )
+        for E, ( Eout, pout ) in zip( Es, calculateAverageProductDataAtEnergies( calculationData, Es ) ) :
             aveEnergy.append( [ E, Eout ] )
             aveMomentum.append( [ E, pout ] )
 
@@ -382,7 +369,7 @@ class form( baseModule.form ) :
     def domainUnitConversionFactor( self, unitTo ) :
 
         if( unitTo is None ) : return( 1. )
-        return( PQU.PQU( '1 ' + self.domainUnit( ) ).getValueAs( unitTo ) )
+        return( PQU.convertUnits( 1., self.domainUnit( ), unitTo ) )
 
     def domainMin( self, unitTo = None, asPQU = False ) :
 
@@ -116,6 +116,9 @@ class component( abstractClassesModule.component ) :
         """
         Overrides ancestry.findEntity. Need ability to find specific distribution component
         """
+        if( ( attribute == 'label' ) and ( value in self ) ) :    # Only parses the requested form when read lazily.
+            entity = self[value]
+            if( entity.moniker == entityName ) : return( entity )
         if attribute is not None:
             for entity in self:
                 if entity.moniker == entityName and getattr(entity,attribute) == value:
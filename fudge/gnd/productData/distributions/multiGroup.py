@@ -76,6 +76,23 @@ noExtrapolationToken = 'noExtrapolation'
 
 __metaclass__ = type
 
+def dataToString( values, self, indent = '', **kwargs ) :
+    """
+    Writes each run of the flattened array self's data on its own line. This is a module function (rather than just a
+    staticmethod of multiGroup) so that an array holding it as its dataToString can be pickled.
+    """
+
+    valueFormatter = kwargs['valueFormatter']
+    sep = kwargs.get( 'sep', values.sep )
+
+    XMLStrList = [ ]
+    start = 0
+    for length in self.lengths :
+        strList = [ valueFormatter( self.data[i1] ) for i1 in range( start, start + length ) ]
+        XMLStrList.append( indent + sep.join( strList ) )
+        start += length
+    return( XMLStrList )
+
 class subform( baseModule.subform ) :
     """
     Abstract base class for multiGroup subforms.
@@ -105,19 +122,7 @@ class multiGroup( subform, griddedModule.gridded ) :
         xPath.pop()
         return GB
 
-    @staticmethod
-    def dataToString( values, self, indent = '', **kwargs ) :
-
-        valueFormatter = kwargs['valueFormatter']
-        sep = kwargs.get( 'sep', values.sep )
-
-        XMLStrList = [ ]
-        start = 0
-        for length in self.lengths :
-            strList = [ valueFormatter( self.data[i1] ) for i1 in range( start, start + length ) ]
-            XMLStrList.append( indent + sep.join( strList ) )
-            start += length
-        return( XMLStrList )
+    dataToString = staticmethod( dataToString )
 
 class form( baseModule.form ) :
 
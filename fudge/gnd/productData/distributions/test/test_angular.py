@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+# <<BEGIN-copyright>>
+# Copyright (c) 2016, Lawrence Livermore National Security, LLC.
+# Produced at the Lawrence Livermore National Laboratory.
+# Written by the LLNL Nuclear Data and Theory group
+#         (email: mattoon1@llnl.gov)
+# LLNL-CODE-683960.
+# All rights reserved.
+# 
+# This file is part of the FUDGE package (For Updating Data and 
+#         Generating Evaluations)
+# 
+# When citing FUDGE, please use the following reference:
+#   C.M. Mattoon, B.R. Beck, N.R. Patel, N.C. Summers, G.W. Hedstrom, D.A. Brown, "Generalized Nuclear Data: A New Structure (with Supporting Infrastructure) for Handling Nuclear Data", Nuclear Data Sheets, Volume 113, Issue 12, December 2012, Pages 3145-3171, ISSN 0090-3752, http://dx.doi.org/10. 1016/j.nds.2012.11.008
+# 
+# 
+#     Please also read this link - Our Notice and Modified BSD License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the disclaimer below.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the disclaimer (as noted below) in the
+#       documentation and/or other materials provided with the distribution.
+#     * Neither the name of LLNS/LLNL nor the names of its contributors may be used
+#       to endorse or promote products derived from this software without specific
+#       prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL LAWRENCE LIVERMORE NATIONAL SECURITY, LLC,
+# THE U.S. DEPARTMENT OF ENERGY OR CONTRIBUTORS BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# 
+# 
+# Additional BSD Notice
+# 
+# 1. This notice is required to be provided under our contract with the U.S.
+# Department of Energy (DOE). This work was produced at Lawrence Livermore
+# National Laboratory under Contract No. DE-AC52-07NA27344 with the DOE.
+# 
+# 2. Neither the United States Government nor Lawrence Livermore National Security,
+# LLC nor any of their employees, makes any warranty, express or implied, or assumes
+# any liability or responsibility for the accuracy, completeness, or usefulness of any
+# information, apparatus, product, or process disclosed, or represents that its use
+# would not infringe privately-owned rights.
+# 
+# 3. Also, reference herein to any specific commercial products, process, or services
+# by trade name, trademark, manufacturer or otherwise does not necessarily constitute
+# or imply its endorsement, recommendation, or favoring by the United States Government
+# or Lawrence Livermore National Security, LLC. The views and opinions of authors expressed
+# herein do not necessarily state or reflect those of the United States Government or
+# Lawrence Livermore National Security, LLC, and shall not be used for advertising or
+# product endorsement purposes.
+# 
+# <<END-copyright>>
+
+"""
+test fudge/gnd/productData/distributions/angular
+"""
+
+import unittest
+from fudge.gnd.productData.distributions.angular import *
+from xData import standards
+
+class TestXYs2d( unittest.TestCase ):
+
+    def setUp(self):
+        axes = XYs2d.defaultAxes( asLegendre = True )
+        self.angular = XYs2d( axes = axes )
+        for index, energy in enumerate( [ 1.0, 10.0, 100.0, 1000.0 ] ) :
+            self.angular.append( Legendre( coefficients = [ 1.0, 0.1 * index, 0.05 ], value = energy, axes = axes ) )
+
+    def test_getBoundingSubFunctions(self):
+        position, function1, function2, frac = self.angular.getBoundingSubFunctions( 55.0 )
+        self.assertEqual( ( position, function1.value, function2.value ), ( '', 10.0, 100.0 ) )
+        self.assertAlmostEqual( frac, 0.5 )
+        self.assertEqual( self.angular.getBoundingSubFunctions( 100.0 )[:2], ( '=', self.angular[2] ) )
+        self.assertEqual( self.angular.getBoundingSubFunctions( 0.5 )[:3], ( '<', self.angular[0], None ) )
+        self.assertEqual( self.angular.getBoundingSubFunctions( 2000.0 )[:3], ( '>', self.angular[-1], None ) )
+        self.angular.insertAtValue( Legendre( coefficients = [ 1.0 ], value = 50.0, axes = self.angular.axes ) )
+        self.assertEqual( self.angular.getBoundingSubFunctions( 55.0 )[1].value, 50.0 )
+
+    def test_evaluate(self):
+        function = self.angular.evaluate( 55.0 )
+        self.assertEqual( function.value, 55.0 )
+        self.assertAlmostEqual( function.evaluate( 1.0 ), 0.5 * ( 0.5 + 1.5 * 0.1 + 2.5 * 0.05 ) + 0.5 * ( 0.5 + 1.5 * 0.2 + 2.5 * 0.05 ), places = 3 )
+
+    def test_setSubFunctionValue(self):
+        self.assertEqual( self.angular.getBoundingSubFunctions( 50.0 )[1:3], ( self.angular[1], self.angular[2] ) )
+        self.angular.evaluate( 50.0 )
+        self.angular[2].value = 20.0
+        self.assertEqual( self.angular.getBoundingSubFunctions( 50.0 )[1:3], ( self.angular[2], self.angular[3] ) )
+        self.assertEqual( self.angular.evaluate( 20.0 ).value, 20.0 )
+        self.assertAlmostEqual( self.angular.evaluate( 20.0 ).evaluate( 1.0 ), self.angular[2].evaluate( 1.0 ) )
+
+    def test_evaluateMany(self):
+        energies = [ 500.0, 2.0, 10.0, 55.0, 0.5, 3000.0 ]
+        functions = self.angular.evaluateMany( energies, extrapolation = standards.flatExtrapolationToken )
+        self.assertEqual( [ function.value for function in functions ], energies )
+        for energy, function in zip( energies, functions ) :
+            self.assertEqual( function.toXMLList( ), self.angular.evaluate( energy, extrapolation = standards.flatExtrapolationToken ).toXMLList( ) )
+        self.assertRaises( Exception, self.angular.evaluateMany, [ 0.5 ] )
+
+if __name__=="__main__":
+    unittest.main()
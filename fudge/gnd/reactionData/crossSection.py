@@ -148,48 +148,45 @@ class XYs1d( baseCrossSectionForm, XYsModule.XYs1d ) :
         """
 
         from crossSectionAdjustForHeatedTarget import heat
-        from pqu import PQU
 
         styles = ancestor.findAttributeInAncestry( 'styles' )
-        from fudge.core.utilities import brb
         evaluated = styles.getEvaluatedStyle( )
-        gotT = currentTemperature = evaluated.temperature
-        if( gotT.isTemperature( ) ) : gotT = PQU.PQU( gotT.getValueAs( 'K' ), 'K' ) * PQU.PQU( '1 k' )
-        gotT = gotT.getValueAs( self.domainUnit( ) )
-
-        if( isinstance( temperature, str ) ) : temperature = PQU.PQU( temperature )
-        _temperature = temperature
-        if( temperature.isTemperature( ) ) :
-            _temperature = PQU.PQU( temperature.getValueAs( 'K' ), 'K' ) * PQU.PQU( '1 k' )
-        wantedT = _temperature.getValueAs( self.domainUnit( ) )
+        currentTemperature = evaluated.temperature
+        gotT = temperatureToEnergy( currentTemperature, self.domainUnit( ) )
+        wantedT = temperatureToEnergy( temperature, self.domainUnit( ) )
 
         dT = wantedT - gotT
         if( abs( dT ) <= 1e-2 * wantedT ) : dT = 0.
         if( dT < 0 ) : raise Exception( 'Current temperature "%s" (%.4e) higher than desired temperature "%s" (%.4e)' % ( currentTemperature, gotT, temperature, wantedT ) ) 
 
-        projectile, target = ancestor.findAttributeInAncestry( 'projectile' ), ancestor.findAttributeInAncestry( 'target' )
-        if( projectile.getMass( 'amu' ) == 0 ) : raise Exception( 'Heating with gamma as projectile not supported.' )
-        massRatio = target.getMass( 'amu' ) / projectile.getMass( 'amu' )
+        massRatio = heatMassRatio( ancestor )
 
         heated = unheated = self
         if( not( unheated.isInterpolationLinear( ) ) ) : unheated = self.toPointwise_withLinearXYs( lowerEps, upperEps )
         if( ( len( unheated ) > 0 ) and ( dT > 0. ) ) :
-            if( isinstance( EMin, str ) ) : EMin = PQU.PQU( EMin )
-            EMin_ = EMin
-            if( not( isinstance( EMin, float ) ) ) : EMin_ = EMin.getValueAs( self.domainUnit( ) )
-            if( not( heatBelowThreshold ) ) : EMin_ = max( unheated.domainMin( ), EMin_ )
-            if( lowerlimit is None ) :
-                lowerlimit = "oneOverV"
-                domainMin = PQU.PQU( 1e-5, 'eV' ).getValueAs( self.domainUnit( ) )
-                if( domainMin < 0.04 * unheated.domainMin( ) ) : lowerlimit = "threshold"
-            if( upperlimit is None ) : upperlimit = 'constant'
-
+            EMin_, lowerlimit, upperlimit = unheated.heatLimits( EMin, lowerlimit, upperlimit, heatBelowThreshold )
             heated = heat.crossSectionAdjustForHeatedTarget( massRatio, dT, EMin_, unheated, lowerlimit = lowerlimit,
                 upperlimit = upperlimit, interpolationAccuracy = interpolationAccuracy, heatAllPoints = heatAllPoints, doNotThin = doNotThin,
                 heatAllEDomain = heatAllEDomain )
         accuracy = max( interpolationAccuracy, self.getAccuracy( ) )
         return( XYs1d( data = heated, axes = unheated.axes, accuracy = accuracy ) )
 
+    def heatLimits( self, EMin, lowerlimit = None, upperlimit = None, heatBelowThreshold = True ) :
+        """
+        Returns the tuple ( EMin, lowerlimit, upperlimit ) passed to crossSectionAdjustForHeatedTarget when self is heated, with
+        EMin as a float in self's domain unit and the defaults for lowerlimit and upperlimit as described in method heat.
+        """
+
+        if( isinstance( EMin, str ) ) : EMin = PQU.PQU( EMin )
+        if( not( isinstance( EMin, float ) ) ) : EMin = EMin.getValueAs( self.domainUnit( ) )
+        if( not( heatBelowThreshold ) ) : EMin = max( self.domainMin( ), EMin )
+        if( lowerlimit is None ) :
+            lowerlimit = "oneOverV"
+            domainMin = PQU.PQU( 1e-5, 'eV' ).getValueAs( self.domainUnit( ) )
+            if( domainMin < 0.04 * self.domainMin( ) ) : lowerlimit = "threshold"
+        if( upperlimit is None ) : upperlimit = 'constant'
+        return( EMin, lowerlimit, upperlimit )
+
     def processSnMultiGroup( self, style, tempInfo, indent ) :
 
         from fudge.processing import miscellaneous as miscellaneousModule
@@ -209,6 +206,10 @@ class XYs1d( baseCrossSectionForm, XYsModule.XYs1d ) :
 
         return( XYsModule.XYs1d.toXMLList( self, indent, **kwargs ) )
 
+    def toXMLStream( self, writer, indent = "", **kwargs ) :
+
+        XYsModule.XYs1d.toXMLStream( self, writer, indent, **kwargs )
+
 class regions1d( baseCrossSectionForm, regionsModule.regions1d ) :
     """
     This class stores a cross section in two or more regions, which may have different interpolations.
@@ -472,6 +473,45 @@ def defaultAxes( energyUnit = 'eV', crossSectionUnit = 'b' ) :
     axes[1] = axesModule.axis( 'energy_in', 1, energyUnit )
     return( axes )
 
+def temperatureToEnergy( temperature, unit ) :
+    """
+    Returns temperature (a PQU or a string) as a float in the energy unit unit. A temperature in kelvins is converted using
+    Boltzmann's constant.
+    """
+
+    if( isinstance( temperature, str ) ) : temperature = PQU.PQU( temperature )
+    if( temperature.isTemperature( ) ) : temperature = PQU.PQU( temperature.getValueAs( 'K' ), 'K' ) * PQU.PQU( '1 k' )
+    return( temperature.getValueAs( unit ) )
+
+def heatMassRatio( ancestor ) :
+    """Returns the target to projectile mass ratio used to heat cross sections of the reactionSuite containing ancestor."""
+
+    projectile, target = ancestor.findAttributeInAncestry( 'projectile' ), ancestor.findAttributeInAncestry( 'target' )
+    if( projectile.getMass( 'amu' ) == 0 ) : raise Exception( 'Heating with gamma as projectile not supported.' )
+    return( target.getMass( 'amu' ) / projectile.getMass( 'amu' ) )
+
+def heatToTemperatures( arguments ) :
+    """
+    Heats the linear cross section data E_cs (a list of [ energy, cross section ] pairs) by each of the temperature differences
+    dTs (in ascending order and in the same unit as energy) and returns the list of heated data, one for each dT. If
+    incremental is True, the data for dTs[i] are the data for dTs[i-1] heated by dTs[i] - dTs[i-1], as a convolution with
+    the free gas kernel at T1 followed by one at T2 - T1 is a convolution at T2. Otherwise, each is heated from E_cs.
+    The arguments are packed into one tuple ( massRatio, dTs, EMin, E_cs, incremental, kwargs ), with kwargs the keyword
+    arguments for crossSectionAdjustForHeatedTarget, so that this function can be called by multiprocessing.Pool.map.
+    """
+
+    from crossSectionAdjustForHeatedTarget import heat
+
+    massRatio, dTs, EMin, E_cs, incremental, kwargs = arguments
+    heatedList, heated, previousT = [], E_cs, 0.
+    for dT in dTs :
+        if( not( incremental ) ) : heated, previousT = E_cs, 0.
+        if( ( len( heated ) > 0 ) and ( dT > previousT ) ) :
+            heated = heat.crossSectionAdjustForHeatedTarget( massRatio, dT - previousT, EMin, heated, **kwargs )
+            previousT = dT
+        heatedList.append( heated )
+    return( heatedList )
+
 def chargeParticle_changeInterpolationSubFunction( threshold, x, x1, y1, x2, y2 ) :
 
     B = math.log( x2 * y2 / ( x1 * y1 ) ) / ( 1. / math.sqrt( x1 - threshold ) - 1. / math.sqrt( x2 - threshold ) )
@@ -502,7 +542,7 @@ class component( abstractClassesModule.component ) :
     def domainUnitConversionFactor( self, unitTo ) :
 
         if( unitTo is None ) : return( 1. )
-        return( PQU.PQU( '1 ' + self.domainUnit( ) ).getValueAs( unitTo ) )
+        return( PQU.convertUnits( 1., self.domainUnit( ), unitTo ) )
 
     def domain( self, unitTo = None, asPQU = False ) :
 
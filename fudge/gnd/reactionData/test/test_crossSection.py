@@ -105,6 +105,47 @@ class TestPointwise( unittest.TestCase ):
                 XYs.xAxisIndex : ( 'energy_in', 'eV' ) }), data=[ [1e-5,1.0], [20.0e6,1.0] ] )
         self.assertEqual(ptwise_const.evaluate( 10.0e6 ), 1.0 )
 
+    def test_evaluateNumpy(self):
+        import numpy
+        ptwise=XYs1d(axes=XYs1d.defaultAxes(), data=[ [1.0,1.0], [3.0,5.0] ] )
+        for x in ( numpy.float64( 2.0 ), numpy.array( 2.0 ), numpy.array( [ 2.0 ] )[0], numpy.array( [ 2.0 ] )[()] ):
+            self.assertEqual( ptwise.evaluate( x ), 3.0 )
+        self.assertEqual( list( ptwise.evaluate( numpy.array( [ 1.0, 2.0 ] ) ) ), [ 1.0, 3.0 ] )
+        self.assertEqual( list( ptwise.evaluate( [ 2.0, 3.0 ] ) ), [ 3.0, 5.0 ] )
+
+    def test_sumOnUnionGrid(self):
+        from xData import unionGrid
+        ptwises = [ XYs1d(axes=XYs1d.defaultAxes(), data=data) for data in [
+            [ [1e-5,1.0], [1.0,2.0], [20.0e6,1.0] ],
+            [ [1e6,0.5], [1.5e6,1.5], [20.0e6,1.0] ],
+            [ [1e-5,3.0], [2.0,2.0], [1e3,1.0], [1e7,0.2] ] ] ]
+        sum_ = ptwises[0]
+        for ptwise in ptwises[1:]:
+            sum_, current = sum_.mutualify( 1e-8, 1e-8, 0, ptwise, 1e-8, 1e-8, 0 )
+            sum_ = sum_ + current
+        unionSum = unionGrid.sumOnUnionGrid( ptwises, 1e-8, 1e-8 )
+        self.assertTrue( isinstance( unionSum, XYs1d ) )
+        self.assertEqual( unionSum.domainGrid(), sum_.domainGrid() )
+        for (x1,y1), (x2,y2) in zip( unionSum.copyDataToXYs(), sum_.copyDataToXYs() ):
+            self.assertAlmostEqual( y1, y2, places=12 )
+
+    def test_unionGridDiscontinuities(self):
+        # like the ACE total cross section: a threshold reaction starting at a non-zero value and one ending early
+        from xData import unionGrid
+        ptwises = [ XYs1d(axes=XYs1d.defaultAxes(), data=data) for data in [
+            [ [0.0,10.0], [20.0,2.0] ],
+            [ [0.0,5.0], [10.0,1.0], [20.0,0.5] ],
+            [ [5.0,2.0], [20.0,5.0] ],
+            [ [0.0,1.0], [15.0,1.0] ] ] ]
+        self.assertEqual( unionGrid.discontinuities( ptwises ), [ 5.0, 15.0 ] )
+        grid = unionGrid.unionGrid( ptwises )
+        self.assertEqual( grid.tolist(), [ 0.0, 5.0, 5.0, 10.0, 15.0, 15.0, 20.0 ] )
+        self.assertEqual( unionGrid.evaluateOnGrid( ptwises[2], grid ).tolist(), [ 0.0, 0.0, 2.0, 3.0, 4.0, 4.0, 5.0 ] )
+        self.assertEqual( unionGrid.evaluateOnGrid( ptwises[3], grid ).tolist(), [ 1.0, 1.0, 1.0, 1.0, 1.0, 0.0, 0.0 ] )
+        self.assertEqual( unionGrid.sumOnGrid( ptwises, grid ).tolist(), [ 16.0, 12.0, 14.0, 11.0, 9.75, 8.75, 7.5 ] )
+        self.assertRaises( ValueError, unionGrid.sumOnUnionGrid, ptwises )
+        unionGrid.sumOnUnionGrid( ptwises, 1e-8, 1e-8 )
+
 
 class TestCrossSection( unittest.TestCase ): 
 
@@ -72,10 +72,12 @@ import datetime
 from fudge.gnd import suites as suitesModule
 from fudge.gnd.reactionData import crossSection as crossSectionModule
 from xData import standards as standardsModule
+from xData import XMLWriter as XMLWriterModule
 from fudge.particles import nuclear
 from alias import aliases
 from .version import GND_VERSION
 import styles as stylesModule
+import checkCache as checkCacheModule
 
 import xData.ancestry as ancestryModule
 import xData.link as linkModule
@@ -262,6 +264,16 @@ class reactionSuite( ancestryModule.ancestry ) :
             'fissionEnergyBalanceLimit'  0.15        # at least 85% of available energy should go to fission products
             'failOnException'            False       # if True, crash instead of converting exceptions to warnings
             'cleanUpTempFiles'           True        # remove derived data that was produced during checking
+            'nProcesses'                 1           # if > 1, the reactions are checked by this many worker processes
+            'cache'                      None        # a checkCache.checkCache instance for reusing derived data
+
+        The warnings for the reactions are in the same order for any nProcesses. With worker processes, the object of each
+        reaction warning is found again from its xpath, and is None if the xpath cannot be followed. The cpu and wall times (in seconds) of
+        each part of the check are stored in the 'timings' member of the returned context, an OrderedDict whose keys are
+        'resonances', 'reconstructResonances', "Wick's limit", 'particles' and the reactions' context messages, and whose
+        values are ( cpu, wall ) tuples. If a cache is given, the reconstructed cross sections and the average product
+        data are only calculated for data not already in it, and are added to it. The cache may be saved for another
+        session with its save method.
 
         Currently unused options:
             'checkForEnDepData'         False
@@ -273,8 +285,11 @@ class reactionSuite( ancestryModule.ancestry ) :
             'maxGammaMultiplicity'      100.
           """
 
+        import numpy
+        import collections
         from fudge.gnd import warning
         from fudge.processing import processingInfo as processingInfoModule
+        from fudge.core.utilities import times as timesModule
 
         options = {
                 'branchingRatioSumTolerance': 1e-6,
@@ -293,6 +308,8 @@ class reactionSuite( ancestryModule.ancestry ) :
                 'fissionEnergyBalanceLimit': 0.15,
                 'failOnException': False,
                 'cleanUpTempFiles': True,
+                'nProcesses': 1,
+                'cache': None,
                 # currently unused options:
                 'checkForEnDepData': False,
                 'allowZeroE': False,
@@ -338,17 +355,29 @@ class reactionSuite( ancestryModule.ancestry ) :
             # For elemental targets, calculating energy balance isn't possible
             info['checkEnergyBalance']=False
 
+        timings = collections.OrderedDict()
+        def addTiming( name, times ):
+            timings[name] = ( times.delta_cpu(), times.delta_wall() )
+
         if self.resonances is not None:
+            t0 = timesModule.times()
             resonanceWarnings = self.resonances.check( info )
             if resonanceWarnings:
                 warnings.append( warning.context('resonances', resonanceWarnings) )
+            addTiming( 'resonances', t0 )
             if ( options['reconstructResonances'] and self.resonances.reconstructCrossSection ):
+                t0 = timesModule.times()
                 info['reconstructedStyle'] = self.styles.getTempStyleNameOfClass( stylesModule.crossSectionReconstructed )
                 # convert resonance parameters to pointwise data, interpolable to .1 percent:
-                try: self.reconstructResonances( styleName=info['reconstructedStyle'], accuracy=0.001, thin=False, verbose=False )
+                try:
+                    if options['cache'] is None:
+                        self.reconstructResonances( styleName=info['reconstructedStyle'], accuracy=0.001, thin=False, verbose=False )
+                    else:
+                        options['cache'].reconstructResonances( self, info['reconstructedStyle'], accuracy=0.001, thin=False, verbose=False )
                 except Exception as e:
                     warnings.append( warning.ExceptionRaised( "when reconstructing resonances: %s" % e ) )
                     if info['failOnException']: raise
+                addTiming( 'reconstructResonances', t0 )
 
         if info['checkEnergyBalance']:
             # setup options for calculating average product energy and momentum
@@ -357,10 +386,12 @@ class reactionSuite( ancestryModule.ancestry ) :
             averageProductDataStyle.derivedStyles.add(evaluatedStyle)
             self.styles.add( averageProductDataStyle )
             info['averageProductDataStyle'] = averageProductDataStyle
+            info['depositionStyle'] = averageProductDataStyle.label
             info['averageProductDataArgs'] = { 'verbosity':1,   # additional required arguments
                         'incrementalIndent':'  ', 'energyAccuracy':1e-6, 'momentumAccuracy':1e-6, 'reactionSuite':self }
 
         if self.projectile.name == 'n':
+            t0 = timesModule.times()
             # test Wick's limit: 0-degree elastic xsc >= ( total xsc * k/4pi )^2
             try:
                 elastic = self.getReaction('elastic')
@@ -393,32 +424,55 @@ class reactionSuite( ancestryModule.ancestry ) :
 
                     mutualDomain = zip( *[dat.domain() for dat in elastic_xsc, total_xsc, forward_scattering] )
                     mutualDomain = (max(mutualDomain[0]), min(mutualDomain[1]))
-                    egrid = [e for e in forward_scattering.domainGrid() if mutualDomain[0] <= e <= mutualDomain[1]]
+                    egrid = numpy.array( forward_scattering.domainGrid() )
+                    egrid = egrid[ (mutualDomain[0] <= egrid) & (egrid <= mutualDomain[1]) ]
 
                     # get probability at mu=1.0:
-                    forward_scattering = [forward_scattering.evaluate(e) for e in egrid]
-                    elastic_xsc = [elastic_xsc.evaluate(e) for e in egrid]
-                    total_xsc = [total_xsc.evaluate(e) for e in egrid]
+                    forward_scattering = forward_scattering.evaluate(egrid)
+                    elastic_xsc = elastic_xsc.evaluate(egrid)
+                    total_xsc = total_xsc.evaluate(egrid)
 
                     wlcons = 3.05607e-8 * kinematicFactor**2 # ( sqrt(2 * neutronMass) / (4 * pi * hbar) * (M+m)/M )^2 in 1/(eV*b)
-                    for i1 in range(len(egrid)):
-                        if forward_scattering[i1] * elastic_xsc[i1] < wlcons * egrid[i1] * total_xsc[i1]**2:
-                            ratio = (forward_scattering[i1] * elastic_xsc[i1]) / (wlcons * egrid[i1] * total_xsc[i1]**2 )
-                            warnings.append( warning.WicksLimitError( 1-ratio, egrid[i1] ) )
+                    lhs = forward_scattering * elastic_xsc
+                    rhs = wlcons * egrid * total_xsc**2
+                    for i1 in numpy.nonzero( lhs < rhs )[0]:
+                        warnings.append( warning.WicksLimitError( 1-lhs[i1]/rhs[i1], egrid[i1] ) )
                 except Exception as e:
                     warnings.append( warning.ExceptionRaised( "when checking Wick's limit: %s" % e ) )
                     if info['failOnException']: raise
+            addTiming( "Wick's limit", t0 )
 
+        t0 = timesModule.times()
         particleWarnings = self.particles.check( info )
         if particleWarnings: warnings.append( warning.context('particles', particleWarnings) )
-
-        for reaction in self :
-            reactionWarnings = reaction.check( info )
-            if reactionWarnings: warnings.append( warning.context('%s label %s: %s'
-                % (reaction.moniker, reaction.getLabel(), reaction), reactionWarnings ) )
+        addTiming( 'particles', t0 )
+
+        reactions = list( self )
+        if options['nProcesses'] > 1:
+            results = _runInWorkers( checkReactionTask, ( self, info ), range( len( reactions ) ), options['nProcesses'] )
+            for reaction, ( reactionWarnings, forms, timing, cacheEntries ) in zip( reactions, results ):
+                if info['checkEnergyBalance']:
+                    checkCacheModule.addAverageProductDataForms( reaction, forms, info['averageProductDataStyle'].label )
+                for warning_ in warning.context( warningList = reactionWarnings ).flatten():
+                    if warning_.xpath:
+                        try: warning_.obj = self.followXPath( warning_.xpath )
+                        except Exception: pass
+                if options['cache'] is not None:
+                    for key, value in cacheEntries: options['cache'].add( key, value )
+                message = checkReactionContextMessage( reaction )
+                if reactionWarnings: warnings.append( warning.context( message, reactionWarnings ) )
+                timings[message] = timing
+        else:
+            for reaction in reactions:
+                t0 = timesModule.times()
+                message = checkReactionContextMessage( reaction )
+                reactionWarnings = reaction.check( info )
+                if reactionWarnings: warnings.append( warning.context( message, reactionWarnings ) )
+                addTiming( message, t0 )
 
         result = warning.context('ReactionSuite: %s + %s' % (self.projectile, self.target), warnings)
         result.info = info
+        result.timings = timings
 
         if options['cleanUpTempFiles']:
             if info['reconstructedStyle'] is not None: self.removeStyle( info['reconstructedStyle'] )
@@ -433,6 +487,9 @@ class reactionSuite( ancestryModule.ancestry ) :
         """
 
         if entityName in ('reaction','summedReaction','fissionComponent','production','reactionSum'):
+            if( attribute == 'label' ) :      # Avoids parsing other reactions when read lazily.
+                suite = getattr( self, entityName+'s' )
+                if( value in suite ) : return( suite[value] )
             for entity in getattr( self, entityName+'s' ):
                 if getattr( entity, attribute, None ) == value:
                     return entity
@@ -574,10 +631,13 @@ class reactionSuite( ancestryModule.ancestry ) :
 
         return( self.styles[style].temperature )
 
-    def calculateAverageProductData( self, style, indent = '', **kwargs ) :
+    def calculateAverageProductData( self, style, indent = '', nProcesses = 1, **kwargs ) :
         """
         Calculate average energy and momentum data for all products of all reactions.
-        Resulting data are stored within each product. Example usage is:
+        Resulting data are stored within each product. The calculation is split into independent tasks, one for each
+        product of each reaction's outputChannel (including the product's decay products). If nProcesses is greater
+        than 1, the tasks are run by nProcesses worker processes and the forms they return are added to the products in
+        task order, so the result does not depend on nProcesses. Example usage is:
 
         from fudge.gnd import reactionSuite as reactionSuiteModule
         from fudge.gnd import styles as stylesSuiteModule
@@ -589,6 +649,7 @@ class reactionSuite( ancestryModule.ancestry ) :
 
         :param style: The style to use.
         :param indent: string; The amount to indent and verbose output.
+        :param nProcesses: int; The number of worker processes to use.
         :param kwargs: string; All other parameters.
         :return:
         """
@@ -614,14 +675,30 @@ class reactionSuite( ancestryModule.ancestry ) :
 
         self.styles.add( style )
         kwargs['reactionSuite'] = self
-        for reaction in self.reactions :
-            reaction.calculateAverageProductData( style, indent = indent2, **kwargs )
+        if( nProcesses > 1 ) :
+            tasks = []
+            for reactionIndex, reaction in enumerate( self.reactions ) :
+                tasks += [ ( reactionIndex, productIndex ) for productIndex in range( len( reaction.outputChannel ) ) ]
+            results = _runInWorkers( calculateAverageProductDataTask, ( self, style, indent2, kwargs ), tasks, nProcesses )
+            for ( reactionIndex, productIndex ), forms in zip( tasks, results ) :
+                checkCacheModule.addAverageProductDataForms( self.reactions[reactionIndex], forms, style.label )
+        else :
+            for reaction in self.reactions :
+                reaction.calculateAverageProductData( style, indent = indent2, **kwargs )
 
     def inputParticlesToReactionString( self, prefix = "", suffix = "" ) :
 
         return( "%s%s + %s%s" % ( prefix, str( self.projectile ), str( self.target ), suffix ) )
 
-    def processSnMultiGroup( self, style, verbosity = 0, indent = '', incrementalIndent = '  ', logFile = None ) :
+    def processSnMultiGroup( self, style, verbosity = 0, indent = '', incrementalIndent = '  ', logFile = None, nProcesses = 1 ) :
+        """
+        Adds the Sn multi-group data for style to each reaction. The processing is split into independent tasks, one for
+        each reaction's own data (cross section, available energy, available momentum and Q) and one for each product of
+        each reaction's outputChannel (including the product's decay products). If nProcesses is greater than 1, the tasks
+        are run by nProcesses worker processes, each task using its own sub-directory of the work directory, and the
+        multi-group forms they return are added to the reactions in task order. The cpu and wall times of each task are
+        written to logFile.
+        """
 
         from fudge.core.utilities import times as timesModule
         status = 0
@@ -648,14 +725,99 @@ class reactionSuite( ancestryModule.ancestry ) :
 
         tempInfo['groupedFlux'] = style.flux[0].groupOneFunction( style.transportables[self.projectile.name].group.boundaries )
 
+        tasks = []
+        for reactionIndex, reaction in enumerate( self.reactions ) :
+            tasks.append( ( len( tasks ), reactionIndex, None ) )
+            for productIndex, product in enumerate( reaction.outputChannel ) : tasks.append( ( len( tasks ), reactionIndex, productIndex ) )
+
 # BRB FIXME, must have test to determine if reconstructResonances is needed.
 #        self.reconstructResonances( styleName = 'reconstructed', accuracy = 1e-3, verbose = False )
-        for reaction in self.reactions : status += reaction.processSnMultiGroup( style, tempInfo, indent + incrementalIndent )
-        logFile.write( str( t0 ) + '\n' )
+        if( nProcesses > 1 ) :
+            results = _runInWorkers( processSnMultiGroupTask, ( self, style, tempInfo, indent + incrementalIndent ), tasks, nProcesses )
+            for taskStatus, forms, log in results :
+                status += taskStatus
+                for xLink, form in forms : self.followXPath( xLink ).add( form )
+                if( logFile is not None ) : logFile.write( log )
+        else :
+            for taskIndex, reactionIndex, productIndex in tasks :
+                t1 = timesModule.times( )
+                status += self.reactions[reactionIndex].processSnMultiGroup( style, tempInfo, indent + incrementalIndent,
+                        reactionData = productIndex is None, productIndices = [ productIndex ] )
+                if( logFile is not None ) :
+                    logFile.write( SnMultiGroupTaskName( self, reactionIndex, productIndex ) + ': ' + t1.toString( current = False ) + '\n' )
+        if( logFile is not None ) : logFile.write( str( t0 ) + '\n' )
 
         return( status )
 
-    def reconstructResonances( self, styleName, accuracy = None, thin = True, verbose = False ):
+    def heat( self, temperatures, EMin, styleLabels = None, lowerlimit = None, upperlimit = None, interpolationAccuracy = 0.002,
+            heatAllPoints = False, doNotThin = True, heatBelowThreshold = True, heatAllEDomain = True, incremental = False,
+            nProcesses = 1, verbose = False ) :
+        """
+        Heats the cross section of each reaction to each temperature in temperatures and stores each result in the reaction's
+        crossSection component with the label of a new heated style (one per temperature), which is returned in a list.
+        Each cross section is linearized once and all of its temperatures are done in one task; the tasks are run by
+        nProcesses worker processes. If incremental is False, each temperature is heated from the evaluated cross section and
+        the results are the same as those from reaction.heatCrossSection. Otherwise, the cross section for each temperature is
+        obtained by heating the one for the previous (lower) temperature by the difference in temperatures. As the heated
+        cross sections are the input for the next temperature, their energy grids grow unless doNotThin is False.
+
+        options:
+            temperatures (list) - temperatures as PQU instances or strings (e.g., '600 K' or '2.5e-8 MeV').
+            EMin - the minimum energy as in reaction.heatCrossSection.
+            styleLabels (list) - labels for the new heated styles, one per temperature (default: 'heated_' + temperature).
+            nProcesses (int) - number of worker processes (default: 1, all in this process).
+            verbose (boolean) - turn on/off verbosity.
+        The other options are as in method heat of crossSection.XYs1d.
+        """
+
+        evaluatedStyle = self.styles.getEvaluatedStyle( )
+        energyUnit = self.reactions[0].crossSection.domainUnit( )
+        currentT = crossSectionModule.temperatureToEnergy( evaluatedStyle.temperature, energyUnit )
+        if( styleLabels is None ) : styleLabels = [ 'heated_%s' % str( temperature ).replace( ' ', '' ) for temperature in temperatures ]
+        if( len( styleLabels ) != len( temperatures ) ) : raise ValueError( 'number of styleLabels and temperatures differ' )
+
+        dTs = []
+        for temperature in temperatures :
+            dT = crossSectionModule.temperatureToEnergy( temperature, energyUnit ) - currentT
+            if( abs( dT ) <= 1e-2 * ( dT + currentT ) ) : dT = 0.
+            if( dT < 0 ) : raise Exception( 'Current temperature "%s" higher than desired temperature "%s"' % ( evaluatedStyle.temperature, temperature ) )
+            dTs.append( dT )
+        order = sorted( range( len( dTs ) ), key = lambda index : dTs[index] )
+        sortedDTs = [ dTs[index] for index in order ]
+
+        newStyles = []
+        for index in order :
+            if( styleLabels[index] in self.styles ) : raise KeyError( 'style "%s" already present' % styleLabels[index] )
+            newStyle = stylesModule.heated( label = styleLabels[index], temperature = temperatures[index] )
+            newStyle.derivedStyles.add( evaluatedStyle )
+            newStyles.append( newStyle )
+
+        massRatio = crossSectionModule.heatMassRatio( self )
+        kwargs = { 'interpolationAccuracy' : interpolationAccuracy, 'heatAllPoints' : heatAllPoints, 'doNotThin' : doNotThin,
+                'heatAllEDomain' : heatAllEDomain }
+        unheateds, tasks = [], []
+        for reaction in self.reactions :
+            unheated = reaction.crossSection.toPointwise_withLinearXYs( crossSectionModule.lowerEps, crossSectionModule.upperEps )
+            factor = 1. / unheated.domainUnitConversionFactor( energyUnit )
+            taskKwargs = dict( kwargs )
+            _EMin, taskKwargs['lowerlimit'], taskKwargs['upperlimit'] = unheated.heatLimits( EMin, lowerlimit, upperlimit, heatBelowThreshold )
+            unheateds.append( unheated )
+            tasks.append( ( massRatio, [ factor * dT for dT in sortedDTs ], _EMin, unheated.copyDataToXYs( ), incremental, taskKwargs ) )
+
+        if( verbose ) : print 'Heating %d reactions to %d temperatures' % ( len( tasks ), len( dTs ) )
+        results = _runInWorkers( heatTask, None, tasks, nProcesses )
+
+        for newStyle in newStyles : self.styles.add( newStyle )
+
+        for reaction, unheated, heatedList in zip( self.reactions, unheateds, results ) :
+            accuracy = max( interpolationAccuracy, unheated.getAccuracy( ) )
+            for newStyle, heated in zip( newStyles, heatedList ) :
+                heated = crossSectionModule.XYs1d( data = heated, axes = unheated.axes, accuracy = accuracy, label = newStyle.label )
+                reaction.crossSection.add( heated )
+        return( [ self.styles[label] for label in styleLabels ] )
+
+    def reconstructResonances( self, styleName, accuracy = None, thin = True, verbose = False, nProcesses = None,
+            windowWidths = None ):
         """
         Turn resonance parameters into pointwise cross sections, then merge the results with
         tabulated pointwise cross sections. Resulting pointwise cross sections are stored
@@ -666,6 +828,9 @@ class reactionSuite( ancestryModule.ancestry ) :
             thin (boolean) - enable/disable thinning after resonance reconstruction.
                 Disabling thinning makes it easier to check for consistency of summed cross sections.
             verbose (boolean) - turn on/off verbosity.
+            nProcesses (int) - number of worker processes for the resolved region (default: number of CPUs).
+            windowWidths (float) - if given, only sum resonances within this many widths of each energy explicitly
+                (SLBW, MLBW and Reich_Moore). More distant resonances are treated as a smooth background.
         """
 
         from . import sums as sumsModule
@@ -675,7 +840,8 @@ class reactionSuite( ancestryModule.ancestry ) :
             return # nothing to do
         from fudge.processing.resonances import reconstructResonances
 
-        xsecs = reconstructResonances.reconstructResonances(self, tolerance = accuracy, verbose = verbose)
+        xsecs = reconstructResonances.reconstructResonances(self, tolerance = accuracy, verbose = verbose, nProcesses = nProcesses,
+                windowWidths = windowWidths)
         epsilon = 1e-8  # for joining multiple regions together
 
         evalStyle, = [style for style in self.styles if isinstance(style,stylesModule.evaluated)]
@@ -820,10 +986,11 @@ class reactionSuite( ancestryModule.ancestry ) :
         self.styles.remove( style )
 
     def saveToOpenedFile( self, fOut, **kwargs ) :
+        """Writes self to fOut as each reaction (or other top level element) is converted to XML."""
 
-        xmlString = self.toXMLList( **kwargs )
-        fOut.write( '\n'.join( xmlString ) )
-        fOut.write( '\n' )
+        writer = XMLWriterModule.XMLWriter( fOut )
+        self.toXMLStream( writer, **kwargs )
+        writer.close( )
 
     def saveToFile( self, fileName, **kwargs ) :
         """Save the reactionSuite in GND/xml structure to specified file.
@@ -837,35 +1004,38 @@ class reactionSuite( ancestryModule.ancestry ) :
 
     def toXMLList( self, indent = "", **kwargs ) :
 
+        return( XMLWriterModule.toXMLList( self, indent, **kwargs ) )
+
+    def toXMLStream( self, writer, indent = "", **kwargs ) :
+
         incrementalIndent = kwargs.get( 'incrementalIndent', '  ' )
         indent2 = indent + incrementalIndent
         indent3 = indent2 + incrementalIndent
 
-        xmlString = [ '%s<%s projectile="%s" target="%s" version="%s" xmlns:xlink="http://www.w3.org/1999/xlink" projectileFrame="%s">'
-            % ( indent, self.moniker, self.projectile.name, self.target.name, self.GND_version, self.projectileFrame ) ]
+        writer.writeLine( '%s<%s projectile="%s" target="%s" version="%s" xmlns:xlink="http://www.w3.org/1999/xlink" projectileFrame="%s">'
+            % ( indent, self.moniker, self.projectile.name, self.target.name, self.GND_version, self.projectileFrame ) )
 
-        xmlString += self.styles.toXMLList( indent2, **kwargs )
+        writer.write( self.styles, indent2, **kwargs )
 
-        xmlString.append( '%s<documentations>' % indent2 )
-        for doc in self.documentation : xmlString += self.documentation[doc].toXMLList( indent3, **kwargs )
-        xmlString[-1] += '</documentations>'
+        writer.writeLine( '%s<documentations>' % indent2 )
+        for doc in self.documentation : writer.write( self.documentation[doc], indent3, **kwargs )
+        writer.appendToLastLine( '</documentations>' )
 
-        xmlString += self.aliases.toXMLList( indent2, **kwargs )
+        writer.write( self.aliases, indent2, **kwargs )
 
-        xmlString += self.particles.toXMLList( indent2, **kwargs )
+        writer.write( self.particles, indent2, **kwargs )
 
         if self.resonances is not None:
-            xmlString += self.resonances.toXMLList( indent2, **kwargs )
+            writer.write( self.resonances, indent2, **kwargs )
 
-        xmlString += self.reactions.toXMLList( indent2, **kwargs )
-        xmlString += self.sums.toXMLList( indent2, **kwargs )
-        xmlString += self.fissionComponents.toXMLList( indent2, **kwargs )
-        xmlString += self.productions.toXMLList( indent2, **kwargs )
+        writer.write( self.reactions, indent2, **kwargs )
+        writer.write( self.sums, indent2, **kwargs )
+        writer.write( self.fissionComponents, indent2, **kwargs )
+        writer.write( self.productions, indent2, **kwargs )
         # FIXME: remove partialGammaProductions
-        for reaction in self.partialGammaProductions : xmlString += reaction.toXMLList( indent2, **kwargs )
+        for reaction in self.partialGammaProductions : writer.write( reaction, indent2, **kwargs )
 
-        xmlString.append( '%s</%s>' % ( indent, self.moniker ) )
-        return( xmlString )
+        writer.writeLine( '%s</%s>' % ( indent, self.moniker ) )
 
     def toString( self, indent = '' ) :
         """Returns a string representation of an reactionSuite."""
@@ -878,11 +1048,163 @@ class reactionSuite( ancestryModule.ancestry ) :
             indent3 = indent2
         return( s )
 
-def readXML( gndFile ):
+_workerData = None      # The data argument of the running _runInWorkers call, inherited by its forked worker processes.
+
+def _runInWorkers( workerFunction, data, tasks, nProcesses ) :
+    """
+    For internal use. Returns the list of workerFunction( data, task ) for each task in tasks, in task order. If nProcesses
+    is greater than 1, the tasks are run by a pool of nProcesses worker processes. The workers are forked after data is
+    stored in the module variable _workerData, so data is not pickled; only the tasks and the results are. If a task
+    raises, the pool is terminated and the exception is re-raised. workerFunction must be a module level function.
+    """
+
+    global _workerData
+
+    if( nProcesses <= 1 ) : return( [ workerFunction( data, task ) for task in tasks ] )
+
+    import multiprocessing
+
+    _workerData = data
+    pool = multiprocessing.Pool( nProcesses )
+    try :
+        results = pool.map( _workerTask, [ ( workerFunction, task ) for task in tasks ], chunksize = 1 )
+        pool.close( )
+    except :
+        pool.terminate( )
+        raise
+    finally :
+        pool.join( )
+        _workerData = None
+    return( results )
+
+def _workerTask( task ) :
+    """For internal use. Runs one task of _runInWorkers in a worker process."""
+
+    workerFunction, task = task
+    return( workerFunction( _workerData, task ) )
+
+def SnMultiGroupTaskName( reactionSuite, reactionIndex, productIndex ) :
+    """For internal use. Returns the name of a reactionSuite.processSnMultiGroup task used in the log file."""
+
+    reaction = reactionSuite.reactions[reactionIndex]
+    if( productIndex is None ) : return( 'reaction "%s" data' % reaction.label )
+    return( 'reaction "%s" product "%s"' % ( reaction.label, reaction.outputChannel[productIndex].label ) )
+
+def SnMultiGroupTaskComponents( reaction, productIndex ) :
+    """
+    For internal use. Returns the list of components that a reactionSuite.processSnMultiGroup task adds a multi-group
+    form to.
+    """
+
+    from .reactions import reaction as reactionModule
+
+    def productComponents( product ) :
+
+        components = [ product.multiplicity, product.energyDeposition, product.momentumDeposition, product.distribution ]
+        if( product.outputChannel is not None ) :
+            components.append( product.outputChannel.Q )
+            for decayProduct in product.outputChannel : components += productComponents( decayProduct )
+        return( components )
+
+    if( productIndex is not None ) : return( productComponents( reaction.outputChannel[productIndex] ) )
+    components = [ reaction.crossSection ]
+    if( isinstance( reaction, reactionModule.reaction ) ) : components += [ reaction.availableEnergy, reaction.availableMomentum ]
+    return( components + [ reaction.outputChannel.Q ] )
+
+def processSnMultiGroupTask( data, task ) :
+    """
+    For internal use. Runs one reactionSuite.processSnMultiGroup task in a worker process and returns its status, the
+    list of ( xLink of component, multi-group form ) for the forms it added and its log as a string. The forms are removed
+    from the worker's reactionSuite and detached from it so that only they are pickled.
+    """
+
+    import os
+    import StringIO
+    from fudge.core.utilities import times as timesModule
+
+    reactionSuite, style, tempInfo, indent = data
+    taskIndex, reactionIndex, productIndex = task
+
+    tempInfo = dict( tempInfo )
+    tempInfo['masses'] = dict( tempInfo['masses'] )
+    tempInfo['workFile'] = []
+    if( tempInfo['workDir'] is not None ) : tempInfo['workDir'] = os.path.join( tempInfo['workDir'], 'task%d' % taskIndex )
+    log = StringIO.StringIO( )
+    if( tempInfo['logFile'] is not None ) : tempInfo['logFile'] = log
+
+    t0 = timesModule.times( )
+    reaction = reactionSuite.reactions[reactionIndex]
+    status = reaction.processSnMultiGroup( style, tempInfo, indent, reactionData = productIndex is None, productIndices = [ productIndex ] )
+    log.write( SnMultiGroupTaskName( reactionSuite, reactionIndex, productIndex ) + ': ' + t0.toString( current = False ) + '\n' )
+
+    forms = []
+    for component in SnMultiGroupTaskComponents( reaction, productIndex ) :
+        if( style.label not in component ) : continue
+        form = component[style.label]
+        component.remove( style.label )
+        form.setAncestor( None )
+        forms.append( ( component.toXLink( ), form ) )
+    return( status, forms, log.getvalue( ) )
+
+def calculateAverageProductDataTask( data, task ) :
+    """
+    For internal use. Calculates the average product data of one product (and its decay products) of a reaction in a
+    worker process of reactionSuite.calculateAverageProductData. Returns the list of ( path, copy of form ) for the forms
+    added, as returned by checkCache.averageProductDataForms, so that only they are pickled.
+    """
+
+    reactionSuite, style, indent, kwargs = data
+    reactionIndex, productIndex = task
+
+    reaction = reactionSuite.reactions[reactionIndex]
+    reaction.calculateAverageProductData( style, indent = indent, productIndices = [ productIndex ], **kwargs )
+    return( [ ( path, form ) for path, form in checkCacheModule.averageProductDataForms( reaction, style.label )
+            if( path[0] == productIndex ) ] )
+
+def heatTask( data, task ) :
+    """For internal use. Heats one cross section of reactionSuite.heat (see crossSection.heatToTemperatures); data is not used."""
+
+    return( crossSectionModule.heatToTemperatures( task ) )
+
+def checkReactionContextMessage( reaction ) :
+    """For internal use. Returns the message of the warning.context for a reaction checked by reactionSuite.check."""
+
+    return( '%s label %s: %s' % ( reaction.moniker, reaction.getLabel( ), reaction ) )
+
+def checkReactionTask( data, index ) :
+    """
+    For internal use. Checks the index-th reaction (in iteration order) of a reactionSuite in a worker process of
+    reactionSuite.check. Returns the reaction's warnings, the list of its average product data forms (see
+    checkCache.averageProductDataForms), its ( cpu, wall ) times and the list of ( key, value ) entries it added to the
+    check cache. The warnings are detached from their objects (only their xpaths are kept) so that only they are pickled.
+    """
+
+    from fudge.gnd import warning as warningModule
+    from fudge.core.utilities import times as timesModule
+
+    reactionSuite, info = data
+    reaction = list( reactionSuite )[index]
+    cache = info['cache']
+    if( cache is not None ) : cacheSize = len( cache.added )
+
+    t0 = timesModule.times( )
+    warnings = reaction.check( info )
+    timing = ( t0.delta_cpu( ), t0.delta_wall( ) )
+
+    for warning in warningModule.context( warningList = warnings ).flatten( ) : warning.obj = None
+    forms = []
+    if( info['checkEnergyBalance'] ) : forms = checkCacheModule.averageProductDataForms( reaction, info['averageProductDataStyle'].label )
+    cacheEntries = []
+    if( cache is not None ) : cacheEntries = [ ( key, cache[key] ) for key in cache.added[cacheSize:] ]
+    return( warnings, forms, timing, cacheEntries )
+
+def readXML( gndFile, lazy = False ):
     """
     Read a GND/xml file and create a new reactionSuite instance from the result.
 
     :param gndFile: path to a GND file, as a string.
+    :param lazy: if True, the items of suites (e.g., reactions, products and the forms of each component) are only
+        converted from xml the first time they are accessed. Reading a file to use a few reactions is then much faster.
     :return: reactionSuite instance containing all data from the file.
     """
     from xml.etree import cElementTree
@@ -890,9 +1212,9 @@ def readXML( gndFile ):
     # wrapper around the xml parser:
     from fudge.core.utilities.xmlNode import xmlNode
     rsElement = xmlNode( rsElement, xmlNode.etree )
-    return parseXMLNode( rsElement )
+    return parseXMLNode( rsElement, lazy = lazy )
 
-def parseXMLNode( rsElement ):
+def parseXMLNode( rsElement, lazy = False ):
     """Translates a <reactionSuite> xml node into a reactionSuite instance. Users should use the 'readXML' function instead."""
 
     xPath = ['reactionSuite']   # Keep track of location in the tree, in case errors come up.
@@ -908,7 +1230,8 @@ def parseXMLNode( rsElement ):
         rs = reactionSuite( projectile, target, GND_version = GND_version, particleList = particles,
                             projectileFrame = projectileFrame )
 
-        linkData = { 'particles' : particles, 'reactionSuite' : rs, 'unresolvedLinks' : [], 'format' : GND_version }
+        linkData = { 'particles' : particles, 'reactionSuite' : rs, 'unresolvedLinks' : [], 'format' : GND_version,
+                'lazy' : lazy }
         rs.styles.parseXMLNode( rsElement.find('styles'), xPath, linkData )
         for doc in rsElement.find( 'documentations' ) :
             rs.addDocumentation( fudge.gnd.documentation.documentation.parseXMLNode( doc, xPath, linkData ) )
@@ -942,7 +1265,14 @@ def parseXMLNode( rsElement ):
         print( "Error encountered at xpath = /%s" % '/'.join( xPath ) )
         raise
 
-    # Fix links.
+    resolveLinks( linkData )
+
+    return( rs )
+
+def resolveLinks( linkData ) :
+    """Fixes the links in linkData['unresolvedLinks']. Also called when an item of a lazily read suite is parsed."""
+
+    rs = linkData['reactionSuite']
     for quant in linkData['unresolvedLinks'] :
         if isinstance( quant, linkModule.link ) :
             if quant.path.startswith('/covarianceSuite'):
@@ -950,6 +1280,5 @@ def parseXMLNode( rsElement ):
                 continue
             quant.link = quant.follow( rs )
         else :
-            raise 'hell'
-
-    return( rs )
+            raise TypeError( 'Cannot resolve link "%s": unsupported type %s in unresolvedLinks' % ( quant, type( quant ) ) )
+    linkData['unresolvedLinks'] = []
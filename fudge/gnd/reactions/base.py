@@ -62,6 +62,7 @@
 # <<END-copyright>>
 
 import xData.ancestry as ancestryModule
+import xData.XMLWriter as XMLWriterModule
 
 import fudge
 from fudge.core.utilities import fudgeExceptions
@@ -200,7 +201,10 @@ class base_reaction( ancestryModule.ancestry ) :
             # At each step, if we have energy deposition for *every* product in the list, we can rigorously check
             # energy balance. Otherwise, can only check that we don't exceed available energy.
             try:
-                self.calculateAverageProductData( style=info['averageProductDataStyle'], **info['averageProductDataArgs'] )
+                if info.get( 'cache' ) is None:
+                    self.calculateAverageProductData( style=info['averageProductDataStyle'], **info['averageProductDataArgs'] )
+                else:
+                    info['cache'].calculateAverageProductData( self, info )
             except CoulombDepositionNotSupported, e:
                 warnings.append( warning.EnergyDepositionExceptionRaised( str(e), self ) )
             except Exception, e:
@@ -357,12 +361,13 @@ class base_reaction( ancestryModule.ancestry ) :
         from .. import reactionSuite as reactionSuiteModule
         return( self.findClassInAncestry( reactionSuiteModule.reactionSuite ) )
 
-    def calculateAverageProductData( self, style, indent = '', **kwargs ) :
+    def calculateAverageProductData( self, style, indent = '', productIndices = None, **kwargs ) :
         """
         Calculate average product data.
 
         :param style: The style to use.
         :param indent: string; The amount to indent and verbose output.
+        :param productIndices: list of the indices of the outputChannel's products to do (all products if None).
         :param kwargs: string; All other parameters.
         :return:
         """
@@ -376,9 +381,14 @@ class base_reaction( ancestryModule.ancestry ) :
         kwargs['reaction'] = self
         kwargs['EMin'], kwargs['EMax'] = self.domain( )
         kwargs['incidentEnergyUnit'] = self.crossSection.domainUnit( )
-        self.outputChannel.calculateAverageProductData( style, indent2, **kwargs )
+        self.outputChannel.calculateAverageProductData( style, indent2, productIndices = productIndices, **kwargs )
 
-    def processSnMultiGroup( self, style, tempInfo, indent ) :
+    def processSnMultiGroup( self, style, tempInfo, indent, reactionData = True, productIndices = None ) :
+        """
+        Adds the Sn multi-group data for style to the reaction's components. If reactionData is False, the reaction's
+        own data (i.e., cross section, available energy, available momentum and Q) are not processed. If productIndices
+        is not None, only the outputChannel's products whose indices are in productIndices are processed.
+        """
 
         from fudge.gnd import xParticle
         from . import reaction as reactionModule
@@ -396,24 +406,29 @@ class base_reaction( ancestryModule.ancestry ) :
         tempInfo['reaction'] = self
         if( verbosity > 0 ) : print '%s%s' % ( indent, self.outputChannel.toString( simpleString = True ) )
 
-        norm = tempInfo['groupedFlux']
-        tempInfo['groupedFlux'] = None
         tempInfo['crossSection'] = self.crossSection
-        tempInfo['multiGroupCrossSection'] = self.crossSection.processSnMultiGroup( style, tempInfo, indent2 )
-        self.crossSection.remove( style.label )
-        tempInfo['groupedFlux'] = norm
-        self.crossSection.processSnMultiGroup( style, tempInfo, indent2 )
-
-        if( isinstance( self, reactionModule.reaction ) ) :
-            self.availableEnergy.processSnMultiGroup( style, tempInfo, indent2 )
-            self.availableMomentum.processSnMultiGroup( style, tempInfo, indent2 )
-        status += self.outputChannel.processSnMultiGroup( style, tempInfo, indent2 )
+        if( reactionData ) :
+            norm = tempInfo['groupedFlux']
+            tempInfo['groupedFlux'] = None
+            tempInfo['multiGroupCrossSection'] = self.crossSection.processSnMultiGroup( style, tempInfo, indent2 )
+            self.crossSection.remove( style.label )
+            tempInfo['groupedFlux'] = norm
+            self.crossSection.processSnMultiGroup( style, tempInfo, indent2 )
+
+            if( isinstance( self, reactionModule.reaction ) ) :
+                self.availableEnergy.processSnMultiGroup( style, tempInfo, indent2 )
+                self.availableMomentum.processSnMultiGroup( style, tempInfo, indent2 )
+        status += self.outputChannel.processSnMultiGroup( style, tempInfo, indent2, Q = reactionData, productIndices = productIndices )
 
         del tempInfo['workFile'][-1]
         return( status )
 
     def toXMLList( self, indent = '', **kwargs ) :
 
+        return( XMLWriterModule.toXMLList( self, indent, **kwargs ) )
+
+    def toXMLStream( self, writer, indent = '', **kwargs ) :
+
         incrementalIndent = kwargs.get( 'incrementalIndent', '  ' )
         indent2 = indent + incrementalIndent
         indent3 = indent2 + incrementalIndent
@@ -424,23 +439,22 @@ class base_reaction( ancestryModule.ancestry ) :
         if( self.process is not None ) : attributeString += ' process="%s"' % self.process
         attributeString += ' ENDF_MT="%s"' % self.ENDF_MT
 
-        xmlString = [ '%s<%s label="%s"' % ( indent, self.moniker, self.label ) ]
-        xmlString[-1] += ' outputChannel="%s"' % self.outputChannel
+        writer.writeLine( '%s<%s label="%s"' % ( indent, self.moniker, self.label ) )
+        writer.appendToLastLine( ' outputChannel="%s"' % self.outputChannel )
         fissionGenre = self.outputChannel.getFissionGenre( )
         if fissionGenre is not None: attributeString += ' fissionGenre="%s"' % fissionGenre
 
-        xmlString[-1] += attributeString + '>'
+        writer.appendToLastLine( attributeString + '>' )
 
         if self.documentation:
-            xmlString.append( '%s<documentations>' % indent2 )
-            for doc in self.documentation: xmlString += self.documentation[doc].toXMLList( indent3, **kwargs )
-            xmlString[-1] += '</documentations>'
+            writer.writeLine( '%s<documentations>' % indent2 )
+            for doc in self.documentation: writer.write( self.documentation[doc], indent3, **kwargs )
+            writer.appendToLastLine( '</documentations>' )
 
-        xmlString += self.crossSection.toXMLList( indent2, **kwargs )
-        xmlString += self.outputChannel.toXMLList( indent2, **kwargs )
+        writer.write( self.crossSection, indent2, **kwargs )
+        writer.write( self.outputChannel, indent2, **kwargs )
 
-        xmlString[-1] += '</%s>' % self.moniker
-        return xmlString
+        writer.appendToLastLine( '</%s>' % self.moniker )
 
     @classmethod
     def parseXMLNode( cls, element, xPath, linkData ) :
@@ -448,9 +462,6 @@ class base_reaction( ancestryModule.ancestry ) :
 
         xPath.append( '%s[@label="%s"]' % ( element.tag, element.get( 'label' ) ) )
 
-        crossSectionComponent = fudge.gnd.reactionData.crossSection.parseXMLNode(
-                element.find( 'crossSection' ), xPath, linkData )
-
         outputChannel = fudge.gnd.channels.parseXMLNode( element.find( 'outputChannel' ), xPath, linkData )
         outputChannel.fissionGenre = element.get( 'fissionGenre' )
 
@@ -458,7 +469,7 @@ class base_reaction( ancestryModule.ancestry ) :
                 date=element.get('date') )
         if element.get('process'):
             reac.process = element.get('process')
-        for crossSection in crossSectionComponent : reac.crossSection.add( crossSection )
+        reac.crossSection.parseXMLNode( element.find( 'crossSection' ), xPath, linkData )
 
         if( element.find( 'documentations' ) ) :
             for doc in element.find( 'documentations' ) :
@@ -364,6 +364,11 @@ class heated( style ) :
 
         return( self.__temperature )
 
+    @staticmethod
+    def requiredArgs() :
+
+        return ( 'label', 'date', 'temperature' )
+
 class averageProductData( style ) :
 
     moniker = 'averageProductData'
@@ -65,9 +65,33 @@ __metaclass__ = type
 
 import abc
 import xData.ancestry as ancestryModule
+import xData.XMLWriter as XMLWriterModule
 
 from fudge.core.utilities import brb
 
+class lazyItem :
+    """
+    Stand-in for an item of a suite when a GND file is read lazily (i.e., linkData['lazy'] is True). It records the
+    item's label and XML element, and is replaced in the suite by the parsed item the first time the item is accessed.
+    """
+
+    def __init__( self, element, parser, xPath, linkData ) :
+
+        self.label = element.get( 'label' )
+        self.element = element
+        self.parser = parser
+        self.xPath = list( xPath )
+        self.linkData = linkData
+
+    def parse( self ) :
+        """Returns the item parsed from self's element. Links within the item must be resolved by the caller."""
+
+        try :
+            return( self.parser( self.element, self.xPath, self.linkData ) )
+        except Exception :
+            print( "Error encountered at xpath = /%s" % '/'.join( self.xPath ) )
+            raise
+
 class suite( ancestryModule.ancestry ) :
     """
     Base class for a class member that is list like. For example, the lists inside the class 
@@ -84,27 +108,43 @@ class suite( ancestryModule.ancestry ) :
 
     def __contains__( self, label ) :
 
-        for item in self :
+        for item in self.__items :
             if( item.label == label ) : return( True )
         return( False )
 
     def __getitem__( self, label ) :
 
-        if( isinstance( label, int ) ) : return( self.__items[label] )   # BRB - FIXME, Temp fix until Caleb gets neutrons/n-017_Cl_035.endf working without it.
+        if( isinstance( label, int ) ) : return( self.__item( label ) )   # BRB - FIXME, Temp fix until Caleb gets neutrons/n-017_Cl_035.endf working without it.
         if( not( isinstance( label, str ) ) ) : raise TypeError( "label must be a string" )
-        for item in self :
-            if( item.label == label ) : return( item )
+        for i1, item in enumerate( self.__items ) :
+            if( item.label == label ) : return( self.__item( i1 ) )
         # requested style not found, but what about styles it derives from?
         requestedStyle = self.getRootAncestor().styles[ label ]
         for dstyle in requestedStyle.derivedStyles:
-            for item in self :
-                if( item.label == dstyle.label ) : return( item )
+            for i1, item in enumerate( self.__items ) :
+                if( item.label == dstyle.label ) : return( self.__item( i1 ) )
         raise KeyError( "item with label '%s' not found in suite '%s'" % ( label, self.moniker ) )
 
     def __iter__( self ) :
 
         n1 = len( self )
-        for i1 in range( n1 ) : yield self.__items[i1]
+        for i1 in range( n1 ) : yield self.__item( i1 )
+
+    def __item( self, index ) :
+        """Returns the item at index, first parsing it if it is a lazyItem."""
+
+        item = self.__items[index]
+        if( isinstance( item, lazyItem ) ) :
+            linkData = dict( item.linkData )
+            linkData['unresolvedLinks'] = []
+            item.linkData = linkData
+            parsedItem = item.parse( )
+            parsedItem.setAncestor( self, attribute = 'label' )
+            self.__items[index] = parsedItem
+            from fudge.gnd import reactionSuite as reactionSuiteModule
+            reactionSuiteModule.resolveLinks( linkData )
+            item = parsedItem
+        return( item )
 
     def __len__( self ) :
 
@@ -141,6 +181,39 @@ class suite( ancestryModule.ancestry ) :
         newItem.setAncestor( self, attribute = 'label' )
         self.__items.insert( index, newItem )
 
+    def addLazily( self, element, parser, xPath, linkData ) :
+        """
+        Adds the item returned by parser( element, xPath, linkData ). If linkData['lazy'] is True and element has
+        a label, the call to parser is deferred until the item is first accessed (see lazyItem).
+        """
+
+        if( not( linkData.get( 'lazy', False ) ) or ( element.get( 'label' ) is None ) ) :
+            self.add( parser( element, xPath, linkData ) )
+            return
+
+        newItem = lazyItem( element, parser, xPath, linkData )
+        index = len( self )
+        for i1, item in enumerate( self.__items ) :
+            if( item.label == newItem.label ) :
+                if( self.replace ) :
+                    del self.__items[i1]
+                    index = i1
+                    break
+                else :
+                    raise KeyError( 'item with label = "%s" already present in suite' % item.label )
+        self.__items.insert( index, newItem )
+
+    def findEntity( self, entityName, attribute = None, value = None ) :
+        """Overrides ancestry.findEntity so that, for a lazily read suite, only the item with the requested label is parsed."""
+
+        if( attribute == 'label' ) :
+            for i1, item in enumerate( self.__items ) :
+                if( item.label == value ) :
+                    item = self.__item( i1 )
+                    if( item.moniker == entityName ) : return( item )
+                    break
+        return( ancestryModule.ancestry.findEntity( self, entityName, attribute, value ) )
+
     def remove( self, label ) :
 
         for i1, item in enumerate( self.__items ) :
@@ -155,13 +228,16 @@ class suite( ancestryModule.ancestry ) :
 
     def toXMLList( self, indent = '', **kwargs ) :
 
+        return( XMLWriterModule.toXMLList( self, indent, **kwargs ) )
+
+    def toXMLStream( self, writer, indent = '', **kwargs ) :
+
         indent2 = indent + kwargs.get( 'incrementalIndent', '  ' )
 
-        if( len( self ) == 0 ) : return( [] )
-        xmlString = [ '%s<%s>' % ( indent, self.moniker ) ]
-        for item in self : xmlString += item.toXMLList( indent2, **kwargs )
-        xmlString[-1] += '</%s>' % self.moniker
-        return( xmlString )
+        if( len( self ) == 0 ) : return
+        writer.writeLine( '%s<%s>' % ( indent, self.moniker ) )
+        for item in self : writer.write( item, indent2, **kwargs )
+        writer.appendToLastLine( '</%s>' % self.moniker )
 
     def parseXMLNode( self, element, xPath, linkData ):
 
@@ -175,7 +251,7 @@ class suite( ancestryModule.ancestry ) :
             if parseClass is None:
                 raise TypeError( "Invalid element '%s' encountered in suite '%s'" % (child.tag, self.moniker) )
 
-            self.add( parseClass.parseXMLNode( child, xPath, linkData ) )
+            self.addLazily( child, parseClass.parseXMLNode, xPath, linkData )
 
         xPath.pop()
 
@@ -68,6 +68,7 @@ This module contains the 'sum', 'summand' and 'listOfSummands' classes
 import fudge
 import xData.link as linkModule
 import xData.ancestry as ancestryModule
+import xData.unionGrid as unionGridModule
 from pqu import PQU as PQUModule
 
 from channelData import Q as QModule
@@ -140,11 +141,7 @@ class crossSectionSum( ancestryModule.ancestry ):
             if info['reconstructedStyle'] in component: return component[ info['reconstructedStyle'] ]
             else: return component.toPointwise_withLinearXYs()
 
-        sum_ = getPointwiseLinearForm( self.summands[0].link )
-        for idx in range(1,len(self.summands)):
-            sum_, current = sum_.mutualify( 1e-8, 1e-8, 0,
-                    getPointwiseLinearForm( self.summands[idx].link ), 1e-8, 1e-8, 0 )
-            sum_ += current
+        sum_ = unionGridModule.sumOnUnionGrid( [ getPointwiseLinearForm( summand.link ) for summand in self.summands ], 1e-8, 1e-8 )
         quotedXsec = getPointwiseLinearForm( self.crossSection )
         if sum_.domain() != quotedXsec.domain():
             warnings.append( warning.summedCrossSectionDomainMismatch( obj=self ) )
@@ -260,11 +257,7 @@ class multiplicitySum( ancestryModule.ancestry ):
                     warnings.append( warning.negativeMultiplicity( form.rangeMin(), obj=form ) )
 
         # does multiplicity equal the sum over its summand multiplicities?
-        sum_ = self.summands[0].link.toPointwise_withLinearXYs()
-        for idx in range(1,len(self.summands)):
-            sum_, current = sum_.mutualify( 1e-8, 1e-8, 0,
-                    self.summands[idx].link.toPointwise_withLinearXYs(), 1e-8, 1e-8, 0 )
-            sum_ += current
+        sum_ = unionGridModule.sumOnUnionGrid( [ summand.link.toPointwise_withLinearXYs() for summand in self.summands ], 1e-8, 1e-8 )
         quotedXsec = self.multiplicity.toPointwise_withLinearXYs()
         if sum_.domain() != quotedXsec.domain():
             warnings.append( warning.summedMultiplicityDomainMismatch( obj=self ) )
@@ -2297,10 +2297,8 @@ def readMatrix( info, LS,LB, NT,NP, dat ):
 
     if NP in (0,1):   # matrix has at most one energy boundary, no data
         return None
-    nlines, remainder = divmod(NT,6)
-    subsec = []
-    for line in range(nlines): subsec += funkyF(dat.next(), logFile = info.logs)
-    if remainder: subsec += funkyF(dat.next(), logFile = info.logs)[:remainder]
+    lines = [ dat.next() for line in range( ( NT + 5 ) // 6 ) ]
+    subsec = endfFileToGNDMisc.funkyFloatStringsToFloats( NT, 0, lines, logFile = info.logs )
     # LB flag tells how to interpret this data:
     if LB in (0,1,2,8): # diagonal
         subsec = subsec[:NT]
@@ -68,6 +68,8 @@ import xData.axes as axesModule
 import xData.XYs as XYsModule
 import xData.regions as regionsModule
 
+from numericalFunctions import listOfDoubles_C as listOfDoubles_CModule
+
 ENDF_Accuracy = 1e-3
 FUDGE_EPS = 1e-8
 
@@ -164,10 +166,20 @@ def sixFunkyFloatStringsToIntsAndFloats( s, intIndices = [], logFile = sys.stder
     for i1 in intIndices : values[i1] = int( values[i1] )
     return( values )
 
-def nFunkyFloatStringsToFloats( n1, startLine, lines, dimension = 1, logFile = sys.stderr ) :
+def funkyFloatStringsToFloats( n1, startLine, lines, logFile = sys.stderr ) :
+    """
+    Returns the list of n1 floats in the fields of lines starting at lines[startLine]. The conversion is done in C by
+    listOfDoubles_C.createFromENDFLines, unless a field is in a form it does not support, in which case all fields
+    are converted (or reported) by funkyFloatStringToFloat.
+    """
+
+    try :
+        return( list( listOfDoubles_CModule.createFromENDFLines( lines, n1, startLine ) ) )
+    except ValueError :
+        pass
 
     floats = []
-    nd = dimension * n1
+    nd = n1
     while( True ) :
         l = lines[startLine]
         n6 = min( nd, 6 )
@@ -175,6 +187,11 @@ def nFunkyFloatStringsToFloats( n1, startLine, lines, dimension = 1, logFile = s
         nd -= n6
         if( nd == 0 ) : break
         startLine += 1
+    return( floats )
+
+def nFunkyFloatStringsToFloats( n1, startLine, lines, dimension = 1, logFile = sys.stderr ) :
+
+    floats = funkyFloatStringsToFloats( dimension * n1, startLine, lines, logFile = logFile )
     if( dimension > 1 ) :
         floats1D, floats = floats, []
         for i1 in xrange( 0, dimension * n1, dimension ) : floats.append( floats1D[i1:i1+dimension] )
@@ -203,15 +220,7 @@ def readEndfINTG( string, ndigit ) :
 
 def readDiscreteAndLegendre( numDiscrete, numContinua, startLine, lines, dimension, logFile = sys.stderr ) :
 
-    floats = []
-    nd = dimension * numDiscrete + dimension * numContinua  #  total amount of data
-    while( True ) :
-        l = lines[startLine]
-        n6 = min( nd, 6 )
-        for i1 in xrange( n6 ) : floats.append( funkyFloatStringToFloat( i1, l, logFile = logFile ) )
-        nd -= n6
-        if( nd == 0 ) : break
-        startLine += 1
+    floats = funkyFloatStringsToFloats( dimension * numDiscrete + dimension * numContinua, startLine, lines, logFile = logFile )
 
     discretes = []                                  # Data for discrete gammas is [ gammaEnergy, multiplicity ]
     for i1 in xrange( 0, dimension * numDiscrete, dimension ) :
@@ -285,9 +285,9 @@ if( __name__ == '__main__' ) :
     rce = endfFileToGND( fileName = sys.argv[1] )
     x, c = rce['reactionSuite'], rce['covarianceSuite']
     f = open( 'test.xml', 'w' )
-    f.write( '\n'.join( x.toXMLList( ) + [ '' ] ) )
+    x.saveToOpenedFile( f )
     f.close( )
     if( c is not None ) : # covariances
         f = open( 'test-covar.xml', 'w' )
-        f.write( '\n'.join( c.toXMLList( ) + [ '' ] ) )
+        c.saveToOpenedFile( f )
         f.close()
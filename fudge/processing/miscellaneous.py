@@ -62,6 +62,181 @@
 # <<END-copyright>>
 
 from xData import link as linkModule
+from xData import standards as standardsModule
+
+class groupingContext :
+    """
+    This class groups functions with a weight (i.e., flux) for one set of group boundaries. That is, for each function f(x)
+    it calculates the integrals of f(x) * flux(x) over each group as XYs1d.groupTwoFunctions does. The flux restricted to
+    the groups and the group boundaries merged into its grid are calculated once, when the instance is constructed, and
+    are reused for each function grouped. Each function is then grouped in one sweep over the union of its grid and the
+    flux's grid using numpy. A list of functions that share the same grid can be grouped together. If flux is None, the
+    flux is taken to be 1 (i.e., as XYs1d.groupOneFunction).
+
+    Functions with interpolations other than lin-lin or flat are evaluated at the points of the union grid and integrated
+    as lin-lin between them, as is done by XYs1d.groupTwoFunctions.
+    """
+
+    def __init__( self, groupBoundaries, flux = None ) :
+
+        import numpy
+
+        if( not( isinstance( groupBoundaries, list ) ) ) : groupBoundaries = groupBoundaries.values.values
+        self.groupBoundaries = numpy.array( groupBoundaries, dtype = numpy.float64 )
+        if( len( self.groupBoundaries ) < 2 ) : raise ValueError( 'At least two group boundaries required.' )
+        if( numpy.any( numpy.diff( self.groupBoundaries ) <= 0. ) ) : raise ValueError( 'Group boundaries must be ascending.' )
+
+        self.flux = flux
+        if( flux is None ) :
+            self.__fluxXs = self.groupBoundaries
+            self.__fluxFlat = True
+        else :
+            fluxXs = flux.xsAsArray( )
+            if( numpy.any( numpy.diff( fluxXs ) <= 0. ) ) : raise ValueError( 'Flux x-values must be ascending.' )
+            domainMin, domainMax = max( fluxXs[0], self.groupBoundaries[0] ), min( fluxXs[-1], self.groupBoundaries[-1] )
+            boundaries = self.groupBoundaries[( self.groupBoundaries >= domainMin ) & ( self.groupBoundaries <= domainMax )]
+            self.__fluxXs = numpy.union1d( fluxXs[( fluxXs >= domainMin ) & ( fluxXs <= domainMax )], boundaries )
+            self.__fluxFlat = flux.interpolation == standardsModule.interpolation.flatToken
+        self.__fluxYs = self.__evaluate( flux, self.__fluxXs )
+        self.groupedFlux = self.group( None ).tolist( )
+
+    def __len__( self ) :
+        """Returns the number of groups."""
+
+        return( len( self.groupBoundaries ) - 1 )
+
+    @staticmethod
+    def __evaluate( function, xs ) :
+
+        import numpy
+
+        if( function is None ) : return( numpy.ones( len( xs ) ) )
+        return( function.evaluateArray( xs, outOfDomainValue = 0. ) )
+
+    def __fluxAt( self, xs ) :
+        """Returns the flux at xs, which must all be within the domain of the flux's grid."""
+
+        import numpy
+
+        if( self.flux is None ) : return( numpy.ones( len( xs ) ) )
+        if( self.__fluxFlat ) : return( self.__fluxYs[numpy.searchsorted( self.__fluxXs, xs, side = 'right' ) - 1] )
+        if( self.flux.interpolation == standardsModule.interpolation.linlinToken ) :
+            return( numpy.interp( xs, self.__fluxXs, self.__fluxYs ) )
+        return( self.__evaluate( self.flux, xs ) )
+
+    def __union( self, functions ) :
+        """
+        Returns the union of the flux's grid and the shared grid of functions over their mutual domain, the flux on it and
+        a 2d array of the functions on it. The flux's grid points not in the functions' grid are inserted with searchsorted
+        so that only the flux at the functions' points and the functions at the inserted points need to be evaluated.
+        """
+
+        import numpy
+
+        xs = functions[0].xsAsArray( )
+        for function in functions[1:] :
+            if( not( numpy.array_equal( xs, function.xsAsArray( ) ) ) ) : raise ValueError( 'Functions must share the same grid.' )
+        if( numpy.any( numpy.diff( xs ) <= 0. ) ) : raise ValueError( 'Function x-values must be ascending.' )
+        empty = ( numpy.array( [] ), numpy.array( [] ), numpy.zeros( ( len( functions ), 0 ) ) )
+        if( ( len( xs ) == 0 ) or ( len( self.__fluxXs ) == 0 ) ) : return( empty )
+        domainMin, domainMax = max( xs[0], self.__fluxXs[0] ), min( xs[-1], self.__fluxXs[-1] )
+        if( domainMin >= domainMax ) : return( empty )
+
+        inDomain = slice( numpy.searchsorted( xs, domainMin ), numpy.searchsorted( xs, domainMax, side = 'right' ) )
+        xs = xs[inDomain]
+        fluxInDomain = slice( numpy.searchsorted( self.__fluxXs, domainMin ), numpy.searchsorted( self.__fluxXs, domainMax, side = 'right' ) )
+        fluxXs, fluxYs = self.__fluxXs[fluxInDomain], self.__fluxYs[fluxInDomain]
+
+        indices = numpy.searchsorted( xs, fluxXs )
+        present = numpy.zeros( len( fluxXs ), dtype = bool )
+        inside = indices < len( xs )
+        present[inside] = xs[indices[inside]] == fluxXs[inside]
+        extra = ~present
+        extraXs = fluxXs[extra]
+        inserted = indices[extra] + numpy.arange( len( extraXs ) )     # Indices of the inserted points in the union.
+        original = numpy.ones( len( xs ) + len( extraXs ), dtype = bool )
+        original[inserted] = False
+
+        unionXs = numpy.empty( len( original ) )
+        unionXs[original], unionXs[inserted] = xs, extraXs
+        unionFluxYs = numpy.empty( len( original ) )
+        unionFluxYs[original], unionFluxYs[inserted] = self.__fluxAt( xs ), fluxYs[extra]
+        ys = numpy.empty( ( len( functions ), len( original ) ) )
+        for index, function in enumerate( functions ) :
+            ys[index,original], ys[index,inserted] = function.ysAsArray( )[inDomain], self.__evaluate( function, extraXs )
+        return( unionXs, unionFluxYs, ys )
+
+    def group( self, functions, norm = None ) :
+        """
+        Returns a numpy array of the integrals of each function in functions times the flux over each group, divided by
+        the norm. If functions is a single XYs1d instance (or None for the flux alone), a 1d array is returned. Otherwise,
+        functions must be a list of XYs1d instances with the same grid and a 2d array with one row per function is
+        returned. The argument norm is as for XYs1d.groupTwoFunctions (i.e., None, 'dx' or a list of one value per group).
+        """
+
+        import numpy
+
+        single = not( isinstance( functions, ( list, tuple ) ) )
+        if( single ) : functions = [ functions ]
+        numberOfGroups = len( self )
+        sums = numpy.zeros( ( len( functions ), numberOfGroups ) )
+
+        if( functions[0] is None ) :
+            xs, fluxYs = self.__fluxXs, self.__fluxYs
+            ys = numpy.ones( ( 1, len( xs ) ) )
+            flats = [ True ]
+        else :
+            xs, fluxYs, ys = self.__union( functions )
+            flats = [ function.interpolation == standardsModule.interpolation.flatToken for function in functions ]
+
+        if( len( xs ) > 1 ) :       # On each interval, the integral of f * flux is f1 * fluxWeight1 + f2 * fluxWeight2.
+            dx = xs[1:] - xs[:-1]
+            fluxY1 = fluxYs[:-1]
+            fluxY2 = fluxY1 if self.__fluxFlat else fluxYs[1:]
+            fluxWeight1 = ( 2 * fluxY1 + fluxY2 ) * dx
+            fluxWeight2 = ( fluxY1 + 2 * fluxY2 ) * dx
+            fluxWeight12 = None
+            numberOfIntervals = len( dx )       # As the group boundaries are in xs, each group is a contiguous run of intervals.
+            starts = numpy.searchsorted( xs, self.groupBoundaries ).clip( 0, numberOfIntervals )
+            nonEmpty = starts[1:] > starts[:-1]
+            starts = starts[:-1][nonEmpty]
+            for index, flat in enumerate( flats ) :
+                if( flat ) :
+                    if( fluxWeight12 is None ) : fluxWeight12 = fluxWeight1 + fluxWeight2
+                    integral = ys[index,:-1] * fluxWeight12
+                else :
+                    integral = ys[index,:-1] * fluxWeight1 + ys[index,1:] * fluxWeight2
+                sums[index,nonEmpty] = numpy.add.reduceat( integral, starts )
+
+        if( norm is not None ) :
+            if( isinstance( norm, str ) ) :
+                if( norm != 'dx' ) : raise ValueError( 'Invalid norm "%s".' % norm )
+                norm = numpy.diff( self.groupBoundaries )
+            else :
+                norm = numpy.array( norm, dtype = numpy.float64 )
+                if( len( norm ) != numberOfGroups ) :
+                    raise ValueError( 'Norm length = %d but there are %d groups.' % ( len( norm ), numberOfGroups ) )
+            nonZero = sums != 0.
+            if( numpy.any( nonZero & ( norm == 0. ) ) ) : raise ZeroDivisionError( 'Divide by 0. Norm is 0 for a non-zero group.' )
+            sums = numpy.where( nonZero, sums / numpy.where( norm == 0., 1., norm ), 0. )
+        sums /= 6.
+
+        if( single ) : return( sums[0] )
+        return( sums )
+
+def groupingContextFromStyle( style, tempInfo ) :
+    """
+    Returns the groupingContext for the projectile's group boundaries and the flux of style. It is only created once
+    per tempInfo and stored in tempInfo['groupingContext'].
+    """
+
+    groupingContext_ = tempInfo.get( 'groupingContext' )
+    if( groupingContext_ is None ) :
+        reactionSuite = tempInfo['reactionSuite']
+        groupBoundaries = style.transportables[reactionSuite.projectile.name].group.boundaries
+        groupingContext_ = groupingContext( groupBoundaries, style.flux[0] )
+        tempInfo['groupingContext'] = groupingContext_
+    return( groupingContext_ )
 
 def _groupFunctionsAndFluxInit( style, tempInfo, f1 ) :
 
@@ -86,8 +261,12 @@ def _mutualifyGrouping3Data( f1, f2, f3 ) :
 
 def groupOneFunctionAndFlux( style, tempInfo, f1 ) :
 
+    import numpy
+
     if( isinstance( f1, linkModule.link ) ) : f1 = style.findFormMatchingDerivedStyles( f1.link )
-    groupBoundaries, flux = _groupFunctionsAndFluxInit( style, tempInfo, f1 )
+    if( numpy.all( numpy.diff( f1.xsAsArray( ) ) > 0. ) ) :
+        return( groupingContextFromStyle( style, tempInfo ).group( f1, norm = tempInfo['groupedFlux'] ).tolist( ) )
+    groupBoundaries, flux = _groupFunctionsAndFluxInit( style, tempInfo, f1 )         # f1 has a discontinuity.
     return( f1.groupTwoFunctions( groupBoundaries, flux, norm = tempInfo['groupedFlux'] ) )
 
 def groupTwoFunctionsAndFlux( style, tempInfo, f1, f2, norm = None ) :
@@ -61,8 +61,14 @@
 # 
 # <<END-copyright>>
 
-import math 
-from fudge.core.math import fudgemath
+"""
+Equal-probable bins and sampling tables of linear-linear probability distributions P(x), or of each P(x|value) of an
+XYs2d, for Monte Carlo transport. The functions here work on all distributions of an XYs2d at once: each distribution is
+a row of 2-D numpy arrays, padded to the same number of points by repeating its last point (adding zero width segments).
+"""
+
+from xData import standards as standardsModule
+from xData import XYs as XYsModule
 
 __metaclass__ = type
 
@@ -103,66 +109,185 @@ class equalProbableBinnedData :
 
         return( 0 )
 
+class samplingTables :
+    """
+    Tables for sampling x from each P(x|value) of an XYs2d in constant time per sample, independent of the number of
+    points in P(x|value). For each value (row), the members are:
+
+        values:             the values of the XYs2d (1-D array),
+        xs, pdfs:           the padded x and P(x) values, with each P(x) normalized to 1,
+        cdfs:               the cumulative distribution at each x,
+        aliasProbabilities,
+        aliases:            Walker's alias table for choosing a segment [ xs[i], xs[i+1] ] with probability
+                            cdfs[i+1] - cdfs[i].
+
+    A transport code samples a row's segment with one random number (see aliasTable), then x within the segment by
+    inverting the linear P(x) (see linearInverse). The cdfs can also be used for sampling by bisection.
+    """
+
+    def __init__( self, xys2d, accuracy = 1e-3 ) :
+
+        import numpy
+
+        self.values, self.xs, pdfs = toPaddedArrays( xys2d, accuracy )
+        self.cdfs = cumulativeDistributions( self.xs, pdfs )
+        self.pdfs = pdfs / self.cdfs[:,-1:]
+        self.cdfs /= self.cdfs[:,-1:]
+        self.aliasProbabilities = numpy.zeros( ( len( self.values ), self.xs.shape[1] - 1 ) )
+        self.aliases = numpy.zeros( self.aliasProbabilities.shape, dtype = numpy.int32 )
+        for index, cdf in enumerate( self.cdfs ) :
+            self.aliasProbabilities[index], self.aliases[index] = aliasTable( numpy.diff( cdf ) )
+
+    def __len__( self ) :
+
+        return( len( self.values ) )
+
+    def sample( self, index, random1, random2 ) :
+        """
+        Returns x sampled from the index-th P(x|value) using the two uniform random numbers random1 and random2 in [0, 1).
+        random1 and random2 can be floats or numpy arrays of the same shape.
+        """
+
+        import numpy
+
+        random1, random2 = numpy.asarray( random1, dtype = float ), numpy.asarray( random2, dtype = float )
+        aliasProbabilities, aliases = self.aliasProbabilities[index], self.aliases[index]
+        scaled = random1 * len( aliases )
+        column = numpy.minimum( scaled.astype( int ), len( aliases ) - 1 )
+        segment = numpy.where( scaled - column < aliasProbabilities[column], column, aliases[column] )
+
+        xs, pdfs, cdfs = self.xs[index], self.pdfs[index], self.cdfs[index]
+        area = random2 * ( cdfs[segment+1] - cdfs[segment] )
+        return( linearInverse( xs[segment], xs[segment+1], pdfs[segment], pdfs[segment+1], area ) )
+
+def toPaddedArrays( xys2d, accuracy = 1e-3 ) :
+    """
+    Returns the values of xys2d and the padded 2-D numpy arrays of x and P(x) for its functions. Functions that are not
+    linear-linear XYs1d instances are converted with toPointwise_withLinearXYs( accuracy ).
+    """
+
+    import numpy
+
+    values, functions = [], []
+    for function in xys2d :
+        if( not( isinstance( function, XYsModule.XYs1d ) ) or
+                ( function.interpolation != standardsModule.interpolation.linlinToken ) ) :
+            function = function.toPointwise_withLinearXYs( accuracy = accuracy, lowerEps = 0, upperEps = 0 )
+        values.append( function.value )
+        functions.append( function.copyDataToXsAndYs( ) )
+    if( len( functions ) == 0 ) : raise ValueError( 'no functions to tabulate' )
+
+    length = max( [ len( xs ) for xs, ys in functions ] )
+    if( length < 2 ) : raise ValueError( 'functions must have at least 2 points' )
+    xs, ys = numpy.zeros( ( len( functions ), length ) ), numpy.zeros( ( len( functions ), length ) )
+    for index, ( functionXs, functionYs ) in enumerate( functions ) :
+        xs[index,:len( functionXs )], ys[index,:len( functionYs )] = functionXs, functionYs
+        xs[index,len( functionXs ):], ys[index,len( functionYs ):] = functionXs[-1], functionYs[-1]
+    return( numpy.array( values, dtype = float ), xs, ys )
+
+def cumulativeDistributions( xs, ys ) :
+    """
+    Returns the running integrals of the linear-linear functions in the rows of the 2-D arrays xs and ys, starting with 0
+    at xs[:,0]. Raises ValueError if a function's integral is not positive.
+    """
+
+    import numpy
+
+    cdfs = numpy.zeros( xs.shape )
+    cdfs[:,1:] = numpy.cumsum( 0.5 * ( ys[:,1:] + ys[:,:-1] ) * numpy.diff( xs, axis = 1 ), axis = 1 )
+    if( numpy.any( cdfs[:,-1] <= 0 ) ) :
+        raise ValueError( 'distribution %d has integral %e <= 0' % ( numpy.argmin( cdfs[:,-1] ), cdfs[:,-1].min( ) ) )
+    return( cdfs )
+
+def linearInverse( x1, x2, y1, y2, area ) :
+    """
+    Returns x such that the integral from x1 to x of the linear function through ( x1, y1 ) and ( x2, y2 ) is area.
+    All arguments are numpy arrays (or floats) of the same shape and the y's must be non-negative.
+    """
+
+    import numpy
+
+    dx = x2 - x1
+    with numpy.errstate( divide = 'ignore', invalid = 'ignore' ) :
+        slope = numpy.where( dx > 0, ( y2 - y1 ) / numpy.where( dx > 0, dx, 1. ), 0. )
+        sqrtArgument = y1 * y1 + 2. * slope * area
+        if( numpy.any( y1 * y1 * 1e-12 < -sqrtArgument ) ) :
+            index = numpy.argmin( sqrtArgument + y1 * y1 * 1e-12 )
+            raise ValueError( 'b^2 + 2 a c  = %e < 0. a = %e, b = %e c = %e' %
+                    ( numpy.ravel( sqrtArgument )[index], numpy.ravel( slope )[index], numpy.ravel( y1 )[index], numpy.ravel( area )[index] ) )
+        x = x1 + 2. * area / ( numpy.sqrt( numpy.maximum( sqrtArgument, 0. ) ) + y1 )  # Stable form of the quadratic's root.
+    return( numpy.where( area > 0, x, x1 ) )
+
+def aliasTable( weights ) :
+    """
+    Returns the arrays ( probabilities, aliases ) of Walker's alias table (built with Vose's method) for choosing index i
+    with probability weights[i] / sum( weights ). To sample, pick a column j uniformly and return j with probability
+    probabilities[j], otherwise aliases[j].
+    """
+
+    import numpy
+
+    weights = numpy.asarray( weights, dtype = float )
+    length = len( weights )
+    scaled = length * weights / weights.sum( )
+    probabilities, aliases = numpy.ones( length ), numpy.arange( length, dtype = numpy.int32 )
+    small = [ index for index in range( length ) if( scaled[index] < 1. ) ]
+    large = [ index for index in range( length ) if( scaled[index] >= 1. ) ]
+    while( ( len( small ) > 0 ) and ( len( large ) > 0 ) ) :
+        smallIndex, largeIndex = small.pop( ), large[-1]
+        probabilities[smallIndex], aliases[smallIndex] = scaled[smallIndex], largeIndex
+        scaled[largeIndex] -= 1. - scaled[smallIndex]
+        if( scaled[largeIndex] < 1. ) : small.append( large.pop( ) )
+    return( probabilities, aliases )        # Entries left in small or large (from round-off) keep probability 1.
+
+def equalProbableBinsArrays( nBins, xs, ys ) :
+    """
+    Returns the 2-D numpy array of the nBins + 1 equal-probable bin boundaries of each linear-linear function in the rows
+    of the 2-D arrays xs and ys (see toPaddedArrays). The boundaries are found for all functions at once, by a
+    vectorized search of each function's cumulative distribution and inversion of its linear segments.
+    """
+
+    import numpy
+
+    nFunctions, length = xs.shape
+    cdfs = cumulativeDistributions( xs, ys )
+    pdfs = ys / cdfs[:,-1:]
+    cdfs /= cdfs[:,-1:]
+
+    fractions = numpy.arange( 1, nBins ) / float( nBins )
+    offsets = 2. * numpy.arange( nFunctions )[:,None]               # Separates the rows so one sorted search does all of them.
+    indices = numpy.searchsorted( ( cdfs + offsets ).ravel( ), ( fractions[None,:] + offsets ).ravel( ), side = 'left' )
+    rows = numpy.repeat( numpy.arange( nFunctions ), nBins - 1 )
+    segments = numpy.clip( indices - rows * length - 1, 0, length - 2 )
+
+    area = numpy.maximum( numpy.tile( fractions, nFunctions ) - cdfs[rows,segments], 0. )
+    x = linearInverse( xs[rows,segments], xs[rows,segments+1], pdfs[rows,segments], pdfs[rows,segments+1], area )
+    domainMax = numpy.maximum( numpy.abs( xs[rows,0] ), numpy.abs( xs[rows,-1] ) )
+    x[( numpy.abs( x ) < 3e-16 ) & ( 1e-8 * domainMax > numpy.abs( x ) )] = 0.     # Special case for when x should probably be 0.
+
+    boundaries = numpy.zeros( ( nFunctions, nBins + 1 ) )
+    boundaries[:,1:-1] = x.reshape( nFunctions, nBins - 1 )
+    nonZero = ys != 0
+    first = numpy.argmax( nonZero, axis = 1 )                       # Data starting or ending with more than one P(x) = 0
+    last = length - 1 - numpy.argmax( nonZero[:,::-1], axis = 1 )   # have bins starting at the last leading zero and ending
+    boundaries[:,0] = xs[numpy.arange( nFunctions ),numpy.maximum( first - 1, 0 )]                 # at the first trailing zero.
+    boundaries[:,-1] = xs[numpy.arange( nFunctions ),numpy.minimum( last + 1, length - 1 )]
+    return( boundaries )
+
+def equalProbableBins2d( nBins, xys2d, accuracy = 1e-3 ) :
+    """
+    Returns the values of xys2d and the 2-D numpy array of the nBins + 1 equal-probable bin boundaries of each of its
+    functions (one row per value). See toPaddedArrays for the meaning of accuracy.
+    """
+
+    values, xs, ys = toPaddedArrays( xys2d, accuracy )
+    return( values, equalProbableBinsArrays( nBins, xs, ys ) )
+
 def equalProbableBins( nBins, xy ) :
+    """Returns the nBins + 1 equal-probable bin boundaries of xy, a list of [ x, P(x) ] pairs or a linear-linear XYs1d."""
+
+    import numpy
 
-    S = fudgemath.runningYSum( xy )
-    SMax = S.data[-1][1]
-    dS = SMax / nBins
-    i = 0
-    yp1 = xy[i][1]
-    x1, y1 = S.data[0]
-    iSum = 0
-    runningSum = 0.
-    epbs = [ x1 ]
-    domainMax = max( abs( xy[0][0] ), abs( xy[-1][0] ) )
-    for x2, y2 in S.data :
-        yp2 = xy[i][1]
-        exitLoop = False
-        if( x1 != x2 ) :
-            while( ( runningSum + dS ) <= y2 ) :
-                iSum += 1
-                if( iSum == nBins ) :
-                    exitLoop = True
-                    break
-                runningSum = SMax * ( float( iSum ) / float( nBins ) )
-                c = runningSum - y1
-                if( c == 0. ) : continue
-                if( yp1 == yp2 ) :
-                    if( yp1 != 0. ) :
-                        x = x1 + c / yp1
-                    else :                                                      # Both yp1 and yp2 are zero.
-                        x = None
-                else :
-                    a = ( yp2 - yp1 ) / ( x2 - x1 )
-                    b = yp1
-                    sqrtArgument = b * b + 2. * a * c
-                    if( sqrtArgument < 0. ) :
-                        if(b * b * 1e-12 < -sqrtArgument) : raise Exception( 'equalProbableBins: b^2 + 2 a c  = %e < 0. a = %e, b = %e c = %e' % ( sqrtArgument, a, b, c ) )
-                        sqrtArgument = 0.
-                    x = x1 + 2. * c / ( math.sqrt( sqrtArgument ) + b ) # c (a) should be -c (a/2)
-                if( x is not None ) :
-                    if( ( abs( x ) < 3e-16 ) and ( 1e-8 * domainMax > abs( x ) ) ) : x = 0.  # Special case for when x should probably be 0.
-                    epbs.append( x )
-        if( exitLoop ) : break
-        i += 1
-        x1 = x2
-        y1 = y2
-        yp1 = yp2
-    if( len( epbs ) != ( nBins + 1 ) ) : epbs.append( S.data[-1][0] )
-
-    i = 0                               # Correct for case where data starts with more than one P(mu) = 0.
-    for x, y in xy :
-        if( y != 0. ) : break
-        i += 1
-    i -= 1
-    if( i > 0 ) : epbs[0] = xy[i][0]
-
-    i = 0                               # Correct for case where data ends with more than one P(mu) = 0.
-    iEnd = 0
-    for x, y in xy :
-        if( y != 0. ) : iEnd = i
-        i += 1
-    iEnd += 1
-    if( iEnd < len( xy ) ) : epbs[-1] = xy[iEnd][0]
-
-    return( equalProbableBinnedData( epbs ) )
+    if( isinstance( xy, XYsModule.XYs1d ) ) : xy = xy.copyDataToXYs( )
+    xy = numpy.array( xy, dtype = float )
+    return( equalProbableBinnedData( equalProbableBinsArrays( nBins, xy[None,:,0], xy[None,:,1] )[0].tolist( ) ) )
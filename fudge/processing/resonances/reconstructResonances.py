@@ -122,7 +122,7 @@ from xData import XYs as XYsModule
 
 __metaclass__ = type
 
-debug = False   # recommend setting to True before debugging (disables multiprocessing)
+debug = False   # recommend setting to True before debugging (disables the @blockwise worker pool)
 
 VERBOSE = False
 
@@ -214,10 +214,13 @@ def getAllowedTotalSpins( L, S, useFactor2Trick=True ):
     else: return [ j/2.0 for j in getAllowedTotalSpins( int(L*2), int(S*2) ) ]
 
 
-def reconstructResonances(reactionSuite, tolerance=None, verbose=False):
+def reconstructResonances(reactionSuite, tolerance=None, verbose=False, nProcesses=None, windowWidths=None):
     """ reconstruct all resonance cross sections (resolved/unresolved) in reactionSuite,
     add results together for full (resonance region) pointwise cross section.
-    If tolerance is specified, refine grid to required tolerance for (lin-lin) interpolation """
+    If tolerance is specified, refine grid to required tolerance for (lin-lin) interpolation.
+    nProcesses sets the number of worker processes used in the resolved region (default: number of CPUs).
+    If windowWidths is given, SLBW, MLBW and Reich_Moore sums only include resonances within that many widths of
+    each energy explicitly, and treat the others as a smooth background (see windowedResonanceSum) """
 
     egrids, xsecs = [], []
 
@@ -229,13 +232,17 @@ def reconstructResonances(reactionSuite, tolerance=None, verbose=False):
     # Helper function to reconstruct one region, used for single & multiple regions as well as URR ensembles
     def resolvedReconstruct( formalism, sectionIndex = None ):
         resCls = getResonanceReconstructionClass(formalism.moniker)
-        reconstructClass = resCls( reactionSuite, sectionIndex, enableAngDists=False, verbose=verbose )
-        egrid = reconstructClass.generateEnergyGrid()
-        xsecs_now = reconstructClass.getCrossSection( egrid )
-        if tolerance:
-            egrid, xsecs_now, messages = reconstructClass.refineInterpolation(numpy.array(egrid), xsecs_now, tolerance)
-            if verbose:
-                for message in messages: print (message)
+        reconstructClass = resCls( reactionSuite, sectionIndex, enableAngDists=False, verbose=verbose, nProcesses=nProcesses,
+                windowWidths=windowWidths )
+        try:
+            egrid = reconstructClass.generateEnergyGrid()
+            xsecs_now = reconstructClass.getCrossSection( egrid )
+            if tolerance:
+                egrid, xsecs_now, messages = reconstructClass.refineInterpolation(numpy.array(egrid), xsecs_now, tolerance)
+                if verbose:
+                    for message in messages: print (message)
+        finally:
+            reconstructClass.closeWorkerPool()
         return egrid, xsecs_now
 
     # Resolved resonance reconstruction
@@ -310,7 +317,7 @@ def reconstructResonances(reactionSuite, tolerance=None, verbose=False):
     return xsecs_final
 
 
-def reconstructAngularDistributions(reactionSuite, tolerance=None, verbose=False):
+def reconstructAngularDistributions(reactionSuite, tolerance=None, verbose=False, nProcesses=None):
     """
     Reconstruct all pure two-body angular distributions from the resonance region.
     For MLBW and RM, that means 'elastic' channel only, but R-Matrix evaluations can support additional channels.
@@ -328,7 +335,7 @@ def reconstructAngularDistributions(reactionSuite, tolerance=None, verbose=False
 
         # Get the correct class
         resCls = getResonanceReconstructionClass(formalism.moniker)
-        reconstructClass = resCls( reactionSuite, sectionIndex, enableAngDists=True, verbose=verbose )
+        reconstructClass = resCls( reactionSuite, sectionIndex, enableAngDists=True, verbose=verbose, nProcesses=nProcesses )
 
         # Deal with potential thresholds by splitting up the energy grid at the thresholds
         fullEgrid = reconstructClass.generateEnergyGrid()
@@ -347,14 +354,18 @@ def reconstructAngularDistributions(reactionSuite, tolerance=None, verbose=False
 
         # Now do the calculation & merge the different regions
         angularResults={}
-        for egrid in subgrids:
-            print "Working egrid: [%s, ..., %s]"%(str(egrid[0]),str(egrid[-1]))
-            thisAngularResults = reconstructClass.getAngularDistribution( egrid, keepL0Term=True, renormalize=True )
-            if tolerance:
-                raise NotImplementedError("Refining interpolation grid for angular distributions")
-            for reaction, results in thisAngularResults.items():
-                if reaction not in angularResults: angularResults[reaction] = []
-                angularResults[reaction] += zip( egrid, numpy.array( results ).squeeze().T )
+        try:
+            for egrid in subgrids:
+                if verbose:
+                    print "Working egrid: [%s, ..., %s]"%(str(egrid[0]),str(egrid[-1]))
+                thisAngularResults = reconstructClass.getAngularDistribution( egrid, keepL0Term=True, renormalize=True )
+                if tolerance:
+                    raise NotImplementedError("Refining interpolation grid for angular distributions")
+                for reaction, results in thisAngularResults.items():
+                    if reaction not in angularResults: angularResults[reaction] = []
+                    angularResults[reaction] += zip( egrid, numpy.array( results ).squeeze().T )
+        finally:
+            reconstructClass.closeWorkerPool()
         return angularResults
 
     if reactionSuite.resonances.resolved:
@@ -413,90 +424,236 @@ def reconstructURRCrossSectionPDF(reactionSuite, tolerance=None, verbose=False,
     return URRcrossSection( reactionSuite, verbose ).getURRPDF( resCls )
 
 
+def reconstructURRProbabilityTables(reactionSuite, verbose=False, **kwargs):
+    """
+    Generate unresolved resonance probability tables from the average parameters in reactionSuite.resonances.
+    See URRcrossSection.getProbabilityTables for the keyword arguments and the returned tables.
+    """
+    if not reactionSuite.resonances.unresolved:
+        raise ValueError("No unresolved resonance region in %s" % reactionSuite.inputParticlesToReactionString())
+    return URRcrossSection( reactionSuite, verbose ).getProbabilityTables( verbose=verbose, **kwargs )
+
+
 """
 @blockwise: function decorator for improving performance in resolved region.
 Each 'getCrossSection' and 'getAngularDistribution' method is wrapped by this function.
-If we have lots of incident energies, this splits up a calculation using the multiprocessing module.
-May still need to tweak the 'NE' and 'nprocesses' variables for best performance.
+If we have lots of incident energies, the calculation is split into chunks that are handed to a persistent
+pool of worker processes (see class workerPool). The pool is started the first time it is needed and lives as long
+as the reconstruction class (or until closeWorkerPool is called), so repeated calls from refineInterpolation
+do not pay the process start-up cost again.
 """
 def blockwise(function):
     def wrapped(self,E,**kwargs):
-        if debug:
-            # disable multiprocessing
-            if numpy.isscalar(E):
-                E = numpy.array([[E]])
-            else:
-                E = numpy.array(E).reshape(len(E),1)
-            return function(self,E,**kwargs)
-
         if numpy.isscalar(E):
             E = numpy.array([[E]])
             return function(self,E,**kwargs)
-        else:
-            NE = len(E)
-            # turn E into a column vector
-            E = numpy.array(E).reshape(NE,1)
-            if NE < 1000: # faster to run directly
-                return function(self,E,**kwargs)
-            else:
-                from multiprocessing import Process, Queue
-                queue = Queue()
-
-                def enqueue_result(elist, Slice, queue):
-                    # perform the calculation, put result in the queue
-                    result = function(self, elist, **kwargs)
-                    queue.put( (Slice, result) )
-                    return
-
-                jobs = []
-                nprocesses = 8  # number of processes to spawn
-                # how many energies does each process calculate?
-                chunk = int(numpy.ceil((NE+0.) / nprocesses))
-                for pid in range(nprocesses): # start the calculations
-                    Slice = slice(pid*chunk, (pid+1)*chunk)
-                    p = Process(target=enqueue_result, args=(E[Slice], Slice, queue))
-                    jobs.append(p)
-                    p.start()
-
-                for pid in range(nprocesses): # collect results as they finish
-                    Slice, vals = queue.get()
-                    if function.__name__ == 'getCrossSection':
-                        if pid==0:
-                            result = dict.fromkeys( vals )
-                            for key in result: result[key] = numpy.zeros(NE)
-                        for key in result:
-                            result[key][Slice] = vals[key]
-                    elif function.__name__ == 'getAngularDistribution':
-                        if pid==0:
-                            result = dict.fromkeys( vals )
-                            for key in result: result[key] = [numpy.zeros((NE,1)) for L in range(len(vals[key]))]
-                        for key in result:
-                            for L in range(len(vals[key])):
-                                result[key][L][Slice] = vals[key][L]
-                    else:
-                        raise NotImplementedError("Blockwise computation for function %s" % function.__name__)
 
-                # allow child processes to exit:
-                for job in jobs: job.join()
-                return result
+        NE = len(E)
+        # turn E into a column vector
+        E = numpy.array(E).reshape(NE,1)
+        pool = None
+        if not debug: pool = self.getWorkerPool()
+        if pool is None or NE < pool.minimumEnergies: # faster to run directly
+            return function(self,E,**kwargs)
+        return pool.evaluate(self, function, E, **kwargs)
+    wrapped.__name__ = function.__name__
+    wrapped.__doc__ = function.__doc__
+    wrapped.__wrapped__ = function
     return wrapped
 
 
+_workerInstances = {}   # reconstruction classes inherited by forked workers, keyed by workerPool.key
+
+def _workerEvaluate( args ):
+    """
+    Runs in a worker process: evaluate one chunk of energies and store the results in the shared array.
+    Returns the number of rows used by each result, any rows that did not fit in the shared array and the
+    worker's windowedSumErrorEstimate (see RRBaseClass.sumOverResonances).
+    """
+    key, functionName, E, start, layout, bufferName, bufferShape, kwargs = args
+    instance = _workerInstances[key]
+    method = getattr( instance.__class__, functionName )
+    function = getattr( method, '__func__', method ).__wrapped__
+    result = function( instance, E, **kwargs )
+    shared = numpy.memmap( bufferName, dtype=numpy.float64, mode='r+', shape=bufferShape )
+    rowsUsed, overflow = workerPool.storeResult( result, layout, shared, slice( start, start+len(E) ) )
+    shared.flush()
+    del shared
+    return start, start+len(E), rowsUsed, overflow, getattr( instance, 'windowedSumErrorEstimate', 0.0 )
+
+
+class workerPool:
+    """
+    Persistent pool of worker processes used by the @blockwise decorator.
+
+    Workers are forked from the process that owns the reconstruction class, so they inherit its resonance parameters
+    and only the energies (and keyword arguments) are sent to them. Results are written directly into a
+    numpy.memmap in shared memory (/dev/shm when available) instead of being pickled back through a queue.
+    Energies are handed out in chunks of decreasing size (guided scheduling) so all workers finish at about the same time.
+
+    :param nProcesses: number of worker processes. Defaults to multiprocessing.cpu_count()
+    :param minimumChunkSize: smallest number of energies sent to a worker at one time
+    """
+
+    def __init__(self, nProcesses=None, minimumChunkSize=250):
+        import multiprocessing, os
+        if nProcesses is None: nProcesses = multiprocessing.cpu_count()
+        self.nProcesses = max( 1, int(nProcesses) )
+        self.minimumChunkSize = max( 1, int(minimumChunkSize) )
+        self.key = None
+        self.ownerPid = os.getpid()
+        self.pool = None
+
+    def __del__(self):
+        self.close()
+
+    @property
+    def minimumEnergies(self):
+        """ below this many energies it is faster to compute in the calling process """
+        return 4 * self.minimumChunkSize
+
+    def start(self, reconstructClass):
+        """ fork the workers. They get a copy of reconstructClass, which must not change while the pool is in use """
+        import multiprocessing
+        if self.pool is not None: return
+        self.key = id(reconstructClass)
+        _workerInstances[self.key] = reconstructClass
+        try: self.pool = multiprocessing.Pool( self.nProcesses )
+        finally: del _workerInstances[self.key]    # workers hold their own copy
+
+    def close(self):
+        import os
+        if self.pool is not None and os.getpid() == self.ownerPid:
+            self.pool.terminate()
+            self.pool.join()
+        self.pool = None
+
+    def chunks(self, start, stop):
+        """ list of (start, stop) index pairs covering range(start, stop), largest chunks first """
+        chunks = []
+        while start < stop:
+            size = max( self.minimumChunkSize, int( math.ceil( (stop-start) / (2.0*self.nProcesses) ) ) )
+            chunks.append( (start, min(stop, start+size)) )
+            start += size
+        return chunks
+
+    @staticmethod
+    def getLayout(result, reserveRows=0):
+        """
+        From the result of one chunk, decide which rows of the shared array hold each result.
+        Cross sections take one row each. Angular distributions (lists of Legendre coefficients) get at least
+        reserveRows rows, since the number of coefficients may differ from one chunk to the next.
+        """
+        layout, row = [], 0
+        for key in sorted(result):
+            isList = isinstance( result[key], list )
+            nRows = max( len(result[key]), reserveRows ) if isList else 1
+            layout.append( (key, row, nRows, isList) )
+            row += nRows
+        return layout, row
+
+    @staticmethod
+    def storeResult(result, layout, shared, Slice):
+        rowsUsed, overflow = {}, {}
+        for key, row, nRows, isList in layout:
+            if isList:
+                values = result[key]
+                rowsUsed[key] = len(values)
+                for index, value in enumerate( values[:nRows] ):
+                    shared[row+index,Slice] = numpy.asarray(value).flatten()
+                if len(values) > nRows:
+                    overflow[key] = [ numpy.asarray(value).flatten() for value in values[nRows:] ]
+            else:
+                rowsUsed[key] = 1
+                shared[row,Slice] = result[key]
+        return rowsUsed, overflow
+
+    def evaluate(self, reconstructClass, function, E, **kwargs):
+        """
+        Evaluate function (an undecorated getCrossSection or getAngularDistribution) at energies E (a column vector).
+        The first chunk is computed in this process to find out the shape of the results.
+        """
+        import tempfile, os
+
+        NE = len(E)
+        first = min( NE, self.minimumChunkSize )
+        firstResult = function( reconstructClass, E[:first], **kwargs )
+        reserveRows = 0
+        if function.__name__ == 'getAngularDistribution':
+            reserveRows = reconstructClass.getLMax() + 3
+        layout, nRows = self.getLayout( firstResult, reserveRows )
+
+        self.start( reconstructClass )
+        bufferDirectory = '/dev/shm' if os.path.isdir('/dev/shm') else None
+        fd, bufferName = tempfile.mkstemp( prefix='fudge_blockwise_', dir=bufferDirectory )
+        os.close(fd)
+        try:
+            shared = numpy.memmap( bufferName, dtype=numpy.float64, mode='w+', shape=(nRows,NE) )
+            rowsUsed, overflow = self.storeResult( firstResult, layout, shared, slice(0,first) )
+            overflows = [ (0, first, overflow) ]
+            tasks = [ (self.key, function.__name__, E[start:stop], start, layout, bufferName, (nRows,NE), kwargs)
+                    for start, stop in self.chunks( first, NE ) ]
+            for start, stop, chunkRows, overflow, errorEstimate in self.pool.imap_unordered( _workerEvaluate, tasks ):
+                for key in chunkRows: rowsUsed[key] = max( rowsUsed[key], chunkRows[key] )
+                if overflow: overflows.append( (start, stop, overflow) )
+                if hasattr( reconstructClass, 'windowedSumErrorEstimate' ):
+                    reconstructClass.windowedSumErrorEstimate = max( reconstructClass.windowedSumErrorEstimate, errorEstimate )
+            data = numpy.array( shared )
+            del shared
+        finally:
+            os.remove( bufferName )
+
+        result = {}
+        for key, row, nReserved, isList in layout:
+            if isList:
+                values = [ data[row+index].reshape(NE,1) for index in range( min( nReserved, rowsUsed[key] ) ) ]
+                while len(values) < rowsUsed[key]: values.append( numpy.zeros((NE,1)) )
+                for start, stop, overflow in overflows:
+                    for index, value in enumerate( overflow.get(key,[]) ):
+                        values[nReserved+index][start:stop,0] = value
+                result[key] = values
+            else:
+                result[key] = data[row]
+        return result
+
+
 # base class common to resolved and unresolved resonance reconstruction
 class resonanceReconstructionBaseClass:
 
     __metaclass__ = abc.ABCMeta
 
-    def __init__(self, reactionSuite, **kw):
+    def __init__(self, reactionSuite, nProcesses=None, **kw):
         self.projectile = reactionSuite.projectile
         self.target = reactionSuite.target
         self.spin = self.target.getSpin().value
         neutronMass = reactionSuite.getParticle( 'n' ).getMass('amu')
         self.targetToNeutronMassRatio = self.target.getMass('amu') / neutronMass
+        self.nProcesses = nProcesses    # for @blockwise methods. None means use all CPUs, 1 disables multiprocessing
+        self.__workerPool = None
 
     @abc.abstractmethod
     def getCrossSection(self, E): pass
 
+    def getWorkerPool(self):
+        """
+        Returns the workerPool used by @blockwise methods, or None if everything should be computed in this process
+        (only one process requested or available, or we are already running inside a worker process).
+        """
+        import multiprocessing, sys
+        if self.__workerPool is None:
+            nProcesses = self.nProcesses
+            if nProcesses is None: nProcesses = multiprocessing.cpu_count()
+            if nProcesses < 2 or sys.platform.startswith('win') or multiprocessing.current_process().daemon:
+                return None
+            self.__workerPool = workerPool( nProcesses )
+        return self.__workerPool
+
+    def closeWorkerPool(self):
+        """ stop worker processes started by @blockwise methods. A new pool is started if they are needed again """
+        if self.__workerPool is not None:
+            self.__workerPool.close()
+            self.__workerPool = None
+
     def k(self, energy):
         """
         For an incident neutron, with energy in eV, the ENDF manual states
@@ -547,133 +704,118 @@ class resonanceReconstructionBaseClass:
             return phi_Lminus1 - numpy.arctan(P_Lminus1 / (L-S_Lminus1))
 
     # for use after the cross section has been calculated on the initial grid:
-    def refineInterpolation(self, egrid, xsecs, tolerance=0.01):
+    def refineInterpolation(self, egrid, xsecs, tolerance=0.01, absoluteTolerance=0.0, reactionTolerances=None,
+            maxIterations=100, minimumSpacing=1e-10):
         """ generateEnergyGrid may not give a fine enough grid to linearly interpolate to desired tolerance.
         My solution to that: for all consecutive points (x0,y0), (x1,y1) and (x2,y2) do a linear interpolation between
         (x0,y0) and (x2,y2). If the interpolation doesn't agree with (x1,y1) within tolerance,
         subdivide up the region by adding two more calculated points.  Keep iterating until interpolation agrees within tolerance.
 
+        The work is done by gridRefinement, which only re-checks points whose neighbors changed in the last pass,
+        so each pass costs O(number of new points) plus one vectorized insert.
+
         This means that in the end we will have more points than required for given tolerance.
         The results can be thinned (implemented in XYs)
+
+        :param tolerance: relative tolerance for linear interpolation
+        :param absoluteTolerance: differences smaller than this (in b) are always accepted
+        :param reactionTolerances: optional dict {reaction: (tolerance, absoluteTolerance)} overriding the above
+        :param maxIterations: maximum number of refinement passes
+        :param minimumSpacing: intervals narrower than minimumSpacing * energy are not subdivided
+        :return: tuple (egrid, xsecs, messages)
         """
-        def checkInterpolation(x,y):
-            """
-            Does a linear interpolation of each point from its two nearest neighbors,
-            checks where the interpolation is insufficient and returns two lists:
-                1: list of indices (in array x) where additional points are needed,
-                2: list of corresponding energies where resonances need to be reconstructed and inserted into array y
-
-            @type x: numpy.multiarray.ndarray
-            @type y: numpy.multiarray.ndarray
-            :return:
-            """
-            m = (y[2:]-y[:-2])/(x[2:]-x[:-2])
-            delta_x = x[1:-1] - x[:-2]
-            b = y[:-2]
-
-            # add first and last points back in, for easier comparison with
-            # original y values:
-            interpolated = numpy.zeros_like(x)
-            interpolated[1:-1] = m*delta_x+b
-            interpolated[0] = y[0]; interpolated[-1] = y[-1]
-
-            # find where original and interpolated grids differ by more than tolerance
-            # silence div/0 warnings for this step, since xsc = 0 case is explicitly handled below
-            with numpy.errstate( divide='ignore', invalid='ignore' ):
-                delt = interpolated / y
-                mask = (delt>1+tolerance) + (delt<1-tolerance) # boolean array
-
-            badindices = numpy.arange(len(mask))[ mask ]
-            # at these points, we need a finer mesh
-
-            # switch to absolute convergence condition for very small cross sections (i.e. near thresholds):
-            smallXSec = 1e-50
-            zeros = (y[badindices-1]<smallXSec) + (y[badindices]<smallXSec) + (y[badindices+1]<smallXSec)
-            if any(zeros):
-                ignore = []
-                for idx in badindices[ zeros ]:
-                    if abs(y[idx]-y[idx-1])<1e-3 and abs(y[idx+1]-y[idx])<1e-3:
-                        mask[ idx ] = False
-                        ignore.append( idx )
-                badindices = list(badindices)
-                for idx in ignore[::-1]:
-                    badindices.remove(idx)
-
-            midpoints = (x[:-1]+x[1:])/2
-            energies_needed = sorted( set( list( midpoints[mask[1:]]) + list( midpoints[mask[:-1]]) ) )
-            return badindices, energies_needed
-
-        def mergeArrays( newIdx, x1, x2, y1, y2 ):
-            # from the list of 'bad' points in original array x1, obtain two new integer arrays, a1 and a2,
-            # containing indices to insert x1 and x2 into merged array. Use these to quickly merge all data:
-            newLen = len(x1)+len(x2)
-            a1,a2 = [],[]
-            nic = iter( newIdx )
-            if len(newIdx)==1: idnow, idnext = nic.next(), -1
-            else: idnow, idnext = nic.next(), nic.next()
-            current, offset = idnow, 0
-            extraPoint = False
-
-            for val in xrange(newLen):
-                if val==current:
-                    a2.append(val)
-                    offset += 1
-                    if idnext==idnow+1:
-                        current=idnext + offset
-                        idnow = idnext
-                        try: idnext = nic.next()
-                        except StopIteration: idnext = -1
-                    elif extraPoint:
-                        extraPoint = False
-                        current=idnext + offset
-                        idnow = idnext
-                        try: idnext = nic.next()
-                        except StopIteration: idnext = -1
-                    else:
-                        extraPoint = True
-                        current += 2
-                else:
-                    a1.append(val)
+        refinement = gridRefinement( egrid, xsecs, tolerance=tolerance, absoluteTolerance=absoluteTolerance,
+                reactionTolerances=reactionTolerances, minimumSpacing=minimumSpacing )
+        messages = refinement.refine( self.getCrossSection, maxIterations=maxIterations )
+        return refinement.egrid, refinement.xsecs, messages
 
-            # a1 and a2 now hold the indices for inserting x1 and x2 into merged array
-            xnew = numpy.zeros(newLen)
-            xnew[a1] = x1; xnew[a2] = x2
-            ynew = {}
-            for key in y1:
-                ynew[key] = numpy.zeros(newLen)
-                ynew[key][a1] = y1[key]; ynew[key][a2] = y2[key]
-            return xnew, ynew
 
+class gridRefinement:
+    """
+    Adaptive refinement of an energy grid so that every cross section can be linearly interpolated to a
+    requested tolerance.
+
+    A point x1 passes if linear interpolation between its neighbors x0 and x2 agrees with y1 to within the relative
+    tolerance (or the absolute tolerance) for every reaction. If it fails, midpoints are added to both intervals
+    next to it. The test at a point only changes when one of its neighbors changes, so the state kept between passes
+    is the set of points still to be checked (new points and their neighbors): points in converged parts of the grid
+    are never checked again. New midpoints are evaluated in one batch, and merged with numpy.insert.
+    """
+
+    smallCrossSection = 1e-50   # below this, also accept differences less than 1e-3 b (near thresholds)
+
+    def __init__(self, egrid, xsecs, tolerance=0.01, absoluteTolerance=0.0, reactionTolerances=None, minimumSpacing=1e-10):
+        self.egrid = numpy.array(egrid, dtype=float)
+        self.xsecs = dict( [ (key, numpy.array(xsecs[key], dtype=float)) for key in xsecs ] )
+        self.tolerance = tolerance
+        self.tolerances = {}
+        for key in self.xsecs:
+            self.tolerances[key] = (tolerance, absoluteTolerance)
+            if reactionTolerances is not None and key in reactionTolerances:
+                self.tolerances[key] = reactionTolerances[key]
+        self.minimumSpacing = minimumSpacing
+        self.unchecked = numpy.ones( len(self.egrid), dtype=bool )   # points that must be (re-)checked
+        self.addedPoints = 0
+        self.tooNarrow = 0
+
+    def badPoints(self, key, indices):
+        """ return the subset of indices (all interior points) where interpolation from the neighbors fails for key """
+        x, y = self.egrid, self.xsecs[key]
+        relative, absolute = self.tolerances[key]
+        x0, x1, x2 = x[indices-1], x[indices], x[indices+1]
+        y0, y1, y2 = y[indices-1], y[indices], y[indices+1]
+        interpolated = y0 + (y2-y0) / (x2-x0) * (x1-x0)
+        difference = numpy.abs( interpolated - y1 )
+        bad = (difference > relative * numpy.abs(y1)) & (difference > absolute)
+        # switch to absolute convergence condition for very small cross sections (i.e. near thresholds):
+        small = (y0 < self.smallCrossSection) | (y1 < self.smallCrossSection) | (y2 < self.smallCrossSection)
+        ignore = small & (numpy.abs(y1-y0) < 1e-3) & (numpy.abs(y2-y1) < 1e-3)
+        return indices[ bad & ~ignore ]
+
+    def intervalsToRefine(self):
+        """ indices i of intervals [egrid[i], egrid[i+1]] that need a midpoint """
+        candidates = numpy.nonzero( self.unchecked[1:-1] )[0] + 1
+        self.unchecked[:] = False
+        bad = []
+        for key in self.xsecs:
+            if not numpy.any( self.xsecs[key] ): continue
+            bad.append( self.badPoints( key, candidates ) )
+        if not bad: return numpy.array( [], dtype=int )
+        bad = numpy.unique( numpy.concatenate( bad ) )
+        intervals = numpy.unique( numpy.concatenate( (bad-1, bad) ) )
+        wide = (self.egrid[intervals+1] - self.egrid[intervals]) > self.minimumSpacing * numpy.abs( self.egrid[intervals+1] )
+        self.tooNarrow += numpy.count_nonzero( ~wide )
+        return intervals[wide]
+
+    def insert(self, intervals, newX, newY):
+        """ insert new points at the midpoints of intervals, and flag them and their neighbors for checking """
+        positions = intervals + 1
+        self.egrid = numpy.insert( self.egrid, positions, newX )
+        for key in self.xsecs:
+            self.xsecs[key] = numpy.insert( self.xsecs[key], positions, newY[key] )
+        self.unchecked = numpy.zeros( len(self.egrid), dtype=bool )
+        newIndices = positions + numpy.arange( len(positions) )
+        for offset in (-1, 0, 1):
+            self.unchecked[ numpy.clip( newIndices + offset, 0, len(self.egrid)-1 ) ] = True
+        self.addedPoints += len(newX)
+
+    def refine(self, getCrossSection, maxIterations=100):
+        """ refine until converged, using getCrossSection( energies ) to compute new points. Returns list of messages """
         messages = []
-        reactionDone = dict.fromkeys(xsecs)  # values are None
-        n_iter = 0
-        addedPoints = 0
-        while True:
-            newX, newIdx = set(), set()
-            for key in xsecs:
-                if not any(xsecs[key]):
-                    continue
-                if not reactionDone[key]:
-                    badindices, energies_needed = checkInterpolation(egrid,xsecs[key])
-                    if len(energies_needed)==0: reactionDone[key] = True
-                    newIdx.update( badindices )
-                    newX.update( energies_needed )
-            newX = sorted(newX)
-            newIdx = sorted(newIdx)
-            if len(newX)==0:    # success!
-                break
-            if n_iter > 20:
+        for iteration in range( maxIterations ):
+            intervals = self.intervalsToRefine()
+            if len(intervals) == 0: break
+            newX = ( self.egrid[intervals] + self.egrid[intervals+1] ) / 2
+            newY = getCrossSection( newX )
+            self.insert( intervals, newX, newY )
+        else:
+            if numpy.any( self.unchecked ):
                 messages.append("Iteration limit exceeded when refining interpolation grid!")
-                break
-            n_iter += 1
-            addedPoints += len(newX)
-            newY = self.getCrossSection( newX )
-            # merge new x/y values with original list:
-            egrid, xsecs = mergeArrays( newIdx, egrid, newX, xsecs, newY )
-
+        if self.tooNarrow:
+            messages.append("%i intervals were narrower than the minimum spacing and were not refined" % self.tooNarrow)
         messages.append("%i points were added (for total of %i) to achieve tolerance of %s%%" %
-            (addedPoints, len(egrid), tolerance*100))
-        return egrid, xsecs, messages
+            (self.addedPoints, len(self.egrid), self.tolerance*100))
+        return messages
 
 
 #### base class for resolved resonance reconstruction ####
@@ -681,10 +823,15 @@ class RRBaseClass(resonanceReconstructionBaseClass):
 
     __metaclass__ = abc.ABCMeta
 
-    def __init__(self, reactionSuite, sectionIndex=None, lowerBound=None, upperBound=None, RR=None, **kw):
+    def __init__(self, reactionSuite, sectionIndex=None, lowerBound=None, upperBound=None, RR=None,
+            windowWidths=None, windowSampledTolerance=1e-6, **kw):
         super(RRBaseClass,self).__init__(reactionSuite, **kw)
         """ store resonance parameters in convenient structure for quick cross section calculations: """
 
+        # windowed summation (SLBW, MLBW and Reich_Moore only), see sumOverResonances:
+        self.windowWidths = windowWidths
+        self.windowSampledTolerance = windowSampledTolerance
+        self.windowedSumErrorEstimate = 0.0
 
         if sectionIndex is not None:
             # energy boundaries for this region (multiple regions are deprecated):
@@ -717,6 +864,11 @@ class RRBaseClass(resonanceReconstructionBaseClass):
         for i in range(len(data)):
             if data[i] is None: data[i] = [0]*nRes
         table = numpy.array( data )
+        # total widths used to size the summation window (see sumOverResonances):
+        resonanceWidths = numpy.abs( table[ params.index('totalWidth') ] )
+        if not any(resonanceWidths):
+            resonanceWidths = sum( [ numpy.abs( table[params.index(key)] ) for key in
+                    ('neutronWidth', 'captureWidth', 'fissionWidthA', 'fissionWidthB') ] )
 
         # sort resonances by L and J, store parameters in numpy arrays
         self.Ls = []
@@ -730,7 +882,8 @@ class RRBaseClass(resonanceReconstructionBaseClass):
                 spinList = LJres[ params.index('channelSpin') ]
                 spins = []
                 for spin in sorted(set(spinList)):
-                    spinRes = LJres[ :, LJres[ params.index('channelSpin') ]==spin ]
+                    spinMask = LJres[ params.index('channelSpin') ]==spin
+                    spinRes = LJres[ :, spinMask ]
                     energies = spinRes[ params.index('energy') ]
                     neutronWidth = ( spinRes[ params.index('neutronWidth') ] /
                         self.penetrationFactor(L,self.rho(abs(energies),L)) )
@@ -745,6 +898,7 @@ class RRBaseClass(resonanceReconstructionBaseClass):
                             'fissionWidthA': spinRes[params.index('fissionWidthA')],
                             'fissionWidthB': spinRes[params.index('fissionWidthB')],
                             'shiftFactor': 0.5*self.shiftFactor(L,self.rho(numpy.abs(energies))),
+                            'totalWidth': resonanceWidths[ Llist==L ][ Jlist==J ][ spinMask ],
                             }
                     spins.append( spindict )
                 Jdict = {
@@ -771,6 +925,49 @@ class RRBaseClass(resonanceReconstructionBaseClass):
                     + table[params.index('fissionWidthA')] + table[params.index('fissionWidthB')] )
         self._widths = totalWidths
 
+    def getResonancesForL(self, L):
+        """
+        Merge the channel spins of one element of self.Ls, so that energy-dependent factors (which only depend
+        on l) can be computed once for all of them.
+
+        :param L: element of self.Ls
+        :return: tuple (gfactors, resonances): gfactors is an array with one g-factor per channel spin, and
+            resonances is a dict of the concatenated spin parameters, plus 'spinIndex' giving the position in
+            gfactors of each resonance's channel spin
+        """
+        spins = [ (J['gfact'], spin) for J in L['Js'] for spin in J['channelSpins'] ]
+        gfactors = numpy.array( [ gfactor for gfactor, spin in spins ] )
+        resonances = {}
+        for key in ('energy', 'neutronWidth', 'captureWidth', 'fissionWidthA', 'fissionWidthB', 'shiftFactor',
+                'totalWidth'):
+            resonances[key] = numpy.concatenate( [ numpy.zeros(0) ] + [ spin[key] for gfactor, spin in spins ] )
+        resonances['spinIndex'] = numpy.concatenate( [ numpy.zeros( 0, dtype=int ) ] +
+                [ index * numpy.ones( len(spin['energy']), dtype=int ) for index, (gfactor, spin) in enumerate(spins) ] )
+        return gfactors, resonances
+
+    def sumOverResonances(self, E, Eres, terms, widths):
+        """
+        Sum per-resonance terms over a set of resonances.
+
+        By default this is just terms(E, slice(None)). If the class was created with windowWidths, each resonance
+        is summed explicitly at energies within windowWidths of its own total widths, and the more distant
+        resonances are treated as a smooth background using windowedResonanceSum. The relative error of that
+        background is checked against windowSampledTolerance at sample energies only (see windowedResonanceSum).
+        The largest error estimate seen (in this process) is kept in self.windowedSumErrorEstimate.
+
+        :param E: column vector of incident energies
+        :param Eres: 1-d array of resonance energies
+        :param terms: function terms(E, indices), returning an array with one row per energy and one column per
+            quantity, each summed over resonances Eres[indices]
+        :param widths: 1-d array with the total width of each resonance in Eres
+        """
+        if self.windowWidths is None or len(Eres) == 0:
+            return terms(E, slice(None))
+        window = self.windowWidths * numpy.abs(widths)
+        sums, errorEstimate = windowedResonanceSum( E, Eres, terms, window, sampledTolerance=self.windowSampledTolerance )
+        self.windowedSumErrorEstimate = max( self.windowedSumErrorEstimate, errorEstimate )
+        return sums
+
     def rho(self, E, L=None):
         """get the channel radius, rho. If L is specified try to get L-dependent value"""
         if self.RR.calculateChannelRadius:
@@ -1586,30 +1783,53 @@ class SLBWcrossSection(RRBaseClass):
 
         raise NotImplementedError("Angular distributions cannot be safely reconstructed using Single-Level Breit-Wigner approximation")
 
+    def resonanceTerms(self, l, gfactors, resonances):
+        """
+        Returns function terms(E, indices) for sumOverResonances, giving the capture, fission and elastic
+        sums (weighted by g-factor) over resonances['energy'][indices]. See getResonancesForL for the arguments.
+        rho, phi, penetrability and shift factor only depend on l, so they are computed once for all channel spins.
+        """
+        def terms(E, indices):
+            rho = self.rho(E)
+            # for calculating phi, always use tabulated scattering radius:
+            rhohat = self.RR.scatteringRadius.getValueAs('10*fm') * self.k(E)
+            phi = self.phi(l,rhohat)
+            P = self.penetrationFactor(l,rho)
+            S = 0.5*self.shiftFactor(l,rho)
+            indices = numpy.arange( len(resonances['energy']) )[indices]
+            sums = numpy.zeros( (len(E), 3) )
+            for spinIndex, gfactor in enumerate(gfactors):
+                spin = indices[ resonances['spinIndex'][indices] == spinIndex ]
+                if len(spin) == 0: continue
+                energy, neutronWidth, captureWidth, fissionWidthA, shiftFactor = [ resonances[key][spin] for key in
+                        ('energy', 'neutronWidth', 'captureWidth', 'fissionWidthA', 'shiftFactor') ]
+                dE = (E-(energy+neutronWidth*(shiftFactor-S)))
+                totalWidth = P*neutronWidth + captureWidth + fissionWidthA
+                denominator = dE**2 + totalWidth**2 / 4
+                sums[:,0] += gfactor * numpy.sum( ( P * neutronWidth * captureWidth ) / denominator , axis=1)
+                sums[:,1] += gfactor * numpy.sum( ( P * neutronWidth * fissionWidthA ) / denominator , axis=1)
+                sums[:,2] += gfactor * numpy.sum( ( P*neutronWidth * ( P*neutronWidth
+                    - 2 * numpy.sin(phi)**2 * totalWidth + 4 * numpy.sin(phi)*numpy.cos(phi) * (E-energy) ) )
+                    / denominator , axis=1)
+            return sums
+        return terms
+
     @blockwise
     def getCrossSection(self, E):
         captureSum = 0
         elasticSum = 0
         fissionSum = 0
-        rho = self.rho(E)
         # for calculating phi, always use tabulated scattering radius:
         rhohat = self.RR.scatteringRadius.getValueAs('10*fm') * self.k(E)
         for L in self.Ls:
             l = L['L']
             phi = self.phi(l,rhohat)
-            P = self.penetrationFactor(l,rho)
-            S = 0.5*self.shiftFactor(l,rho)
-            for J in L['Js']:
-                gfactor = J['gfact']
-                for spin in J['channelSpins']:
-                    dE = (E-(spin['energy']+spin['neutronWidth']*(spin['shiftFactor']-S)))
-                    totalWidth = P*spin['neutronWidth'] + spin['captureWidth'] + spin['fissionWidthA']
-                    denominator = dE**2 + totalWidth**2 / 4
-                    captureSum += gfactor * numpy.sum( ( P * spin['neutronWidth'] * spin['captureWidth'] ) / denominator , axis=1)
-                    fissionSum += gfactor * numpy.sum( ( P * spin['neutronWidth'] * spin['fissionWidthA'] ) / denominator , axis=1)
-                    elasticSum += gfactor * numpy.sum( ( P*spin['neutronWidth'] * ( P*spin['neutronWidth']
-                        - 2 * numpy.sin(phi)**2 * totalWidth + 4 * numpy.sin(phi)*numpy.cos(phi) * (E-spin['energy']) ) )
-                        / denominator , axis=1)
+            gfactors, resonances = self.getResonancesForL(L)
+            sums = self.sumOverResonances( E, resonances['energy'], self.resonanceTerms( l, gfactors, resonances ),
+                    resonances['totalWidth'] )
+            captureSum += sums[:,0]
+            fissionSum += sums[:,1]
+            elasticSum += sums[:,2]
             # numpy.sum(..., axis=1) returns row vector, so also convert first term to row vector:
             elasticSum += 4*(2*l+1)*numpy.sin(phi)[:,0]**2
 
@@ -1704,12 +1924,49 @@ class MLBWcrossSection(RRBaseClass):
                 U[:,i2,i1] = U[:,i1,i2]
         return U
 
+    def resonanceTerms(self, l, gfactors, resonances):
+        """
+        Returns function terms(E, indices) for sumOverResonances, giving the capture and fission sums (weighted by
+        g-factor), followed by the two elastic terms for each channel spin (summed over resonances['energy'][indices])
+        that are combined in getCrossSection. See getResonancesForL for the arguments.
+        rho, penetrability and shift factor only depend on l, so they are computed once for all channel spins.
+        """
+        nSpins = len(gfactors)
+
+        def terms(E, indices):
+            rho = self.rho(E)
+            P = self.penetrationFactor(l,rho)
+            S = 0.5*self.shiftFactor(l,rho)
+            indices = numpy.arange( len(resonances['energy']) )[indices]
+            sums = numpy.zeros( (len(E), 2 + 2*nSpins) )
+            for spinIndex, gfactor in enumerate(gfactors):
+                spin = indices[ resonances['spinIndex'][indices] == spinIndex ]
+                if len(spin) == 0: continue
+                energy, neutronWidth, captureWidth, fissionWidthA, shiftFactor = [ resonances[key][spin] for key in
+                        ('energy', 'neutronWidth', 'captureWidth', 'fissionWidthA', 'shiftFactor') ]
+                dE = (E-(energy+neutronWidth*(shiftFactor-S)))
+                totalWidth = P*neutronWidth + captureWidth + fissionWidthA
+                denominator = dE**2 + totalWidth**2 / 4
+                commonFactor = P * neutronWidth / denominator
+                sums[:,0] += gfactor * numpy.sum( commonFactor * captureWidth , axis=1)
+                sums[:,1] += gfactor * numpy.sum( commonFactor * fissionWidthA , axis=1)
+
+                # simple elastic method, Eq D.19 - D.21 in ENDF 102. This has numerical issues, however:
+                # U_nn = numpy.exp(-2*1j*phi[:,0]) * (1 + numpy.sum( 1j*P*spin['neutronWidth'] /
+                #     (spin['energy']-E-1j*totalWidth/2) , axis=1))
+                # elasticSum += gfactor * abs( (1-U_nn)**2 )
+
+                # Instead of the above, use the following from RECENT:
+                sums[:,2+spinIndex] = numpy.sum( totalWidth/2 * commonFactor, axis=1 )
+                sums[:,2+nSpins+spinIndex] = numpy.sum( dE * commonFactor, axis=1 )
+            return sums
+        return terms
+
     @blockwise
     def getCrossSection(self, E):
         captureSum = 0
         elasticSum = 0
         fissionSum = 0
-        rho = self.rho(E)
         # for phi:
         if self.RR.scatteringRadius.isEnergyDependent():
             rhohat = numpy.array(self.RR.scatteringRadius.getValueAs('10*fm', E[:,0]))[:,numpy.newaxis] * self.k(E)
@@ -1718,29 +1975,16 @@ class MLBWcrossSection(RRBaseClass):
         for L in self.Ls:
             l = L['L']
             phi = self.phi(l,rhohat)
-            P = self.penetrationFactor(l,rho)
-            S = 0.5*self.shiftFactor(l,rho)
-            for J in L['Js']:
-                gfactor = J['gfact']
-                for spin in J['channelSpins']:
-                    dE = (E-(spin['energy']+spin['neutronWidth']*(spin['shiftFactor']-S)))
-                    totalWidth = P*spin['neutronWidth'] + spin['captureWidth'] + spin['fissionWidthA']
-                    denominator = dE**2 + totalWidth**2 / 4
-                    commonFactor = P * spin['neutronWidth'] / denominator
-                    captureSum += gfactor * numpy.sum( commonFactor * spin['captureWidth'] , axis=1)
-                    fissionSum += gfactor * numpy.sum( commonFactor * spin['fissionWidthA'] , axis=1)
-
-                    # simple elastic method, Eq D.19 - D.21 in ENDF 102. This has numerical issues, however:
-                    # U_nn = numpy.exp(-2*1j*phi[:,0]) * (1 + numpy.sum( 1j*P*spin['neutronWidth'] /
-                    #     (spin['energy']-E-1j*totalWidth/2) , axis=1))
-                    # elasticSum += gfactor * abs( (1-U_nn)**2 )
-
-                    # Instead of the above, use the following from RECENT:
-                    elasticTerm1 = numpy.sum( totalWidth/2 * commonFactor, axis=1 )
-                    elasticTerm2 = numpy.sum( dE * commonFactor, axis=1 )
-                    sin2ps = 2*numpy.sin(phi[:,0])*numpy.cos(phi[:,0])
-                    sinps2 = 2*numpy.sin(phi[:,0])**2
-                    elasticSum += gfactor * ((sinps2-elasticTerm1)**2 + (sin2ps+elasticTerm2)**2)
+            gfactors, resonances = self.getResonancesForL(L)
+            nSpins = len(gfactors)
+            sums = self.sumOverResonances( E, resonances['energy'], self.resonanceTerms( l, gfactors, resonances ),
+                    resonances['totalWidth'] )
+            captureSum += sums[:,0]
+            fissionSum += sums[:,1]
+            elasticTerm1, elasticTerm2 = sums[:,2:2+nSpins], sums[:,2+nSpins:]
+            sin2ps = 2*numpy.sin(phi)*numpy.cos(phi)
+            sinps2 = 2*numpy.sin(phi)**2
+            elasticSum += numpy.dot( (sinps2-elasticTerm1)**2 + (sin2ps+elasticTerm2)**2, gfactors )
             if True: #addMissingGfactor:
                 elasticSum += 2*numpy.sin(phi[:,0])**2 * 2*self.missingGfactor[l]
 
@@ -1756,6 +2000,97 @@ class MLBWcrossSection(RRBaseClass):
         return {'total':total, 'elastic':elastic, 'capture':capture, 'fission':fission, 'nonelastic':nonelastic}
 
 
+###### Windowed summation over resonances ######
+
+def windowedResonanceSum(E, Eres, terms, window, sampledTolerance=1e-6, nNodes=10, leafSize=40, directSize=2**17):
+    """
+    Sum of per-resonance terms where only resonances close to each energy are summed explicitly.
+
+    The (sorted) energies are split recursively into blocks. For a block [a,b], a resonance further than
+    max(b-a, its own window) from the block has its poles well outside it, so the summed contribution of all such
+    resonances is a smooth function of energy on the block: it is computed at nNodes Chebyshev nodes and
+    interpolated to all energies in the block. The interpolant is only used if it also agrees with the explicit sum
+    at nNodes-1 check points to within 'sampledTolerance' relative to the full sum there; otherwise those
+    resonances are passed down to the sub-blocks. Remaining (nearby) resonances are summed explicitly once blocks
+    have at most leafSize energies (or fewer than directSize energy-resonance pairs), so the cost is close to linear
+    in len(E) + len(Eres) instead of len(E) * len(Eres).
+
+    The error is only measured at the check points, so 'sampledTolerance' is not a bound in between them. Since
+    every interpolated pole is at least 1.5 block widths from the block center, the interpolation error decreases
+    like 5.8**-nNodes and varies smoothly over the block, so in practice the check points are representative.
+
+    Blocks closer to E=0 than their own width are never interpolated, since penetrabilities and k have a
+    branch point there.
+
+    :param E: column vector (or 1-d array) of incident energies
+    :param Eres: 1-d array of resonance energies
+    :param terms: function terms(E, indices) returning an array of shape (len(E), nQuantities) with each quantity
+        summed over resonances Eres[indices], at energies E (a column vector)
+    :param window: resonances closer than this (in the units of E) to an energy are always summed explicitly.
+        Either a scalar, or an array with one window per resonance in Eres
+    :param sampledTolerance: largest relative error of an interpolated background accepted at the check points
+    :return: tuple (sums, errorEstimate): sums has shape (len(E), nQuantities), errorEstimate is the largest
+        relative error found at the check points
+    """
+    from numpy.polynomial import chebyshev
+
+    E = numpy.asarray(E, dtype=float).flatten()
+    Eres = numpy.asarray(Eres, dtype=float).flatten()
+    if len(E) == 0 or len(Eres) == 0:
+        return terms( E.reshape(-1,1), numpy.arange(len(Eres)) ), 0.0
+    eOrder = numpy.argsort(E, kind='mergesort')
+    Esorted = E[eOrder]
+    rOrder = numpy.argsort(Eres, kind='mergesort')
+    Rsorted = Eres[rOrder]
+    Wsorted = (numpy.zeros(len(Eres)) + window)[rOrder]
+    nodes = numpy.cos( numpy.pi * (numpy.arange(nNodes)+0.5) / nNodes )
+    checks = numpy.cos( numpy.pi * numpy.arange(1,nNodes) / nNodes )      # between the nodes
+    leafSize = max( leafSize, 2*nNodes )
+
+    sums = [None]
+    errorEstimate = [0.0]
+
+    def add( i0, i1, values ):
+        if sums[0] is None: sums[0] = numpy.zeros( (len(E), values.shape[1]) )
+        sums[0][i0:i1] += values
+
+    def process( i0, i1, active ):
+        # active: positions (in Rsorted) of the resonances still to be summed for energies Esorted[i0:i1]
+        if len(active) == 0: return
+        a, b = Esorted[i0], Esorted[i1-1]
+        width = b - a
+        if i1 - i0 <= leafSize or (i1 - i0) * len(active) <= directSize or width <= 0:
+            add( i0, i1, terms( Esorted[i0:i1].reshape(-1,1), rOrder[active] ) )
+            return
+
+        distance = numpy.maximum( numpy.maximum( a - Rsorted[active], Rsorted[active] - b ), 0 )
+        isNear = distance <= numpy.maximum( width, Wsorted[active] )
+        near, far = active[isNear], rOrder[active[~isNear]]
+        if len(far) > 0 and a >= width:
+            center, half = (a+b)/2.0, width/2.0
+            nodeValues = terms( (center + half*nodes).reshape(-1,1), far )
+            checkValues = terms( (center + half*checks).reshape(-1,1), far )
+            coefficients = chebyshev.chebfit( nodes, nodeValues, nNodes-1 )
+            error = numpy.abs( chebyshev.chebval( checks, coefficients ).T - checkValues )
+            total = checkValues
+            if len(near) > 0: total = total + terms( (center + half*checks).reshape(-1,1), rOrder[near] )
+            scale = numpy.max( numpy.abs(total), axis=0 )
+            if numpy.all( error <= sampledTolerance * scale ):
+                add( i0, i1, chebyshev.chebval( (Esorted[i0:i1]-center)/half, coefficients ).T )
+                relative = error[:, scale > 0] / scale[scale > 0]
+                if relative.size: errorEstimate[0] = max( errorEstimate[0], numpy.max(relative) )
+                active = near
+
+        middle = (i0 + i1) // 2
+        process( i0, middle, active )
+        process( middle, i1, active )
+
+    process( 0, len(E), numpy.arange( len(Eres) ) )
+    result = numpy.zeros_like( sums[0] )
+    result[eOrder] = sums[0]
+    return result, errorEstimate[0]
+
+
 ###### Reich_Moore and R-Matrix Limited ######
 
 # some helper functions:
@@ -2026,6 +2361,31 @@ class RMcrossSection(RRBaseClass):
 
         return R
 
+    def getR_S(self, E, Eres, captureWidth, widths, penetrabilities, totalWidths):
+        """
+        Same as the module-level getR_S, but summed using sumOverResonances so that windowed summation
+        can be used. The penetrabilities do not depend on the resonance, so they are applied after summing.
+        totalWidths (one per resonance) set the size of the summation window.
+        """
+        if self.windowWidths is None:
+            return getR_S(E, Eres, captureWidth, widths, penetrabilities)
+        NE, dim = len(E), len(widths)
+
+        def terms(Ein, indices):
+            R, S = getR_S( Ein, Eres[indices], captureWidth[indices], [ width[indices] for width in widths ],
+                    [ numpy.ones((1,1)) for width in widths ] )
+            return numpy.hstack( ( R.reshape(len(Ein), dim*dim), S.reshape(len(Ein), dim*dim) ) )
+
+        sums = self.sumOverResonances(E, Eres, terms, totalWidths)
+        R = sums[:,:dim*dim].reshape(NE,dim,dim)
+        S = sums[:,dim*dim:].reshape(NE,dim,dim)
+        penetrabilities = [ (numpy.ones((NE,1)) * penetrability)[:,0] for penetrability in penetrabilities ]
+        for i in range(dim):
+            for j in range(dim):
+                R[:,i,j] *= penetrabilities[i] * penetrabilities[j]
+                S[:,i,j] *= penetrabilities[i] * penetrabilities[j]
+        return R, S
+
     @blockwise
     def getCrossSection(self, E):
         elasticSum = 0
@@ -2059,7 +2419,8 @@ class RMcrossSection(RRBaseClass):
                         penetrabilities += [numpy.array([[1]]),numpy.array([[1]])]
 
                         RI,SI = invertMatrices(
-                                *getR_S(E, spin['energy'], captureWidth, widths, penetrabilities)
+                                *self.getR_S(E, spin['energy'], captureWidth, widths, penetrabilities,
+                                    spin['totalWidth'])
                                 )
 
                         elasticSum += gfactor * ((2*numpy.sin(phi[:,0])**2+2*RI[:,0,0])**2 +
@@ -2069,7 +2430,8 @@ class RMcrossSection(RRBaseClass):
 
                     else: # faster method when we don't have fission:
                         RI, SI = invertMatrices(
-                                *getR_S(E, spin['energy'], captureWidth, widths, penetrabilities)
+                                *self.getR_S(E, spin['energy'], captureWidth, widths, penetrabilities,
+                                    spin['totalWidth'])
                                 )
                         RI, SI = numpy.squeeze(RI), numpy.squeeze(SI)
                         elasticSum += gfactor * ((2*numpy.sin(phi[:,0])**2+2*RI)**2 +
@@ -2750,6 +3112,88 @@ class RMatrixLimitedcrossSection(RRBaseClass):
         return retDict
 
 
+def faddeeva(z, N=32):
+    """
+    The Faddeeva function w(z) = exp(-z**2) erfc(-i z) for Im(z) >= 0, from Weideman's rational approximation
+    (J.A.C. Weideman, SIAM J. Numer. Anal. 31, 1497 (1994)) for abs(z) < 12 and from its asymptotic series elsewhere.
+    With N = 32 the relative error is about 1e-9.
+
+    :param z: complex numpy array (or scalar) with non-negative imaginary parts
+    :param N: number of terms in the approximation
+    :return: w(z), with the shape of z
+    """
+    z = numpy.asarray(z, dtype=complex)
+    shape, z = z.shape, z.flatten()
+    zm2 = 0.5 / z**2
+    w = 1j / (numpy.sqrt(numpy.pi) * z) * (1 + zm2 * (1 + zm2 * (3 + zm2 * (15 + zm2 * 105))))
+    near = numpy.abs(z) < 12
+    if numpy.any(near):
+        M = 2*N
+        L = numpy.sqrt(N/numpy.sqrt(2))
+        t = L*numpy.tan(numpy.arange(-M+1, M)*numpy.pi/(2*M))
+        f = numpy.concatenate(([0], numpy.exp(-t**2)*(L**2+t**2)))
+        a = numpy.real(numpy.fft.fft(numpy.fft.fftshift(f)))/(2*M)
+        a = a[1:N+1][::-1]
+        denominator = L - 1j*z[near]
+        w[near] = 2*numpy.polyval(a, (L + 1j*z[near])/denominator)/denominator**2 + 1/(numpy.sqrt(numpy.pi)*denominator)
+    return w.reshape(shape)
+
+
+def getFluctuationQuadrature(DOF, order=None):
+    """
+    Nodes and weights for averaging a function of a width over its chi-square distribution with DOF degrees of freedom,
+    with the width in units of its average (so the nodes have mean 1).
+
+    If order is None, the 10 point tables from subroutine GNRL3 in RECENT are used: these are only available for
+    DOF = 1 to 4, anything else is treated as an infinite number of degrees of freedom. Otherwise an order point
+    generalized Gauss-Laguerre quadrature (computed with the Golub-Welsch algorithm) is used, which is exact for
+    polynomials up to degree 2*order-1 and works for any DOF > 0. In both cases an infinite number of degrees of
+    freedom (or DOF None, False or <= 0) gives the single node 1 with weight 1.
+
+    :param DOF: number of degrees of freedom
+    :param order: number of nodes, or None for the GNRL3 tables
+    :return: tuple of numpy arrays (nodes, weights)
+    """
+    XX = [[ 3.0013465e-03,1.3219203e-02,1.0004488e-03,1.3219203e-02,1.0e+0],
+        [7.8592886e-02,7.2349624e-02,2.6197629e-02,7.2349624e-02,0.0e+0],
+        [4.3282415e-01,1.9089473e-01,1.4427472e-01,1.9089473e-01,0.0e+0],
+        [1.3345267e+00,3.9528842e-01,4.4484223e-01,3.9528842e-01,0.0e+0],
+        [3.0481846e+00,7.4083443e-01,1.0160615e+00,7.4083443e-01,0.0e+0],
+        [5.8263198e+00,1.3498293e+00,1.9421066e+00,1.3498293e+00,0.0e+0],
+        [9.9452656e+00,2.5297983e+00,3.3150885e+00,2.5297983e+00,0.0e+0],
+        [1.5782128e+01,5.2384894e+00,5.2607092e+00,5.2384894e+00,0.0e+0],
+        [2.3996824e+01,1.3821772e+01,7.9989414e+00,1.3821772e+01,0.0e+0],
+        [3.6216208e+01,7.5647525e+01,1.2072069e+01,7.5647525e+01,0.0e+0],]
+    WW = [[1.1120413e-01,3.3773418e-02,3.3376214e-04,1.7623788e-03,1.0e+0],
+        [2.3546798e-01,7.9932171e-02,1.8506108e-02,2.1517749e-02,0.0e+0],
+        [2.8440987e-01,1.2835937e-01,1.2309946e-01,8.0979849e-02,0.0e+0],
+        [2.2419127e-01,1.7652616e-01,2.9918923e-01,1.8797998e-01,0.0e+0],
+        [1.0967668e-01,2.1347043e-01,3.3431475e-01,3.0156335e-01,0.0e+0],
+        [3.0493789e-02,2.1154965e-01,1.7766657e-01,2.9616091e-01,0.0e+0],
+        [4.2930874e-03,1.3365186e-01,4.2695894e-02,1.0775649e-01,0.0e+0],
+        [2.5827047e-04,2.2630659e-02,4.0760575e-03,2.5171914e-03,0.0e+0],
+        [4.9031965e-06,1.6313638e-05,1.1766115e-04,8.9630388e-10,0.0e+0],
+        [1.4079206e-08,0.0000000e+00,5.0989546e-07,0.0000000e+00,0.0e+0],]
+
+    DOF = float(DOF or 0)
+    if order is None:
+        column = int(DOF) - 1
+        if column < 0 or column > 3: column = 4
+        nodes, weights = numpy.array(XX)[:,column], numpy.array(WW)[:,column]
+        nonZero = weights != 0
+        return nodes[nonZero], weights[nonZero]
+    if DOF <= 0 or numpy.isinf(DOF): return numpy.ones(1), numpy.ones(1)
+
+    # Width x has density proportional to x**(DOF/2-1) exp(-DOF x/2): with t = DOF x/2 this is the generalized
+    # Laguerre weight t**alpha exp(-t) with alpha = DOF/2-1, whose Jacobi matrix has the nodes as eigenvalues.
+    alpha = DOF / 2 - 1
+    n = numpy.arange(order)
+    offDiagonal = numpy.sqrt(n[1:] * (n[1:] + alpha))
+    jacobi = numpy.diag(2*n + alpha + 1) + numpy.diag(offDiagonal, 1) + numpy.diag(offDiagonal, -1)
+    nodes, vectors = numpy.linalg.eigh(jacobi)
+    return 2 * nodes / DOF, vectors[0]**2
+
+
 ##### unresolved resonance region. Only one formalism here: #####
 class URRcrossSection(resonanceReconstructionBaseClass):
 
@@ -2759,11 +3203,13 @@ class URRcrossSection(resonanceReconstructionBaseClass):
 
         :param reactionSuite: The reactionSuite this class is destined to be part of
         :param verbose: duh, verbosity flag
-        :param kw: Python dict of keywords, currently none defined
+        :param kw: Python dict of keywords. 'fluctuationQuadratureOrder' sets the default quadratureOrder
+            for getFluctuationIntegrals
         :return: None
         """
         super(URRcrossSection,self).__init__(reactionSuite)
         self.verbose = verbose
+        self.fluctuationQuadratureOrder = kw.get('fluctuationQuadratureOrder')
 
         # energy boundaries for this region:
         urr = reactionSuite.resonances.unresolved
@@ -2948,11 +3394,10 @@ class URRcrossSection(resonanceReconstructionBaseClass):
         a = 0.123 * self.target.getMass('amu')**(1./3.) + 0.08
         return self.k(E) * a
 
-    def getFluctuationIntegrals(self, widths, DOF):
+    def getFluctuationIntegrals(self, widths, DOF, quadratureOrder=None):
         """
-        From subroutine GNRL3 in RECENT. If possible, this will be replaced
-        with more basic approach (rather than using lookup table)... not finding
-        appropriate equations right now
+        From subroutine GNRL3 in RECENT, optionally with exact chi-square quadratures instead of the GNRL3
+        lookup tables.
 
         Comments from GNRL3 sourcecode::
 
@@ -2981,79 +3426,38 @@ class URRcrossSection(resonanceReconstructionBaseClass):
               for one point is 1.0 and the weight for all other points is zero.
               for the one point of weight 1.0 the average width will be used.
 
-        """
-        XX = [[ 3.0013465e-03,1.3219203e-02,1.0004488e-03,1.3219203e-02,1.0e+0],
-            [7.8592886e-02,7.2349624e-02,2.6197629e-02,7.2349624e-02,0.0e+0],
-            [4.3282415e-01,1.9089473e-01,1.4427472e-01,1.9089473e-01,0.0e+0],
-            [1.3345267e+00,3.9528842e-01,4.4484223e-01,3.9528842e-01,0.0e+0],
-            [3.0481846e+00,7.4083443e-01,1.0160615e+00,7.4083443e-01,0.0e+0],
-            [5.8263198e+00,1.3498293e+00,1.9421066e+00,1.3498293e+00,0.0e+0],
-            [9.9452656e+00,2.5297983e+00,3.3150885e+00,2.5297983e+00,0.0e+0],
-            [1.5782128e+01,5.2384894e+00,5.2607092e+00,5.2384894e+00,0.0e+0],
-            [2.3996824e+01,1.3821772e+01,7.9989414e+00,1.3821772e+01,0.0e+0],
-            [3.6216208e+01,7.5647525e+01,1.2072069e+01,7.5647525e+01,0.0e+0],]
-        WW = [[1.1120413e-01,3.3773418e-02,3.3376214e-04,1.7623788e-03,1.0e+0],
-            [2.3546798e-01,7.9932171e-02,1.8506108e-02,2.1517749e-02,0.0e+0],
-            [2.8440987e-01,1.2835937e-01,1.2309946e-01,8.0979849e-02,0.0e+0],
-            [2.2419127e-01,1.7652616e-01,2.9918923e-01,1.8797998e-01,0.0e+0],
-            [1.0967668e-01,2.1347043e-01,3.3431475e-01,3.0156335e-01,0.0e+0],
-            [3.0493789e-02,2.1154965e-01,1.7766657e-01,2.9616091e-01,0.0e+0],
-            [4.2930874e-03,1.3365186e-01,4.2695894e-02,1.0775649e-01,0.0e+0],
-            [2.5827047e-04,2.2630659e-02,4.0760575e-03,2.5171914e-03,0.0e+0],
-            [4.9031965e-06,1.6313638e-05,1.1766115e-04,8.9630388e-10,0.0e+0],
-            [1.4079206e-08,0.0000000e+00,5.0989546e-07,0.0000000e+00,0.0e+0],]
+        The sum over the quadrature nodes of the neutron, fission and competitive width distributions is done for
+        all energies as a single tensor contraction over a (neutron x fission x competitive x energy) array.
+        By default the 10 point quadratures of GNRL3 are used. If quadratureOrder is given (or the class was
+        created with fluctuationQuadratureOrder), exact chi-square quadratures of that order are used instead,
+        for any positive number of degrees of freedom (see getFluctuationQuadrature).
 
+        :param widths: dict of average widths (arrays, one value per energy)
+        :param DOF: dict of degrees of freedom for the neutron, fission and competitive widths
+        :param quadratureOrder: number of Gauss-Laguerre nodes, or None for the GNRL3 tables
+        :return: tuple of arrays RN, RC, RF
+        """
         if numpy.all(widths['captureWidth']<=0):
             return 0,0,0
-        shape = widths['neutronWidth'].shape
-        RN,RC,RF = numpy.zeros(shape), numpy.zeros(shape), numpy.zeros(shape)
-
-        # We may store non-integer DOF, but we just end up converting to int:
-        MUN = int( DOF['neutronDOF'] )
-        if MUN<1 or MUN>4: MUN=5
-        MUF = int( DOF['fissionDOF'] )
-        if MUF<1 or MUF>5: MUF=5
-        MUX=int( DOF['competitiveDOF'] )
-        if MUX<1 or MUX>4: MUX=5
-        for j in range(10):
-            xj = XX[j][MUN-1]
-            wj = WW[j][MUN-1]
-            if numpy.any(widths['fissionWidthA']) and numpy.any(widths['competitiveWidth']):
-                effj = widths['neutronWidth']*xj+widths['captureWidth']
-                for k in range(10):
-                    xk = XX[k][MUF-1]
-                    wk = WW[k][MUF-1]
-                    effjk = effj+widths['fissionWidthA']*xk
-                    for i in range(10):
-                        xi = XX[i][MUX-1]
-                        wi = WW[i][MUX-1]
-                        factor = wi*wk*wj*xj/(effjk+widths['competitiveWidth']*xi)
-                        RN += xj*factor
-                        RC += factor
-                        RF += xk*factor
-            elif numpy.any(widths['fissionWidthA']):
-                effj = widths['neutronWidth']*xj+widths['captureWidth']
-                for k in range(10):
-                    xk = XX[k][MUF-1]
-                    wk = WW[k][MUF-1]
-                    factor = wk*wj*xj/(effj+widths['fissionWidthA']*xk)
-                    RN += xj*factor
-                    RC += factor
-                    RF += xk*factor
-            elif numpy.any(widths['competitiveWidth']):
-                effj = widths['neutronWidth']*xj + widths['captureWidth']
-                for k in range(10):
-                    xk = XX[k][MUX-1]
-                    wk = WW[k][MUX-1]
-                    factor = wk*wj*xj/(effj+widths['competitiveWidth']*xk)
-                    RN += xj*factor
-                    RC += factor
-            else:   # only neutron and capture widths:
-                factor = wj*xj/(widths['neutronWidth']*xj+widths['captureWidth'])
-                RN += xj*factor
-                RC += factor
+        if quadratureOrder is None: quadratureOrder = self.fluctuationQuadratureOrder
+        neutronWidth = numpy.asarray(widths['neutronWidth'], dtype=float)
+        captureWidth = widths['captureWidth'] * numpy.ones(neutronWidth.shape)
+        hasFission = numpy.any(widths['fissionWidthA'])
+        hasCompetitive = numpy.any(widths['competitiveWidth'])
+
+        xn, wn = getFluctuationQuadrature( DOF['neutronDOF'], quadratureOrder )
+        xf, wf = getFluctuationQuadrature( DOF['fissionDOF'] if hasFission else None, quadratureOrder )
+        xc, wc = getFluctuationQuadrature( DOF['competitiveDOF'] if hasCompetitive else None, quadratureOrder )
+
+        denominator = (neutronWidth * xn[:,None,None,None] + captureWidth +
+                (widths['fissionWidthA'] if hasFission else 0) * xf[None,:,None,None] +
+                (widths['competitiveWidth'] if hasCompetitive else 0) * xc[None,None,:,None])
+        # weights for RN, RC and RF at each (neutron, fission) node pair:
+        weights = numpy.array( [ numpy.outer(wn*xn*xn, wf), numpy.outer(wn*xn, wf), numpy.outer(wn*xn, wf*xf) ] )
+        RN,RC,RF = numpy.einsum('rjk,i,jkie->re', weights, wc, 1 / denominator)
+        if not hasFission: RF = numpy.zeros(RF.shape)
         for arr in (RN,RC,RF):
-            arr[ widths['neutronWidth']<=0 ] = 0
+            arr[ neutronWidth<=0 ] = 0
         return RN,RC,RF
 
     def generateEnergyGrid(self, interpolateWidths=False):
@@ -3130,7 +3534,7 @@ class URRcrossSection(resonanceReconstructionBaseClass):
                 # Because the neutron width is really a reduced width in ENDF, we have to convert it to a "regular" width.
                 # Save all the widths in a new widths container to simplify coding in the fluctuating integral widget
                 VL = self.DOFs[(l,j)]['neutronDOF'] * self.penetrationFactor(l,rho) / rho
-                widths = self.averageWidths[(l,j)]
+                widths = dict(self.averageWidths[(l,j)])
                 widths['neutronWidth'] = VL*numpy.sqrt(E)*self.averageWidths[(l,j)]['neutronWidth']
 
                 RN,RC,RF = self.getFluctuationIntegrals(widths,self.DOFs[(l,j)])
@@ -3164,6 +3568,198 @@ class URRcrossSection(resonanceReconstructionBaseClass):
 
         return xscs
 
+    def getAverageParameters(self, energy):
+        """
+        The average resonance parameters of each spin group at energy, lin-lin interpolated on the widths grid
+        (see getWidthsAndSpacings, which must have been called first).
+
+        :param energy: incident energy in eV
+        :return: OrderedDict indexed by (L,J) of dicts with the level spacing, the average widths (the neutron width
+            is converted from the reduced width as in getCrossSection) and the degrees of freedom
+        """
+        rho = self.rho(energy)
+        averages = collections.OrderedDict()
+        for lj in self.levelSpacings:
+            average = { 'levelSpacing' : numpy.interp(energy, self.egrid, self.levelSpacings[lj]) }
+            for wid in ('neutronWidth','captureWidth','fissionWidthA','competitiveWidth'):
+                column = self.averageWidths[lj].get(wid)
+                average[wid] = 0.0 if column is None else numpy.interp(energy, self.egrid, column)
+            average['neutronWidth'] *= (self.DOFs[lj]['neutronDOF'] * self.penetrationFactor(lj[0],rho) / rho *
+                    numpy.sqrt(energy))
+            average.update(self.DOFs[lj])
+            averages[lj] = average
+        return averages
+
+    def sampleResonanceLadder(self, averages, lowerEnergy, upperEnergy, randomState):
+        """
+        Sample a ladder of resonances for each spin group from the average parameters. Spacings follow the Wigner
+        distribution and widths follow chi-square distributions with the given (possibly non-integer) degrees of
+        freedom. As in getFluctuationQuadrature, degrees of freedom None, 0 or infinite mean all widths equal the
+        average; negative degrees of freedom raise a ValueError.
+
+        :param averages: average parameters, as returned by getAverageParameters
+        :param lowerEnergy: lower end of the ladder in eV (a negative value is replaced by 0)
+        :param upperEnergy: upper end of the ladder in eV
+        :param randomState: numpy.random.RandomState used for all sampling
+        :return: OrderedDict indexed by (L,J) of dicts of arrays: energy, neutronWidth, captureWidth, fissionWidthA
+            and totalWidth
+        """
+        def sampleWidths(average, DOF, size):
+            if not average: return numpy.zeros(size)
+            DOF = float(DOF or 0)
+            if DOF < 0: raise ValueError("Invalid number of degrees of freedom %g" % DOF)
+            if DOF == 0 or numpy.isinf(DOF): return average * numpy.ones(size)
+            return average * randomState.chisquare(DOF, size) / DOF
+
+        lowerEnergy = max(lowerEnergy, 0.0)
+        ladder = collections.OrderedDict()
+        for lj, average in averages.items():
+            D = average['levelSpacing']
+            nResonances = int(1.2 * (upperEnergy - lowerEnergy) / D) + 10
+            energies = lowerEnergy + D * randomState.random_sample()
+            energies += numpy.cumsum(numpy.concatenate(([0],
+                    D * numpy.sqrt(-4 / numpy.pi * numpy.log(1 - randomState.random_sample(nResonances))))))
+            while energies[-1] < upperEnergy:
+                energies = numpy.append(energies, energies[-1] + D * numpy.sqrt(-4 / numpy.pi * numpy.log(1 - randomState.random_sample())))
+            energies = energies[energies < upperEnergy]
+            size = len(energies)
+            resonances = { 'energy' : energies,
+                    'neutronWidth' : sampleWidths(average['neutronWidth'], average['neutronDOF'], size),
+                    'captureWidth' : average['captureWidth'] * numpy.ones(size),
+                    'fissionWidthA' : sampleWidths(average['fissionWidthA'], average['fissionDOF'], size) }
+            resonances['totalWidth'] = (resonances['neutronWidth'] + resonances['captureWidth'] + resonances['fissionWidthA'] +
+                    sampleWidths(average['competitiveWidth'], average['competitiveDOF'], size))
+            ladder[lj] = resonances
+        return ladder
+
+    def getLadderCrossSection(self, ladder, energy, E, temperature=0.0, formalism='SLBW'):
+        """
+        Evaluate the cross sections of a sampled resonance ladder at energies E, vectorized over energies and
+        resonances. Widths, penetrabilities, phase shifts and k are those at the reference energy 'energy'.
+        At non-zero temperature, the SLBW line shapes are Doppler broadened with the psi and chi functions
+        (computed from the Faddeeva function).
+
+        :param ladder: resonance ladder, as returned by sampleResonanceLadder
+        :param energy: reference energy in eV
+        :param E: 1-d array of incident energies in eV
+        :param temperature: temperature in K
+        :param formalism: 'SLBW' or 'MLBW' (MLBW only at 0 K)
+        :return: dict of arrays for total, elastic, capture, fission and nonelastic, in b
+        """
+        if formalism not in ('SLBW', 'MLBW'): raise ValueError("Unknown formalism %s" % formalism)
+        if formalism == 'MLBW' and temperature > 0:
+            raise ValueError("Doppler broadening is only available for SLBW probability tables")
+        DopplerWidth = numpy.sqrt(4 * 8.617333262e-5 * temperature * energy / self.targetToNeutronMassRatio)
+        rhohat = self.URR.scatteringRadius.getValueAs('10*fm') * self.k(energy)
+
+        capture, fission, elastic = 0, 0, 0
+        Ls = set()
+        for (l,j), resonances in ladder.items():
+            gfactor = (2.0*abs(j)+1)/(2*(2*self.spin+1))
+            phi = self.phi(l,rhohat)
+            if l not in Ls:
+                elastic += 4*(2*l+1)*numpy.sin(phi)**2
+                Ls.add(l)
+            if len(resonances['energy']) == 0: continue
+            neutronWidth, totalWidth = resonances['neutronWidth'], resonances['totalWidth']
+            x = 2 * (E[:,numpy.newaxis] - resonances['energy']) / totalWidth
+            if DopplerWidth > 0:
+                xi = totalWidth / DopplerWidth
+                w = faddeeva(0.5 * xi * (x + 1j))
+                psi = 0.5 * numpy.sqrt(numpy.pi) * xi * w.real
+                chi = 0.5 * numpy.sqrt(numpy.pi) * xi * w.imag
+            else:
+                psi = 1 / (1 + x**2)
+                chi = x * psi
+            factor = 4 * neutronWidth / totalWidth**2
+            capture += gfactor * numpy.dot(psi, factor * resonances['captureWidth'])
+            fission += gfactor * numpy.dot(psi, factor * resonances['fissionWidthA'])
+            if formalism == 'SLBW':
+                elastic += gfactor * (numpy.dot(psi, factor * (neutronWidth - 2*numpy.sin(phi)**2 * totalWidth)) +
+                        numpy.dot(chi, factor * numpy.sin(2*phi) * totalWidth))
+            else:
+                A = numpy.sum(neutronWidth / (resonances['energy'] - E[:,numpy.newaxis] - 0.5j*totalWidth), axis=1)
+                U = numpy.exp(-2j*phi) * (1 + 1j*A)
+                elastic += gfactor * (numpy.abs(1 - U)**2 - 4*numpy.sin(phi)**2)
+
+        beta = numpy.pi / self.k(energy)**2
+        xscs = {'capture':beta*capture*numpy.ones(len(E)), 'elastic':beta*elastic*numpy.ones(len(E)),
+                'fission':beta*fission*numpy.ones(len(E))}
+        for reaction in xscs.values():
+            reaction[ reaction<=0 ] = 0
+        xscs['total'] = xscs['elastic'] + xscs['capture'] + xscs['fission']
+        xscs['nonelastic'] = xscs['capture'] + xscs['fission']
+        return xscs
+
+    def getProbabilityTables(self, energies=None, nBands=20, nLadders=64, nSamplesPerLadder=256, ladderSpacings=100,
+            temperatures=(0.0,), formalism='SLBW', seed=None, interpolateWidths=False, verbose=False):
+        """
+        Generate unresolved resonance probability tables (ptables) by the ladder method: at each energy, nLadders
+        resonance ladders are sampled from the average parameters (see sampleResonanceLadder), the cross sections of
+        each ladder are evaluated at nSamplesPerLadder random energies in the middle half of the ladder (see
+        getLadderCrossSection), and the samples are sorted by total cross section into nBands equally probable bands.
+        The same ladders and sample energies are used for all temperatures. Ladders start at 0 eV or above, and at
+        energies below a quarter of the ladder width the samples are taken between 0 and twice the energy.
+
+        Only the resonance contribution is included (no background cross sections), as in getCrossSection. Results
+        are reproducible: the random numbers for the i-th energy come from numpy.random.RandomState([seed, i]).
+
+        :param energies: energies in eV at which to make tables (default: the widths grid, see generateEnergyGrid)
+        :param nBands: number of bands in each table
+        :param nLadders: number of ladders sampled at each energy
+        :param nSamplesPerLadder: number of cross section samples per ladder
+        :param ladderSpacings: width of each ladder, in units of the largest average level spacing
+        :param temperatures: list of temperatures in K
+        :param formalism: 'SLBW' or 'MLBW' (MLBW only at 0 K)
+        :param seed: integer seed, or None for a non-reproducible table
+        :param interpolateWidths: passed to generateEnergyGrid
+        :param verbose: print the average total cross section of each table
+        :return: OrderedDict indexed by temperature of dicts with arrays: 'energies' (nEnergies),
+            'probabilities' (nEnergies x nBands), 'bandBoundaries' (nEnergies x nBands+1, in total cross section) and
+            the band averaged 'total', 'elastic', 'capture', 'fission' and 'nonelastic' cross sections
+            (nEnergies x nBands)
+        """
+        egrid, interpolateWidths = self.generateEnergyGrid(interpolateWidths=interpolateWidths)
+        self.getWidthsAndSpacings(egrid, interpolateWidths=interpolateWidths)
+        if energies is None: energies = egrid
+        energies = numpy.asarray(energies, dtype=float)
+        nSamples = nLadders * nSamplesPerLadder
+        if nSamples < nBands: raise ValueError("Need at least one sample per band")
+        reactions = ('total', 'elastic', 'capture', 'fission', 'nonelastic')
+
+        tables = collections.OrderedDict()
+        for temperature in temperatures:
+            table = {'energies':energies, 'probabilities':numpy.zeros((len(energies), nBands)),
+                    'bandBoundaries':numpy.zeros((len(energies), nBands+1))}
+            for reaction in reactions: table[reaction] = numpy.zeros((len(energies), nBands))
+            tables[temperature] = table
+
+        for index, energy in enumerate(energies):
+            randomState = numpy.random.RandomState(None if seed is None else [seed, index])
+            averages = self.getAverageParameters(energy)
+            halfWidth = 0.5 * ladderSpacings * max([average['levelSpacing'] for average in averages.values()])
+            sampleHalfWidth = min(0.5 * halfWidth, energy)
+            samples = dict([(temperature, dict([(reaction, []) for reaction in reactions])) for temperature in temperatures])
+            for iLadder in range(nLadders):
+                ladder = self.sampleResonanceLadder(averages, energy - halfWidth, energy + halfWidth, randomState)
+                E = energy + sampleHalfWidth * (2 * randomState.random_sample(nSamplesPerLadder) - 1)
+                for temperature in temperatures:
+                    xscs = self.getLadderCrossSection(ladder, energy, E, temperature, formalism)
+                    for reaction in reactions: samples[temperature][reaction].append(xscs[reaction])
+
+            for temperature in temperatures:
+                table = tables[temperature]
+                xscs = dict([(reaction, numpy.concatenate(samples[temperature][reaction])) for reaction in reactions])
+                order = numpy.argsort(xscs['total'], kind='mergesort')
+                for band, indices in enumerate(numpy.array_split(order, nBands)):
+                    table['probabilities'][index,band] = len(indices) / float(nSamples)
+                    table['bandBoundaries'][index,band] = xscs['total'][indices[0]]
+                    for reaction in reactions: table[reaction][index,band] = xscs[reaction][indices].mean()
+                table['bandBoundaries'][index,-1] = xscs['total'][order[-1]]
+                if verbose:
+                    print ("Probability table at %g eV, %g K: average total %g b" % (energy, temperature, xscs['total'].mean()))
+        return tables
+
     def sampleRR(self, lastResonanceEnergies, style='goe', verbose=True):
         """
         Generate a sample of a resolved resonant set using the average URR parameters
@@ -267,6 +267,81 @@ class TestResonanceReconstruction( unittest.TestCase ):
 
 
 
+class TestBlockwiseWorkerPool( unittest.TestCase ):
+
+    def test_chunks( self ):
+        pool = workerPool( nProcesses=4, minimumChunkSize=10 )
+        chunks = pool.chunks( 10, 1000 )
+        self.assertEqual( chunks[0][0], 10 )
+        self.assertEqual( chunks[-1][1], 1000 )
+        for (start1, stop1), (start2, stop2) in zip( chunks[:-1], chunks[1:] ):
+            self.assertEqual( stop1, start2 )
+            self.assertTrue( stop1 - start1 >= stop2 - start2 )
+
+    def test_getCrossSection( self ):
+        serial = SLBWcrossSection( SLBWExample, verbose=False, nProcesses=1 )
+        pooled = SLBWcrossSection( SLBWExample, verbose=False, nProcesses=3 )
+        egrid = numpy.logspace( math.log10( serial.lowerBound ), math.log10( serial.upperBound ), 5000 )
+        try:
+            x1 = serial.getCrossSection( egrid )
+            x2 = pooled.getCrossSection( egrid )
+            x3 = pooled.getCrossSection( egrid[::2] )   # pool is reused
+        finally:
+            pooled.closeWorkerPool()
+        self.assertEqual( set( x1.keys() ), set( x2.keys() ) )
+        for key in x1:
+            self.assertTrue( numpy.all( x1[key] == x2[key] ) )
+            self.assertTrue( numpy.all( x1[key][::2] == x3[key] ) )
+
+    def test_windowedSumErrorEstimate( self ):
+        serial = SLBWcrossSection( SLBWExample, verbose=False, nProcesses=1, windowWidths=20 )
+        pooled = SLBWcrossSection( SLBWExample, verbose=False, nProcesses=3, windowWidths=20 )
+        egrid = numpy.logspace( math.log10( serial.lowerBound ), math.log10( serial.upperBound ), 100000 )
+        try:
+            serial.getCrossSection( egrid )
+            pooled.getCrossSection( egrid )
+        finally:
+            pooled.closeWorkerPool()
+        # chunks are split differently in the workers, so only check that their estimates reach the parent
+        for instance in (serial, pooled):
+            self.assertTrue( 0 < instance.windowedSumErrorEstimate <= instance.windowSampledTolerance )
+
+
+class TestWindowedResonanceSum( unittest.TestCase ):
+
+    def test_lorentzians( self ):
+        Eres = numpy.linspace( 1.0, 1000.0, 400 )
+        widths = 0.05 + 0.01 * numpy.sin( Eres )
+        def terms( E, indices ):
+            return numpy.column_stack( ( numpy.sum( widths[indices] / ( ( E - Eres[indices] )**2 + widths[indices]**2 / 4 ), axis=1 ),
+                    numpy.sum( ( E - Eres[indices] ) / ( ( E - Eres[indices] )**2 + widths[indices]**2 / 4 ), axis=1 ) ) )
+        E = numpy.linspace( 0.5, 1001.0, 20000 ).reshape( -1, 1 )
+        full = terms( E, slice( None ) )
+        windowed, errorEstimate = windowedResonanceSum( E, Eres, terms, window=20*widths, sampledTolerance=1e-7 )
+        self.assertEqual( windowed.shape, full.shape )
+        self.assertTrue( errorEstimate <= 1e-7 )
+        self.assertTrue( numpy.max( numpy.abs( windowed[:,0] - full[:,0] ) / full[:,0] ) < 1e-6 )
+        self.assertTrue( numpy.max( numpy.abs( windowed[:,1] - full[:,1] ) ) < 1e-6 * numpy.max( numpy.abs( full[:,1] ) ) )
+
+    def test_SLBWWindowedCrossSection( self ):
+        full = SLBWcrossSection( SLBWExample, verbose=False, nProcesses=1 )
+        windowed = SLBWcrossSection( SLBWExample, verbose=False, nProcesses=1, windowWidths=20 )
+        egrid = numpy.logspace( math.log10( full.lowerBound ), math.log10( full.upperBound ), 20000 )
+        x1 = full.getCrossSection( egrid )
+        x2 = windowed.getCrossSection( egrid )
+        for key in ( 'capture', 'elastic', 'total' ):
+            self.assertTrue( numpy.max( numpy.abs( x1[key] - x2[key] ) / x1[key] ) < 1e-5 )
+
+    def test_MLBWWindowedCrossSection( self ):
+        full = MLBWcrossSection( MLBWExample, verbose=False, nProcesses=1 )
+        windowed = MLBWcrossSection( MLBWExample, verbose=False, nProcesses=1, windowWidths=20 )
+        egrid = numpy.logspace( math.log10( full.lowerBound ), math.log10( full.upperBound ), 20000 )
+        x1 = full.getCrossSection( egrid )
+        x2 = windowed.getCrossSection( egrid )
+        for key in ( 'capture', 'elastic', 'total' ):
+            self.assertTrue( numpy.max( numpy.abs( x1[key] - x2[key] ) / x1[key] ) < 1e-5 )
+
+
 class TestSLBWClassAndBaseClasses( unittest.TestCase ):
 
     def setUp( self ):
@@ -287,7 +362,7 @@ class TestSLBWClassAndBaseClasses( unittest.TestCase ):
         self.assertEqual( self.RRR.Ls[1]['L'], 1 )
         self.assertEqual( self.RRR.Ls[1]['Js'][0].keys(), ['gfact', 'channelSpins', 'J'] )
         self.assertAlmostEqual( self.RRR.Ls[1]['Js'][0]['gfact'], 0.35 )
-        self.assertEqual( self.RRR.Ls[1]['Js'][0]['channelSpins'][0].keys(), ['neutronWidth','channelSpin','captureWidth','energy', 'fissionWidthA', 'fissionWidthB', 'shiftFactor'] )
+        self.assertEqual( self.RRR.Ls[1]['Js'][0]['channelSpins'][0].keys(), ['fissionWidthA', 'fissionWidthB', 'neutronWidth', 'captureWidth', 'channelSpin', 'totalWidth', 'energy', 'shiftFactor'] )
         self.assertEqual( self.RRR.Ls[1]['Js'][0]['J'], 3.0 )
         self.assertEqual( list(self.RRR._energies), [ -105.4   ,    35.9   ,    42.3   ,    94.3   ,   105.8   ,
          119.2   ,   193.    ,   244.    ,   319.    ,   335.5   ,
@@ -447,9 +522,28 @@ class TestSLBWClassAndBaseClasses( unittest.TestCase ):
             GamN_correct = self.RRR1PRes.penetrationFactor( c.l, self.RRR1PRes.rho(E) ) * spin_thingee['neutronWidth']
             self.assertAlmostEqual( GamN, GamN_correct[0] )
 
-    @unittest.skip("didn't write the test yet")
     def test_refineInterpolation( self ):
-        self.RRR.refineInterpolation( egrid=0, xsecs=0, tolerance=0.01)
+        egrid = numpy.array( self.RRR.generateEnergyGrid()[::10] )
+        egrid2, xsecs, messages = self.RRR.refineInterpolation( egrid, self.RRR.getCrossSection( egrid ), tolerance=0.01 )
+        self.assertTrue( len( egrid2 ) > len( egrid ) )
+        self.assertTrue( numpy.all( numpy.diff( egrid2 ) > 0 ) )
+        self.assertTrue( messages[-1].endswith( 'to achieve tolerance of 1.0%' ) )
+        # every interior point can now be linearly interpolated from its neighbors:
+        refinement = gridRefinement( egrid2, xsecs, tolerance=0.01 )
+        self.assertEqual( len( refinement.intervalsToRefine() ), 0 )
+        # and the refined values agree with a direct calculation:
+        direct = self.RRR.getCrossSection( egrid2 )
+        for key in direct: self.assertTrue( numpy.all( direct[key] == xsecs[key] ) )
+
+    def test_refineInterpolationReactionTolerances( self ):
+        egrid = numpy.array( self.RRR.generateEnergyGrid()[::10] )
+        xsecs = self.RRR.getCrossSection( egrid )
+        egrid1, xsecs1, messages1 = self.RRR.refineInterpolation( egrid, xsecs, tolerance=0.01 )
+        egrid2, xsecs2, messages2 = self.RRR.refineInterpolation( egrid, xsecs, tolerance=0.01,
+                reactionTolerances={ 'elastic': (0.001, 0.0) } )
+        egrid3, xsecs3, messages3 = self.RRR.refineInterpolation( egrid, xsecs, tolerance=0.01, absoluteTolerance=1e3 )
+        self.assertTrue( len( egrid2 ) > len( egrid1 ) )
+        self.assertEqual( len( egrid3 ), len( egrid ) )
 
     def test_generateEnergyGrid( self ):
         egrid = self.RRR.generateEnergyGrid()
@@ -833,7 +927,7 @@ class TestMLBWClassAndBaseClasses( unittest.TestCase ):
         self.assertEqual( self.RRR.Ls[1]['L'], 1 )
         self.assertEqual( self.RRR.Ls[1]['Js'][0].keys(), ['gfact', 'channelSpins', 'J'] )
         self.assertAlmostEqual( self.RRR.Ls[1]['Js'][0]['gfact'], 1.0 )
-        self.assertEqual( self.RRR.Ls[1]['Js'][0]['channelSpins'][0].keys(), ['neutronWidth','channelSpin','captureWidth','energy', 'fissionWidthA', 'fissionWidthB', 'shiftFactor'] )
+        self.assertEqual( self.RRR.Ls[1]['Js'][0]['channelSpins'][0].keys(), ['fissionWidthA', 'fissionWidthB', 'neutronWidth', 'captureWidth', 'channelSpin', 'totalWidth', 'energy', 'shiftFactor'] )
         self.assertEqual( self.RRR.Ls[1]['Js'][0]['J'], 0.5 )
         self.assertEqual( list(self.RRR._energies), [-2485000.0, 663000.0, 1200000.0, 1256000.0, 1450000.0, 1585000.0, 1840000.0, 2300000.0, 2375000.0, 2445000.0, 3050000.0, 3290000.0, 3500000.0, 3590000.0, 4090000.0] )
         self.assertEqual( list(self.RRR._widths), [1429780.0, 55000.0, 50000.0, 3600.0, 350000.0, 300000.0, 8200.0, 280000.0, 130000.0, 20300.0, 20300.0, 250000.0, 100000.0, 100000.0, 6500.0] )
@@ -1130,7 +1224,7 @@ class TestRMClassAndBaseClasses( unittest.TestCase ):
         self.assertEqual( self.RRR.Ls[1]['L'], 1 )
         self.assertEqual( self.RRR.Ls[1]['Js'][0].keys(), ['gfact', 'channelSpins', 'J'] )
         self.assertAlmostEqual( self.RRR.Ls[1]['Js'][0]['gfact'], 1.0 )
-        self.assertEqual( self.RRR.Ls[1]['Js'][0]['channelSpins'][0].keys(), ['neutronWidth','channelSpin','captureWidth','energy', 'fissionWidthA', 'fissionWidthB', 'shiftFactor'] )
+        self.assertEqual( self.RRR.Ls[1]['Js'][0]['channelSpins'][0].keys(), ['fissionWidthA', 'fissionWidthB', 'neutronWidth', 'captureWidth', 'channelSpin', 'totalWidth', 'energy', 'shiftFactor'] )
         self.assertEqual( self.RRR.Ls[1]['Js'][0]['J'], 0.5 )
         self.assertEqual( list(self.RRR._energies), [-3622100.0, -873730.0, -365290.0, -63159.0, -48801.0, 31740.0, 55677.0, 67733.0, 70800.0, 86797.0, 181620.0, 298700.0, 301310.0, 354590.0, 399680.0, 532660.0, 565580.0, 587170.0, 590290.0, 602470.0, 714040.0, 771710.0, 812490.0, 845230.0, 872310.0, 910040.0, 962230.0, 1017800.0, 1042900.0, 1085200.0, 1148100.0, 1162700.0, 1199500.0, 1201200.0, 1256400.0, 1264400.0, 1379900.0, 1408300.0, 1479900.0, 1482400.0, 1512300.0, 1528700.0, 1580600.0, 1592800.0, 1597200.0, 1639600.0, 1651100.0, 1658600.0, 1665000.0, 1785000.0, 1805700.0, 1850700.0, 1852400.0, 1923700.0, 1968900.0, 2248700.0, 3007300.0, 3067800.0] )
         for i, w in enumerate( [3936345.36, 1.12681, 1.030406, 1.046894, 1.0092496, 1.015667, 654.8903, 5.1589, 1.029617, 3.22618, 34899.6, 10.886, 5.9548, 15.46, 1.47361, 535.31, 10955.9, 207.96, 527.26, 53.891, 3.7165, 54.139, 30109.7, 399.91, 33.44, 3674.43, 76630.0, 77.192, 934.7, 76.394, 4.1469, 3017.4, 14921.6, 4604.8, 17386.6, 844.63999999999999, 67.699, 5201.0, 3504.15, 9.68694, 92.493, 2924.9, 1497.9, 11207.8, 4019.6, 15294.0, 21556.0, 1564.1, 218.3, 195.34, 1301.6, 35516.0, 70709.5, 1018.1, 5735.1, 444763.6, 293.56, 425.89] ):
@@ -2361,6 +2455,27 @@ class TestURRClassAndBaseClasses( unittest.TestCase ):
         for i in range(len(expectedResults)):
             self.assertAlmostEqual(expectedResults[i], computedResults[i])
 
+    def test_getFluctuationQuadrature(self):
+        for DOF in (1, 2, 2.5, 4, 7):
+            nodes, weights = getFluctuationQuadrature( DOF, 12 )
+            self.assertAlmostEqual( weights.sum(), 1.0 )
+            self.assertAlmostEqual( numpy.dot( weights, nodes ), 1.0 )
+            self.assertAlmostEqual( numpy.dot( weights, nodes**2 ), 1.0 + 2.0/DOF )
+            self.assertAlmostEqual( numpy.dot( weights, nodes**3 ), 1.0 + 6.0/DOF + 8.0/DOF**2 )
+        for DOF in (0, None, False, 5):
+            self.assertEqual( map( list, getFluctuationQuadrature( DOF ) ), [ [1.0], [1.0] ] )
+        self.assertEqual( len( getFluctuationQuadrature( 2 )[0] ), 9 )
+
+    def test_getFluctuationIntegralsQuadratureOrder(self):
+        egrid,flag=self.Zr90URR.generateEnergyGrid()
+        self.Zr90URR.getWidthsAndSpacings(egrid,interpolateWidths=flag)
+        widths=self.Zr90URR.averageWidths[(2,1.5)]
+        DOF=self.Zr90URR.DOFs[(2,1.5)]
+        GNRL3 = self.Zr90URR.getFluctuationIntegrals( widths, DOF )
+        exact = self.Zr90URR.getFluctuationIntegrals( widths, DOF, quadratureOrder=40 )
+        for R1, R2 in zip( GNRL3[:2], exact[:2] ):
+            for r1, r2 in zip( R1, R2 ): self.assertTrue( withinXPercent( r1, r2, 0.1 ) )
+
     def test_getCrossSection( self ):
         '''Test 1 MeV point'''
         result = self.Zr90URR.getCrossSection()
@@ -2441,6 +2556,41 @@ class TestURRClassAndBaseClasses( unittest.TestCase ):
         self.assertTrue(c in Tcs)
         self.assertAlmostEqual(Tcs[c].evaluate(3.0e+05),0.35007858733963815)
 
+    def test_faddeeva(self):
+        self.assertTrue( withinXPercent( faddeeva(3+1j), 0.0653177772890470+0.1739183154163490j, 1e-7 ) )
+        for y in (1e-3, 0.5, 2.0, 20.0):
+            self.assertTrue( withinXPercent( faddeeva(1j*y).real, math.exp(y*y)*math.erfc(y), 1e-7 ) )
+
+    def test_sampleResonanceLadder(self):
+        average = { 'levelSpacing':10.0, 'neutronWidth':1.0, 'captureWidth':0.1, 'fissionWidthA':0.5, 'competitiveWidth':0.0,
+                'neutronDOF':6, 'fissionDOF':2.5, 'competitiveDOF':None }
+        randomState = numpy.random.RandomState(1)
+        ladder = self.Zr90URR.sampleResonanceLadder( {(0,0.5):average}, -500.0, 20000.0, randomState )[(0,0.5)]
+        self.assertTrue( ladder['energy'].min() >= 0 )
+        for width in ('neutronWidth', 'fissionWidthA'):
+            self.assertTrue( numpy.ptp( ladder[width] ) > 0 )
+            self.assertTrue( withinXPercent( ladder[width].mean(), average[width], 10 ) )
+        average['neutronDOF'] = -1
+        self.assertRaises( ValueError, self.Zr90URR.sampleResonanceLadder, {(0,0.5):average}, 0.0, 100.0, randomState )
+
+    def test_getProbabilityTables(self):
+        averages = URRcrossSection( MLBWExampleZr90, verbose=False ).getCrossSection()
+        tables = self.Zr90URR.getProbabilityTables( energies=[1e6], nBands=8, nLadders=32, nSamplesPerLadder=64,
+                temperatures=(0.0, 3000.0), seed=1 )
+        self.assertEqual( tables.keys(), [0.0, 3000.0] )
+        for table in tables.values():
+            self.assertEqual( table['probabilities'].shape, (1, 8) )
+            self.assertAlmostEqual( table['probabilities'].sum(), 1.0 )
+            self.assertTrue( numpy.all( numpy.diff( table['bandBoundaries'][0] ) >= 0 ) )
+            self.assertTrue( numpy.all( numpy.diff( table['total'][0] ) >= 0 ) )
+            for reaction in ('total', 'elastic', 'capture'):
+                average = numpy.dot( table['probabilities'][0], table[reaction][0] )
+                self.assertTrue( withinXPercent( average, averages[reaction].evaluate(1e6), 5 ) )
+        self.assertTrue( numpy.ptp( tables[3000.0]['total'] ) < numpy.ptp( tables[0.0]['total'] ) )
+        again = self.Zr90URR.getProbabilityTables( energies=[1e6], nBands=8, nLadders=32, nSamplesPerLadder=64,
+                temperatures=(0.0,), seed=1 )
+        self.assertTrue( numpy.all( again[0.0]['total'] == tables[0.0]['total'] ) )
+
     @unittest.skipIf(not HAVEBURR,"needs burr")
     def test_sampleRR(self):
         LJs={(0,0.5), (1, 1.5), (1, 0.5), (2, 1.5), (2, 2.5)}
@@ -0,0 +1,131 @@
+# <<BEGIN-copyright>>
+# Copyright (c) 2016, Lawrence Livermore National Security, LLC.
+# Produced at the Lawrence Livermore National Laboratory.
+# Written by the LLNL Nuclear Data and Theory group
+#         (email: mattoon1@llnl.gov)
+# LLNL-CODE-683960.
+# All rights reserved.
+# 
+# This file is part of the FUDGE package (For Updating Data and 
+#         Generating Evaluations)
+# 
+# When citing FUDGE, please use the following reference:
+#   C.M. Mattoon, B.R. Beck, N.R. Patel, N.C. Summers, G.W. Hedstrom, D.A. Brown, "Generalized Nuclear Data: A New Structure (with Supporting Infrastructure) for Handling Nuclear Data", Nuclear Data Sheets, Volume 113, Issue 12, December 2012, Pages 3145-3171, ISSN 0090-3752, http://dx.doi.org/10. 1016/j.nds.2012.11.008
+# 
+# 
+#     Please also read this link - Our Notice and Modified BSD License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the disclaimer below.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the disclaimer (as noted below) in the
+#       documentation and/or other materials provided with the distribution.
+#     * Neither the name of LLNS/LLNL nor the names of its contributors may be used
+#       to endorse or promote products derived from this software without specific
+#       prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL LAWRENCE LIVERMORE NATIONAL SECURITY, LLC,
+# THE U.S. DEPARTMENT OF ENERGY OR CONTRIBUTORS BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# 
+# 
+# Additional BSD Notice
+# 
+# 1. This notice is required to be provided under our contract with the U.S.
+# Department of Energy (DOE). This work was produced at Lawrence Livermore
+# National Laboratory under Contract No. DE-AC52-07NA27344 with the DOE.
+# 
+# 2. Neither the United States Government nor Lawrence Livermore National Security,
+# LLC nor any of their employees, makes any warranty, express or implied, or assumes
+# any liability or responsibility for the accuracy, completeness, or usefulness of any
+# information, apparatus, product, or process disclosed, or represents that its use
+# would not infringe privately-owned rights.
+# 
+# 3. Also, reference herein to any specific commercial products, process, or services
+# by trade name, trademark, manufacturer or otherwise does not necessarily constitute
+# or imply its endorsement, recommendation, or favoring by the United States Government
+# or Lawrence Livermore National Security, LLC. The views and opinions of authors expressed
+# herein do not necessarily state or reflect those of the United States Government or
+# Lawrence Livermore National Security, LLC, and shall not be used for advertising or
+# product endorsement purposes.
+# 
+# <<END-copyright>>
+
+
+"""
+test fudge/processing/montecarlo/fudge2dEqualProbableBinning.py
+"""
+
+import unittest, numpy
+
+from xData import XYs as XYsModule
+from xData import multiD_XYs as multiD_XYsModule
+from xData import axes as axesModule
+from fudge.processing.montecarlo import fudge2dEqualProbableBinning
+
+axes = axesModule.axes( rank = 3 )
+
+def XYs2d( functions ) :
+
+    xys2d = multiD_XYsModule.XYs2d( axes = axes )
+    for value, data in enumerate( functions ) : xys2d.append( XYsModule.XYs1d( data = data, value = value + 1., axes = axes ) )
+    return( xys2d )
+
+class TestEqualProbableBins( unittest.TestCase ) :
+
+    def test_analytic( self ) :
+
+        nBins = 8
+        bins = fudge2dEqualProbableBinning.equalProbableBins( nBins, [ [ -1., 1. ], [ 1., 1. ] ] )
+        self.assertTrue( numpy.allclose( bins.getData( ), numpy.linspace( -1., 1., nBins + 1 ), rtol = 0, atol = 1e-15 ) )
+        bins = fudge2dEqualProbableBinning.equalProbableBins( nBins, [ [ 0., 0. ], [ 1., 2. ] ] )      # P(x) = 2 x.
+        self.assertTrue( numpy.allclose( bins.getData( ), numpy.sqrt( numpy.arange( nBins + 1 ) / float( nBins ) ), rtol = 1e-14, atol = 0 ) )
+
+    def test_zeroEnds( self ) :
+
+        bins = fudge2dEqualProbableBinning.equalProbableBins( 4, [ [ 0., 0. ], [ 1., 0. ], [ 2., 1. ], [ 3., 1. ], [ 4., 0. ], [ 5., 0. ] ] )
+        self.assertEqual( bins[0], 1. )
+        self.assertEqual( bins[-1], 4. )
+
+    def test_2d( self ) :
+
+        functions = [ [ [ -1., 0.2 ], [ 0., 1. ], [ 1., 0.4 ] ], [ [ 0., 0. ], [ 1e-3, 3. ], [ 2., 5. ], [ 3., 0. ], [ 4., 0. ] ],
+                [ [ 1., 2. ], [ 2., 2. ] ] ]
+        values, boundaries = fudge2dEqualProbableBinning.equalProbableBins2d( 16, XYs2d( functions ) )
+        self.assertEqual( values.tolist( ), [ 1., 2., 3. ] )
+        self.assertEqual( boundaries.shape, ( 3, 17 ) )
+        for function, row in zip( functions, boundaries ) :
+            self.assertTrue( numpy.allclose( fudge2dEqualProbableBinning.equalProbableBins( 16, function ).getData( ), row, rtol = 1e-14, atol = 0 ) )
+
+class TestSamplingTables( unittest.TestCase ) :
+
+    def test_aliasTable( self ) :
+
+        weights = numpy.array( [ 0.1, 0., 3., 0.7, 1.2, 0. ] )
+        probabilities, aliases = fudge2dEqualProbableBinning.aliasTable( weights )
+        implied = numpy.zeros( len( weights ) )
+        for index, ( probability, alias ) in enumerate( zip( probabilities, aliases ) ) :
+            implied[index] += probability
+            implied[alias] += 1. - probability
+        self.assertTrue( numpy.allclose( implied / len( weights ), weights / weights.sum( ), rtol = 1e-14, atol = 1e-15 ) )
+
+    def test_sample( self ) :
+
+        tables = fudge2dEqualProbableBinning.samplingTables( XYs2d( [ [ [ 0., 0. ], [ 1., 2. ] ], [ [ -1., 1. ], [ 0., 1. ], [ 1., 1. ] ] ] ) )
+        random = numpy.linspace( 0., 1., 11 )[:-1]
+        self.assertTrue( numpy.allclose( tables.sample( 0, random, random ), numpy.sqrt( random ), rtol = 1e-14, atol = 0 ) )
+        self.assertTrue( numpy.allclose( tables.sample( 1, 0.25, random ), -1. + random, rtol = 0, atol = 1e-15 ) )
+        self.assertTrue( numpy.allclose( tables.sample( 1, 0.75, random ), random, rtol = 0, atol = 1e-15 ) )
+
+if __name__=="__main__":
+    unittest.main()
@@ -69,6 +69,7 @@
 #include <string.h>
 #include <stdarg.h>
 #include <ctype.h>
+#include <math.h>
 
 #include <nf_integration.h>
 #include <nf_Legendre.h>
@@ -88,10 +89,27 @@ typedef struct GnG_parameters_s {
     PyObject *argList;
 } GnG_parameters;
 
+typedef struct linearXYs_s {
+    Py_ssize_t length;
+    double *xs, *ys;
+} linearXYs;
+
+typedef struct KalbachMann_parameters_s {
+    int degree;
+    linearXYs f, r, a;
+} KalbachMann_parameters;
+
 static PyObject *nf_GnG_adaptiveQuadrature_C( PyObject *self, PyObject *args );
 static nfu_status nf_GnG_adaptiveQuadrature_C_callback( nf_Legendre_GaussianQuadrature_callback integrandFunction, void *argList, double x1,
         double x2, double *integral );
 static nfu_status nf_GnG_adaptiveQuadrature_C_integrandFunction( double x, double *y, void *argList );
+static PyObject *nf_KalbachMann_sqrtEp_MuAverages_C( PyObject *self, PyObject *args );
+static nfu_status nf_KalbachMann_sqrtEp_Mu_callback( nf_Legendre_GaussianQuadrature_callback integrandFunction, void *argList, double x1,
+        double x2, double *integral );
+static nfu_status nf_KalbachMann_sqrtEp_Mu_integrandFunction( double x, double *y, void *argList );
+static int linearXYs_fromPython( PyObject *xys_Py, linearXYs *xys );
+static double linearXYs_evaluate( linearXYs *xys, double x );
+static double linearXYs_nextX( linearXYs *xys, double x );
 static PyObject *nf_integration_C_SetPyErrorExceptionReturnNull( const char *s, ... );
 
 DL_EXPORT( void ) initintegration( void );
@@ -152,6 +170,214 @@ static nfu_status nf_GnG_adaptiveQuadrature_C_integrandFunction( double x, doubl
 /*
 ************************************************************
 */
+static PyObject *nf_KalbachMann_sqrtEp_MuAverages_C( PyObject *self, PyObject *args ) {
+
+    nfu_status status_nf;
+    int maxDepth = nf_GnG_adaptiveQuadrature_MaxMaxDepth, degree, i1, ok;
+    long int evaluations;
+    Py_ssize_t index, length;
+    double tolerance, integral, segmentIntegral, x1, x2, xNext;
+    KalbachMann_parameters parameters;
+    linearXYs *functions[3] = { &parameters.f, &parameters.r, &parameters.a };
+    PyObject *FRAs_Py, *FRAsFast_Py, *FRA_Py, *integrals_Py, *integral_Py;
+
+    if( !PyArg_ParseTuple( args, "iOd|i", &degree, &FRAs_Py, &tolerance, &maxDepth ) ) return( NULL );
+    parameters.degree = degree;
+
+    if( ( FRAsFast_Py = PySequence_Fast( FRAs_Py, "FRAs must be a sequence" ) ) == NULL ) return( NULL );
+    length = PySequence_Fast_GET_SIZE( FRAsFast_Py );
+    if( ( integrals_Py = PyList_New( length ) ) == NULL ) {
+        Py_DECREF( FRAsFast_Py );
+        return( NULL );
+    }
+
+    for( index = 0; index < length; index++ ) {
+        FRA_Py = PySequence_Fast_GET_ITEM( FRAsFast_Py, index );
+        if( !PySequence_Check( FRA_Py ) || ( PySequence_Size( FRA_Py ) != 3 ) ) {
+            nf_integration_C_SetPyErrorExceptionReturnNull( "FRAs[%d] must be a sequence of 3 functions", (int) index );
+            goto err;
+        }
+        for( i1 = 0; i1 < 3; i1++ ) functions[i1]->xs = NULL;
+        for( i1 = 0, ok = 1; ( i1 < 3 ) && ok; i1++ ) {
+            PyObject *xys_Py = PySequence_GetItem( FRA_Py, i1 );
+
+            if( xys_Py == NULL ) {
+                ok = 0; }
+            else {
+                ok = linearXYs_fromPython( xys_Py, functions[i1] );
+                Py_DECREF( xys_Py );
+            }
+        }
+
+        if( ok ) {
+            x1 = parameters.f.xs[0];
+            x2 = parameters.f.xs[parameters.f.length - 1];
+            for( i1 = 1; i1 < 3; i1++ ) {
+                if( functions[i1]->xs[0] > x1 ) x1 = functions[i1]->xs[0];
+                if( functions[i1]->xs[functions[i1]->length - 1] < x2 ) x2 = functions[i1]->xs[functions[i1]->length - 1];
+            }
+            integral = 0.;
+            while( ok && ( x1 < x2 ) ) {        /* Integrate between consecutive x-values of f, r and a, where the integrand is smooth. */
+                xNext = x2;
+                for( i1 = 0; i1 < 3; i1++ ) {
+                    double x = linearXYs_nextX( functions[i1], x1 );
+
+                    if( x < xNext ) xNext = x;
+                }
+                for( i1 = 0; i1 < 3; i1++ ) {   /* The integrand is 0 on the segment if f, r or a is 0 at both of its ends. */
+                    if( ( linearXYs_evaluate( functions[i1], x1 ) == 0. ) && ( linearXYs_evaluate( functions[i1], xNext ) == 0. ) ) break;
+                }
+                if( i1 == 3 ) {     /* nf_GnG_adaptiveQuadrature bisects to maxDepth if the integrand is 0, so only call it when needed. */
+                    status_nf = nf_GnG_adaptiveQuadrature( nf_KalbachMann_sqrtEp_Mu_callback, nf_KalbachMann_sqrtEp_Mu_integrandFunction,
+                        (void *) &parameters, x1, xNext, maxDepth, tolerance, &segmentIntegral, &evaluations );
+                    if( status_nf != nfu_Okay ) {
+                        nf_integration_C_SetPyErrorExceptionReturnNull( "Error from nf_GnG_adaptiveQuadrature: %s", nfu_statusMessage( status_nf ) );
+                        ok = 0;
+                    }
+                    integral += segmentIntegral;
+                }
+                x1 = xNext;
+            }
+        }
+        for( i1 = 0; i1 < 3; i1++ ) PyMem_Free( functions[i1]->xs );
+        if( !ok ) goto err;
+
+        if( ( integral_Py = PyFloat_FromDouble( integral ) ) == NULL ) goto err;
+        PyList_SET_ITEM( integrals_Py, index, integral_Py );
+    }
+
+    Py_DECREF( FRAsFast_Py );
+    return( integrals_Py );
+
+err:
+    Py_DECREF( FRAsFast_Py );
+    Py_DECREF( integrals_Py );
+    return( NULL );
+}
+/*
+************************************************************
+*/
+static nfu_status nf_KalbachMann_sqrtEp_Mu_callback( nf_Legendre_GaussianQuadrature_callback integrandFunction, void *argList, 
+        double x1, double x2, double *integral ) {
+
+    KalbachMann_parameters *parameters = argList;
+
+    return( nf_Legendre_GaussianQuadrature( parameters->degree, x1, x2, integrandFunction, argList, integral ) );
+}
+/*
+************************************************************
+*/
+static nfu_status nf_KalbachMann_sqrtEp_Mu_integrandFunction( double x, double *y, void *argList ) {
+/*
+*   Returns sqrt( x ) * f( x ) * r( x ) * ( coth( a( x ) ) - 1 / a( x ) ), where the last factor is the average mu of the
+*   Kalbach-Mann pre-compound term.
+*/
+    KalbachMann_parameters *parameters = (KalbachMann_parameters *) argList;
+    double a = linearXYs_evaluate( &parameters->a, x ), a2, csa;
+
+    if( fabs( a ) < 1e-2 ) {
+        a2 = a * a;
+        csa = a * ( 315. + a2 * ( -21. + 2. * a2 ) ) / 945.; }
+    else {
+        csa = 1. / tanh( a ) - 1. / a;
+    }
+    *y = sqrt( x ) * linearXYs_evaluate( &parameters->f, x ) * linearXYs_evaluate( &parameters->r, x ) * csa;
+    return( nfu_Okay );
+}
+/*
+************************************************************
+*/
+static int linearXYs_fromPython( PyObject *xys_Py, linearXYs *xys ) {
+/*
+*   Fills xys from a sequence of [ x, y ] pairs. Returns 1 if successful, otherwise sets a Python exception and returns 0.
+*/
+    Py_ssize_t index;
+    PyObject *xysFast_Py, *xyFast_Py;
+
+    xys->xs = NULL;
+    if( ( xysFast_Py = PySequence_Fast( xys_Py, "function must be a sequence of [ x, y ] pairs" ) ) == NULL ) return( 0 );
+    xys->length = PySequence_Fast_GET_SIZE( xysFast_Py );
+    if( xys->length < 2 ) {
+        nf_integration_C_SetPyErrorExceptionReturnNull( "function must have at least 2 points, it has %d", (int) xys->length );
+        goto err;
+    }
+    if( ( xys->xs = (double *) PyMem_Malloc( 2 * xys->length * sizeof( double ) ) ) == NULL ) {
+        PyErr_NoMemory( );
+        goto err;
+    }
+    xys->ys = &(xys->xs[xys->length]);
+
+    for( index = 0; index < xys->length; index++ ) {
+        if( ( xyFast_Py = PySequence_Fast( PySequence_Fast_GET_ITEM( xysFast_Py, index ), "function point must be an [ x, y ] pair" ) ) == NULL ) goto err;
+        if( PySequence_Fast_GET_SIZE( xyFast_Py ) != 2 ) {
+            Py_DECREF( xyFast_Py );
+            nf_integration_C_SetPyErrorExceptionReturnNull( "function point %d is not an [ x, y ] pair", (int) index );
+            goto err;
+        }
+        xys->xs[index] = PyFloat_AsDouble( PySequence_Fast_GET_ITEM( xyFast_Py, 0 ) );
+        xys->ys[index] = PyFloat_AsDouble( PySequence_Fast_GET_ITEM( xyFast_Py, 1 ) );
+        Py_DECREF( xyFast_Py );
+        if( PyErr_Occurred( ) ) goto err;
+        if( ( index > 0 ) && ( xys->xs[index] < xys->xs[index-1] ) ) {
+            nf_integration_C_SetPyErrorExceptionReturnNull( "x-values of function not ascending at index %d", (int) index );
+            goto err;
+        }
+    }
+    Py_DECREF( xysFast_Py );
+    return( 1 );
+
+err:
+    Py_DECREF( xysFast_Py );
+    PyMem_Free( xys->xs );
+    xys->xs = NULL;
+    return( 0 );
+}
+/*
+************************************************************
+*/
+static double linearXYs_evaluate( linearXYs *xys, double x ) {
+/*
+*   Returns the lin-lin interpolated value of xys at x, or the end-point value if x is outside of the domain of xys.
+*/
+    Py_ssize_t lower = 0, upper = xys->length - 1, middle;
+
+    if( x <= xys->xs[lower] ) return( xys->ys[lower] );
+    if( x >= xys->xs[upper] ) return( xys->ys[upper] );
+    while( upper - lower > 1 ) {
+        middle = ( lower + upper ) / 2;
+        if( xys->xs[middle] > x ) {
+            upper = middle; }
+        else {
+            lower = middle;
+        }
+    }
+    if( xys->xs[upper] == xys->xs[lower] ) return( xys->ys[upper] );
+    return( xys->ys[lower] + ( xys->ys[upper] - xys->ys[lower] ) * ( x - xys->xs[lower] ) / ( xys->xs[upper] - xys->xs[lower] ) );
+}
+/*
+************************************************************
+*/
+static double linearXYs_nextX( linearXYs *xys, double x ) {
+/*
+*   Returns the smallest x-value of xys greater than x, or the last x-value of xys if there is none.
+*/
+    Py_ssize_t lower = 0, upper = xys->length - 1, middle;
+
+    if( x < xys->xs[lower] ) return( xys->xs[lower] );
+    if( x >= xys->xs[upper] ) return( xys->xs[upper] );
+    while( upper - lower > 1 ) {
+        middle = ( lower + upper ) / 2;
+        if( xys->xs[middle] > x ) {
+            upper = middle; }
+        else {
+            lower = middle;
+        }
+    }
+    return( xys->xs[upper] );
+}
+/*
+************************************************************
+*/
 static PyObject *nf_integration_C_SetPyErrorExceptionReturnNull( const char *s, ... ) {
 
     va_list args;
@@ -183,6 +409,18 @@ static PyMethodDef nf_integration_CMiscPyMethods[] = {
         "   tolerance               the tolerance for the integration.\n" \
         "   maxDepth            [o] maximum recursive depth.\n" \
         "   .\n" },
+    { "KalbachMann_sqrtEp_MuAverages", (PyCFunction) nf_KalbachMann_sqrtEp_MuAverages_C, METH_VARARGS, 
+        "For each ( f, r, a ) in FRAs, returns the integral over the mutual domain of f, r and a of sqrt( E' ) * f( E' ) * r( E' ) *" \
+        " ( coth( a( E' ) ) - 1 / a( E' ) ) dE' (i.e., <sqrt( E' ) mu> of the Kalbach-Mann pre-compound term at one incident energy)," \
+        " The integral is the sum of the integrals between consecutive x-values of f, r and a, each done with the same adaptive" \
+        " quadrature as adaptiveQuadrature_GnG but without calling python for each integrand point." \
+        " f, r and a must be lin-lin functions given as sequences of [ x, y ] pairs with ascending x-values.\n" \
+        "\nArguments are: [o] are optional arguments,\n" \
+        "   degree                  the degree of the Legendre quadrature function to use (typically in the range 2 to 6).\n" \
+        "   FRAs                    a sequence of ( f, r, a ) functions, one for each incident energy.\n" \
+        "   tolerance               the tolerance for the integration.\n" \
+        "   maxDepth            [o] maximum recursive depth.\n" \
+        "   .\n" },
     { NULL, NULL, 0, NULL }        /* Sentinel (i.e., the end of the list) */
 };
 /*
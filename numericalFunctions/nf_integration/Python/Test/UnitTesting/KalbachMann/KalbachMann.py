@@ -0,0 +1,126 @@
+# <<BEGIN-copyright>>
+# Copyright (c) 2016, Lawrence Livermore National Security, LLC.
+# Produced at the Lawrence Livermore National Laboratory.
+# Written by the LLNL Nuclear Data and Theory group
+#         (email: mattoon1@llnl.gov)
+# LLNL-CODE-683960.
+# All rights reserved.
+# 
+# This file is part of the FUDGE package (For Updating Data and 
+#         Generating Evaluations)
+# 
+# When citing FUDGE, please use the following reference:
+#   C.M. Mattoon, B.R. Beck, N.R. Patel, N.C. Summers, G.W. Hedstrom, D.A. Brown, "Generalized Nuclear Data: A New Structure (with Supporting Infrastructure) for Handling Nuclear Data", Nuclear Data Sheets, Volume 113, Issue 12, December 2012, Pages 3145-3171, ISSN 0090-3752, http://dx.doi.org/10. 1016/j.nds.2012.11.008
+# 
+# 
+#     Please also read this link - Our Notice and Modified BSD License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the disclaimer below.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the disclaimer (as noted below) in the
+#       documentation and/or other materials provided with the distribution.
+#     * Neither the name of LLNS/LLNL nor the names of its contributors may be used
+#       to endorse or promote products derived from this software without specific
+#       prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL LAWRENCE LIVERMORE NATIONAL SECURITY, LLC,
+# THE U.S. DEPARTMENT OF ENERGY OR CONTRIBUTORS BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# 
+# 
+# Additional BSD Notice
+# 
+# 1. This notice is required to be provided under our contract with the U.S.
+# Department of Energy (DOE). This work was produced at Lawrence Livermore
+# National Laboratory under Contract No. DE-AC52-07NA27344 with the DOE.
+# 
+# 2. Neither the United States Government nor Lawrence Livermore National Security,
+# LLC nor any of their employees, makes any warranty, express or implied, or assumes
+# any liability or responsibility for the accuracy, completeness, or usefulness of any
+# information, apparatus, product, or process disclosed, or represents that its use
+# would not infringe privately-owned rights.
+# 
+# 3. Also, reference herein to any specific commercial products, process, or services
+# by trade name, trademark, manufacturer or otherwise does not necessarily constitute
+# or imply its endorsement, recommendation, or favoring by the United States Government
+# or Lawrence Livermore National Security, LLC. The views and opinions of authors expressed
+# herein do not necessarily state or reflect those of the United States Government or
+# Lawrence Livermore National Security, LLC, and shall not be used for advertising or
+# product endorsement purposes.
+# 
+# <<END-copyright>>
+
+import sys
+sys.path.insert( 0, '../../../../../lib' )
+
+import integration
+import os, math
+
+if( 'CHECKOPTIONS' in os.environ ) :
+    options = os.environ['CHECKOPTIONS'].split( )
+    if( '-e' in options ) : print __file__
+
+def evaluate( xys, x ) :
+    """Returns the lin-lin interpolated value of xys at x."""
+
+    for i1, ( x2, y2 ) in enumerate( xys ) :
+        if( x <= x2 ) : break
+    if( i1 == 0 ) : return( xys[0][1] )
+    x1, y1 = xys[i1-1]
+    return( y1 + ( y2 - y1 ) * ( x - x1 ) / ( x2 - x1 ) )
+
+def sqrtEp_Mu( energy_out, FRA ) :
+    """The Kalbach-Mann sqrt( E' ) mu integrand as calculated by the python calculateAverageProductData."""
+
+    f, r, a = FRA
+    a = evaluate( a, energy_out )
+    if( abs( a ) < 1e-2 ) :
+        a2 = a * a
+        csa = a * ( 315. + a2 * ( -21. + 2. * a2 ) ) / 945.
+    else :
+        csa = math.cosh( a ) / math.sinh( a ) - 1. / a
+    return( math.sqrt( energy_out ) * evaluate( f, energy_out ) * evaluate( r, energy_out ) * csa )
+
+def pythonAverage( FRA ) :
+
+    epMin = max( [ function[0][0] for function in FRA ] )
+    epMax = min( [ function[-1][0] for function in FRA ] )
+    integral, evaluations = integration.adaptiveQuadrature_GnG( 2, sqrtEp_Mu, FRA, epMin, epMax, 1e-12 )
+    return( integral )
+
+f = [ [ 0, 0 ], [ 1, 0.5 ], [ 3, 0.3 ], [ 6, 0 ] ]
+r = [ [ 0, 0.2 ], [ 6, 0.8 ] ]
+a = [ [ 0, 0.005 ], [ 2, 1.5 ], [ 6, 4. ] ]
+FRAs = [ [ f, r, a ],
+         [ [ [ 0, 0.4 ], [ 1, 0.2 ], [ 2, 0 ], [ 3, 0 ], [ 4, 0.3 ], [ 5, 0 ] ], r, a ],     # f is 0 from 2 to 3.
+         [ f, [ [ 0.5, 0.3 ], [ 1.5, 0 ], [ 2.5, 0 ], [ 5.5, 0.6 ] ], a ],                      # r is 0 from 1.5 to 2.5, and starts at 0.5.
+         [ f, r, [ [ 0, 0 ], [ 1, 0 ], [ 4, 2. ], [ 6, -0.5 ] ] ],                              # a is 0 from 0 to 1 and changes sign.
+         [ [ [ 0, 0 ], [ 6, 0 ] ], r, a ] ]                                                   # f is 0 everywhere.
+
+CAverages = integration.KalbachMann_sqrtEp_MuAverages( 2, FRAs, 1e-10 )
+if( len( CAverages ) != len( FRAs ) ) : raise Exception( 'KalbachMann_sqrtEp_MuAverages returned %d values for %d FRAs' % ( len( CAverages ), len( FRAs ) ) )
+if( CAverages[-1] != 0 ) : raise Exception( 'KalbachMann_sqrtEp_MuAverages is %s, not 0, for f = 0' % CAverages[-1] )
+for i1, ( FRA, CAverage ) in enumerate( zip( FRAs, CAverages ) ) :
+    pythonAverage_ = pythonAverage( FRA )
+    if( abs( CAverage - pythonAverage_ ) > 1e-8 * abs( pythonAverage_ ) + 1e-14 ) :
+        raise Exception( 'KalbachMann_sqrtEp_MuAverages %s != python value %s for FRAs[%d]' % ( CAverage, pythonAverage_, i1 ) )
+    if( integration.KalbachMann_sqrtEp_MuAverages( 2, [ FRA ], 1e-10 ) != [ CAverage ] ) :
+        raise Exception( 'KalbachMann_sqrtEp_MuAverages for FRAs[%d] alone differs from the bulk call' % i1 )
+
+for FRAs in [ [ [ f, r ] ], [ [ f, r, [ [ 0, 1 ] ] ] ] ] :          # Missing function and function with only 1 point.
+    try :
+        integration.KalbachMann_sqrtEp_MuAverages( 2, FRAs, 1e-10 )
+    except Exception :
+        continue
+    raise Exception( 'KalbachMann_sqrtEp_MuAverages did not raise for %s' % FRAs )
@@ -87,6 +87,7 @@ typedef struct listOfDoubles_CPy_s {
     PyObject_HEAD
     statusMessageReporting smr;
     ptwXPoints *ptwX;
+    int exports;                        /* Number of buffers of self currently exported. */
 } listOfDoubles_CPy;
 
 #define is_listOfDoubles_CPyObject( v ) ((v)->ob_type == &listOfDoubles_CPyType)
@@ -107,6 +108,7 @@ static PyObject *listOfDoubles_C__repr__( listOfDoubles_CPy *self );
 static Py_ssize_t listOfDoubles_C__len__( listOfDoubles_CPy *self );
 static PyObject *listOfDoubles_C__getitem__( listOfDoubles_CPy *self, Py_ssize_t index );
 static PyObject *listOfDoubles_C__getslice__( listOfDoubles_CPy *self, Py_ssize_t index1_, Py_ssize_t index2_ );
+static PyObject *listOfDoubles_C__subscript__( listOfDoubles_CPy *self, PyObject *item );
 static int listOfDoubles_C__setitem__( listOfDoubles_CPy *self, Py_ssize_t index, PyObject *value );
 static int listOfDoubles_C__setslice__( listOfDoubles_CPy *self, Py_ssize_t index1_, Py_ssize_t index2_, PyObject *value );
 static int listOfDoubles_C_contains( listOfDoubles_CPy *self, PyObject *args );
@@ -139,6 +141,8 @@ static PyObject *listOfDoubles_C_richCompare( PyObject *self, PyObject *other, i
 
 static void listOfDoubles_C_getSliceIndices( int64_t length, int64_t *index1, int64_t *index2 );
 static PyObject *listOfDoubles_C_createFromString( listOfDoubles_CPy *self, PyObject *args, PyObject *keywords );
+static PyObject *listOfDoubles_C_createFromENDFLines( listOfDoubles_CPy *self, PyObject *args, PyObject *keywords );
+static int listOfDoubles_C_ENDFFieldToDouble( char const *field, Py_ssize_t length, double *value );
 
 static int listOfDoubles_C_PyNumberToFloat( PyObject *n, double *d );
 static int64_t listOfDoubles_C_doubleListToCList( PyObject *PyDoubleList, double **ds );
@@ -149,6 +153,9 @@ static void listOfDoubles_C_SetPyErrorExceptionFromSMR( PyObject *type, statusMe
 static PyObject *listOfDoubles_C_SetPyErrorExceptionReturnNull( const char *s, ... );
 static int listOfDoubles_C_SetPyErrorExceptionReturnMinusOne( const char *s, ... );
 static int listOfDoubles_C_checkStatus( listOfDoubles_CPy *self, char const *func );
+static int listOfDoubles_C_checkNoExports( listOfDoubles_CPy *self );
+static int listOfDoubles_C_getbuffer( listOfDoubles_CPy *self, Py_buffer *view, int flags );
+static void listOfDoubles_C_releasebuffer( listOfDoubles_CPy *self, Py_buffer *view );
 
 DL_EXPORT( void ) initlistOfDoubles_C( void );
 /*
@@ -161,6 +168,7 @@ static listOfDoubles_CPy *listOfDoubles_CNewInitialize( void ) {
     if( self != NULL ) {
         smr_initialize( &(self->smr), smr_status_Ok );
         self->ptwX = NULL;
+        self->exports = 0;
     }
     return( self );
 }
@@ -174,7 +182,9 @@ static int listOfDoubles_C__init__( listOfDoubles_CPy *self, PyObject *args, PyO
     ptwXPoints *ptwX;
     PyObject *dataPy = NULL;
 
+    if( listOfDoubles_C_checkNoExports( self ) != 0 ) return( -1 );
     self->ptwX = NULL;
+    self->exports = 0;
     if( !PyArg_ParseTupleAndKeywords( args, keywords, "|Oi", kwlist, &dataPy, &initialSize ) ) return( -1 );
 
     if( ( ptwX = ptwX_new( NULL, initialSize ) ) == NULL ) {
@@ -265,6 +275,41 @@ static PyObject *listOfDoubles_C__getslice__( listOfDoubles_CPy *self, Py_ssize_
 /*
 ************************************************************
 */
+static PyObject *listOfDoubles_C__subscript__( listOfDoubles_CPy *self, PyObject *item ) {
+/*
+*   This routine is called for self[item] when item is not a simple slice (e.g., self[slice( 1, 3 )] or self[::2]).
+*/
+    Py_ssize_t index, start, stop, step, length, i1;
+    listOfDoubles_CPy *newPy;
+    statusMessageReporting *smr = &(self->smr);
+
+    if( listOfDoubles_C_checkStatus( self, "__subscript__" ) != 0 ) return( NULL );
+
+    if( PyIndex_Check( item ) ) {
+        if( ( ( index = PyNumber_AsSsize_t( item, PyExc_IndexError ) ) == -1 ) && PyErr_Occurred( ) ) return( NULL );
+        return( listOfDoubles_C__getitem__( self, index ) );
+    }
+    if( !PySlice_Check( item ) ) {
+        PyErr_Format( PyExc_TypeError, "listOfDoubles_C indices must be integers, not %.200s", item->ob_type->tp_name );
+        return( NULL );
+    }
+
+    if( PySlice_GetIndicesEx( (PySliceObject *) item, (Py_ssize_t) self->ptwX->length, &start, &stop, &step, &length ) != 0 ) return( NULL );
+    if( step == 1 ) return( listOfDoubles_C__getslice__( self, start, stop ) );
+
+    if( ( newPy = listOfDoubles_CNewInitialize( ) ) == NULL ) return( NULL );
+    if( ( newPy->ptwX = ptwX_new( smr, length ) ) == NULL ) {
+        Py_DECREF( newPy );
+        listOfDoubles_C_SetPyErrorExceptionFromSMR( PyExc_Exception, smr );
+        return( NULL );
+    }
+    for( i1 = 0, index = start; i1 < length; i1++, index += step ) newPy->ptwX->points[i1] = self->ptwX->points[index];
+    newPy->ptwX->length = length;
+    return( (PyObject *) newPy );
+}
+/*
+************************************************************
+*/
 static int listOfDoubles_C__setitem__( listOfDoubles_CPy *self, Py_ssize_t index_, PyObject *valuePy ) {
 /*
 *   This routine can be called either when "self[index_] = number" or "del self[index_]".
@@ -314,6 +359,7 @@ static int listOfDoubles_C__setslice__( listOfDoubles_CPy *self, Py_ssize_t inde
     statusMessageReporting *smr = &(self->smr);
 
     if( listOfDoubles_C_checkStatus( self, "__setslice_" ) != 0 ) return( -1 );
+    if( listOfDoubles_C_checkNoExports( self ) != 0 ) return( -1 );
 
     listOfDoubles_C_getSliceIndices( self->ptwX->length, &index1, &index2 );
 
@@ -368,6 +414,14 @@ static PySequenceMethods listOfDoubles_CPy_sequence = {
 /*
 ************************************************************
 */
+static PyMappingMethods listOfDoubles_CPy_mapping = {
+    (lenfunc) listOfDoubles_C__len__,                       /* mp_length */
+    (binaryfunc) listOfDoubles_C__subscript__,              /* mp_subscript */
+    0                                                       /* mp_ass_subscript */
+};
+/*
+************************************************************
+*/
 static PyObject *listOfDoubles_C__add__( PyObject *self, PyObject *other ) {
 
     int status;
@@ -408,6 +462,7 @@ static PyObject *listOfDoubles_C__iadd__( PyObject *self, PyObject *other ) {
     statusMessageReporting *smr = &(self2->smr);
 
     if( listOfDoubles_C_checkStatus( self2, "__iadd__" ) != 0 ) return( NULL );
+    if( listOfDoubles_C_checkNoExports( self2 ) != 0 ) return( NULL );
 
     if( ( length = listOfDoubles_C_doubleListToCList( other, &xs ) ) < 0 ) return( NULL );
 
@@ -481,6 +536,7 @@ static PyObject *listOfDoubles_C__imul__( PyObject *self, PyObject *other ) {
     statusMessageReporting *smr = &(self2->smr);
 
     if( listOfDoubles_C_checkStatus( self2, "__imul__" ) != 0 ) return( NULL );
+    if( listOfDoubles_C_checkNoExports( self2 ) != 0 ) return( NULL );
 
     multiplier = PyInt_AsLong( other );
     if( multiplier == -1 ) {
@@ -619,6 +675,8 @@ static PyObject *listOfDoubles_C_reallocatePoints( listOfDoubles_CPy *self, PyOb
     static char *kwlist[] = { "size", "forceSmaller", NULL };
     statusMessageReporting *smr = &(self->smr);
 
+    if( listOfDoubles_C_checkNoExports( self ) != 0 ) return( NULL );
+
     if( !PyArg_ParseTupleAndKeywords( args, keywords, "i|i", kwlist, &size, &forceSmallerResize ) ) return( NULL );
 
     if( ptwX_reallocatePoints( smr, self->ptwX, size, forceSmallerResize ) != nfu_Okay ) {
@@ -637,6 +695,7 @@ static PyObject *listOfDoubles_C_append( listOfDoubles_CPy *self, PyObject *args
     statusMessageReporting *smr = &(self->smr);
 
     if( listOfDoubles_C_checkStatus( self, "append" ) != 0 ) return( NULL );
+    if( listOfDoubles_C_checkNoExports( self ) != 0 ) return( NULL );
 
     if( !PyArg_ParseTuple( args, "d", &value ) ) return( NULL );
 
@@ -673,6 +732,7 @@ static PyObject *listOfDoubles_C_extend( listOfDoubles_CPy *self, PyObject *args
     statusMessageReporting *smr = &(self->smr);
 
     if( listOfDoubles_C_checkStatus( self, "extend" ) != 0 ) return( NULL );
+    if( listOfDoubles_C_checkNoExports( self ) != 0 ) return( NULL );
 
     if( !PyArg_ParseTuple( args, "O", &PyDoubleList ) ) return( NULL );
 
@@ -719,6 +779,7 @@ static PyObject *listOfDoubles_C_insert( listOfDoubles_CPy *self, PyObject *args
     statusMessageReporting *smr = &(self->smr);
 
     if( listOfDoubles_C_checkStatus( self, "insert" ) != 0 ) return( NULL );
+    if( listOfDoubles_C_checkNoExports( self ) != 0 ) return( NULL );
 
     if( !PyArg_ParseTuple( args, "id", &index, &value ) ) return( NULL );
 
@@ -743,6 +804,7 @@ static PyObject *listOfDoubles_C_pop( listOfDoubles_CPy *self, PyObject *args, P
     statusMessageReporting *smr = &(self->smr);
 
     if( listOfDoubles_C_checkStatus( self, "pop" ) != 0 ) return( NULL );
+    if( listOfDoubles_C_checkNoExports( self ) != 0 ) return( NULL );
 
     if( !PyArg_ParseTupleAndKeywords( args, keywords, "|i", kwlist, &index ) ) return( NULL );
 
@@ -770,6 +832,7 @@ static PyObject *listOfDoubles_C_remove( listOfDoubles_CPy *self, PyObject *args
     statusMessageReporting *smr = &(self->smr);
 
     if( listOfDoubles_C_checkStatus( self, "remove" ) != 0 ) return( NULL );
+    if( listOfDoubles_C_checkNoExports( self ) != 0 ) return( NULL );
 
     if( !PyArg_ParseTuple( args, "d", &value ) ) return( NULL );
 
@@ -827,6 +890,7 @@ static PyObject *listOfDoubles_C_setData( listOfDoubles_CPy *self, PyObject *arg
     PyObject *status = NULL, *PyXList;
 
     if( listOfDoubles_C_checkStatus( self, "reverse" ) != 0 ) return( NULL );
+    if( listOfDoubles_C_checkNoExports( self ) != 0 ) return( NULL );
 
     if( !PyArg_ParseTuple( args, "O", &PyXList ) ) return( NULL );
 
@@ -1104,6 +1168,145 @@ static PyObject *listOfDoubles_C_createFromString( listOfDoubles_CPy *self, PyOb
 /*
 ************************************************************
 */
+static PyObject *listOfDoubles_C_createFromENDFLines( listOfDoubles_CPy *self, PyObject *args, PyObject *keywords ) {
+
+    Py_ssize_t numberOfValues, startLine = 0, numberOfLines, i1, lineIndex, fieldStart, lineLength, fieldLength;
+    char const *line;
+    char field[12];
+    PyObject *linesPy, *linesFast, *linePy;
+    listOfDoubles_CPy *ptwXPy;
+    statusMessageReporting smr;
+    static char *kwlist[] = { "lines", "numberOfValues", "startLine", NULL };
+
+    if( !PyArg_ParseTupleAndKeywords( args, keywords, "On|n", kwlist, &linesPy, &numberOfValues, &startLine ) ) return( NULL );
+    if( numberOfValues < 0 ) {
+        PyErr_SetString( PyExc_ValueError, "numberOfValues must not be negative" );
+        return( NULL );
+    }
+    if( startLine < 0 ) {
+        PyErr_SetString( PyExc_IndexError, "startLine must not be negative" );
+        return( NULL );
+    }
+
+    if( ( linesFast = PySequence_Fast( linesPy, "lines must be a list of strings" ) ) == NULL ) return( NULL );
+    numberOfLines = PySequence_Fast_GET_SIZE( linesFast );
+    if( startLine + ( numberOfValues + 5 ) / 6 > numberOfLines ) {
+        Py_DECREF( linesFast );
+        PyErr_Format( PyExc_IndexError, "%d values starting at line %d need more lines than the %d given", (int) numberOfValues,
+                (int) startLine, (int) numberOfLines );
+        return( NULL );
+    }
+
+    smr_initialize( &smr, smr_status_Ok );
+    if( ( ptwXPy = listOfDoubles_CNewInitialize( ) ) == NULL ) {
+        Py_DECREF( linesFast );
+        return( NULL );
+    }
+    if( ( ptwXPy->ptwX = ptwX_new( &smr, numberOfValues ) ) == NULL ) {
+        Py_DECREF( linesFast );
+        Py_DECREF( ptwXPy );
+        listOfDoubles_C_SetPyErrorExceptionFromSMR( PyExc_Exception, &smr );
+        return( NULL );
+    }
+
+    line = NULL;
+    lineLength = 0;
+    for( i1 = 0; i1 < numberOfValues; i1++ ) {
+        if( ( i1 % 6 ) == 0 ) {
+            lineIndex = startLine + i1 / 6;
+            linePy = PySequence_Fast_GET_ITEM( linesFast, lineIndex );
+            if( !PyString_Check( linePy ) ) {
+                Py_DECREF( linesFast );
+                Py_DECREF( ptwXPy );
+                PyErr_Format( PyExc_TypeError, "line %d is not a string", (int) lineIndex );
+                return( NULL );
+            }
+            line = PyString_AS_STRING( linePy );
+            lineLength = PyString_GET_SIZE( linePy );
+        }
+        fieldStart = 11 * ( i1 % 6 );
+        fieldLength = lineLength - fieldStart;
+        if( fieldLength > 11 ) fieldLength = 11;
+        if( fieldLength < 0 ) fieldLength = 0;
+        if( listOfDoubles_C_ENDFFieldToDouble( &(line[fieldStart]), fieldLength, &(ptwXPy->ptwX->points[i1]) ) != 0 ) {
+            strncpy( field, &(line[fieldStart]), fieldLength );
+            field[fieldLength] = 0;
+            Py_DECREF( linesFast );
+            Py_DECREF( ptwXPy );
+            PyErr_Format( PyExc_ValueError, "unsupported ENDF field '%s' at index %d of line %d", field, (int) ( i1 % 6 ),
+                    (int) ( startLine + i1 / 6 ) );
+            return( NULL );
+        }
+    }
+    ptwXPy->ptwX->length = numberOfValues;
+
+    Py_DECREF( linesFast );
+    return( (PyObject *) ptwXPy );
+}
+/*
+************************************************************
+*/
+static int listOfDoubles_C_ENDFFieldToDouble( char const *field, Py_ssize_t length, double *value ) {
+/*
+*   Converts an ENDF field of up to 11 characters. The forms supported are a blank field (value 0), a float as
+*   accepted by python's float (e.g., ' 1.2345E+08' or '         12') and ENDF's exponent without an 'e' (e.g.,
+*   ' 1.234567+8', '-1.234567-8' or ' 1.23456D+8'). Surrounding spaces are ignored. Returns 0 on success and -1 for any
+*   other form, for which the caller must use the python conversion.
+*/
+    char buffer[32], *p1 = buffer, *end;
+    Py_ssize_t i1 = 0;
+    int mantissaDigits = 0, hasPeriod = 0, exponentDigits = 0;
+
+    while( ( i1 < length ) && ( field[i1] == ' ' ) ) i1++;
+    if( i1 == length ) {
+        *value = 0;
+        return( 0 );
+    }
+
+    if( ( field[i1] == '+' ) || ( field[i1] == '-' ) ) *(p1++) = field[i1++];
+    for( ; i1 < length; i1++ ) {
+        if( isdigit( (unsigned char) field[i1] ) ) {
+            mantissaDigits++; }
+        else if( ( field[i1] == '.' ) && !hasPeriod ) {
+            hasPeriod = 1; }
+        else {
+            break;
+        }
+        *(p1++) = field[i1];
+    }
+    if( mantissaDigits == 0 ) return( -1 );
+
+    if( i1 < length ) {
+        if( ( field[i1] == 'e' ) || ( field[i1] == 'E' ) ) {                /* Python float form. */
+            i1++; }
+        else {                                                              /* ENDF form, only converted by python if mantissa has a '.'. */
+            if( !hasPeriod ) return( -1 );
+            if( ( field[i1] == 'd' ) || ( field[i1] == 'D' ) ) i1++;
+            if( ( i1 == length ) || ( ( field[i1] != '+' ) && ( field[i1] != '-' ) ) ) return( -1 );
+        }
+        *(p1++) = 'e';
+        if( ( i1 < length ) && ( ( field[i1] == '+' ) || ( field[i1] == '-' ) ) ) *(p1++) = field[i1++];
+        for( ; ( i1 < length ) && isdigit( (unsigned char) field[i1] ); i1++ ) {
+            exponentDigits++;
+            *(p1++) = field[i1];
+        }
+        if( exponentDigits == 0 ) return( -1 );
+    }
+
+    for( ; i1 < length; i1++ ) if( field[i1] != ' ' ) return( -1 );
+    *p1 = 0;
+
+    *value = PyOS_string_to_double( buffer, &end, NULL );
+    if( ( *value == -1.0 ) && PyErr_Occurred( ) ) {
+        PyErr_Clear( );
+        return( -1 );
+    }
+    if( *end != 0 ) return( -1 );
+    return( 0 );
+}
+/*
+************************************************************
+*/
 static int listOfDoubles_C_PyNumberToFloat( PyObject *valuePy, double *value ) {
 
     PyObject *floatPy = PyNumber_Float( valuePy );
@@ -1120,9 +1323,35 @@ static int64_t listOfDoubles_C_doubleListToCList( PyObject *PyDoubleList, double
     int status = 0;
     int64_t length, i1;
     double *d1;
+    char const *format, *p1;
     PyObject *item, *iterator;
+    Py_buffer view;
 
     *xs = NULL;
+    if( PyObject_CheckBuffer( PyDoubleList ) ) {           /* A buffer of doubles (e.g., a listOfDoubles_C or a numpy array) is copied directly. */
+        if( PyObject_GetBuffer( PyDoubleList, &view, PyBUF_STRIDES | PyBUF_FORMAT ) == 0 ) {
+            format = view.format;
+            if( ( format != NULL ) && ( ( *format == '@' ) || ( *format == '=' ) ) ) format++;
+            if( ( view.ndim == 1 ) && ( view.itemsize == sizeof( double ) ) && ( format != NULL ) && ( strcmp( format, "d" ) == 0 ) ) {
+                length = (int64_t) view.shape[0];
+                if( length > 0 ) {
+                    if( ( *xs = (double *) malloc( (size_t) length * sizeof( double ) ) ) == NULL ) {
+                        PyBuffer_Release( &view );
+                        PyErr_NoMemory( );
+                        return( -1 );
+                    }
+                    for( i1 = 0, d1 = *xs, p1 = (char const *) view.buf; i1 < length; i1++, d1++, p1 += view.strides[0] ) 
+                        *d1 = *((double const *) p1);
+                }
+                PyBuffer_Release( &view );
+                return( length );
+            }
+            PyBuffer_Release( &view ); }
+        else {
+            PyErr_Clear( );
+        }
+    }
+
     if( ( iterator = PyObject_GetIter( PyDoubleList ) ) == NULL ) return( -1 );
     if( ( length = (int64_t) PySequence_Size( PyDoubleList ) ) != (int64_t) 0 ) {
         if( ( *xs = (double *) malloc( (size_t) length * sizeof( double ) ) ) == NULL ) {
@@ -1244,6 +1473,66 @@ static int listOfDoubles_C_checkStatus( listOfDoubles_CPy *self, char const *fun
 /*
 ************************************************************
 */
+static int listOfDoubles_C_checkNoExports( listOfDoubles_CPy *self ) {
+
+    if( self->exports == 0 ) return( 0 );
+    PyErr_SetString( PyExc_BufferError, "cannot add, remove or reallocate values while a buffer of self is exported" );
+    return( -1 );
+}
+/*
+************************************************************
+*/
+static int listOfDoubles_C_getbuffer( listOfDoubles_CPy *self, Py_buffer *view, int flags ) {
+/*
+*   Exports self's values as a contiguous, one dimensional buffer of doubles (i.e., numpy.asarray( self ) does not copy
+*   the values). While a buffer is exported, methods that can reallocate self's values raise a BufferError.
+*/
+    static double empty[1] = { 0. };
+    double *points = empty;
+
+    if( listOfDoubles_C_checkStatus( self, "getbuffer" ) != 0 ) return( -1 );
+    if( self->ptwX->length > 0 ) points = self->ptwX->points;
+    if( PyBuffer_FillInfo( view, (PyObject *) self, points, (Py_ssize_t) ( self->ptwX->length * sizeof( double ) ), 
+        self->ptwX->length == 0, flags ) != 0 ) return( -1 );
+    view->itemsize = sizeof( double );
+    if( ( flags & PyBUF_FORMAT ) == PyBUF_FORMAT ) view->format = "d";
+    if( ( flags & PyBUF_ND ) == PyBUF_ND ) {
+        view->internal = malloc( sizeof( Py_ssize_t ) );
+        if( view->internal == NULL ) {
+            Py_CLEAR( view->obj );
+            PyErr_NoMemory( );
+            return( -1 );
+        }
+        *((Py_ssize_t *) view->internal) = (Py_ssize_t) self->ptwX->length;
+        view->shape = (Py_ssize_t *) view->internal;
+    }
+    if( ( flags & PyBUF_STRIDES ) == PyBUF_STRIDES ) view->strides = &(view->itemsize);
+    self->exports++;
+    return( 0 );
+}
+/*
+************************************************************
+*/
+static void listOfDoubles_C_releasebuffer( listOfDoubles_CPy *self, Py_buffer *view ) {
+
+    free( view->internal );
+    view->internal = NULL;
+    self->exports--;
+}
+/*
+************************************************************
+*/
+static PyBufferProcs listOfDoubles_CPy_buffer = {
+    0,                                                      /* bf_getreadbuffer  */
+    0,                                                      /* bf_getwritebuffer */
+    0,                                                      /* bf_getsegcount    */
+    0,                                                      /* bf_getcharbuffer  */
+    (getbufferproc) listOfDoubles_C_getbuffer,              /* bf_getbuffer      */
+    (releasebufferproc) listOfDoubles_C_releasebuffer       /* bf_releasebuffer  */
+};
+/*
+************************************************************
+*/
 static PyMethodDef listOfDoubles_CPyMethods[] = {
 
     { "allocatedSize", (PyCFunction) listOfDoubles_C_allocatedSize, METH_NOARGS, "Returns the size of memory allocated in the points region." },
@@ -1311,14 +1600,14 @@ static PyTypeObject listOfDoubles_CPyType = {
     (reprfunc) listOfDoubles_C__repr__,         /* tp_repr        */
     &listOfDouble_CPy_number,                   /* tp_as_number   */
     &listOfDoubles_CPy_sequence,                /* tp_as_sequence */
-    0,                                          /* tp_as_mapping  */
+    &listOfDoubles_CPy_mapping,                 /* tp_as_mapping  */
     0,                                          /* tp_hash        */
     0,                                          /* tp_call        */
     0,                                          /* tp_str         */
     0,                                          /* tp_getattro    */
     0,                                          /* tp_setattro    */
-    0,                                          /* tp_as_buffer   */
-    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_CHECKTYPES, /* tp_flags     */
+    &listOfDoubles_CPy_buffer,                  /* tp_as_buffer   */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE | Py_TPFLAGS_CHECKTYPES | Py_TPFLAGS_HAVE_NEWBUFFER, /* tp_flags */
     listOfDoubles_C__doc__,                     /* tp_doc         */
     0,                                          /* tp_traverse    */
     0,                                          /* tp_clear       */
@@ -1350,6 +1639,15 @@ static PyMethodDef listOfDoubles_CMiscPyMethods[] = {
         "translated from 'str'. The second element is the portion of 'str' not translated\n" \
         "\nArguments are:\n" \
         "   str           The string containing a list of floats to be converted.\n" },
+    { "createFromENDFLines", (PyCFunction) listOfDoubles_C_createFromENDFLines, METH_VARARGS | METH_KEYWORDS,
+        "createFromENDFLines( lines, numberOfValues, startLine = 0 )\n\n" \
+        "Returns a listOfDoubles_C instance with the numberOfValues floats read from the 11 character fields of lines\n" \
+        "(6 per line) starting at lines[startLine]. Blank fields are 0 and ENDF's exponent without an 'e' (e.g.,\n" \
+        "' 1.234567+8') is supported. Raises ValueError for a field in any other form.\n" \
+        "\nArguments are:\n" \
+        "   lines           A list of strings (ENDF lines without the MAT, MF, MT and line number columns).\n" \
+        "   numberOfValues  The number of values to read.\n" \
+        "   startLine       The index in lines of the first line to read.\n" },
     { NULL, NULL, 0, NULL }        /* Sentinel (i.e., the end of the list) */
 };
 /*
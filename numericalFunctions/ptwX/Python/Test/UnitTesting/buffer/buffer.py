@@ -0,0 +1,99 @@
+# <<BEGIN-copyright>>
+# Copyright (c) 2016, Lawrence Livermore National Security, LLC.
+# Produced at the Lawrence Livermore National Laboratory.
+# Written by the LLNL Nuclear Data and Theory group
+#         (email: mattoon1@llnl.gov)
+# LLNL-CODE-683960.
+# All rights reserved.
+# 
+# This file is part of the FUDGE package (For Updating Data and 
+#         Generating Evaluations)
+# 
+# When citing FUDGE, please use the following reference:
+#   C.M. Mattoon, B.R. Beck, N.R. Patel, N.C. Summers, G.W. Hedstrom, D.A. Brown, "Generalized Nuclear Data: A New Structure (with Supporting Infrastructure) for Handling Nuclear Data", Nuclear Data Sheets, Volume 113, Issue 12, December 2012, Pages 3145-3171, ISSN 0090-3752, http://dx.doi.org/10. 1016/j.nds.2012.11.008
+# 
+# 
+#     Please also read this link - Our Notice and Modified BSD License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the disclaimer below.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the disclaimer (as noted below) in the
+#       documentation and/or other materials provided with the distribution.
+#     * Neither the name of LLNS/LLNL nor the names of its contributors may be used
+#       to endorse or promote products derived from this software without specific
+#       prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL LAWRENCE LIVERMORE NATIONAL SECURITY, LLC,
+# THE U.S. DEPARTMENT OF ENERGY OR CONTRIBUTORS BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# 
+# 
+# Additional BSD Notice
+# 
+# 1. This notice is required to be provided under our contract with the U.S.
+# Department of Energy (DOE). This work was produced at Lawrence Livermore
+# National Laboratory under Contract No. DE-AC52-07NA27344 with the DOE.
+# 
+# 2. Neither the United States Government nor Lawrence Livermore National Security,
+# LLC nor any of their employees, makes any warranty, express or implied, or assumes
+# any liability or responsibility for the accuracy, completeness, or usefulness of any
+# information, apparatus, product, or process disclosed, or represents that its use
+# would not infringe privately-owned rights.
+# 
+# 3. Also, reference herein to any specific commercial products, process, or services
+# by trade name, trademark, manufacturer or otherwise does not necessarily constitute
+# or imply its endorsement, recommendation, or favoring by the United States Government
+# or Lawrence Livermore National Security, LLC. The views and opinions of authors expressed
+# herein do not necessarily state or reflect those of the United States Government or
+# Lawrence Livermore National Security, LLC, and shall not be used for advertising or
+# product endorsement purposes.
+# 
+# <<END-copyright>>
+
+import sys
+sys.path.insert( 0, '../../../../../lib' )
+
+import listOfDoubles_C
+import os, random
+import numpy
+
+if( 'CHECKOPTIONS' in os.environ ) :
+    options = os.environ['CHECKOPTIONS'].split( )
+    if( '-e' in options ) : print __file__
+
+values = [ random.uniform( -1e3, 3.14e6 ) for i1 in range( 37 ) ]
+CList, extraCharacters = listOfDoubles_C.createFromString( ' '.join( [ repr( value ) for value in values ] ) )
+
+view = numpy.asarray( CList )
+if( view.flags.owndata ) : raise Exception( 'numpy.asarray( listOfDoubles_C ) copied the data' )
+if( list( view ) != values ) : raise Exception( 'buffer values differ from the list values' )
+view[3] = -1.
+if( CList[3] != -1. ) : raise Exception( 'buffer is not a view of the data' )
+values[3] = -1.
+
+for method, args in [ ( 'append', ( 1., ) ), ( 'extend', ( [ 1., 2. ], ) ), ( 'pop', ( ) ), ( 'setData', ( [ 1. ], ) ) ] :
+    try :
+        getattr( CList, method )( *args )
+        raise Exception( '%s did not raise while a buffer is exported' % method )
+    except BufferError :
+        pass
+del view
+CList.append( 1. )
+values.append( 1. )
+
+for slice1 in [ slice( None, None, 2 ), slice( None, None, -1 ), slice( 3, -4 ), slice( 30, 1, -3 ), slice( 40, 50 ) ] :
+    if( list( CList[slice1] ) != values[slice1] ) : raise Exception( 'slice %s failed' % slice1 )
+
+if( list( listOfDoubles_C.listOfDoubles_C( numpy.array( values )[::3] ) ) != values[::3] ) :
+    raise Exception( 'construction from a strided numpy array failed' )
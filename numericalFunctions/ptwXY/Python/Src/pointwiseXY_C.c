@@ -110,8 +110,19 @@ typedef struct pointwiseXY_CPy_s {
     ptwXYPoints *ptwXY;
     int infill;
     int safeDivide;
+    int exports;                        /* Number of buffers currently exported via xsBuffer and ysBuffer. */
 } pointwiseXY_CPy;
 
+staticforward PyTypeObject pointwiseXY_CBufferPyType;
+
+typedef struct pointwiseXY_CBufferPy_s {
+    PyObject_HEAD
+    pointwiseXY_CPy *owner;
+    Py_ssize_t offset;                  /* Byte offset of the value within a ptwXYPoint (i.e., x or y). */
+    Py_ssize_t shape;
+    Py_ssize_t stride;
+} pointwiseXY_CBufferPy;
+
 #define is_pointwiseXY_CPyObject( v ) ((v)->ob_type == &pointwiseXY_CPyType)
 
 typedef struct GnG_parameters_s {
@@ -210,6 +221,15 @@ static PyObject *pointwiseXY_C_isInterpolationOther( pointwiseXY_CPy *self );
 static PyObject *pointwiseXY_C_getSecondaryCacheSize( pointwiseXY_CPy *self );
 static PyObject *pointwiseXY_C_getSafeDivide( pointwiseXY_CPy *self );
 static PyObject *pointwiseXY_C_evaluate( pointwiseXY_CPy *self, PyObject *args );
+static PyObject *pointwiseXY_C_evaluateMany( pointwiseXY_CPy *self, PyObject *args, PyObject *keywords );
+static nfu_status pointwiseXY_C_evaluateMany2( statusMessageReporting *smr, ptwXYPoints *ptwXY, Py_ssize_t n, char const *xs, 
+    Py_ssize_t xStride, char *ys, Py_ssize_t yStride, double outOfDomainValue );
+static int64_t pointwiseXY_C_indexAtOrBelowX( ptwXYPoint const *points, int64_t length, double x, int64_t lower );
+static int pointwiseXY_C_getDoubleBuffer( PyObject *object, Py_buffer *view, int flags );
+static PyObject *pointwiseXY_C_xsBuffer( pointwiseXY_CPy *self );
+static PyObject *pointwiseXY_C_ysBuffer( pointwiseXY_CPy *self );
+static PyObject *pointwiseXY_C_newBuffer( pointwiseXY_CPy *self, Py_ssize_t offset );
+static int pointwiseXY_C_checkNoExports( pointwiseXY_CPy *self );
 static PyObject *pointwiseXY_C_getUserFlag( pointwiseXY_CPy *self );
 static PyObject *pointwiseXY_C_integrate( pointwiseXY_CPy *self, PyObject *args, PyObject *keywords );
 static PyObject *pointwiseXY_C_integrateWithFunction( pointwiseXY_CPy *self, PyObject *args, PyObject *keywords );
@@ -275,6 +295,7 @@ static PyObject *pointwiseXY_C_basicGaussian( pointwiseXY_CPy *self, PyObject *a
 static PyObject *pointwiseXY_C_unitbaseInterpolate( pointwiseXY_CPy *self, PyObject *args );
 
 static PyObject *floatToShortestString_C( PyObject *self, PyObject *args, PyObject *keywords );
+static PyObject *floatsToShortestStrings_C( PyObject *self, PyObject *args, PyObject *keywords );
 
 static void pointwiseXY_C_getSliceIndices( int64_t length, int64_t *index1, int64_t *index2 );
 static int pointwiseXY_C_PythonXYPairToCPair( PyObject *XYPairPy, double *x, double *y, int64_t index );
@@ -309,6 +330,7 @@ static pointwiseXY_CPy *pointwiseXY_CNewInitialize( int infill, int safeDivide )
         self->ptwXY = NULL;
         self->infill = infill;
         self->safeDivide = safeDivide;
+        self->exports = 0;
     }
     return( self );
 }
@@ -327,6 +349,7 @@ static int pointwiseXY_C__init__( pointwiseXY_CPy *self, PyObject *args, PyObjec
     char *interpolationStr = NULL, *dataForm, dataFormXYs[] = "xys", dataFormXsAndYs[] = "xsandys", dataFormList[] = "list", dataFormToLower[12], *c;
     ptwXY_interpolation interpolation = ptwXY_interpolationLinLin;
 
+    if( pointwiseXY_C_checkNoExports( self ) != 0 ) return( -1 );
     self->ptwXY = NULL;
     if( !PyArg_ParseTupleAndKeywords( args, keywords, "|OOiiddsiiiOO", kwlist, &dataPy, &dataFormPy, &initialSize, &overflowSize, &accuracy, 
         &biSectionMax, &interpolationStr, &infill, &safeDivide, &userFlag ) ) return( -1 );
@@ -510,6 +533,7 @@ static int pointwiseXY_C__setitem__( pointwiseXY_CPy *self, Py_ssize_t index_, P
     statusMessageReporting *smr = &(self->smr);
 
     if( pointwiseXY_C_checkStatus( self ) != 0 ) return( -1 );
+    if( pointwiseXY_C_checkNoExports( self ) != 0 ) return( -1 );
 
     if( ( index < 0 ) || ( index >= self->ptwXY->length ) ) {
         PyErr_SetString( PyExc_IndexError, "index out of range" );
@@ -568,6 +592,7 @@ static int pointwiseXY_C__setslice__( pointwiseXY_CPy *self, Py_ssize_t index1_,
     statusMessageReporting *smr = &(self->smr);
 
     if( pointwiseXY_C_checkStatus( self ) != 0 ) return( -1 );
+    if( pointwiseXY_C_checkNoExports( self ) != 0 ) return( -1 );
 
     pointwiseXY_C_getSliceIndices( self->ptwXY->length, &index1, &index2 );
 
@@ -1005,6 +1030,7 @@ static PyObject *pointwiseXY_C_add_sub_mul_div_pointwiseXY_C_insitu( pointwiseXY
     ptwXYPoints *n1 = NULL;
     statusMessageReporting *smr = &(self->smr);
 
+    if( pointwiseXY_C_checkNoExports( self ) != 0 ) return( NULL );
     if( ( n1 = func( smr, self->ptwXY, other->ptwXY ) )  == NULL ) {
         pointwiseXY_C_SetPyErrorExceptionFromSMR( PyExc_Exception, smr );
         self->ptwXY->status = nfu_badSelf;
@@ -1134,6 +1160,7 @@ static PyObject *pointwiseXY_C_pop( pointwiseXY_CPy *self, PyObject *args, PyObj
     statusMessageReporting *smr = &(self->smr);
 
     if( pointwiseXY_C_checkStatus( self ) != 0 ) return( NULL );
+    if( pointwiseXY_C_checkNoExports( self ) != 0 ) return( NULL );
 
     if( !PyArg_ParseTupleAndKeywords( args, keywords, "|i", kwlist, &index ) ) return( NULL );
 
@@ -1723,6 +1750,246 @@ static PyObject *pointwiseXY_C_evaluate( pointwiseXY_CPy *self, PyObject *args )
 /*
 ************************************************************
 */
+static PyObject *pointwiseXY_C_evaluateMany( pointwiseXY_CPy *self, PyObject *args, PyObject *keywords ) {
+
+    int xsIsBuffer = 0, ysIsBuffer = 0;
+    Py_ssize_t i, n;
+    double outOfDomainValue = Py_NAN, *xsList = NULL, *ysList = NULL;
+    nfu_status status_nf;
+    static char *kwlist[] = { "xs", "ys", "outOfDomainValue", NULL };
+    PyObject *xsPy, *ysPy = NULL, *value = NULL, *item;
+    Py_buffer xsView, ysView;
+    char const *xs;
+    char *ys;
+    Py_ssize_t xStride = sizeof( double ), yStride = sizeof( double );
+    statusMessageReporting *smr = &(self->smr);
+
+    if( pointwiseXY_C_checkStatus( self ) != 0 ) return( NULL );
+
+    if( !PyArg_ParseTupleAndKeywords( args, keywords, "O|Od", kwlist, &xsPy, &ysPy, &outOfDomainValue ) ) return( NULL );
+    if( ysPy == Py_None ) ysPy = NULL;
+
+    if( pointwiseXY_C_getDoubleBuffer( xsPy, &xsView, PyBUF_STRIDES | PyBUF_FORMAT ) == 0 ) {
+        xsIsBuffer = 1;
+        n = xsView.shape[0];
+        xs = (char const *) xsView.buf;
+        xStride = xsView.strides[0]; }
+    else {
+        if( PyErr_Occurred( ) ) return( NULL );
+        if( ( n = (Py_ssize_t) pointwiseXY_C_pythonDoubleListToCList( xsPy, &xsList, 0 ) ) < 0 ) return( NULL );
+        xs = (char const *) xsList;
+    }
+
+    if( ysPy != NULL ) {
+        if( pointwiseXY_C_getDoubleBuffer( ysPy, &ysView, PyBUF_STRIDES | PyBUF_FORMAT | PyBUF_WRITABLE ) != 0 ) {
+            if( !PyErr_Occurred( ) ) PyErr_SetString( PyExc_TypeError, "ys must be a writable, one dimensional buffer of doubles" );
+            goto err;
+        }
+        ysIsBuffer = 1;
+        if( ysView.shape[0] != n ) {
+            PyErr_Format( PyExc_ValueError, "length of ys = %ld not equal to length of xs = %ld", (long) ysView.shape[0], (long) n );
+            goto err;
+        }
+        ys = (char *) ysView.buf;
+        yStride = ysView.strides[0]; }
+    else {
+        if( ( ysList = (double *) malloc( (size_t) ( n > 0 ? n : 1 ) * sizeof( double ) ) ) == NULL ) {
+            PyErr_NoMemory( );
+            goto err;
+        }
+        ys = (char *) ysList;
+    }
+
+    if( ( status_nf = pointwiseXY_C_evaluateMany2( smr, self->ptwXY, n, xs, xStride, ys, yStride, outOfDomainValue ) ) != nfu_Okay ) {
+        if( status_nf == nfu_otherInterpolation ) {
+            pointwiseXY_C_SetPyErrorExceptionReturnNull( "unsupported interpolation = %s", self->ptwXY->interpolationString ); }
+        else {
+            pointwiseXY_C_SetPyErrorExceptionFromSMR( PyExc_Exception, smr );
+        }
+        goto err;
+    }
+
+    if( ysIsBuffer ) {
+        Py_INCREF( ysPy );
+        value = ysPy; }
+    else {
+        if( ( value = PyList_New( n ) ) == NULL ) goto err;
+        for( i = 0; i < n; i++ ) {
+            if( ( item = PyFloat_FromDouble( ysList[i] ) ) == NULL ) {
+                Py_DECREF( value );
+                value = NULL;
+                goto err;
+            }
+            PyList_SET_ITEM( value, i, item );
+        }
+    }
+
+err:
+    if( xsIsBuffer ) PyBuffer_Release( &xsView );
+    if( ysIsBuffer ) PyBuffer_Release( &ysView );
+    free( xsList );
+    free( ysList );
+    return( value );
+}
+/*
+************************************************************
+*/
+static nfu_status pointwiseXY_C_evaluateMany2( statusMessageReporting *smr, ptwXYPoints *ptwXY, Py_ssize_t n, char const *xs,
+        Py_ssize_t xStride, char *ys, Py_ssize_t yStride, double outOfDomainValue ) {
+/*
+*   Evaluates ptwXY at the n x-values in xs and puts the results in ys. The x-values are walked in order while the
+*   index into ptwXY's points only moves forward, so an ascending xs costs one merge pass over the points. When an
+*   x-value is less than the prior one the search restarts from the first point.
+*/
+    int chargedParticle = 0;
+    Py_ssize_t i;
+    int64_t index = 0, length;
+    double x, y, x1, y1, x2, y2, f1, f2, alpha;
+    ptwXYPoint const *points;
+    nfu_status status_nf;
+
+    if( ptwXY->interpolation == ptwXY_interpolationOther ) {
+        if( strcmp( ptwXY->interpolationString, "charged-particle" ) != 0 ) return( nfu_otherInterpolation );
+        chargedParticle = 1;
+    }
+    if( ptwXY_coalescePoints( smr, ptwXY, 0, NULL, 0 ) != nfu_Okay ) return( ptwXY->status );
+
+    length = ptwXY->length;
+    points = ptwXY->points;
+    for( i = 0; i < n; i++, xs += xStride, ys += yStride ) {
+        x = *((double const *) xs);
+        y = outOfDomainValue;
+        if( ( length > 0 ) && ( x >= points[0].x ) && ( x <= points[length-1].x ) ) {
+            if( x < points[index].x ) index = 0;
+            index = pointwiseXY_C_indexAtOrBelowX( points, length, x, index );
+            x1 = points[index].x;
+            y1 = points[index].y;
+            if( x == x1 ) {
+                y = y1; }
+            else {
+                x2 = points[index+1].x;
+                y2 = points[index+1].y;
+                if( chargedParticle ) {                     /* Only T = 0 is supported, as in crossSection.changeInterpolation. */
+                    if( ( x1 <= 0. ) || ( y1 < 0. ) || ( y2 < 0. ) ) {
+                        smr_setReportError2( smr, nfu_SMR_libraryID, nfu_invalidInterpolation,
+                                "For charged-particle, x-values must be positive and y-values non-negative, x1 = %.17e, y1 = %.17e, y2 = %.17e.",
+                                x1, y1, y2 );
+                        return( nfu_invalidInterpolation );
+                    }
+                    f1 = 1. / sqrt( x1 );
+                    f2 = 1. / sqrt( x2 );
+                    alpha = ( 1. / sqrt( x ) - f1 ) / ( f2 - f1 );
+                    y = pow( x1 * y1, 1. - alpha ) * pow( x2 * y2, alpha ) / x; }
+                else {
+                    if( ( status_nf = ptwXY_interpolatePoint( smr, ptwXY->interpolation, x, &y, x1, y1, x2, y2 ) ) != nfu_Okay )
+                        return( status_nf );
+                }
+            }
+        }
+        *((double *) ys) = y;
+    }
+    return( nfu_Okay );
+}
+/*
+************************************************************
+*/
+static int64_t pointwiseXY_C_indexAtOrBelowX( ptwXYPoint const *points, int64_t length, double x, int64_t lower ) {
+/*
+*   Returns the largest index i >= lower with points[i].x <= x. Assumes points[lower].x <= x. The search gallops up from
+*   lower and then bisects, so that a step of k points costs O( log( k ) ).
+*/
+    int64_t step = 1, upper = lower + 1, middle;
+
+    while( ( upper < length ) && ( points[upper].x <= x ) ) {
+        lower = upper;
+        step *= 2;
+        upper = lower + step;
+    }
+    if( upper > length ) upper = length;
+    while( ( upper - lower ) > 1 ) {
+        middle = ( lower + upper ) / 2;
+        if( points[middle].x <= x ) {
+            lower = middle; }
+        else {
+            upper = middle;
+        }
+    }
+    return( lower );
+}
+/*
+************************************************************
+*/
+static int pointwiseXY_C_getDoubleBuffer( PyObject *object, Py_buffer *view, int flags ) {
+/*
+*   Gets a one dimensional buffer of native doubles from object. Returns 0 on success and -1 otherwise. On failure, a python
+*   exception is only set when object has a buffer of doubles that cannot be used as requested (e.g., is not writable).
+*/
+    char const *format;
+
+    if( !PyObject_CheckBuffer( object ) ) return( -1 );
+    if( PyObject_GetBuffer( object, view, flags ) != 0 ) {
+        PyErr_Clear( );
+        if( PyObject_GetBuffer( object, view, PyBUF_STRIDES | PyBUF_FORMAT ) != 0 ) {
+            PyErr_Clear( );
+            return( -1 );
+        }
+        format = view->format;
+        if( ( format != NULL ) && ( ( *format == '@' ) || ( *format == '=' ) ) ) format++;
+        if( ( format != NULL ) && ( strcmp( format, "d" ) == 0 ) ) PyErr_SetString( PyExc_BufferError, "buffer of doubles not writable" );
+        PyBuffer_Release( view );
+        return( -1 );
+    }
+    format = view->format;
+    if( ( format != NULL ) && ( ( *format == '@' ) || ( *format == '=' ) ) ) format++;
+    if( ( view->ndim != 1 ) || ( view->itemsize != sizeof( double ) ) || ( format == NULL ) || ( strcmp( format, "d" ) != 0 ) ) {
+        PyBuffer_Release( view );
+        return( -1 );
+    }
+    return( 0 );
+}
+/*
+************************************************************
+*/
+static PyObject *pointwiseXY_C_xsBuffer( pointwiseXY_CPy *self ) {
+
+    return( pointwiseXY_C_newBuffer( self, (Py_ssize_t) offsetof( ptwXYPoint, x ) ) );
+}
+/*
+************************************************************
+*/
+static PyObject *pointwiseXY_C_ysBuffer( pointwiseXY_CPy *self ) {
+
+    return( pointwiseXY_C_newBuffer( self, (Py_ssize_t) offsetof( ptwXYPoint, y ) ) );
+}
+/*
+************************************************************
+*/
+static PyObject *pointwiseXY_C_newBuffer( pointwiseXY_CPy *self, Py_ssize_t offset ) {
+
+    pointwiseXY_CBufferPy *buffer;
+
+    if( pointwiseXY_C_checkStatus( self ) != 0 ) return( NULL );
+
+    if( ( buffer = PyObject_New( pointwiseXY_CBufferPy, &pointwiseXY_CBufferPyType ) ) == NULL ) return( NULL );
+    Py_INCREF( self );
+    buffer->owner = self;
+    buffer->offset = offset;
+    buffer->shape = 0;
+    buffer->stride = sizeof( ptwXYPoint );
+    return( (PyObject *) buffer );
+}
+/*
+************************************************************
+*/
+static int pointwiseXY_C_checkNoExports( pointwiseXY_CPy *self ) {
+
+    if( self->exports == 0 ) return( 0 );
+    PyErr_SetString( PyExc_BufferError, "cannot add, remove or reallocate points while a buffer of self is exported" );
+    return( -1 );
+}
+/*
+************************************************************
+*/
 static PyObject *pointwiseXY_C_getUserFlag( pointwiseXY_CPy *self ) {
 
     if( pointwiseXY_C_checkStatus( self ) != 0 ) return( NULL );
@@ -2175,6 +2442,7 @@ static PyObject *pointwiseXY_C_reallocatePoints( pointwiseXY_CPy *self, PyObject
     statusMessageReporting *smr = &(self->smr);
 
     if( pointwiseXY_C_checkStatus( self ) != 0 ) return( NULL );
+    if( pointwiseXY_C_checkNoExports( self ) != 0 ) return( NULL );
 
     if( !PyArg_ParseTupleAndKeywords( args, keywords, "i|i", kwlist, &size, &forceSmallerResize ) ) return( NULL );
 
@@ -2194,6 +2462,7 @@ static PyObject *pointwiseXY_C_reallocateOverflowPoints( pointwiseXY_CPy *self,
     statusMessageReporting *smr = &(self->smr);
 
     if( pointwiseXY_C_checkStatus( self ) != 0 ) return( NULL );
+    if( pointwiseXY_C_checkNoExports( self ) != 0 ) return( NULL );
 
     if( !PyArg_ParseTuple( args, "i", &size ) ) return( NULL );
 
@@ -2213,6 +2482,7 @@ static PyObject *pointwiseXY_C_setData( pointwiseXY_CPy *self, PyObject *args )
     PyObject *PyXYList;
 
     if( pointwiseXY_C_checkStatus( self ) != 0 ) return( NULL );
+    if( pointwiseXY_C_checkNoExports( self ) != 0 ) return( NULL );
 
     if( !PyArg_ParseTuple( args, "O", &PyXYList ) ) return( NULL );
     if( pointwiseXY_C_setData2( self, self->ptwXY, PyXYList ) == 0 ) status = pointwiseXY_C_GetNone( );
@@ -2303,6 +2573,7 @@ static PyObject *pointwiseXY_C_setDataFromList( pointwiseXY_CPy *self, PyObject
     PyObject *PyXYs;
 
     if( pointwiseXY_C_checkStatus( self ) != 0 ) return( NULL );
+    if( pointwiseXY_C_checkNoExports( self ) != 0 ) return( NULL );
 
     if( !PyArg_ParseTuple( args, "O", &PyXYs) ) return( NULL );
     if( pointwiseXY_C_setDataFromList2( self->ptwXY, PyXYs ) == 0 ) status = pointwiseXY_C_GetNone( );
@@ -2359,6 +2630,7 @@ static PyObject *pointwiseXY_C_setDataFromXsAndYs( pointwiseXY_CPy *self, PyObje
     PyObject *PyXs, *PyYs;
 
     if( pointwiseXY_C_checkStatus( self ) != 0 ) return( NULL );
+    if( pointwiseXY_C_checkNoExports( self ) != 0 ) return( NULL );
 
     if( !PyArg_ParseTuple( args, "OO", &PyXs, &PyYs) ) return( NULL );
     if( pointwiseXY_C_setDataFromXsAndYs2( self->ptwXY, PyXs, PyYs ) == 0 ) status = pointwiseXY_C_GetNone( );
@@ -2433,6 +2705,7 @@ static PyObject *pointwiseXY_C_setValue( pointwiseXY_CPy *self, PyObject *args )
     statusMessageReporting *smr = &(self->smr);
 
     if( pointwiseXY_C_checkStatus( self ) != 0 ) return( NULL );
+    if( pointwiseXY_C_checkNoExports( self ) != 0 ) return( NULL );
 
     if( !PyArg_ParseTuple( args, "dd", &x, &y ) ) return( NULL );
 
@@ -3147,6 +3420,58 @@ static PyObject *floatToShortestString_C( PyObject *self, PyObject *args, PyObje
 /*
 ************************************************************
 */
+static PyObject *floatsToShortestStrings_C( PyObject *self, PyObject *args, PyObject *keywords ) {
+
+    int significantDigits = 15, trimZeros = 1, keepPeriod = 0, favorEFormBy = 0, includeSign = 0, flags = 0;
+    int64_t i1, length;
+    size_t sepLength, stringLength, size = 0, allocated = 0;
+    double *values;
+    char *sep = " ", *string, *strings = NULL, *newStrings;
+    PyObject *valuesPy, *StringPy = NULL;
+    static char *kwlist[] = { "values", "significantDigits", "trimZeros", "keepPeriod", "favorEFormBy", "includeSign", "sep", NULL };
+
+    if( !PyArg_ParseTupleAndKeywords( args, keywords, "O|iiiiis", kwlist, &valuesPy, &significantDigits, &trimZeros, &keepPeriod,
+            &favorEFormBy, &includeSign, &sep ) ) return( NULL );
+
+    if( trimZeros ) flags += nf_floatToShortestString_trimZeros;
+    if( keepPeriod ) flags += nf_floatToShortestString_keepPeriod;
+    if( includeSign ) flags += nf_floatToShortestString_includeSign;
+
+    if( ( length = pointwiseXY_C_pythonDoubleListToCList( valuesPy, &values, 0 ) ) < 0 ) return( NULL );
+    sepLength = strlen( sep );
+    for( i1 = 0; i1 < length; i1++ ) {
+        if( ( string = nf_floatToShortestString( values[i1], significantDigits, favorEFormBy, flags ) ) == NULL ) {
+            PyErr_NoMemory( );
+            goto err;
+        }
+        stringLength = strlen( string );
+        if( ( size + sepLength + stringLength + 1 ) > allocated ) {
+            allocated = 2 * allocated + sepLength + stringLength + 1;
+            if( ( newStrings = (char *) realloc( strings, allocated ) ) == NULL ) {
+                free( string );
+                PyErr_NoMemory( );
+                goto err;
+            }
+            strings = newStrings;
+        }
+        if( i1 > 0 ) {
+            memcpy( &(strings[size]), sep, sepLength );
+            size += sepLength;
+        }
+        memcpy( &(strings[size]), string, stringLength );
+        size += stringLength;
+        free( string );
+    }
+    StringPy = PyString_FromStringAndSize( strings, (Py_ssize_t) size );
+
+err:
+    free( values );
+    free( strings );
+    return( StringPy );
+}
+/*
+************************************************************
+*/
 static int pointwiseXY_C_PythonXYPairToCPair( PyObject *XYPairPy, double *x, double *y, int64_t index ) {
 /*
 *   Status is 0) if all is ok.
@@ -3267,9 +3592,40 @@ static int64_t pointwiseXY_C_pythonDoubleListToCList( PyObject *PyDoubleList, do
     int status = 0;
     int64_t length, i;
     double *d, dPrior = 0.;
+    char const *p;
     PyObject *item, *iterator;
+    Py_buffer view;
 
     *ds = NULL;
+    if( pointwiseXY_C_getDoubleBuffer( PyDoubleList, &view, PyBUF_STRIDES | PyBUF_FORMAT ) == 0 ) {
+                    /* A buffer of doubles (e.g., a listOfDoubles_C or a numpy array) is copied without creating python floats. */
+        length = (int64_t) view.shape[0];
+        if( length > 0 ) {
+            if( ( *ds = (double *) malloc( (size_t) length * sizeof( double ) ) ) == NULL ) {
+                PyBuffer_Release( &view );
+                PyErr_NoMemory( );
+                return( -1 );
+            }
+            for( i = 0, d = *ds, p = (char const *) view.buf; i < length; i++, d++, p += view.strides[0] ) {
+                *d = *((double const *) p);
+                if( ascending && ( i != 0 ) && ( *d <= dPrior ) ) {
+                    status = -1;
+                    pointwiseXY_C_SetPyErrorExceptionReturnNull( "data not in ascending order at index %d and %d", (int) i - 1, (int) i );
+                    break;
+                }
+                dPrior = *d;
+            }
+        }
+        PyBuffer_Release( &view );
+        if( status != 0 ) {
+            free( *ds );
+            *ds = NULL;
+            return( -1 );
+        }
+        return( length );
+    }
+    if( PyErr_Occurred( ) ) return( -1 );
+
     if( ( iterator = PyObject_GetIter( PyDoubleList ) ) == NULL ) return( -1 );
     if( ( length = (int64_t) PySequence_Size( PyDoubleList ) ) != (int64_t) 0 ) {
         if( ( *ds = (double *) malloc( (size_t) length * sizeof( double ) ) ) == NULL ) {
@@ -3624,6 +3980,17 @@ static PyMethodDef pointwiseXY_CPyMethods[] = {
     { "getSecondaryCacheSize", (PyCFunction) pointwiseXY_C_getSecondaryCacheSize, METH_NOARGS, "Returns the size of self's secondary cache." },
     { "getSafeDivide", (PyCFunction) pointwiseXY_C_getSafeDivide, METH_NOARGS, "Returns self's safeDivide flag." },
     { "evaluate", (PyCFunction) pointwiseXY_C_evaluate, METH_VARARGS, "Gets the y value at x." },
+    { "evaluateMany", (PyCFunction) pointwiseXY_C_evaluateMany, METH_VARARGS | METH_KEYWORDS, 
+        "self.evaluateMany( xs, ys = None, outOfDomainValue = nan )\n\n" \
+        "Returns the y-values of self at each x-value in xs. The x-values are evaluated in one pass over self's points,\n" \
+        "which is fastest when xs is ascending, but xs need not be sorted. All interpolations, including 'charged-particle',\n" \
+        "are supported. If xs supports the buffer protocol with double items (e.g., a numpy array of floats), its data are\n" \
+        "read without copying.\n" \
+        "\nArguments are: ([o] implies optional argument)\n" \
+        "   xs                  a sequence or buffer of x-values,\n" \
+        "   ys              [o] a writable buffer of doubles with the same length as xs that receives the y-values and is returned.\n" \
+        "                       If not present, a python list of floats is returned,\n" \
+        "   outOfDomainValue [o] the y-value given for any x-value outside of self's domain (default is nan)." },
     { "getUserFlag", (PyCFunction) pointwiseXY_C_getUserFlag, METH_NOARGS, "Gets the user flag." },
     { "groupOneFunction", (PyCFunction) pointwiseXY_C_groupOneFunction, METH_VARARGS | METH_KEYWORDS, 
         "Returns a python list of float values. Each value is the integral of self between two consecutive group boundaries.\n" \
@@ -3766,6 +4133,13 @@ static PyMethodDef pointwiseXY_CPyMethods[] = {
     { "mergeClosePoints", (PyCFunction) pointwiseXY_C_mergeClosePoints, METH_VARARGS, 
         "Returns a new pointwiseXY_C object whose x values are the union of self and other." },
     { "domainGrid", (PyCFunction) pointwiseXY_C_domainGrid, METH_VARARGS, "Returns a list of x-values for self." },
+    { "xsBuffer", (PyCFunction) pointwiseXY_C_xsBuffer, METH_NOARGS, 
+        "Returns a read-only buffer object that exposes self's x-values, without copying, through the buffer protocol\n" \
+        "(e.g., numpy.asarray( self.xsBuffer( ) ) is a view of the x-values). While any view of the buffer exists, methods\n" \
+        "that add, remove or reallocate points of self raise a BufferError." },
+    { "ysBuffer", (PyCFunction) pointwiseXY_C_ysBuffer, METH_NOARGS, 
+        "Returns a read-only buffer object that exposes self's y-values, without copying, through the buffer protocol.\n" \
+        "See xsBuffer for more information." },
     { "domain", (PyCFunction) pointwiseXY_C_domain, METH_NOARGS, "Returns the x-value of the first and last points as a tuple." },
     { "domainMin", (PyCFunction) pointwiseXY_C_domainMin, METH_NOARGS, "Returns the x-value of the first point." },
     { "domainMax", (PyCFunction) pointwiseXY_C_domainMax, METH_NOARGS, "Returns the x-value of the last point." },
@@ -3828,6 +4202,103 @@ static PyTypeObject pointwiseXY_CPyType = {
 /*
 ************************************************************
 */
+static void pointwiseXY_CBuffer_dealloc( pointwiseXY_CBufferPy *self ) {
+
+    Py_DECREF( self->owner );
+    PyObject_Del( self );
+}
+/*
+************************************************************
+*/
+static int pointwiseXY_CBuffer_getbuffer( pointwiseXY_CBufferPy *self, Py_buffer *view, int flags ) {
+
+    static double empty[2] = { 0., 0. };
+    char *buf = (char *) empty;
+    pointwiseXY_CPy *owner = self->owner;
+    statusMessageReporting *smr = &(owner->smr);
+
+    view->obj = NULL;
+    if( ( flags & PyBUF_WRITABLE ) == PyBUF_WRITABLE ) {
+        PyErr_SetString( PyExc_BufferError, "pointwiseXY_C buffer is read-only" );
+        return( -1 );
+    }
+    if( ( flags & PyBUF_STRIDES ) != PyBUF_STRIDES ) {
+        PyErr_SetString( PyExc_BufferError, "pointwiseXY_C buffer is strided" );
+        return( -1 );
+    }
+    if( pointwiseXY_C_checkStatus( owner ) != 0 ) return( -1 );
+    if( ptwXY_coalescePoints( smr, owner->ptwXY, 0, NULL, 0 ) != nfu_Okay ) {
+        pointwiseXY_C_SetPyErrorExceptionFromSMR( PyExc_Exception, smr );
+        return( -1 );
+    }
+
+    if( owner->ptwXY->length > 0 ) buf = (char *) owner->ptwXY->points;
+    self->shape = (Py_ssize_t) owner->ptwXY->length;
+
+    Py_INCREF( self );
+    view->obj = (PyObject *) self;
+    view->buf = buf + self->offset;
+    view->len = self->shape * sizeof( double );
+    view->readonly = 1;
+    view->itemsize = sizeof( double );
+    view->format = ( ( flags & PyBUF_FORMAT ) == PyBUF_FORMAT ) ? "d" : NULL;
+    view->ndim = 1;
+    view->shape = &(self->shape);
+    view->strides = &(self->stride);
+    view->suboffsets = NULL;
+    view->internal = NULL;
+    owner->exports++;
+    return( 0 );
+}
+/*
+************************************************************
+*/
+static void pointwiseXY_CBuffer_releasebuffer( pointwiseXY_CBufferPy *self, Py_buffer *view ) {
+
+    self->owner->exports--;
+}
+/*
+************************************************************
+*/
+static PyBufferProcs pointwiseXY_CBufferPy_buffer = {
+    0,                                                      /* bf_getreadbuffer  */
+    0,                                                      /* bf_getwritebuffer */
+    0,                                                      /* bf_getsegcount    */
+    0,                                                      /* bf_getcharbuffer  */
+    (getbufferproc) pointwiseXY_CBuffer_getbuffer,          /* bf_getbuffer      */
+    (releasebufferproc) pointwiseXY_CBuffer_releasebuffer   /* bf_releasebuffer  */
+};
+/*
+************************************************************
+*/
+static PyTypeObject pointwiseXY_CBufferPyType = {
+    PyObject_HEAD_INIT( NULL )
+    0,                                      /* ob_size        */
+    "pointwiseXY_C.buffer",                 /* tp_name        */
+    sizeof( pointwiseXY_CBufferPy ),        /* tp_basicsize   */
+    0,                                      /* tp_itemsize    */
+    /* methods */
+    (destructor) pointwiseXY_CBuffer_dealloc, /* tp_dealloc   */
+    0,                                      /* tp_print       */
+    0,                                      /* tp_getattr     */
+    0,                                      /* tp_setattr     */
+    0,                                      /* tp_compare     */
+    0,                                      /* tp_repr        */
+    0,                                      /* tp_as_number   */
+    0,                                      /* tp_as_sequence */
+    0,                                      /* tp_as_mapping  */
+    0,                                      /* tp_hash        */
+    0,                                      /* tp_call        */
+    0,                                      /* tp_str         */
+    0,                                      /* tp_getattro    */
+    0,                                      /* tp_setattro    */
+    &pointwiseXY_CBufferPy_buffer,          /* tp_as_buffer   */
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_NEWBUFFER, /* tp_flags */
+    "A read-only, strided view of the x- or y-values of a pointwiseXY_C instance (see pointwiseXY_C.xsBuffer).", /* tp_doc */
+};
+/*
+************************************************************
+*/
 
 static PyMethodDef pointwiseXY_CMiscPyMethods[] = {
 
@@ -3929,6 +4400,16 @@ static PyMethodDef pointwiseXY_CMiscPyMethods[] = {
         "                       with the shortest representation is determined,\n" \
         "   includeSign         If True, the returned string will always start with a sign character\n" \
         "                       (i.e., '+' or '-'). Otherwise, only negative values will have a sign.\n" },
+    { "floatsToShortestStrings", (PyCFunction) floatsToShortestStrings_C, METH_VARARGS | METH_KEYWORDS,
+        "floatsToShortestStrings( values, significantDigits = 15, trimZeros = True, keepPeriod = False,\n" \
+        "        favorEFormBy = 0, includeSign = False, sep = ' ' )\n\n" \
+        "Returns a string of each float in values converted as by floatToShortestString and separated by sep.\n" \
+        "That is, the returned string is sep.join( [ floatToShortestString( value, ... ) for value in values ] ).\n" \
+        "\n" \
+        "Arguments are:\n" \
+        "   values              a sequence or buffer of floats (e.g., a list, a listOfDoubles_C or a numpy array),\n" \
+        "   sep                 the string put between two converted values,\n" \
+        "   See floatToShortestString for the other arguments.\n" },
     { NULL, NULL, 0, NULL }        /* Sentinel (i.e., the end of the list) */
 };
 /*
@@ -3968,6 +4449,7 @@ DL_EXPORT( void ) initpointwiseXY_C( void ) {
 
     pointwiseXY_CPyType.tp_new = PyType_GenericNew;
     if( PyType_Ready( &pointwiseXY_CPyType ) < 0 ) return;
+    if( PyType_Ready( &pointwiseXY_CBufferPyType ) < 0 ) return;
 
     if( ( m = Py_InitModule3( "pointwiseXY_C", pointwiseXY_CMiscPyMethods, "A module that contains the class pointwiseXY_C." ) ) == NULL ) return;
 
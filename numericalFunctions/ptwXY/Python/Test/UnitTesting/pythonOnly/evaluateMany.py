@@ -0,0 +1,120 @@
+# <<BEGIN-copyright>>
+# Copyright (c) 2016, Lawrence Livermore National Security, LLC.
+# Produced at the Lawrence Livermore National Laboratory.
+# Written by the LLNL Nuclear Data and Theory group
+#         (email: mattoon1@llnl.gov)
+# LLNL-CODE-683960.
+# All rights reserved.
+# 
+# This file is part of the FUDGE package (For Updating Data and 
+#         Generating Evaluations)
+# 
+# When citing FUDGE, please use the following reference:
+#   C.M. Mattoon, B.R. Beck, N.R. Patel, N.C. Summers, G.W. Hedstrom, D.A. Brown, "Generalized Nuclear Data: A New Structure (with Supporting Infrastructure) for Handling Nuclear Data", Nuclear Data Sheets, Volume 113, Issue 12, December 2012, Pages 3145-3171, ISSN 0090-3752, http://dx.doi.org/10. 1016/j.nds.2012.11.008
+# 
+# 
+#     Please also read this link - Our Notice and Modified BSD License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the disclaimer below.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the disclaimer (as noted below) in the
+#       documentation and/or other materials provided with the distribution.
+#     * Neither the name of LLNS/LLNL nor the names of its contributors may be used
+#       to endorse or promote products derived from this software without specific
+#       prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL LAWRENCE LIVERMORE NATIONAL SECURITY, LLC,
+# THE U.S. DEPARTMENT OF ENERGY OR CONTRIBUTORS BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# 
+# 
+# Additional BSD Notice
+# 
+# 1. This notice is required to be provided under our contract with the U.S.
+# Department of Energy (DOE). This work was produced at Lawrence Livermore
+# National Laboratory under Contract No. DE-AC52-07NA27344 with the DOE.
+# 
+# 2. Neither the United States Government nor Lawrence Livermore National Security,
+# LLC nor any of their employees, makes any warranty, express or implied, or assumes
+# any liability or responsibility for the accuracy, completeness, or usefulness of any
+# information, apparatus, product, or process disclosed, or represents that its use
+# would not infringe privately-owned rights.
+# 
+# 3. Also, reference herein to any specific commercial products, process, or services
+# by trade name, trademark, manufacturer or otherwise does not necessarily constitute
+# or imply its endorsement, recommendation, or favoring by the United States Government
+# or Lawrence Livermore National Security, LLC. The views and opinions of authors expressed
+# herein do not necessarily state or reflect those of the United States Government or
+# Lawrence Livermore National Security, LLC, and shall not be used for advertising or
+# product endorsement purposes.
+# 
+# <<END-copyright>>
+
+import sys, math, random
+sys.path.insert( 0, '../../Utilities' )
+sys.path.insert( 0, '../../../../../lib' )
+
+import numpy
+import pointwiseXY_C
+import utilities
+options = utilities.getOptions( __file__ )
+
+def compare( xys, xs, ys, outOfDomainValue = None ) :
+
+    domainMin, domainMax = xys.domain( )
+    for i1, x in enumerate( xs ) :
+        if( ( x < domainMin ) or ( x > domainMax ) ) :
+            y = outOfDomainValue
+            if( ( y is None ) and math.isnan( ys[i1] ) ) : continue
+        else :
+            y = xys.evaluate( x )
+        if( abs( y - ys[i1] ) > 1e-14 * abs( y ) ) : raise Exception( '%s: at x = %.17e, evaluateMany = %.17e and evaluate = %.17e' % 
+                ( xys.getInterpolation( ), x, ys[i1], y ) )
+
+random.seed( 31 )
+xData = [ 0.5 * i + 0.145 for i in xrange( 51 ) ]
+yData = [ 2 + math.sin( x ) for x in xData ]
+xs = sorted( [ random.uniform( -1, 27 ) for i in xrange( 1000 ) ] ) + xData + [ random.uniform( -1, 27 ) for i in xrange( 100 ) ]
+
+for interpolation in [ 'lin-lin', 'log-lin', 'lin-log', 'log-log', 'flat' ] :
+    xys = pointwiseXY_C.pointwiseXY_C( [ xData, yData ], dataForm = 'XsAndYs', interpolation = interpolation )
+    compare( xys, xs, xys.evaluateMany( xs ) )
+    compare( xys, xs, xys.evaluateMany( numpy.array( xs ) ) )
+    ys = numpy.zeros( len( xs ) )
+    if( xys.evaluateMany( numpy.array( xs ), ys, outOfDomainValue = -1. ) is not ys ) : raise Exception( 'evaluateMany did not return ys' )
+    compare( xys, xs, ys, outOfDomainValue = -1. )
+    xsStrided = numpy.array( [ xs, xs ] ).T[:,0]
+    compare( xys, xs, xys.evaluateMany( xsStrided ) )
+
+xys = pointwiseXY_C.pointwiseXY_C( [ xData, yData ], dataForm = 'XsAndYs', interpolation = 'charged-particle' )
+ys = xys.evaluateMany( xData )
+if( ys != yData ) : raise Exception( 'charged-particle: evaluateMany at the x-values of self does not return the y-values of self' )
+x1, y1, x2, y2 = xData[0], yData[0], xData[1], yData[1]
+x = 0.5 * ( x1 + x2 )
+alpha = ( 1 / math.sqrt( x ) - 1 / math.sqrt( x1 ) ) / ( 1 / math.sqrt( x2 ) - 1 / math.sqrt( x1 ) )
+y = ( x1 * y1 )**( 1 - alpha ) * ( x2 * y2 )**alpha / x
+if( abs( xys.evaluateMany( [ x ] )[0] - y ) > 1e-14 * y ) : raise Exception( 'charged-particle: evaluateMany failed at x = %.17e' % x )
+
+xsView = numpy.asarray( xys.xsBuffer( ) )
+ysView = numpy.asarray( xys.ysBuffer( ) )
+if( list( xsView ) != xData ) : raise Exception( 'xsBuffer does not match x-values' )
+if( list( ysView ) != yData ) : raise Exception( 'ysBuffer does not match y-values' )
+if( xsView.flags.writeable ) : raise Exception( 'xsBuffer is writable' )
+try :
+    xys.setValue( 1000., 1. )
+    raise Exception( 'setValue did not raise while a buffer is exported' )
+except BufferError :
+    pass
+del xsView, ysView
+xys.setValue( 1000., 1. )
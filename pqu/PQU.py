@@ -561,6 +561,7 @@ Future plans
 """
 
 import sys, math, re, string
+import threading
 from functools import reduce
 from NumberDict import NumberDict
 
@@ -697,6 +698,16 @@ def valueOrPQ( value, unitFrom = None, unitTo = None, asPQU = False, checkOrder
         if( asPQU ) : return( PQU( value, unitTo, checkOrder = checkOrder ) )
         return( float( value ) )
 
+    if( not( asPQU ) and isinstance( value, ( int, long, float ) ) ) :
+        # Fast path for a plain number. The returned value is the same as from the PQU logic below which, via pqu_float, calls
+        # fixFloatsOrder for the value and after adding the offset and multiplying by the factor.
+        fixFloatsOrder = pqu_float.fixFloatsOrder
+        value = float( value )
+        if( checkOrder ) : value = fixFloatsOrder( value )[0]
+        if( unitTo is None ) : return( value )
+        factor, offset = _conversionTuple( unitFrom, unitTo )
+        return( fixFloatsOrder( fixFloatsOrder( value + offset )[0] * factor )[0] )
+
     if( isinstance( value, PQU ) ) :
         if( unitFrom != value.unit ) : raise Exception( "Unit '%s' not compatible with unit '%s'" % ( unitFrom, value.unit ) )
         value = value.__deepcopy__( )
@@ -2470,6 +2481,16 @@ class PhysicalUnit :
         :raises TypeError: if the units are not compatible
         """
 
+        if( not( isinstance( other, ( str, PhysicalUnit ) ) ) ) : return( self._conversionTupleTo( other ) )
+        try :
+            other_ = _findUnit( other )
+        except :
+            return( self._conversionTupleTo( other ) )
+        return( _conversionTuple( self, other_ ) )
+
+    def _conversionTupleTo( self, other ) :
+        """For internal use. Like conversionTupleTo but does not use the conversion cache."""
+
         other_ = _getPhysicalUnit( other )
         if( self.powers != other_.powers ) : raise TypeError( 'Unit "%s" not convertible with "%s"' % ( self, other ) )
 
@@ -2583,25 +2604,149 @@ class PhysicalUnit :
 #
 # Helper functions
 #
+#
+# Unit caches. _findUnit caches the PhysicalUnit for each unit string and PhysicalUnit.conversionTupleTo caches the
+# ( factor, offset ) for each pair of units that came from the unit cache. As these units are held by the unit cache,
+# the conversion cache can be keyed on their ids. unitOperationSymbol caches the unit symbol of the product or quotient
+# of two unit strings. Each cache is cleared when it holds unitCacheMaxSize entries. Lookups
+# are lock free (dict.get is atomic) while misses, which may eval a unit string in _unit_table, hold _unitCacheLock.
+# The counters are not locked and so are only approximate when several threads use PQU.
+#
+unitCacheMaxSize = 1024
+_unitCache = {}
+_unitCacheIds = {}
+_conversionCache = {}
+_unitOperationCache = {}
+_unitCacheCounters = { 'unitHits' : 0, 'unitMisses' : 0, 'conversionHits' : 0, 'conversionMisses' : 0 }
+_unitCacheLock = threading.RLock( )
+
+def clearUnitCache( ) :
+    """Clears the unit string, unit conversion and unit operation caches and resets their counters."""
+
+    with _unitCacheLock :
+        _unitCache.clear( )
+        _unitCacheIds.clear( )
+        _conversionCache.clear( )
+        _unitOperationCache.clear( )
+        for key in _unitCacheCounters : _unitCacheCounters[key] = 0
+
+def unitCacheInfo( ) :
+    """
+    Returns a dictionary with the number of hits and misses of the unit string ('unitHits' and 'unitMisses') and unit
+    conversion ('conversionHits' and 'conversionMisses') caches, their hit rates ('unitHitRate' and 'conversionHitRate'),
+    their current sizes ('units', 'conversions' and 'unitOperations') and their maximum size ('maxSize').
+    """
+
+    info = dict( _unitCacheCounters )
+    for name in ( 'unit', 'conversion' ) :
+        calls = info[name + 'Hits'] + info[name + 'Misses']
+        info[name + 'HitRate'] = 0.
+        if( calls > 0 ) : info[name + 'HitRate'] = info[name + 'Hits'] / float( calls )
+    info['units'] = len( _unitCache )
+    info['conversions'] = len( _conversionCache )
+    info['unitOperations'] = len( _unitOperationCache )
+    info['maxSize'] = unitCacheMaxSize
+    return( info )
+
 def _findUnit( unit ) :
 
     if( isinstance( unit, str ) ) :
-        symbol = unit.strip( )
+        cached = _unitCache.get( unit )
+        if( cached is not None ) :
+            _unitCacheCounters['unitHits'] += 1
+            return( cached )
 
-        if( symbol == '' ) :
-            unit = _unit_table[symbol]
-        else:
-            unit = eval( symbol, _unit_table )
+        with _unitCacheLock :
+            _unitCacheCounters['unitMisses'] += 1
+            symbol = unit.strip( )
 
-        for cruft in ['__builtins__', '__args__'] :
-            try:
-                del _unit_table[cruft]
-            except:
-                pass
+            if( symbol == '' ) :
+                physicalUnit = _unit_table[symbol]
+            else:
+                physicalUnit = eval( symbol, _unit_table )
+
+            for cruft in ['__builtins__', '__args__'] :
+                try:
+                    del _unit_table[cruft]
+                except:
+                    pass
+
+            if( isinstance( physicalUnit, PhysicalUnit ) ) :
+                if( len( _unitCache ) >= unitCacheMaxSize ) :
+                    _unitCache.clear( )
+                    _unitCacheIds.clear( )
+                    _conversionCache.clear( )
+                _unitCache[unit] = physicalUnit
+                _unitCacheIds[id( physicalUnit )] = physicalUnit
+        unit = physicalUnit
 
     if( not( isinstance( unit, PhysicalUnit ) ) ) : raise TypeError( '%s is not a unit' % type( unit ) )
     return( unit )
 
+def unitOperationSymbol( unit1, unit2, operator ) :
+    """
+    Returns the unit symbol of unit1 operator unit2 where operator is '*' or '/'. The result is cached when unit1
+    and unit2 are both strings.
+    """
+
+    key = ( unit1, unit2, operator )
+    cacheable = isinstance( unit1, str ) and isinstance( unit2, str )
+    if( cacheable ) :
+        symbol = _unitOperationCache.get( key )
+        if( symbol is not None ) : return( symbol )
+    if( operator == '*' ) :
+        symbol = ( PQU( 1, unit1 ) * PQU( 1, unit2 ) ).getUnitSymbol( )
+    elif( operator == '/' ) :
+        symbol = ( PQU( 1, unit1 ) / PQU( 1, unit2 ) ).getUnitSymbol( )
+    else :
+        raise ArithmeticError( 'unsupported unit operation "%s"' % operator )
+    if( cacheable ) :
+        with _unitCacheLock :
+            if( len( _unitOperationCache ) >= unitCacheMaxSize ) : _unitOperationCache.clear( )
+            _unitOperationCache[key] = symbol
+    return( symbol )
+
+def _conversionTuple( unitFrom, unitTo ) :
+    """
+    For internal use. Returns the ( factor, offset ) that converts a value in unitFrom to one in unitTo as
+    PhysicalUnit.conversionTupleTo does (i.e., ( value + offset ) * factor). unitFrom and unitTo must be a
+    PhysicalUnit or a unit string.
+    """
+
+    unitFrom, unitTo = _findUnit( unitFrom ), _findUnit( unitTo )
+    if( ( _unitCacheIds.get( id( unitFrom ) ) is unitFrom ) and ( _unitCacheIds.get( id( unitTo ) ) is unitTo ) ) :
+        key = ( id( unitFrom ), id( unitTo ) )
+        conversion = _conversionCache.get( key )
+        if( conversion is not None ) :
+            _unitCacheCounters['conversionHits'] += 1
+            return( conversion )
+        conversion = unitFrom._conversionTupleTo( unitTo )
+        with _unitCacheLock :
+            _unitCacheCounters['conversionMisses'] += 1
+            if( ( _unitCacheIds.get( id( unitFrom ) ) is unitFrom ) and ( _unitCacheIds.get( id( unitTo ) ) is unitTo ) ) :  # Cache may have been cleared by another thread.
+                if( len( _conversionCache ) >= unitCacheMaxSize ) : _conversionCache.clear( )
+                _conversionCache[key] = conversion
+        return( conversion )
+    return( unitFrom._conversionTupleTo( unitTo ) )
+
+def convertUnits( value, unitFrom, unitTo ) :
+    """
+    Returns the float value in unitFrom converted to unitTo, as PQU( value, unitFrom ).getValueAs( unitTo ) does but
+    without creating PQU or pqu_float instances. The ( factor, offset ) for each pair of units is cached.
+
+    :param value: the value to convert
+    :type value: `float`
+    :param unitFrom: the unit of value
+    :type unitFrom: `str` or `PhysicalUnit`
+    :param unitTo: the unit to convert value to
+    :type unitTo: `str` or `PhysicalUnit`
+    :rtype: `float`
+    """
+
+    value = pqu_float.fixFloatsOrder( float( value ) )[0]        # PQU( value, unitFrom ) does this to value.
+    factor, offset = _conversionTuple( unitFrom, unitTo )
+    return( ( value + offset ) * factor )
+
 def _round( x ) :
 
     if( x > 0. ) :
@@ -2678,6 +2823,7 @@ def _addUnit( symbol, unit, name = '' ) :
 
     unit.setSymbol( symbol )
     _unit_table[symbol] = unit
+    clearUnitCache( )
 
 def _addPrefixedUnit( unit ) :
     _prefixed_symbols = []
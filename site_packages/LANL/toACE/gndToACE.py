@@ -69,7 +69,8 @@ Issues:
 """
 
 import time
-from xData import axes, XYs
+from xData import axes
+from xData import unionGrid as unionGridModule
 from fudge.gnd import tokens
 from fudge.gnd.productData import distributions
 from fudge.legacy.converting import endf_endl
@@ -123,8 +124,7 @@ def toACE( self, fileName, evaluationId, temperature, productData, addAnnotation
         if( MT == 2 ) :                 # Elastic (MT = 2) must always be present in ACE file.
             EMin = MTData['ESZ'].domainMin( unitTo = 'MeV' )
             break
-    totalXSec = XYs.XYs( axes.defaultAxes( labelsUnits = { 0 : ( '', 'MeV' ), 1 : ( '', 'b' ) } ), [], 1e-3 )
-    absorptionXSec = XYs.XYs( axes.defaultAxes( labelsUnits = { 0 : ( '', 'MeV' ), 1 : ( '', 'b' ) } ), [], 1e-3 )
+    absorptionMTs = []
     sortedMTs = sorted( [ [ MTData[0], i1 ] for i1, MTData in enumerate( productData ) ] ) # Sort MTs like NJOY.
     for MT, i1 in sortedMTs :
         MT_, MTData = productData[i1]
@@ -143,9 +143,8 @@ def toACE( self, fileName, evaluationId, temperature, productData, addAnnotation
             if( XSec[0][0] != 0 ) :
                 if( XSec[0][0] > EMin ) : XSec = XSec.dullEdges( lowerEps = 1e-8 )
             SigData[MT] = XSec
-            totalXSec = totalXSec + XSec
             if( len( neutronDatas ) == 0 ) :
-                absorptionXSec = absorptionXSec + XSec
+                absorptionMTs.append( MT )
                 neutronMultiplicity = 0
             else :
                 NXS[5-1] += 1
@@ -193,21 +192,22 @@ def toACE( self, fileName, evaluationId, temperature, productData, addAnnotation
                 neutronAngular.append( ( MT, angularData ) )
                 neutronEnergies.append( [ MT, XSec.xMin( ), XSec.xMax( ), energyData ] )
             TYP.append( neutronMultiplicity )
-    totalXSec = elasticXSec + totalXSec
-    annotates, XSS, energyGrid, totalSigma = [], [], [], []
-    for E, sigma in totalXSec :
-        energyGrid.append( E )
-        totalSigma.append( sigma )
+    annotates, XSS = [], []
+    energyGrid = unionGridModule.unionGrid( [ elasticXSec ] + SigData.values( ) )
+    elasticSigma = unionGridModule.evaluateOnGrid( elasticXSec, energyGrid )
+    SigValues = dict( [ ( MT, unionGridModule.evaluateOnGrid( SigData[MT], energyGrid ) ) for MT in SigData ] )
+    totalSigma = elasticSigma.copy( )
+    absorptionSigma = 0. * elasticSigma
+    for MT in SigValues :
+        totalSigma += SigValues[MT]
+        if( MT in absorptionMTs ) : absorptionSigma += SigValues[MT]
 
 # 1) Add the ESZ block.
     NXS[3-1] = len( energyGrid )
-    updateXSSInfo( 'energyGrid', annotates, XSS, energyGrid )
-    updateXSSInfo( 'totalSigma', annotates, XSS, totalSigma )
-    if( len( absorptionXSec ) == 0 ) :
-        updateXSSInfo( 'absorption cross section', annotates, XSS, len( energyGrid ) * [ 0. ] )
-    else :
-        updateXSSInfo( 'absorption cross section', annotates, XSS, mapEnergyToTotal( totalXSec, absorptionXSec ))
-    updateXSSInfo( 'elastic cross section', annotates, XSS, mapEnergyToTotal( totalXSec, elasticXSec ) )
+    updateXSSInfo( 'energyGrid', annotates, XSS, energyGrid.tolist( ) )
+    updateXSSInfo( 'totalSigma', annotates, XSS, totalSigma.tolist( ) )
+    updateXSSInfo( 'absorption cross section', annotates, XSS, absorptionSigma.tolist( ) )
+    updateXSSInfo( 'elastic cross section', annotates, XSS, elasticSigma.tolist( ) )
     averageHeating = len( energyGrid ) * [ 0. ]
     updateXSSInfo( 'average heating', annotates, XSS, averageHeating )
 
@@ -237,7 +237,7 @@ def toACE( self, fileName, evaluationId, temperature, productData, addAnnotation
 # 6 and 7) Add the LSIG and SIG blocks.
     SIG = []
     for MT, MTData in productData :
-        if( MT not in [ 2 ] ) : addSigData( MT, SIG, energyGrid, SigData[MT] )
+        if( MT not in [ 2 ] ) : addSigData( MT, SIG, SigValues[MT] )
     JXS[6-1] = len( XSS ) + 1
     LSIG = [ 1 ]
     for MT, firstNonZero, reactionSIG in SIG[:-1] : LSIG.append( LSIG[-1] + len( reactionSIG ) + 2 )
@@ -362,22 +362,15 @@ def XSSToStrings( annotates, XSS, addAnnotation ) :
     if( record ) : strData.append( ''.join( record ) )
     return( strData )
 
-def mapEnergyToTotal( totalXSec, XSec ) :
-
-    return( [ XSec.getValue( E ) for E, sigma in totalXSec ] )
+def addSigData( MT, SIG, xSec ) :
 
-def addSigData( MT, SIG, energyGrid, SigData ) :
+    import numpy
 
-    lastNonZero, firstNonZero, xSec = 2, -1, []
-    for i1, energy in enumerate( energyGrid ) :
-        value = SigData.getValue( energy )
-        if( value is None ) : value = 0.
-        xSec.append( value )
-        if( value != 0. ) :
-            if( firstNonZero == -1 ) : firstNonZero = i1
-            lastNonZero = i1 + 2
+    lastNonZero, firstNonZero = 2, -1
+    nonZeros = numpy.nonzero( xSec )[0]
+    if( len( nonZeros ) > 0 ) : firstNonZero, lastNonZero = int( nonZeros[0] ), int( nonZeros[-1] ) + 2
     if( firstNonZero > 0 ) : firstNonZero -= 1
-    SIG.append( ( MT, firstNonZero, xSec[firstNonZero:lastNonZero] ) )
+    SIG.append( ( MT, firstNonZero, xSec[firstNonZero:lastNonZero].tolist( ) ) )
 
 class n_nPrimeEnergyData :
 
@@ -96,7 +96,7 @@ except Exception as err:
         
 f = open( outFile, 'w' )
 try:
-    f.write( '\n'.join( x.toXMLList(  ) ) )
+    x.saveToOpenedFile( f )
 except Exception as err:
     sys.stderr.write( 'WARNING: MAIN ENDF WRITE HALTED BECAUSE '+str(err) )
     exit()
@@ -104,7 +104,7 @@ f.close( )
 if c:
     f = open( outCovFile, 'w' )
     try:
-        f.write( '\n'.join( c.toXMLList(  ) ) )
+        c.saveToOpenedFile( f )
     except Exception as err:
         sys.stderr.write( 'WARNING: COVARIANCE ENDF WRITE HALTED BECAUSE '+str(err) )
         exit()
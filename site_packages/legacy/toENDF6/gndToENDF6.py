@@ -76,6 +76,8 @@ import fudge.gnd.productData.distributions.energyAngular as energyAngularModule
 import fudge.gnd.productData.distributions.unspecified as unspecifiedModule
 
 import xData.standards as standardsModule
+import xData.XYs as XYsModule
+import xData.unionGrid as unionGridModule
 
 def angularPointwiseEnergy2ENDF6( self, targetInfo ) :
 
@@ -182,8 +184,11 @@ def gammasToENDF6_MF6( MT, endfMFList, flags, targetInfo, gammas ) :
             raise TypeError( 'Unsupport multiplitiy type = "%s"' % total.moniker )
     else :                              # Total multiplicity is missing in sums section, compute from parts.
         multiplicities = [ gamma.multiplicity[targetInfo['style']] for gamma in gammas ]
-        totalMultiplicity = multiplicities.pop( 0 )
-        for multiplicity in multiplicities : totalMultiplicity += multiplicity
+        if( all( [ isinstance( multiplicity, XYsModule.XYs1d ) for multiplicity in multiplicities ] ) ) :
+            totalMultiplicity = unionGridModule.sumOnUnionGrid( multiplicities, 1e-8, 1e-8 )
+        else :
+            totalMultiplicity = multiplicities.pop( 0 )
+            for multiplicity in multiplicities : totalMultiplicity += multiplicity
     if( isinstance( totalMultiplicity, multiplicityModule.regions1d ) ) :
         totalMultiplicityRegions = totalMultiplicity.copy( )
     else :
@@ -442,7 +447,7 @@ def gammasToENDF6_MF12_13( MT, MF, endfMFList, flags, targetInfo, gammas ) :
     targetInfo['doMF4AsMF6'] = False
     ZA, mass, MFGammas, NI, continuum, NK, NKp = targetInfo[ 'ZA' ], targetInfo[ 'mass' ], [], 0, None, len( gammas ), 0
 
-    total, piecewise, recomputeTotal = None, None, False
+    total, piecewise, recomputeTotal, multiplicities = None, None, False, []
 
     crossSection = None
     if( MF == 13 ) :
@@ -526,10 +531,8 @@ def gammasToENDF6_MF12_13( MT, MF, endfMFList, flags, targetInfo, gammas ) :
                 else :
                     piecewise = multiplicity
                 total = piecewise[0]            # BRB, FIXME, this is a kludge until total is put into sums.
-            elif( total is None )  :
-                total = multiplicity
             else :
-                total = total + multiplicity
+                multiplicities.append( multiplicity )
 
         if( MF == 12 ) :
             LO = 1
@@ -561,6 +564,12 @@ def gammasToENDF6_MF12_13( MT, MF, endfMFList, flags, targetInfo, gammas ) :
         else:
             pass
     if( NKp == 0 ) : return
+    if( recomputeTotal and ( len( multiplicities ) > 0 ) ) :
+        if( piecewise is not None ) : multiplicities.append( piecewise )
+        interpolations = set( [ getattr( multiplicity, 'interpolation', None ) for multiplicity in multiplicities ] )
+        if( len( interpolations ) > 1 ) :       # Mixed interpolations or regions1d data are summed as lin-lin.
+            multiplicities = [ multiplicity.toPointwise_withLinearXYs( lowerEps = 1e-8, upperEps = 1e-8 ) for multiplicity in multiplicities ]
+        total = unionGridModule.sumOnUnionGrid( multiplicities, 1e-8, 1e-8 )
 
     endfMFList[MF][MT] = [ endfFormatsModule.endfContLine( ZA, mass, LO, 0, NK, 0 ) ]
     if( NK > 1 ) :          # If more than one gamma is present, both MF=12 and MF=13 start with the sum over all gammas.
@@ -0,0 +1,162 @@
+# <<BEGIN-copyright>>
+# Copyright (c) 2016, Lawrence Livermore National Security, LLC.
+# Produced at the Lawrence Livermore National Laboratory.
+# Written by the LLNL Nuclear Data and Theory group
+#         (email: mattoon1@llnl.gov)
+# LLNL-CODE-683960.
+# All rights reserved.
+# 
+# This file is part of the FUDGE package (For Updating Data and 
+#         Generating Evaluations)
+# 
+# When citing FUDGE, please use the following reference:
+#   C.M. Mattoon, B.R. Beck, N.R. Patel, N.C. Summers, G.W. Hedstrom, D.A. Brown, "Generalized Nuclear Data: A New Structure (with Supporting Infrastructure) for Handling Nuclear Data", Nuclear Data Sheets, Volume 113, Issue 12, December 2012, Pages 3145-3171, ISSN 0090-3752, http://dx.doi.org/10. 1016/j.nds.2012.11.008
+# 
+# 
+#     Please also read this link - Our Notice and Modified BSD License
+# 
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the disclaimer below.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the disclaimer (as noted below) in the
+#       documentation and/or other materials provided with the distribution.
+#     * Neither the name of LLNS/LLNL nor the names of its contributors may be used
+#       to endorse or promote products derived from this software without specific
+#       prior written permission.
+# 
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL LAWRENCE LIVERMORE NATIONAL SECURITY, LLC,
+# THE U.S. DEPARTMENT OF ENERGY OR CONTRIBUTORS BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+# 
+# 
+# Additional BSD Notice
+# 
+# 1. This notice is required to be provided under our contract with the U.S.
+# Department of Energy (DOE). This work was produced at Lawrence Livermore
+# National Laboratory under Contract No. DE-AC52-07NA27344 with the DOE.
+# 
+# 2. Neither the United States Government nor Lawrence Livermore National Security,
+# LLC nor any of their employees, makes any warranty, express or implied, or assumes
+# any liability or responsibility for the accuracy, completeness, or usefulness of any
+# information, apparatus, product, or process disclosed, or represents that its use
+# would not infringe privately-owned rights.
+# 
+# 3. Also, reference herein to any specific commercial products, process, or services
+# by trade name, trademark, manufacturer or otherwise does not necessarily constitute
+# or imply its endorsement, recommendation, or favoring by the United States Government
+# or Lawrence Livermore National Security, LLC. The views and opinions of authors expressed
+# herein do not necessarily state or reflect those of the United States Government or
+# Lawrence Livermore National Security, LLC, and shall not be used for advertising or
+# product endorsement purposes.
+# 
+# <<END-copyright>>
+
+"""
+This module contains the classes ``XMLWriter`` and ``XMLListWriter`` that are used to write the XML of an instance
+without first creating the whole document as a list of strings.
+
+An instance supports streaming if it has a method ``toXMLStream( self, writer, indent = '', **kwargs )`` that gives
+the same lines as its ``toXMLList`` method to the writer. A writer keeps the last line it was given pending, so that
+the usual ``XMLList[-1] += '</moniker>'`` is done with ``writer.appendToLastLine( '</moniker>' )``.
+"""
+
+__metaclass__ = type
+
+__streamsCache = {}
+
+def streams( instance ) :
+    """
+    Returns True if instance's toXMLStream method can be used in place of its toXMLList method. This is False if
+    instance has no toXMLStream method or if a class derived from the class defining toXMLStream overrides toXMLList.
+    """
+
+    cls = instance.__class__
+    if( cls not in __streamsCache ) :
+        streamIndex, listIndex = None, None
+        for index, base in enumerate( cls.__mro__ ) :
+            if( ( streamIndex is None ) and ( 'toXMLStream' in base.__dict__ ) ) : streamIndex = index
+            if( ( listIndex is None ) and ( 'toXMLList' in base.__dict__ ) ) : listIndex = index
+        __streamsCache[cls] = ( streamIndex is not None ) and ( ( listIndex is None ) or ( streamIndex <= listIndex ) )
+    return( __streamsCache[cls] )
+
+class XMLWriter :
+    """
+    Writes XML lines to a file-like object (i.e., any object with a write method). Lines are separated by '\\n'.
+    The last line is written, with a trailing '\\n', when close is called.
+    """
+
+    def __init__( self, fOut ) :
+
+        self.__fOut = fOut
+        self.__lastLine = None
+
+    def appendToLastLine( self, string ) :
+
+        if( self.__lastLine is None ) : raise Exception( 'no line to append to' )
+        self.__lastLine += string
+
+    def close( self ) :
+
+        if( self.__lastLine is not None ) :
+            self.__fOut.write( self.__lastLine )
+            self.__fOut.write( '\n' )
+        self.__lastLine = None
+
+    def write( self, instance, indent = '', **kwargs ) :
+        """Writes the XML of instance, streaming it if supported by instance."""
+
+        if( streams( instance ) ) :
+            instance.toXMLStream( self, indent, **kwargs )
+        else :
+            self.writeLines( instance.toXMLList( indent, **kwargs ) )
+
+    def writeLine( self, line ) :
+
+        if( self.__lastLine is not None ) :
+            self.__fOut.write( self.__lastLine )
+            self.__fOut.write( '\n' )
+        self.__lastLine = line
+
+    def writeLines( self, lines ) :
+
+        for line in lines : self.writeLine( line )
+
+class XMLListWriter( XMLWriter ) :
+    """Collects the XML lines into the list lines. Used by toXMLList methods that are wrappers of a toXMLStream method."""
+
+    def __init__( self ) :
+
+        self.lines = []
+
+    def appendToLastLine( self, string ) :
+
+        self.lines[-1] += string
+
+    def close( self ) :
+
+        pass
+
+    def writeLine( self, line ) :
+
+        self.lines.append( line )
+
+    def writeLines( self, lines ) :
+
+        self.lines += lines
+
+def toXMLList( instance, indent = '', **kwargs ) :
+    """Returns the XML lines of instance as a list by calling its toXMLStream method."""
+
+    writer = XMLListWriter( )
+    instance.toXMLStream( writer, indent, **kwargs )
+    return( writer.lines )
@@ -104,6 +104,7 @@ import axes as axesModule
 import values as valuesModule
 import standards as standardsModule
 import uncertainties as uncertaintiesModule
+import XMLWriter as XMLWriterModule
 from pqu import PQU
 
 from numericalFunctions import pointwiseXY_C, pointwiseXY
@@ -171,6 +172,11 @@ def allow_XYsWithSameUnits_orNumberWithSameUnit( self, other ) :
         other = PQU.PQU( other, checkOrder = False ).getValueAs( yUnit )
     return( other )
 
+def unpickleXYs1d( cls, data, axes, kwargs ) :
+    """For internal use. Returns the instance of cls pickled by XYs1d.__reduce__."""
+
+    return( cls( data = data, axes = axes, **kwargs ) )
+
 class XYs1d( pointwiseXY, baseModule.xDataFunctional ) :
 
     moniker = 'XYs1d'
@@ -410,6 +416,19 @@ class XYs1d( pointwiseXY, baseModule.xDataFunctional ) :
     __copy__ = copy
     __deepcopy__ = __copy__
 
+    def __reduce__( self ) :
+        """
+        The pointwiseXY base class cannot be pickled, so self is pickled as the arguments needed to construct it
+        (see function unpickleXYs1d). Members not set by the constructor (e.g., uncertainties) are not pickled.
+        """
+
+        axes = self.axes
+        if( axes is not None ) : axes = axes.copy( )
+        kwargs = { 'interpolation' : self.interpolation, 'index' : self.index, 'valueType' : self.valueType, 'value' : self.value,
+                'label' : self.label, 'accuracy' : self.getAccuracy( ), 'biSectionMax' : self.getBiSectionMax( ),
+                'infill' : self.getInfill( ), 'safeDivide' : self.getSafeDivide( ) }
+        return( unpickleXYs1d, ( self.__class__, pointwiseXY.copyDataToXYs( self ), axes, kwargs ) )
+
     def copyDataToXYs( self, xUnitTo = None, yUnitTo = None ) :
 
         xScale, yScale = 1.0, 1.0
@@ -439,12 +458,52 @@ class XYs1d( pointwiseXY, baseModule.xDataFunctional ) :
         return( self.value )
 
     def evaluate( self, x, unitTo = None ) :
+        """
+        Returns the y-value of self at x. If x is a list or numpy array of x-values, a numpy array of the y-values is
+        returned instead. The x-values are evaluated with one call to pointwiseXY_C.evaluateMany, and any x-value outside
+        of self's domain gives nan. A 0-d numpy array is treated as a scalar.
+        """
 
+        if( hasattr( x, '__len__' ) ) :
+            import numpy
+
+            if( numpy.ndim( x ) > 0 ) : return( self.evaluateArray( x, unitTo = unitTo ) )
+            x = float( x )
         y = pointwiseXY.evaluate( self, x )
         if( unitTo is None ) : return( y )
         unit = self.getAxisUnitSafely( yAxisIndex )
         return( PQU.PQU( y, unit, checkOrder = False ).getValueAs( unitTo ) )
 
+    def evaluateArray( self, xs, unitTo = None, outOfDomainValue = float( 'nan' ) ) :
+        """
+        Returns a numpy array of the y-values of self at each x-value in xs. If xs is a numpy array of floats, it is read
+        without copying. The evaluation is fastest when xs is ascending.
+        """
+
+        import numpy
+
+        xs = numpy.asarray( xs, dtype = numpy.float64 )
+        ys = numpy.empty( xs.shape )
+        if( xs.ndim != 1 ) : raise ValueError( 'xs must be one dimensional: ndim = %d' % xs.ndim )
+        pointwiseXY.evaluateMany( self, xs, ys, outOfDomainValue = outOfDomainValue )
+        if( unitTo is not None ) :
+            ys *= PQU.PQU( 1, self.getAxisUnitSafely( yAxisIndex ), checkOrder = False ).getValueAs( unitTo )
+        return( ys )
+
+    def xsAsArray( self ) :
+        """Returns a read-only numpy array that views, without copying, the x-values of self."""
+
+        import numpy
+
+        return( numpy.asarray( self.xsBuffer( ) ) )
+
+    def ysAsArray( self ) :
+        """Returns a read-only numpy array that views, without copying, the y-values of self."""
+
+        import numpy
+
+        return( numpy.asarray( self.ysBuffer( ) ) )
+
     def setValue_units( self, x, y ) :
 
         x = PQU.PQU( x, checkOrder = False ).getValueAs( self.axes[xAxisIndex].unit )
@@ -496,7 +555,7 @@ class XYs1d( pointwiseXY, baseModule.xDataFunctional ) :
     def domainUnitConversionFactor( self, unitTo ) :
 
         if( unitTo is None ) : return( 1. )
-        return( PQU.PQU( '1 ' + self.domainUnit( ) ).getValueAs( unitTo ) )
+        return( PQU.convertUnits( 1., self.domainUnit( ), unitTo ) )
 
     def domainMin( self, unitTo = None, asPQU = False ) :
 
@@ -767,29 +826,35 @@ class XYs1d( pointwiseXY, baseModule.xDataFunctional ) :
 
     def toXMLList( self, indent = '', **kwargs ) :
 
+        return( XMLWriterModule.toXMLList( self, indent, **kwargs ) )
+
+    def toXMLStream( self, writer, indent = '', **kwargs ) :
+
+        import numpy
+
         incrementalIndent = kwargs.get( 'incrementalIndent', '  ' )
         oneLine = kwargs.get( 'oneLine', False )
 
         indent2 = indent + incrementalIndent
-        if( oneLine ) : indent2 = ''
+        if( oneLine ) :
+            indent2 = ''
+            writer2, writer = writer, XMLWriterModule.XMLListWriter( )
 
         attributeStr = baseModule.xDataFunctional.attributesToXMLAttributeStr( self )
         accuracy = self.getAccuracy( )
         if( accuracy != defaultAccuracy ) : attributeStr += ' accuracy="%s"' % accuracy
         if( self.interpolation != standardsModule.interpolation.linlinToken ) : attributeStr += ' interpolation="%s"' % self.interpolation
 
-        XMLList = [ '%s<%s%s>' % ( indent, self.moniker, attributeStr ) ] 
+        writer.writeLine( '%s<%s%s>' % ( indent, self.moniker, attributeStr ) )
         if( self.isPrimaryXData( ) ) : 
-            if( self.axes is not None ) : XMLList += self.axes.toXMLList( indent = indent2, **kwargs )
-        xys = []
-        for x, y in self.copyDataToXYs( ) :
-            xys.append( x )
-            xys.append( y )
-        XMLList += valuesModule.values( xys, valueType = self.valueType, sep = self.__sep ).toXMLList( indent2, **kwargs )
-        if( self.uncertainties ) : XMLList += self.uncertainties.toXMLList( indent = indent2, **kwargs )
-        XMLList[-1] += '</%s>' % self.moniker
-        if( oneLine ) : return( [ ''.join( XMLList ) ] )
-        return( XMLList )
+            if( self.axes is not None ) : writer.write( self.axes, indent2, **kwargs )
+        xys = numpy.empty( 2 * len( self ) )        # The x and y buffers are copied, interleaved, without creating python floats.
+        xys[0::2] = self.xsAsArray( )
+        xys[1::2] = self.ysAsArray( )
+        writer.write( valuesModule.values( xys, valueType = self.valueType, sep = self.__sep ), indent2, **kwargs )
+        if( self.uncertainties ) : writer.write( self.uncertainties, indent2, **kwargs )
+        writer.appendToLastLine( '</%s>' % self.moniker )
+        if( oneLine ) : writer2.writeLine( ''.join( writer.lines ) )
 
     def tweakDomain( self, domainMin = None, domainMax = None, epsilon = domainEpsilon ) :
 
@@ -883,7 +948,7 @@ class XYs1d( pointwiseXY, baseModule.xDataFunctional ) :
         if( values is None ) : raise Exception( 'values element missing' )
         attrs['sep'] = values.sep
 
-        xys = cls( data = values, dataForm = "list", axes = axes, **attrs )
+        xys = cls( data = values.values, dataForm = "list", axes = axes, **attrs )
         if uncertainties is not None: xys.uncertainties = uncertainties
         xPath.pop( )
         return( xys )
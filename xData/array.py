@@ -82,6 +82,7 @@ storageColumnToken = 'column-major'
 class arrayBase( baseModule.xDataCoreMembers ) :
 
     moniker = 'array'
+    entriesChunkSize = 1 << 20
 
     def __init__( self, shape = None, symmetry = None, storageOrder = storageRowToken, 
                 offset = None, permutation = permutationPlusToken,
@@ -112,11 +113,7 @@ class arrayBase( baseModule.xDataCoreMembers ) :
                 raise ValueError( 'invalid storageOrder = "%s"' % storageOrder )
         self.__storageOrder = storageOrder
 
-        if( offset is not None ) :
-            offset = [ int( value ) for value in offset ]
-            if( len( offset ) != len( shape ) ) : raise ValueError( 'offset must contain one value for each dimension' )
-            if( min( offset ) < 0 ) : raise ValueError( 'offsets must be non-negative: %s' % offset )
-        self.__offset = offset
+        self.offset = offset
 
     def __len__( self ) :
 
@@ -164,6 +161,179 @@ class arrayBase( baseModule.xDataCoreMembers ) :
 
         return( self.__offset )
 
+    @offset.setter
+    def offset( self, offset ) :
+
+        if( offset is not None ) :
+            offset = [ int( value ) for value in offset ]
+            if( len( offset ) != self.dimension ) : raise ValueError( 'offset must contain one value for each dimension' )
+            if( min( offset ) < 0 ) : raise ValueError( 'offsets must be non-negative: %s' % offset )
+        self.__offset = offset
+
+    def storedEntries( self ) :
+        """
+        Generator that yields the values stored in self as ( indices, values ) pairs in storage order. indices is a
+        tuple of numpy integer arrays, one for each dimension, and values is a numpy array. The data are yielded in
+        chunks of at most about entriesChunkSize values so that a dense array is never needed. For a symmetric array,
+        only the stored values are yielded (see entries).
+        """
+
+        raise NotImplementedError( 'storedEntries not implemented for compression "%s"' % self.compression )
+
+    def entries( self ) :
+        """
+        Like storedEntries, except that the values implied by the symmetry of self are also yielded. Each element of
+        the array is yielded at most once.
+        """
+
+        import numpy
+        import itertools
+
+        permutations = list( itertools.permutations( range( self.dimension ) ) )[1:]
+        for indices, values in self.storedEntries( ) :
+            yield( indices, values )
+            if( self.symmetry == symmetryNoneToken ) : continue
+            yielded = [ indices ]
+            for permutation in permutations :
+                permuted = tuple( indices[i1] for i1 in permutation )
+                new = numpy.ones( len( values ), dtype = bool )
+                for other in yielded :
+                    same = numpy.ones( len( values ), dtype = bool )
+                    for i1, i2 in zip( permuted, other ) : same &= ( i1 == i2 )
+                    new &= ~same
+                yielded.append( permuted )
+                if( new.any( ) ) : yield( tuple( i1[new] for i1 in permuted ), values[new] )
+
+    def constructArray( self ) :
+        """Returns a dense numpy array of self."""
+
+        import numpy
+
+        order = { storageRowToken : 'C', storageColumnToken : 'F' }[self.storageOrder]
+        array1 = numpy.zeros( self.shape, order = order )
+        for indices, values in self.entries( ) : array1[indices] = values
+        return( array1 )
+
+    def diagonalValues( self ) :
+        """
+        Returns a numpy array of the diagonal of self (i.e., the elements whose indices are all equal) without
+        constructing a dense array.
+        """
+
+        import numpy
+
+        diagonal1 = numpy.zeros( min( self.shape ) )
+        for indices, values in self.entries( ) :
+            onDiagonal = numpy.ones( len( values ), dtype = bool )
+            for index in indices[1:] : onDiagonal &= ( index == indices[0] )
+            diagonal1[indices[0][onDiagonal]] = values[onDiagonal]
+        return( diagonal1 )
+
+    def dot( self, other ) :
+        """
+        Returns the matrix product of self, which must be 2 dimensional, with the numpy array other, which can be a
+        vector of length self.shape[1] or a matrix with self.shape[1] rows. No dense copy of self is made.
+        """
+
+        import numpy
+
+        self.__checkIs2d( 'dot' )
+        other = numpy.asarray( other, dtype = float )
+        if( other.shape[0] != self.shape[1] ) :
+            raise ValueError( 'shapes %s and %s not aligned' % ( self.shape, other.shape ) )
+
+        if( other.ndim == 1 ) :
+            result = numpy.zeros( self.shape[0] )
+            for ( rows, columns ), values in self.entries( ) :
+                result += numpy.bincount( rows, weights = values * other[columns], minlength = self.shape[0] )
+            return( result )
+
+        result = numpy.zeros( ( self.shape[0], other.shape[1] ) )
+        subChunkSize = max( 1, self.entriesChunkSize // max( 1, other.shape[1] ) )
+        for ( rows, columns ), values in self.entries( ) :
+            order = numpy.argsort( rows, kind = 'mergesort' )
+            rows, columns, values = rows[order], columns[order], values[order]
+            for start in range( 0, len( values ), subChunkSize ) :
+                subRows = rows[start:start+subChunkSize]
+                uniqueRows, rowStarts = numpy.unique( subRows, return_index = True )
+                products = values[start:start+subChunkSize,numpy.newaxis] * other[columns[start:start+subChunkSize]]
+                result[uniqueRows] += numpy.add.reduceat( products, rowStarts, axis = 0 )
+        return( result )
+
+    def isSymmetric( self ) :
+        """
+        Returns True if self is a square 2 dimensional array equal to its transpose. No dense copy of self is made.
+        """
+
+        import numpy
+
+        if( self.symmetry != symmetryNoneToken ) : return( True )
+        if( ( self.dimension != 2 ) or ( self.shape[0] != self.shape[1] ) ) : return( False )
+        rows, columns, values = [], [], []
+        for indices, values1 in self.entries( ) :
+            nonZero = values1 != 0
+            rows.append( indices[0][nonZero] )
+            columns.append( indices[1][nonZero] )
+            values.append( values1[nonZero] )
+        if( len( values ) == 0 ) : return( True )
+        rows, columns, values = numpy.concatenate( rows ), numpy.concatenate( columns ), numpy.concatenate( values )
+        keys = rows * self.shape[1] + columns
+        transposedKeys = columns * self.shape[1] + rows
+        order, transposedOrder = numpy.argsort( keys ), numpy.argsort( transposedKeys )
+        return( bool( numpy.array_equal( keys[order], transposedKeys[transposedOrder] ) and
+                numpy.array_equal( values[order], values[transposedOrder] ) ) )
+
+    def scaled( self, rowScale, columnScale = None ) :
+        """
+        Returns a copy of self, which must be 2 dimensional, with element [i,j] multiplied by rowScale[i] * columnScale[j].
+        If columnScale is None, rowScale is used for it. The copy has the same compression as self, except when self is
+        symmetric and columnScale differs from rowScale. As the scaled array is then not symmetric, it is returned as a
+        full array with no symmetry.
+        """
+
+        import numpy
+
+        rowScale, columnScale = self._checkScales( rowScale, columnScale )
+        if( ( self.symmetry == symmetryNoneToken ) or numpy.array_equal( rowScale, columnScale ) ) :
+            return( self._scaled( rowScale, columnScale ) )
+        order = { storageRowToken : 'C', storageColumnToken : 'F' }[self.storageOrder]
+        array1 = self.constructArray( ) * numpy.outer( rowScale, columnScale )
+        return( full( self.shape, array1.flatten( order = order ).tolist( ), storageOrder = self.storageOrder, offset = self.offset,
+                index = self.index, label = self.label ) )
+
+    def _scaled( self, rowScale, columnScale ) :
+        """For internal use only. Returns self scaled as described in scaled, with the same compression and symmetry as self."""
+
+        raise NotImplementedError( 'scaled not implemented for compression "%s"' % self.compression )
+
+    def _scaledStoredValues( self, rowScale, columnScale ) :
+        """For internal use only. Returns the stored values of self scaled as described in scaled."""
+
+        import numpy
+
+        scaledValues = [ values * rowScale[rows] * columnScale[columns] for ( rows, columns ), values in self.storedEntries( ) ]
+        if( len( scaledValues ) == 0 ) : return( [] )
+        return( numpy.concatenate( scaledValues ).tolist( ) )
+
+    def _checkScales( self, rowScale, columnScale ) :
+        """For internal use only. Checks and returns rowScale and columnScale as numpy arrays."""
+
+        import numpy
+
+        self.__checkIs2d( 'scaled' )
+        rowScale = numpy.asarray( rowScale, dtype = float )
+        if( columnScale is None ) :
+            columnScale = rowScale
+        else :
+            columnScale = numpy.asarray( columnScale, dtype = float )
+        if( ( len( rowScale ) != self.shape[0] ) or ( len( columnScale ) != self.shape[1] ) ) :
+            raise ValueError( 'scale lengths %d and %d do not match shape %s' % ( len( rowScale ), len( columnScale ), self.shape ) )
+        return( rowScale, columnScale )
+
+    def __checkIs2d( self, name ) :
+
+        if( self.dimension != 2 ) : raise ValueError( '%s requires a 2 dimensional array: dimension = %d' % ( name, self.dimension ) )
+
     def attributesToXMLAttributeStr( self ) :
 
         attributeStr = ' shape="%s"' % ','.join( [ "%d" % length for length in self.shape ] )
@@ -306,46 +476,89 @@ class full( arrayBase ) :
 
         import numpy
 
-        if( self.symmetry == symmetryNoneToken ) :
-            array1 = numpy.array( [ value for value in self.values ] )
-        else :
-            import itertools
+        if( self.symmetry != symmetryNoneToken ) : return( arrayBase.constructArray( self ) )
+        order = { storageRowToken : 'C', storageColumnToken : 'F' }[self.storageOrder]
+        return( numpy.array( self.values.asArray( ) ).reshape( self.shape, order = order ) )
+
+    def storedEntries( self ) :
+
+        import numpy
 
-            array1 = numpy.zeros( self.size )
-            dimension = self.dimension
+        values = numpy.array( self.values.asArray( ) )
+        order = { storageRowToken : 'C', storageColumnToken : 'F' }[self.storageOrder]
+        if( self.symmetry == symmetryNoneToken ) :
+            for start in range( 0, len( values ), self.entriesChunkSize ) :
+                flatIndices = numpy.arange( start, min( start + self.entriesChunkSize, len( values ) ) )
+                yield( numpy.unravel_index( flatIndices, self.shape, order = order ), values[flatIndices] )
+        elif( self.dimension == 1 ) :
+            yield( ( numpy.arange( len( values ) ), ), values )
+        elif( self.dimension == 2 ) :
             length = self.shape[0]
-            indexRange = range( len( self ) )
-            indices = dimension * [ 0 ]
-            indexChange = dimension - 1
+            # With mode True the values are stored column by column from the diagonal down, otherwise row by row up to the diagonal.
             mode = ( ( self.symmetry == symmetryUpperToken ) and ( self.storageOrder == storageRowToken ) ) or \
                      ( self.symmetry == symmetryLowerToken ) and ( self.storageOrder == storageColumnToken )
-            for value in self.values :
-                permutations = itertools.permutations( indices )
-                for permutation in permutations :
-                    index = permutation[0]
-                    for p1 in permutation[1:] : index = length * index + p1
-                    array1[index] = value
-                if( mode ) :
+            lines = numpy.arange( length )
+            if( mode ) :
+                counts = length - lines
+            else :
+                counts = lines + 1
+            lineStarts = numpy.concatenate( ( [ 0 ], numpy.cumsum( counts ) ) )
+            line1 = 0
+            while( line1 < length ) :
+                line2 = max( line1 + 1, numpy.searchsorted( lineStarts, lineStarts[line1] + self.entriesChunkSize, side = 'right' ) - 1 )
+                line2 = min( line2, length )
+                lines1, counts1 = lines[line1:line2], counts[line1:line2]
+                positions = numpy.arange( lineStarts[line1], lineStarts[line2] )
+                fixed = numpy.repeat( lines1, counts1 )
+                along = positions - numpy.repeat( lineStarts[line1:line2], counts1 )
+                if( mode ) : along += fixed
+                yield( ( fixed, along ), values[positions] )
+                line1 = line2
+        else :
+            yield( self.__storedSymmetricIndices( ), values )
+
+    def __storedSymmetricIndices( self ) :
+        """Returns the indices of each stored value of a symmetric array of any dimension."""
+
+        import numpy
+
+        dimension = self.dimension
+        length = self.shape[0]
+        indexRange = range( len( self ) )
+        indices = dimension * [ 0 ]
+        indexChange = dimension - 1
+        mode = ( ( self.symmetry == symmetryUpperToken ) and ( self.storageOrder == storageRowToken ) ) or \
+                 ( self.symmetry == symmetryLowerToken ) and ( self.storageOrder == storageColumnToken )
+        storedIndices = []
+        for value in self.values :
+            storedIndices.append( list( indices ) )
+            if( mode ) :
+                for i1 in indexRange :
+                    indices[i1] += 1
+                    if( indices[i1] < length ) : break
+                for i2 in indexRange :
+                    if( i1 == i2 ) : break
+                    indices[i2] = indices[i1]
+            else :
+                indexChange += 1
+                if( indexChange == dimension ) :
+                    indexChange -= 1
+                    value = indices[indexChange]
                     for i1 in indexRange :
-                        indices[i1] += 1
-                        if( indices[i1] < length ) : break
-                    for i2 in indexRange :
-                        if( i1 == i2 ) : break
-                        indices[i2] = indices[i1]
-                else :
-                    indexChange += 1
-                    if( indexChange == dimension ) :
+                        if( i1 == ( dimension - 1 ) ) : break
+                        if( indices[indexChange-1] > value ) : break
+                        indices[indexChange] = 0
                         indexChange -= 1
-                        value = indices[indexChange]
-                        for i1 in indexRange :
-                            if( i1 == ( dimension - 1 ) ) : break
-                            if( indices[indexChange-1] > value ) : break
-                            indices[indexChange] = 0
-                            indexChange -= 1
-                    indices[indexChange] += 1
+                indices[indexChange] += 1
+        storedIndices = numpy.array( storedIndices, dtype = int ).reshape( len( storedIndices ), dimension )
+        return( tuple( storedIndices[:,i1] for i1 in range( dimension ) ) )
 
-        order = { storageRowToken : 'C', storageColumnToken : 'F' }[self.storageOrder]
-        return( array1.reshape( self.shape, order = order ) )
+    def _scaled( self, rowScale, columnScale ) :
+
+        return( full( self.shape, self._scaledStoredValues( rowScale, columnScale ),
+                symmetry = self.symmetry, storageOrder = self.storageOrder,
+                offset = self.offset, permutation = self.permutation,
+                index = self.index, label = self.label ) )
 
     def copy( self ) :
 
@@ -407,37 +620,24 @@ class diagonal( arrayBase ) :
 
         self.values = data.copy( )
 
-    def constructArray( self ) :
+    def storedEntries( self ) :
 
         import numpy
-        import itertools
 
+        values = numpy.array( self.values.asArray( ) )
         valuesIndex = 0
-        array1 = numpy.zeros( self.size )
-        shape = self.shape
-        range1 = range( self.dimension )
         for startIndex in self.startingIndices :
-            si = [ index for index in startIndex ]
-            moreToDo = True
-            while( moreToDo ) :
-                value = self.values[valuesIndex]
-                valuesIndex += 1
-                if( self.symmetry == symmetryNoneToken ) :
-                    permutations = [ si ]
-                else :
-                    permutations = itertools.permutations( si )
-                for permutation in permutations :
-                    scale, flatIndex = 1, 0
-                    for i1, index in enumerate( permutation ) :
-                        flatIndex = flatIndex * scale + index
-                        scale = shape[i1]
-                    array1[flatIndex] = value
-                for i1 in range1 :
-                    si[i1] += 1
-                    if( si[i1] >= shape[i1] ) : moreToDo = False
+            length = min( [ length - index for index, length in zip( startIndex, self.shape ) ] )
+            steps = numpy.arange( length )
+            yield( tuple( index + steps for index in startIndex ), values[valuesIndex:valuesIndex+length] )
+            valuesIndex += length
 
-        order = { storageRowToken : 'C', storageColumnToken : 'F' }[self.storageOrder]
-        return( array1.reshape( self.shape, order = order ) )
+    def _scaled( self, rowScale, columnScale ) :
+
+        return( diagonal( self.shape, self._scaledStoredValues( rowScale, columnScale ), self.startingIndicesOriginal,
+                symmetry = self.symmetry, storageOrder = self.storageOrder,
+                offset = self.offset, permutation = self.permutation,
+                index = self.index, label = self.label ) )
 
     def copy( self ) :
 
@@ -501,20 +701,30 @@ class flattened( arrayBase ) :
         self.lengths = lengths.copy( label = 'lengths' )
         self.data = data.copy( )
 
-    def constructArray( self ) :
+    def storedEntries( self ) :
 
         import numpy
 
-        index = 0
-        array1 = numpy.zeros( self.size )
-        for i1, start in enumerate( self.starts ) :
-            length = self.lengths[i1]
-            for i2 in range( length ) :
-                array1[start+i2] = self.data[index]
-                index += 1
-
         order = { storageRowToken : 'C', storageColumnToken : 'F' }[self.storageOrder]
-        return( array1.reshape( self.shape, order = order ) )
+        data = numpy.array( self.data.asArray( ) )
+        starts = numpy.array( [ start for start in self.starts ], dtype = int )
+        lengths = numpy.array( [ length for length in self.lengths ], dtype = int )
+        dataStarts = numpy.concatenate( ( [ 0 ], numpy.cumsum( lengths ) ) )
+        i1 = 0
+        while( i1 < len( starts ) ) :
+            i2 = max( i1 + 1, numpy.searchsorted( dataStarts, dataStarts[i1] + self.entriesChunkSize, side = 'right' ) - 1 )
+            i2 = min( i2, len( starts ) )
+            positions = numpy.arange( dataStarts[i1], dataStarts[i2] )
+            flatIndices = positions + numpy.repeat( starts[i1:i2] - dataStarts[i1:i2], lengths[i1:i2] )
+            yield( numpy.unravel_index( flatIndices, self.shape, order = order ), data[positions] )
+            i1 = i2
+
+    def _scaled( self, rowScale, columnScale ) :
+
+        return( flattened( self.shape, self._scaledStoredValues( rowScale, columnScale ), self.starts, self.lengths,
+                symmetry = self.symmetry, storageOrder = self.storageOrder,
+                offset = self.offset, permutation = self.permutation,
+                index = self.index, label = self.label, dataToString = self.dataToString ) )
 
     def copy( self ) :
 
@@ -568,18 +778,36 @@ class embedded( arrayBase ) :
         if( copy ) : array = array.copy( )
         self.arrays.append( array )
 
-    def constructArray( self ) :
+    def addBlock( self, array, offset, copy = True ) :
+        """Adds array to self with its offset set to offset. If copy is True, a copy of array is added."""
 
-        import numpy
+        if( copy ) : array = array.copy( )
+        array.offset = offset
+        self.addArray( array, copy = False )
 
-        order = { storageRowToken : 'C', storageColumnToken : 'F' }[self.storageOrder]
-        array1 = numpy.zeros( self.shape, order = order )
+    def storedEntries( self ) :
 
         for array in self.arrays :
-            array2 = array.constructArray( )
-            slice1 = [ slice( offset, offset + array2.shape[i1] ) for i1, offset in enumerate( array.offset ) ]
-            array1[slice1] = array2
+            for indices, values in array.entries( ) :
+                yield( tuple( index + offset for index, offset in zip( indices, array.offset ) ), values )
+
+    def entries( self ) :
+        """
+        Same as storedEntries, as each embedded array expands its own symmetry.
+        """
 
+        return( self.storedEntries( ) )
+
+    def _scaled( self, rowScale, columnScale ) :
+
+        array1 = embedded( self.shape,
+                symmetry = self.symmetry, storageOrder = self.storageOrder,
+                offset = self.offset, permutation = self.permutation,
+                index = self.index, label = self.label )
+        for array in self.arrays :
+            rowOffset, columnOffset = array.offset
+            array1.addArray( array.scaled( rowScale[rowOffset:rowOffset+array.shape[0]],
+                    columnScale[columnOffset:columnOffset+array.shape[1]] ), copy = False )
         return( array1 )
 
     def copy( self ) :
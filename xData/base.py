@@ -180,6 +180,8 @@ class xDataFunctional( xDataCoreMembers ) :
 
         if( value is not None ) : value = float( value )
         self.__value = value
+        ancestor = getattr( self, 'ancestor', None )
+        if( hasattr( ancestor, '_clearLookupCaches' ) ) : ancestor._clearLookupCaches( )     # multiD_XYs caches its sub-functions' values.
 
     def getAxisIndexByIndexOrName( self, indexOrName ) :
 
@@ -231,8 +233,7 @@ def getDomainLimits( self, domainMin, domainMax, unit ) :
 def processUnits( unit1, unit2, operator ) :
 
     if( operator not in [ '*', '/' ] ) : raise ArithmeticError( 'unsupported unit operation "%s"' % operator )
-    result = eval( 'PQUModule.PQU( 1, unit1 ) %s PQUModule.PQU( 1, unit2 )' % operator )
-    return( result.getUnitSymbol( ) )
+    return( PQUModule.unitOperationSymbol( unit1, unit2, operator ) )
 
 def getDomainValue2( domainValue ) :
 
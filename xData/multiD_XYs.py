@@ -81,6 +81,8 @@ Missing methods
 """
 
 import abc
+import bisect
+import collections
 
 import standards as standardsModule
 import base as baseModule
@@ -95,6 +97,8 @@ class XYsnd( baseModule.xDataFunctional ) :
 
     __metaclass__ = abc.ABCMeta
 
+    linearizedCacheSize = 8         # Maximum number of linearized sub-functions cached by evaluate.
+
     def __init__( self, interpolation = standardsModule.interpolation.linlinToken, axes = None,
             index = None, valueType = standardsModule.types.float64Token, value = None, label = None, 
             interpolationQualifier = standardsModule.interpolation.noneQualifierToken ) :
@@ -112,6 +116,7 @@ class XYsnd( baseModule.xDataFunctional ) :
         self.interpolationQualifier = interpolationQualifier
 
         self.functionals = []
+        self._clearLookupCaches( )
 
     def __len__( self ) :
 
@@ -130,6 +135,7 @@ class XYsnd( baseModule.xDataFunctional ) :
             if( ( index_ < ( len( self ) - 1 ) ) and ( functional_.value >= self.functionals[index_+1].value ) ) :
                 raise ValueError( 'functional.value = %s is >= next functional.value = %s' % ( functional_.value, self.functionals[index_+1].value ) )
             self.functionals[index_] = functional_
+        self._clearLookupCaches( )
 
     def append( self, functional, makeCopy = True ) :
 
@@ -148,6 +154,7 @@ class XYsnd( baseModule.xDataFunctional ) :
             if( value >= self.functionals[index_].value ) :
                 raise Exception( 'value = %s is >= next functionals.value = %s. index = %d' % ( value, self.functionals[index_].value, index_ ) )
             self.functionals.insert( index_, functional_ )
+        self._clearLookupCaches( )
 
     def insertAtValue( self, functional, value = None, makeCopy = True ) :
         """
@@ -157,21 +164,16 @@ class XYsnd( baseModule.xDataFunctional ) :
 
         if( value is None ) : value = functional.value
         value = float( value )
-        index = -1               # Set in case self is empty and next line does not set index or functional.
-        for index, functional_ in enumerate( self ) :
-            if( functional_.value >= value ) : break
-        if( index == -1 ) :
-            index = 0
-        else :
-            if( functional_.value == value ) :
-                del self.functionals[index]
-            elif( functional_.value < value ) :     # Happens when value is greater than last items value.
-                index += 1
+        index = bisect.bisect_left( self._domainValues( ), value )
+        if( ( index < len( self ) ) and ( self.functionals[index].value == value ) ) :
+            del self.functionals[index]
+            self._clearLookupCaches( )
         self.insert( index, functional, value = value, makeCopy = makeCopy )
 
     def pop( self, index ):
 
         self.functionals.pop( index )
+        self._clearLookupCaches( )
 
     def _set_insertCommon( self, index, value, functional, makeCopy = True ) :
         """For internal use only."""
@@ -193,14 +195,45 @@ class XYsnd( baseModule.xDataFunctional ) :
         functional.setAncestor( self )
         if( n1 == 0 ) :
             self.functionals.append( functional )
+            self._clearLookupCaches( )
             return( None, None )
         elif( n1 == index_ ) :
             if( value <= self.functionals[-1].value ) :
                 raise Exception( 'value = %s is <= prior functional.value = %s' % ( value, self.functionals[-1].value ) )
             self.functionals.append( functional )
+            self._clearLookupCaches( )
             return( None, None )
         return( ( index_, functional ) )
 
+    def _clearLookupCaches( self ) :
+        """For internal use only. Must be called whenever a sub-function is added, replaced or removed."""
+
+        self.__domainValues = None
+        self.__linearized = collections.OrderedDict( )
+
+    def _domainValues( self ) :
+        """For internal use only. Returns the list of the sub-functions' values, used for bisection lookups."""
+
+        if( self.__domainValues is None ) : self.__domainValues = [ functional.value for functional in self.functionals ]
+        return( self.__domainValues )
+
+    def _linearizedSubFunction( self, functional ) :
+        """
+        For internal use only. Returns functional if it is an XYs1d instance, otherwise its lin-lin representation.
+        The last linearizedCacheSize linearizations are cached.
+        """
+
+        if( isinstance( functional, XYsModule.XYs1d ) ) : return( functional )
+        key = id( functional )
+        cached = self.__linearized.pop( key, None )
+        if( ( cached is None ) or ( cached[0] is not functional ) ) :   # FIXME, accuracy, lowerEps and upperEps should not be hardwired.
+            linear = functional.toPointwise_withLinearXYs( accuracy = 1e-4, lowerEps = 1e-6, upperEps = 1e-6 )
+            if( linear.value is None ) : linear.value = functional.value     # Not all toPointwise_withLinearXYs methods set value.
+            cached = ( functional, linear )
+            if( len( self.__linearized ) >= self.linearizedCacheSize ) : self.__linearized.popitem( last = False )
+        self.__linearized[key] = cached
+        return( cached[1] )
+
     def copy( self, index = None, value = None, axes = None ) :
 
         if( index is None ) : index = self.index
@@ -234,7 +267,37 @@ class XYsnd( baseModule.xDataFunctional ) :
 
         if( extrapolation not in standardsModule.validExtrapolations ) :
             raise ValueError( 'Invalid extrapolation value = "%s"' % extrapolation )
-        position, function1, function2, frac = self.getBoundingSubFunctions( domainValue )
+        return( self.__evaluate( value, self.getBoundingSubFunctions( domainValue ), extrapolation, epsilon ) )
+
+    def evaluateMany( self, domainValues, extrapolation = standardsModule.noExtrapolationToken, epsilon = 0 ) :
+        """
+        Returns the list of functions self.evaluate( domainValue, extrapolation, epsilon ) for each domainValue in domainValues.
+        The bounding sub-functions for all domainValues are located with one sorted search and each linearized
+        sub-function is shared by all domainValues that need it.
+        """
+
+        import numpy
+
+        if( extrapolation not in standardsModule.validExtrapolations ) :
+            raise ValueError( 'Invalid extrapolation value = "%s"' % extrapolation )
+        values = [ baseModule.getDomainValue2( domainValue ) for domainValue in domainValues ]
+        if( len( values ) == 0 ) : return( [] )
+        if( len( self ) == 0 ) : raise Exception( "No data to interpolate" )
+        if( any( isinstance( value, PQU.PQU ) for value in values ) ) :
+            return( [ self.evaluate( value, extrapolation, epsilon ) for value in values ] )
+
+        indices = numpy.searchsorted( numpy.array( self._domainValues( ) ), numpy.array( values ), side = 'left' )
+        order = numpy.argsort( indices, kind = 'mergesort' )        # Groups domainValues with the same bounding sub-functions.
+        functions = len( values ) * [ None ]
+        for i1 in order :
+            value = values[i1]
+            functions[i1] = self.__evaluate( value, self.__boundingSubFunctions( value, int( indices[i1] ) ), extrapolation, epsilon )
+        return( functions )
+
+    def __evaluate( self, value, boundingSubFunctions, extrapolation, epsilon ) :
+        """For internal use only. The body of evaluate after the bounding sub-functions have been found."""
+
+        position, function1, function2, frac = boundingSubFunctions
         if( position is None ) : raise Exception( "No data to interpolate" )
 
         if( frac <= epsilon ) :             # If close to first point pick it.
@@ -249,10 +312,8 @@ class XYsnd( baseModule.xDataFunctional ) :
                                 ( value, { '<' : 'less', '>' : 'greater' }[position], self[0].value ) )
                 function = function1.copy( value = value )
             else :
-                if( not( isinstance( function1, XYsModule.XYs1d ) ) ) :      # FIXME, accuracy, lowerEps and upperEps should not be hardwired.
-                    function1 = function1.toPointwise_withLinearXYs( accuracy = 1e-4, lowerEps = 1e-6, upperEps = 1e-6 )
-                if( not( isinstance( function2, XYsModule.XYs1d ) ) ) :
-                    function2 = function2.toPointwise_withLinearXYs( accuracy = 1e-4, lowerEps = 1e-6, upperEps = 1e-6 )
+                function1 = self._linearizedSubFunction( function1 )
+                function2 = self._linearizedSubFunction( function2 )
                 if( self.interpolationQualifier == standardsModule.interpolation.unitBaseToken ) :
                     xy = XYsModule.pointwiseXY_C.unitbaseInterpolate( value, function1.value, function1,
                                                                              function2.value, function2, 1 )
@@ -323,8 +384,8 @@ class XYsnd( baseModule.xDataFunctional ) :
                 return( self[-1].copy( value = value ) )
             else :
                 raise Exception( "Interpolation point = %s greater than %s" % ( value, self[-1].value ) )
-        for index, functional2 in enumerate( self ) :
-            if( functional2.value >= value ) : break
+        index = bisect.bisect_left( self._domainValues( ), value )
+        functional2 = self[index]
         if( value == functional2.value ) : return( functional2.copy( value = value ) )
         functional1 = self[index-1]
 # FIXME: following logic only works if functional1 and functional2 are both XYs1d:
@@ -338,18 +399,30 @@ class XYsnd( baseModule.xDataFunctional ) :
         return( xyp )
 
     def getBoundingSubFunctions( self, value ) :
+        """
+        Returns the tuple ( position, function1, function2, frac ) for value where position is '<' or '>' if value is
+        below or above the domain of self, '=' if value is the value of sub-function function1 or '' if value is between
+        the values of sub-functions function1 and function2. The sub-functions are located by bisection.
+        """
 
         if( len( self ) == 0 ) : return( None, None, None, None )
+        return( self.__boundingSubFunctions( value, bisect.bisect_left( self._domainValues( ), value ) ) )
+
+    def __boundingSubFunctions( self, value, index ) :
+        """
+        For internal use only. Same as getBoundingSubFunctions but index, the bisect_left index of value in
+        self._domainValues( ), must be supplied. self must not be empty.
+        """
+
         if( value < self[0].value ) :
             frac = ( self[0].value - value ) / max( abs( value ), abs( self[0].value ) )
             return( '<', self[0], None, frac )
         if( value > self[-1].value ) :
             frac = ( value - self[-1].value ) / max( abs( value ), abs( self[-1].value ) )
             return( '>', self[-1], None, frac )
-        for index, functional2 in enumerate( self ) :
-            if( functional2.value >= value ) : break
-            functional1 = functional2
+        functional2 = self[index]
         if( value == functional2.value ) : return( '=', functional2, None, 0 )
+        functional1 = self[index-1]
         frac = ( value - functional1.value ) / ( functional2.value - functional1.value )
         return( '', functional1, functional2, frac )
 
@@ -371,7 +444,7 @@ class XYsnd( baseModule.xDataFunctional ) :
     def domainUnitConversionFactor( self, unitTo ) :
 
         if( unitTo is None ) : return( 1. )
-        return( PQU.PQU( '1 ' + self.domainUnit( ) ).getValueAs( unitTo ) )
+        return( PQU.convertUnits( 1., self.domainUnit( ), unitTo ) )
 
     def domainMin( self, unitTo = None, asPQU = False ) :
 
@@ -193,7 +193,7 @@ class regions( baseModule.xDataFunctional ) :
     def domainUnitConversionFactor( self, unitTo ) :
 
         if( unitTo is None ) : return( 1. )
-        return( PQUModule.PQU( '1 ' + self.domainUnit( ) ).getValueAs( unitTo ) )
+        return( PQUModule.convertUnits( 1., self.domainUnit( ), unitTo ) )
 
     def domainMin( self, unitTo = None, asPQU = False ) :
 
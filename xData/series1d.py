@@ -244,7 +244,7 @@ class series( baseModule.xDataFunctional ) :
     def domainUnitConversionFactor( self, unitTo ) :
 
         if( unitTo is None ) : return( 1. )
-        return( PQUModule.PQU( '1 ' + self.domainUnit( ) ).getValueAs( unitTo ) )
+        return( PQUModule.convertUnits( 1., self.domainUnit( ), unitTo ) )
 
     def getCoefficientSafely( self, l ) :
         """
@@ -0,0 +1,176 @@
+# <<BEGIN-copyright>>
+# Copyright (c) 2016, Lawrence Livermore National Security, LLC.
+# Produced at the Lawrence Livermore National Laboratory.
+# Written by the LLNL Nuclear Data and Theory group
+#         (email: mattoon1@llnl.gov)
+# LLNL-CODE-683960.
+# All rights reserved.
+#
+# This file is part of the FUDGE package (For Updating Data and
+#         Generating Evaluations)
+#
+# When citing FUDGE, please use the following reference:
+#   C.M. Mattoon, B.R. Beck, N.R. Patel, N.C. Summers, G.W. Hedstrom, D.A. Brown, "Generalized Nuclear Data: A New Structure (with Supporting Infrastructure) for Handling Nuclear Data", Nuclear Data Sheets, Volume 113, Issue 12, December 2012, Pages 3145-3171, ISSN 0090-3752, http://dx.doi.org/10. 1016/j.nds.2012.11.008
+#
+#
+#     Please also read this link - Our Notice and Modified BSD License
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#     * Redistributions of source code must retain the above copyright
+#       notice, this list of conditions and the disclaimer below.
+#     * Redistributions in binary form must reproduce the above copyright
+#       notice, this list of conditions and the disclaimer (as noted below) in the
+#       documentation and/or other materials provided with the distribution.
+#     * Neither the name of LLNS/LLNL nor the names of its contributors may be used
+#       to endorse or promote products derived from this software without specific
+#       prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS" AND
+# ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE IMPLIED
+# WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+# DISCLAIMED. IN NO EVENT SHALL LAWRENCE LIVERMORE NATIONAL SECURITY, LLC,
+# THE U.S. DEPARTMENT OF ENERGY OR CONTRIBUTORS BE LIABLE FOR ANY
+# DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES
+# (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER CAUSED AND
+# ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY, OR TORT
+# (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE OF THIS
+# SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+#
+#
+# Additional BSD Notice
+#
+# 1. This notice is required to be provided under our contract with the U.S.
+# Department of Energy (DOE). This work was produced at Lawrence Livermore
+# National Laboratory under Contract No. DE-AC52-07NA27344 with the DOE.
+#
+# 2. Neither the United States Government nor Lawrence Livermore National Security,
+# LLC nor any of their employees, makes any warranty, express or implied, or assumes
+# any liability or responsibility for the accuracy, completeness, or usefulness of any
+# information, apparatus, product, or process disclosed, or represents that its use
+# would not infringe privately-owned rights.
+#
+# 3. Also, reference herein to any specific commercial products, process, or services
+# by trade name, trademark, manufacturer or otherwise does not necessarily constitute
+# or imply its endorsement, recommendation, or favoring by the United States Government
+# or Lawrence Livermore National Security, LLC. The views and opinions of authors expressed
+# herein do not necessarily state or reflect those of the United States Government or
+# Lawrence Livermore National Security, LLC, and shall not be used for advertising or
+# product endorsement purposes.
+#
+# <<END-copyright>>
+
+"""
+This module contains functions that sum, or tabulate, several ``XYs1d`` instances on the union of their domain grids.
+The union grid is built once and each function is evaluated on it with one call to ``XYs1d.evaluateArray``, instead of
+the union grid being rebuilt by each pairwise addition of ``XYs1d`` instances (which is quadratic in the number of
+functions times the size of the grid).
+"""
+
+__metaclass__ = type
+
+import XYs as XYsModule
+
+def discontinuities( functions ) :
+    """
+    Returns the sorted list of x-values where the sum of the XYs1d instances in functions is discontinuous. That is,
+    where a function starts [ends] with a non-zero y-value above [below] the smallest domainMin [largest domainMax]
+    of all functions.
+    """
+
+    if( len( functions ) == 0 ) : return( [] )
+    domainMin = min( [ function.domainMin( ) for function in functions ] )
+    domainMax = max( [ function.domainMax( ) for function in functions ] )
+    xs = set( )
+    for function in functions :
+        x1, y1 = function[0]
+        x2, y2 = function[-1]
+        if( ( x1 > domainMin ) and ( y1 != 0 ) ) : xs.add( x1 )
+        if( ( x2 < domainMax ) and ( y2 != 0 ) ) : xs.add( x2 )
+    return( sorted( xs ) )
+
+def unionGrid( functions ) :
+    """
+    Returns, as an ascending numpy array, the union of the domain grids of the XYs1d instances in functions. Each
+    x-value appears once, except at the discontinuities of the sum of functions (see discontinuities), which appear
+    twice: evaluateOnGrid gives the value just below the discontinuity at the first and the value just above it at
+    the second. This is how ACE energy grids represent steps.
+    """
+
+    import numpy
+
+    if( len( functions ) == 0 ) : return( numpy.zeros( 0 ) )
+    grid = numpy.unique( numpy.concatenate( [ function.xsAsArray( ) for function in functions ] ) )
+    steps = discontinuities( functions )
+    if( len( steps ) > 0 ) : grid = numpy.sort( numpy.concatenate( ( grid, steps ) ) )
+    return( grid )
+
+def dullEdges( functions, lowerEps = 0., upperEps = 0. ) :
+    """
+    Returns a list of functions with the lower [upper] edge of each function whose domainMin [domainMax] is greater [less]
+    than the minimum [maximum] domainMin [domainMax] of all functions dulled with lowerEps [upperEps] (see
+    XYs1d.dullEdges). This is what XYs1d.mutualify does to the two functions it is given.
+    """
+
+    if( len( functions ) == 0 ) : return( [] )
+    domainMin = min( [ function.domainMin( ) for function in functions ] )
+    domainMax = max( [ function.domainMax( ) for function in functions ] )
+    dulled = []
+    for function in functions :
+        lowerEps_, upperEps_ = 0., 0.
+        if( function.domainMin( ) > domainMin ) : lowerEps_ = lowerEps
+        if( function.domainMax( ) < domainMax ) : upperEps_ = upperEps
+        if( ( lowerEps_ != 0 ) or ( upperEps_ != 0 ) ) : function = function.dullEdges( lowerEps = lowerEps_, upperEps = upperEps_ )
+        dulled.append( function )
+    return( dulled )
+
+def evaluateOnGrid( function, grid ) :
+    """
+    Returns a numpy array of function evaluated at each x-value of grid, with 0 outside of function's domain. Where an
+    x-value appears twice in grid (see unionGrid), the first is taken as just below x and the second as just above x,
+    so function is 0 at the first [second] if x is its domainMin [domainMax].
+    """
+
+    import numpy
+
+    values = function.evaluateArray( grid, outOfDomainValue = 0. )
+    duplicates = numpy.nonzero( grid[1:] == grid[:-1] )[0]
+    if( len( duplicates ) > 0 ) :
+        values[duplicates[grid[duplicates] == function.domainMin( )]] = 0.
+        values[duplicates[grid[duplicates] == function.domainMax( )] + 1] = 0.
+    return( values )
+
+def sumOnGrid( functions, grid ) :
+    """Returns a numpy array of the sum of functions evaluated at each x-value of grid, with each function 0 outside of its domain."""
+
+    import numpy
+
+    total = numpy.zeros( len( grid ) )
+    for function in functions : total += evaluateOnGrid( function, grid )
+    return( total )
+
+def sumOnUnionGrid( functions, lowerEps = 0., upperEps = 0., cls = None ) :
+    """
+    Returns the sum of the XYs1d instances in functions, which must all have the same interpolation and convertible axes
+    units, as an instance of cls (default is the class of functions[0]). The sum is tabulated on the union grid of
+    functions, after their edges have been dulled by dullEdges. This gives the same result as adding the functions one
+    at a time, after each pair has been mutualified with lowerEps and upperEps. As with mutualify, a ValueError is
+    raised if the sum has a discontinuity (see discontinuities) that lowerEps and upperEps do not dull.
+    """
+
+    if( len( functions ) == 0 ) : raise ValueError( 'no functions to sum' )
+    function0 = functions[0]
+    for function in functions[1:] :
+        if( function.interpolation != function0.interpolation ) :
+            raise ValueError( 'interpolations differ: "%s" and "%s"' % ( function0.interpolation, function.interpolation ) )
+    functions = [ function0 ] + [ XYsModule.otherToSelfsUnits( function0, function ) for function in functions[1:] ]
+    functions = dullEdges( functions, lowerEps = lowerEps, upperEps = upperEps )
+    steps = discontinuities( functions )
+    if( len( steps ) > 0 ) : raise ValueError( 'sum is discontinuous at x = %s, use non-zero lowerEps and upperEps' % steps )
+    grid = unionGrid( functions )
+    total = sumOnGrid( functions, grid )
+
+    if( cls is None ) : cls = function0.__class__
+    return( cls( data = [ grid.tolist( ), total.tolist( ) ], dataForm = 'xsandys', interpolation = function0.interpolation, axes = function0.axes,
+            accuracy = function0.getAccuracy( ) ) )
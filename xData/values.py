@@ -62,15 +62,21 @@
 # <<END-copyright>>
 
 import base as baseModule
+import XMLWriter as XMLWriterModule
 
 __metaclass__ = type
 
 try :
     from numericalFunctions import pointwiseXY_C as pointwiseXY_CModule
     floatToShortestString = pointwiseXY_CModule.floatToShortestString
+    floatsToShortestStrings = pointwiseXY_CModule.floatsToShortestStrings
+    from numericalFunctions import listOfDoubles_C as listOfDoubles_CModule
+    listOfDoubles_C = listOfDoubles_CModule.listOfDoubles_C
 except :
     from pqu import PQU as PQUModule
     floatToShortestString = PQUModule.floatToShortestString
+    floatsToShortestStrings = None
+    listOfDoubles_C = ()
 
 from . import standards as standardsModule
 
@@ -109,13 +115,20 @@ class values( baseModule.xDataCoreMembers )  :
 
     def __getitem__( self, index ) :
 
+        if( isinstance( index, slice ) and isinstance( self.__values, listOfDoubles_C ) ) : return( list( self.__values[index] ) )
         return( self.__values[index] )
 
+    def __getstate__( self ) :
+
+        state = self.__dict__.copy( )
+        if( isinstance( self.__values, listOfDoubles_C ) ) : state['_values__values'] = list( self.__values )    # listOfDoubles_C cannot be pickled.
+        return( state )
+
     def copy( self, untrimZeros = False, label = None ) :
 
         if( label is None ) : label = self.label
         if( ( untrimZeros ) and ( ( self.start != 0 ) or ( self.end != self.size ) ) ) :
-            return( values( self.start * [ 0 ] + self.__values + ( self.size - self.end ) * [ 0 ], self.valueType, sep = self.__sep, label = label ) )
+            return( values( self.start * [ 0 ] + list( self.__values ) + ( self.size - self.end ) * [ 0 ], self.valueType, sep = self.__sep, label = label ) )
         else :
             return( values( self.__values, self.valueType, sep = self.sep, start = self.start, size = self.size, label = label ) )
 
@@ -144,7 +157,9 @@ class values( baseModule.xDataCoreMembers )  :
 
     @property
     def values( self ) :
+        """Returns the values as a python list. Values parsed into a listOfDoubles_C instance are converted to a list on first access."""
 
+        if( isinstance( self.__values, listOfDoubles_C ) ) : self.__values = list( self.__values )
         return( self.__values )
 
     @values.setter
@@ -164,6 +179,17 @@ class values( baseModule.xDataCoreMembers )  :
 
         return( self.__valueType )
 
+    def asArray( self ) :
+        """
+        Returns the values as a numpy array. If self is backed by a buffer of doubles (e.g., a listOfDoubles_C instance
+        as created by parseXMLNode), the returned array is a view of that buffer and no values are copied.
+        """
+
+        import numpy
+
+        dtype = { standardsModule.types.integer32Token : numpy.int32 }.get( self.valueType, numpy.float64 )
+        return( numpy.asarray( self.__values, dtype = dtype ) )
+
     def toString( self ) :
 
         strList = [ "%s" % value for value in self.__values ]
@@ -175,6 +201,14 @@ class values( baseModule.xDataCoreMembers )  :
 
     def toXMLList( self, indent = '', **kwargs ) :
 
+        return( XMLWriterModule.toXMLList( self, indent, **kwargs ) )
+
+    def toXMLStream( self, writer, indent = '', **kwargs ) :
+        """
+        Writes the XML lines of self to writer (see module XMLWriter). Each line of values is formatted with one call to
+        floatsToShortestStrings, so no list of strings for all values is created.
+        """
+
         indent2 = indent + kwargs.get( 'incrementalIndent', '  ' )
         valuesPerLine = kwargs.get( 'valuesPerLine', 100 )
         valueFormatter = kwargs.get( 'valueFormatter', floatToShortestString )
@@ -185,7 +219,6 @@ class values( baseModule.xDataCoreMembers )  :
 
         if( sep is None ) : sep = self.sep
 
-        strList, line = [], None
         attributeStr = ''
 
         if( self.start != 0 ) : attributeStr += ' start="%d"' % self.start
@@ -198,30 +231,31 @@ class values( baseModule.xDataCoreMembers )  :
             sep += ' '
         if( self.valueType != standardsModule.types.float64Token ) : attributeStr += ' valueType="%s"' % self.valueType
         attributeStr += baseModule.xDataCoreMembers.attributesToXMLAttributeStr( self )
-        XMLList = [ '%s<%s length="%d"%s>' % ( indent, self.moniker, len( self.__values ), attributeStr ) ]
+        writer.writeLine( '%s<%s length="%d"%s>' % ( indent, self.moniker, len( self.__values ), attributeStr ) )
         if( outline ) :                     # Logic above guarantees more than 14 elements in self.
             line = []
             for i1 in range( 6 ) : line.append( valueFormatter( self[i1], significantDigits = significantDigits ) )
             line.append( ' ... ' )
             for i1 in range( -6, 0 ) : line.append( valueFormatter( self[i1], significantDigits = significantDigits ) )
-            strList.append( sep.join( line ) )
+            writer.appendToLastLine( sep.join( line ) )
         else :
             dataToString = kwargs.get( 'dataToString', None )
             if( dataToString is None ) :
-                for index, value in enumerate( self.__values ) :
-                    if( ( index % valuesPerLine ) == 0 ) :
-                        if( line is not None ) : strList.append( sep.join( line ) )
-                        line = []
-                    line.append( valueFormatter( value, significantDigits = significantDigits ) )
-                if( ( line is not None ) and ( len( line ) > 0 ) ) : strList.append( sep.join( line ) )
+                useC = ( valueFormatter is floatToShortestString ) and ( floatsToShortestStrings is not None )
+                for index in range( 0, len( self.__values ), valuesPerLine ) :
+                    chunk = self.__values[index:index+valuesPerLine]
+                    if( useC ) :
+                        line = floatsToShortestStrings( chunk, significantDigits = significantDigits, sep = sep )
+                    else :
+                        line = sep.join( [ valueFormatter( value, significantDigits = significantDigits ) for value in chunk ] )
+                    if( index == 0 ) :
+                        writer.appendToLastLine( line )
+                    else :
+                        writer.writeLine( "%s%s" % ( indent2, line ) )
             else :
                 kwargs['valueFormatter'] = valueFormatter
-                XMLList += kwargs['dataToString']( self, kwargs['dataToStringParent'], indent = indent2, **kwargs )
-        if( len( strList ) > 0 ) : XMLList[-1] += strList.pop( 0 )
-
-        for line in strList : XMLList.append( "%s%s" % ( indent2, line ) )
-        XMLList[-1] += '</%s>' % self.moniker
-        return( XMLList )
+                writer.writeLines( kwargs['dataToString']( self, kwargs['dataToStringParent'], indent = indent2, **kwargs ) )
+        writer.appendToLastLine( '</%s>' % self.moniker )
 
     @staticmethod
     def parseXMLNode( element, xPath, linkData ) :
@@ -240,8 +274,7 @@ class values( baseModule.xDataCoreMembers )  :
         length = attrs.pop( 'length', len( values1 ) )
         if( length != len( values1 ) ) : raise Exception( 'length = %d != len( values1 ) = %d' % ( length, len( values1 ) ) )
 
-        values1 = [ value for value in values1 ]
-
+# values1 is kept as the listOfDoubles_C instance so that the data stay in one contiguous C buffer (no python float per value).
         return( values( values1, **attrs ) )
 
     @staticmethod